@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/cache_tiling_test_matmul.dir/root/package/.dacecache/cache_tiling_test_matmul/src/cpu/cache_tiling_test_matmul.cpp.o"
+  "CMakeFiles/cache_tiling_test_matmul.dir/root/package/.dacecache/cache_tiling_test_matmul/src/cpu/cache_tiling_test_matmul.cpp.o.d"
+  "libcache_tiling_test_matmul.pdb"
+  "libcache_tiling_test_matmul.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/cache_tiling_test_matmul.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_cache_tiling_test_matmul.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_cache_tiling_test_matmul.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_cache_tiling_test_matmul.pdb"
+  "libdacestub_cache_tiling_test_matmul.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_cache_tiling_test_matmul.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
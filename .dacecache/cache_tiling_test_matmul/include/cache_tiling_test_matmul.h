@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * cache_tiling_test_matmulHandle_t;
+extern "C" cache_tiling_test_matmulHandle_t __dace_init_cache_tiling_test_matmul();
+extern "C" void __dace_exit_cache_tiling_test_matmul(cache_tiling_test_matmulHandle_t handle);
+extern "C" void __program_cache_tiling_test_matmul(cache_tiling_test_matmulHandle_t handle, double * __restrict__ A, double * __restrict__ B, double * __restrict__ C);
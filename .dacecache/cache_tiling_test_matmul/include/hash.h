@@ -0,0 +1 @@
+#define __HASH_cache_tiling_test_matmul "080868fe902ad964664a032bfd349a939c43009dc2d5195b7f33d3c9f0bbfde2"
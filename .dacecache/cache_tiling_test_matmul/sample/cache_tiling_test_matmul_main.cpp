@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/cache_tiling_test_matmul.h"
+
+int main(int argc, char **argv) {
+    cache_tiling_test_matmulHandle_t handle;
+    double * __restrict__ A = (double*) calloc(90000, sizeof(double));
+    double * __restrict__ B = (double*) calloc(90000, sizeof(double));
+    double * __restrict__ C = (double*) calloc(90000, sizeof(double));
+
+
+    handle = __dace_init_cache_tiling_test_matmul();
+    __program_cache_tiling_test_matmul(handle, A, B, C);
+    __dace_exit_cache_tiling_test_matmul(handle);
+
+    free(A);
+    free(B);
+    free(C);
+
+
+    return 0;
+}
@@ -0,0 +1,96 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct cache_tiling_test_matmul_t {
+
+};
+
+inline void cache_tiling_test_matmul_14_4_0_0_2(cache_tiling_test_matmul_t *__state, double* __restrict__ __tmp_16_23_r, double* __restrict__ __tmp_16_33_r, double&  __tmp_16_12_w) {
+    long long k;
+
+
+
+
+    for (k = 0; (k < 300); k = k + 1) {
+        {
+            double __tmp3[1]  DACE_ALIGN(64);
+
+            {
+                double __in1 = __tmp_16_23_r[k];
+                double __in2 = __tmp_16_33_r[(300 * k)];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __tmp3[0] = __out;
+            }
+            {
+                double __inp = __tmp3[0];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (assign_16_12)
+                __out = __inp;
+                ///////////////////
+
+                dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce(&__tmp_16_12_w, __out);
+            }
+
+        }
+
+    }
+
+    
+}
+
+void __program_cache_tiling_test_matmul_internal(cache_tiling_test_matmul_t *__state, double * __restrict__ A, double * __restrict__ B, double * __restrict__ C)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto tile_i = 0; tile_i < 300; tile_i += 16) {
+                for (auto tile_j = 0; tile_j < 300; tile_j += 16) {
+                    {
+                        for (auto i = tile_i; i < (Min(299, (tile_i + 15)) + 1); i += 1) {
+                            for (auto j = tile_j; j < (Min(299, (tile_j + 15)) + 1); j += 1) {
+                                cache_tiling_test_matmul_14_4_0_0_2(__state, &A[(300 * i)], &B[j], C[((300 * i) + j)]);
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_cache_tiling_test_matmul(cache_tiling_test_matmul_t *__state, double * __restrict__ A, double * __restrict__ B, double * __restrict__ C)
+{
+    __program_cache_tiling_test_matmul_internal(__state, A, B, C);
+}
+
+DACE_EXPORTED cache_tiling_test_matmul_t *__dace_init_cache_tiling_test_matmul()
+{
+    int __result = 0;
+    cache_tiling_test_matmul_t *__state = new cache_tiling_test_matmul_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_cache_tiling_test_matmul(cache_tiling_test_matmul_t *__state)
+{
+    delete __state;
+}
+
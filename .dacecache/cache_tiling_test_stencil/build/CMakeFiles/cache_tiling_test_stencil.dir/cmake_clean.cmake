@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/cache_tiling_test_stencil.dir/root/package/.dacecache/cache_tiling_test_stencil/src/cpu/cache_tiling_test_stencil.cpp.o"
+  "CMakeFiles/cache_tiling_test_stencil.dir/root/package/.dacecache/cache_tiling_test_stencil/src/cpu/cache_tiling_test_stencil.cpp.o.d"
+  "libcache_tiling_test_stencil.pdb"
+  "libcache_tiling_test_stencil.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/cache_tiling_test_stencil.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * cache_tiling_test_stencilHandle_t;
+extern "C" cache_tiling_test_stencilHandle_t __dace_init_cache_tiling_test_stencil(int N);
+extern "C" void __dace_exit_cache_tiling_test_stencil(cache_tiling_test_stencilHandle_t handle);
+extern "C" void __program_cache_tiling_test_stencil(cache_tiling_test_stencilHandle_t handle, double * __restrict__ A, double * __restrict__ B, int N);
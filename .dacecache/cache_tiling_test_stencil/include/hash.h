@@ -0,0 +1 @@
+#define __HASH_cache_tiling_test_stencil "0ef09eb1aa5fdfd6594b07c62323aca3fe71ec357a78caaed9ad29217ad6fa62"
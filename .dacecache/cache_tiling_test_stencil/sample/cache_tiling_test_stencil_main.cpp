@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/cache_tiling_test_stencil.h"
+
+int main(int argc, char **argv) {
+    cache_tiling_test_stencilHandle_t handle;
+    int N = 42;
+    double * __restrict__ A = (double*) calloc((N * N), sizeof(double));
+    double * __restrict__ B = (double*) calloc((N * N), sizeof(double));
+
+
+    handle = __dace_init_cache_tiling_test_stencil(N);
+    __program_cache_tiling_test_stencil(handle, A, B, N);
+    __dace_exit_cache_tiling_test_stencil(handle);
+
+    free(A);
+    free(B);
+
+
+    return 0;
+}
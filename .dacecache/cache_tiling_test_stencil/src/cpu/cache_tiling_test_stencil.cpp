@@ -0,0 +1,129 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct cache_tiling_test_stencil_t {
+
+};
+
+void __program_cache_tiling_test_stencil_internal(cache_tiling_test_stencil_t *__state, double * __restrict__ A, double * __restrict__ B, int N)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto tile_i = 1; tile_i < (N - 1); tile_i += 64) {
+                for (auto tile_j = 1; tile_j < (N - 1); tile_j += 64) {
+                    {
+                        for (auto i = tile_i; i < (Min((N - 2), (tile_i + 63)) + 1); i += 1) {
+                            for (auto j = tile_j; j < (Min((N - 2), (tile_j + 63)) + 1); j += 1) {
+                                double __tmp1;
+                                double __tmp2;
+                                double __tmp3;
+                                double __tmp4;
+                                double __tmp5;
+                                {
+                                    double __in1 = A[((N * i) + j)];
+                                    double __in2 = A[((N * (i - 1)) + j)];
+                                    double __out;
+
+                                    ///////////////////
+                                    // Tasklet code (_Add_)
+                                    __out = (__in1 + __in2);
+                                    ///////////////////
+
+                                    __tmp1 = __out;
+                                }
+                                {
+                                    double __in1 = __tmp1;
+                                    double __in2 = A[((N * (i + 1)) + j)];
+                                    double __out;
+
+                                    ///////////////////
+                                    // Tasklet code (_Add_)
+                                    __out = (__in1 + __in2);
+                                    ///////////////////
+
+                                    __tmp2 = __out;
+                                }
+                                {
+                                    double __in1 = __tmp2;
+                                    double __in2 = A[(((N * i) + j) - 1)];
+                                    double __out;
+
+                                    ///////////////////
+                                    // Tasklet code (_Add_)
+                                    __out = (__in1 + __in2);
+                                    ///////////////////
+
+                                    __tmp3 = __out;
+                                }
+                                {
+                                    double __in1 = __tmp3;
+                                    double __in2 = A[(((N * i) + j) + 1)];
+                                    double __out;
+
+                                    ///////////////////
+                                    // Tasklet code (_Add_)
+                                    __out = (__in1 + __in2);
+                                    ///////////////////
+
+                                    __tmp4 = __out;
+                                }
+                                {
+                                    double __in2 = __tmp4;
+                                    double __out;
+
+                                    ///////////////////
+                                    // Tasklet code (_Mult_)
+                                    __out = (0.2 * __in2);
+                                    ///////////////////
+
+                                    __tmp5 = __out;
+                                }
+                                {
+                                    double __inp = __tmp5;
+                                    double __out;
+
+                                    ///////////////////
+                                    // Tasklet code (assign_22_8)
+                                    __out = __inp;
+                                    ///////////////////
+
+                                    B[((N * i) + j)] = __out;
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_cache_tiling_test_stencil(cache_tiling_test_stencil_t *__state, double * __restrict__ A, double * __restrict__ B, int N)
+{
+    __program_cache_tiling_test_stencil_internal(__state, A, B, N);
+}
+
+DACE_EXPORTED cache_tiling_test_stencil_t *__dace_init_cache_tiling_test_stencil(int N)
+{
+    int __result = 0;
+    cache_tiling_test_stencil_t *__state = new cache_tiling_test_stencil_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_cache_tiling_test_stencil(cache_tiling_test_stencil_t *__state)
+{
+    delete __state;
+}
+
@@ -0,0 +1 @@
+#define __HASH_multiversion_test_axpy_1 "61838f63f1fc7b9537fefe342c172384cd4ea3b2753351d26ae6917a105613b0"
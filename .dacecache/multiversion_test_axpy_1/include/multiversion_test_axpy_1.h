@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * multiversion_test_axpy_1Handle_t;
+extern "C" multiversion_test_axpy_1Handle_t __dace_init_multiversion_test_axpy_1(int N);
+extern "C" void __dace_exit_multiversion_test_axpy_1(multiversion_test_axpy_1Handle_t handle);
+extern "C" void __program_multiversion_test_axpy_1(multiversion_test_axpy_1Handle_t handle, double * __restrict__ x, double * __restrict__ y, int N, double a);
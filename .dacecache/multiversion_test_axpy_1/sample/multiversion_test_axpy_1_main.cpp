@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/multiversion_test_axpy_1.h"
+
+int main(int argc, char **argv) {
+    multiversion_test_axpy_1Handle_t handle;
+    int N = 42;
+    double a = 42;
+    double * __restrict__ x = (double*) calloc(N, sizeof(double));
+    double * __restrict__ y = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_multiversion_test_axpy_1(N);
+    __program_multiversion_test_axpy_1(handle, x, y, N, a);
+    __dace_exit_multiversion_test_axpy_1(handle);
+
+    free(x);
+    free(y);
+
+
+    return 0;
+}
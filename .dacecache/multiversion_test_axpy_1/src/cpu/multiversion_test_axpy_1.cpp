@@ -0,0 +1,173 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct multiversion_test_axpy_1_t {
+
+};
+
+inline void multiversion_test_axpy_v0_0_2_0(multiversion_test_axpy_1_t *__state, const double&  a, double* __restrict__ x, double* __restrict__ y) {
+    constexpr long long N = 32;
+
+    {
+        double *__tmp0;
+        __tmp0 = new double DACE_ALIGN(64)[32];
+        double *__tmp1;
+        __tmp1 = new double DACE_ALIGN(64)[32];
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 32; __i0 += 1) {
+                {
+                    double __in1 = a;
+                    double __in2 = x[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (__in1 * __in2);
+                    ///////////////////
+
+                    __tmp0[__i0] = __out;
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 32; __i0 += 1) {
+                {
+                    double __in1 = __tmp0[__i0];
+                    double __in2 = y[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    __tmp1[__i0] = __out;
+                }
+            }
+        }
+
+        dace::CopyND<double, 1, false, 32>::template ConstDst<1>::Copy(
+        __tmp1, y, 1);
+        delete[] __tmp0;
+        delete[] __tmp1;
+
+    }
+    
+}
+
+inline void multiversion_test_axpy_v1_0_3_0(multiversion_test_axpy_1_t *__state, const double&  a, double* __restrict__ x, double* __restrict__ y, int N) {
+
+    {
+        double *__tmp0;
+        __tmp0 = new double DACE_ALIGN(64)[N];
+        double *__tmp1;
+        __tmp1 = new double DACE_ALIGN(64)[N];
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                {
+                    double __in1 = a;
+                    double __in2 = x[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (__in1 * __in2);
+                    ///////////////////
+
+                    __tmp0[__i0] = __out;
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                {
+                    double __in1 = __tmp0[__i0];
+                    double __in2 = y[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    __tmp1[__i0] = __out;
+                }
+            }
+        }
+
+        dace::CopyNDDynamic<double, 1, false, 1>::template ConstDst<1>::Copy(
+        __tmp1, y, N, 1);
+        delete[] __tmp0;
+        delete[] __tmp1;
+
+    }
+    
+}
+
+void __program_multiversion_test_axpy_1_internal(multiversion_test_axpy_1_t *__state, double * __restrict__ x, double * __restrict__ y, int N, double a)
+{
+
+
+    if ((N == 32)) {
+        {
+
+            multiversion_test_axpy_v0_0_2_0(__state, a, &x[0], &y[0]);
+
+        }
+        goto __state_0_end;
+
+    } else if (((N <= 16) && (! (N == 32)))) {
+        {
+
+            multiversion_test_axpy_v1_0_3_0(__state, a, &x[0], &y[0], N);
+
+        }
+        goto __state_0_end;
+
+    } else if ((! ((N == 32) || (N <= 16)))) {
+        {
+
+            multiversion_test_axpy_v1_0_3_0(__state, a, &x[0], &y[0], N);
+
+        }
+        goto __state_0_end;
+
+    } else {
+        goto __state_exit_0;
+
+    }__state_0_end:;
+
+    __state_exit_0:;
+}
+
+DACE_EXPORTED void __program_multiversion_test_axpy_1(multiversion_test_axpy_1_t *__state, double * __restrict__ x, double * __restrict__ y, int N, double a)
+{
+    __program_multiversion_test_axpy_1_internal(__state, x, y, N, a);
+}
+
+DACE_EXPORTED multiversion_test_axpy_1_t *__dace_init_multiversion_test_axpy_1(int N)
+{
+    int __result = 0;
+    multiversion_test_axpy_1_t *__state = new multiversion_test_axpy_1_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_multiversion_test_axpy_1(multiversion_test_axpy_1_t *__state)
+{
+    delete __state;
+}
+
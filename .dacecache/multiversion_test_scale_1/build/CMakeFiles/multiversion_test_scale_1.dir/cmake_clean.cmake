@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/multiversion_test_scale_1.dir/root/package/.dacecache/multiversion_test_scale_1/src/cpu/multiversion_test_scale_1.cpp.o"
+  "CMakeFiles/multiversion_test_scale_1.dir/root/package/.dacecache/multiversion_test_scale_1/src/cpu/multiversion_test_scale_1.cpp.o.d"
+  "libmultiversion_test_scale_1.pdb"
+  "libmultiversion_test_scale_1.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/multiversion_test_scale_1.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
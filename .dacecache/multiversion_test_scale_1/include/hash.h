@@ -0,0 +1 @@
+#define __HASH_multiversion_test_scale_1 "a10157db00c838e43fb23071b4591532d7c578cd2990fddd4f8e7c257fa2610d"
@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/multiversion_test_scale_1.h"
+
+int main(int argc, char **argv) {
+    multiversion_test_scale_1Handle_t handle;
+    int N = 42;
+    double * __restrict__ __return = (double*) calloc(N, sizeof(double));
+    double * __restrict__ x = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_multiversion_test_scale_1(N);
+    __program_multiversion_test_scale_1(handle, __return, x, N);
+    __dace_exit_multiversion_test_scale_1(handle);
+
+    free(__return);
+    free(x);
+
+
+    return 0;
+}
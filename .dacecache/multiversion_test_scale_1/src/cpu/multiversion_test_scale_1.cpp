@@ -0,0 +1,145 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct multiversion_test_scale_1_t {
+
+};
+
+inline void multiversion_test_scale_v0_0_2_0(multiversion_test_scale_1_t *__state, double* __restrict__ x, double* __restrict__ __return) {
+    constexpr long long N = 20;
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 20; __i0 += 1) {
+                {
+                    double __in1 = x[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (__in1 * dace::float64(2));
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void multiversion_test_scale_v1_0_3_0(multiversion_test_scale_1_t *__state, double* __restrict__ x, double* __restrict__ __return) {
+    constexpr long long N = 1000;
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 1000; __i0 += 1) {
+                {
+                    double __in1 = x[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (__in1 * dace::float64(2));
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void multiversion_test_scale_generic_0_4_0(multiversion_test_scale_1_t *__state, double* __restrict__ x, double* __restrict__ __return, int N) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                {
+                    double __in1 = x[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (__in1 * dace::float64(2));
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_multiversion_test_scale_1_internal(multiversion_test_scale_1_t *__state, double * __restrict__ __return, double * __restrict__ x, int N)
+{
+
+
+    if ((N == 20)) {
+        {
+
+            multiversion_test_scale_v0_0_2_0(__state, &x[0], &__return[0]);
+
+        }
+        goto __state_0_end;
+
+    } else if (((N == 1000) && (! (N == 20)))) {
+        {
+
+            multiversion_test_scale_v1_0_3_0(__state, &x[0], &__return[0]);
+
+        }
+        goto __state_0_end;
+
+    } else if ((! ((N == 20) || (N == 1000)))) {
+        {
+
+            multiversion_test_scale_generic_0_4_0(__state, &x[0], &__return[0], N);
+
+        }
+        goto __state_0_end;
+
+    } else {
+        goto __state_exit_0;
+
+    }__state_0_end:;
+
+    __state_exit_0:;
+}
+
+DACE_EXPORTED void __program_multiversion_test_scale_1(multiversion_test_scale_1_t *__state, double * __restrict__ __return, double * __restrict__ x, int N)
+{
+    __program_multiversion_test_scale_1_internal(__state, __return, x, N);
+}
+
+DACE_EXPORTED multiversion_test_scale_1_t *__dace_init_multiversion_test_scale_1(int N)
+{
+    int __result = 0;
+    multiversion_test_scale_1_t *__state = new multiversion_test_scale_1_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_multiversion_test_scale_1(multiversion_test_scale_1_t *__state)
+{
+    delete __state;
+}
+
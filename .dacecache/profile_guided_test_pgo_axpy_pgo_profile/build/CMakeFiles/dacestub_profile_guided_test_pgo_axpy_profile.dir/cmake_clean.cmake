@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_profile_guided_test_pgo_axpy_profile.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_profile_guided_test_pgo_axpy_profile.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_profile_guided_test_pgo_axpy_profile.pdb"
+  "libdacestub_profile_guided_test_pgo_axpy_profile.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_profile_guided_test_pgo_axpy_profile.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,19 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/.dacecache/profile_guided_test_pgo_axpy_pgo_profile/src/cpu/profile_guided_test_pgo_axpy_profile.cpp" "CMakeFiles/profile_guided_test_pgo_axpy_profile.dir/root/package/.dacecache/profile_guided_test_pgo_axpy_pgo_profile/src/cpu/profile_guided_test_pgo_axpy_profile.cpp.o" "gcc" "CMakeFiles/profile_guided_test_pgo_axpy_profile.dir/root/package/.dacecache/profile_guided_test_pgo_axpy_pgo_profile/src/cpu/profile_guided_test_pgo_axpy_profile.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
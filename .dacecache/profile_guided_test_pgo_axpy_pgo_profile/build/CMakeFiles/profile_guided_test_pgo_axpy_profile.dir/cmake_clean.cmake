@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/profile_guided_test_pgo_axpy_profile.dir/root/package/.dacecache/profile_guided_test_pgo_axpy_pgo_profile/src/cpu/profile_guided_test_pgo_axpy_profile.cpp.o"
+  "CMakeFiles/profile_guided_test_pgo_axpy_profile.dir/root/package/.dacecache/profile_guided_test_pgo_axpy_pgo_profile/src/cpu/profile_guided_test_pgo_axpy_profile.cpp.o.d"
+  "libprofile_guided_test_pgo_axpy_profile.pdb"
+  "libprofile_guided_test_pgo_axpy_profile.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/profile_guided_test_pgo_axpy_profile.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_profile_guided_test_pgo_axpy_profile "8eefd3c806823fcb16075a780e8a53ddb9f2005b643f794bd2adbcdd3ae27820"
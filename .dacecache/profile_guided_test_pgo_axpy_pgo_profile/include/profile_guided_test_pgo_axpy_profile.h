@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * profile_guided_test_pgo_axpy_profileHandle_t;
+extern "C" profile_guided_test_pgo_axpy_profileHandle_t __dace_init_profile_guided_test_pgo_axpy_profile(int N);
+extern "C" void __dace_exit_profile_guided_test_pgo_axpy_profile(profile_guided_test_pgo_axpy_profileHandle_t handle);
+extern "C" void __program_profile_guided_test_pgo_axpy_profile(profile_guided_test_pgo_axpy_profileHandle_t handle, double * __restrict__ x, double * __restrict__ y, int N, double a);
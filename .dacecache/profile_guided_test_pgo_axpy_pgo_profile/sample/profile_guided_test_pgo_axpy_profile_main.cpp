@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/profile_guided_test_pgo_axpy_profile.h"
+
+int main(int argc, char **argv) {
+    profile_guided_test_pgo_axpy_profileHandle_t handle;
+    int N = 42;
+    double a = 42;
+    double * __restrict__ x = (double*) calloc(N, sizeof(double));
+    double * __restrict__ y = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_profile_guided_test_pgo_axpy_profile(N);
+    __program_profile_guided_test_pgo_axpy_profile(handle, x, y, N, a);
+    __dace_exit_profile_guided_test_pgo_axpy_profile(handle);
+
+    free(x);
+    free(y);
+
+
+    return 0;
+}
@@ -0,0 +1,86 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct profile_guided_test_pgo_axpy_profile_t {
+    double * __restrict__ __0___tmp1;
+    dace::perf::Report report;
+};
+
+
+#include <chrono>
+#include <chrono>
+void __program_profile_guided_test_pgo_axpy_profile_internal(profile_guided_test_pgo_axpy_profile_t *__state, double * __restrict__ x, double * __restrict__ y, int N, double a)
+{
+
+    {
+
+        {
+            auto __dace_tbegin_0_0_0 = std::chrono::high_resolution_clock::now();
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                double __s0_n1__out_n2IN___tmp0;
+                {
+                    double __in1 = a;
+                    double __in2 = x[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (__in1 * __in2);
+                    ///////////////////
+
+                    __s0_n1__out_n2IN___tmp0 = __out;
+                }
+                {
+                    const double __in1 = __s0_n1__out_n2IN___tmp0;
+                    double __in2 = y[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    __state->__0___tmp1[__i0] = __out;
+                }
+            }
+            auto __dace_tend_0_0_0 = std::chrono::high_resolution_clock::now();
+            unsigned long int __dace_ts_start_0_0_0 = std::chrono::duration_cast<std::chrono::microseconds>(__dace_tbegin_0_0_0.time_since_epoch()).count();
+            unsigned long int __dace_ts_end_0_0_0 = std::chrono::duration_cast<std::chrono::microseconds>(__dace_tend_0_0_0.time_since_epoch()).count();
+            __state->report.add_completion("Map _Mult__map", "Timer", __dace_ts_start_0_0_0, __dace_ts_end_0_0_0, 0, 0, 0);
+        }
+
+        dace::CopyNDDynamic<double, 1, false, 1>::template ConstDst<1>::Copy(
+        __state->__0___tmp1, y, N, 1);
+
+    }
+}
+
+DACE_EXPORTED void __program_profile_guided_test_pgo_axpy_profile(profile_guided_test_pgo_axpy_profile_t *__state, double * __restrict__ x, double * __restrict__ y, int N, double a)
+{
+    __program_profile_guided_test_pgo_axpy_profile_internal(__state, x, y, N, a);
+}
+
+DACE_EXPORTED profile_guided_test_pgo_axpy_profile_t *__dace_init_profile_guided_test_pgo_axpy_profile(int N)
+{
+    int __result = 0;
+    profile_guided_test_pgo_axpy_profile_t *__state = new profile_guided_test_pgo_axpy_profile_t;
+
+
+    __state->__0___tmp1 = new double DACE_ALIGN(64)[N];
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_profile_guided_test_pgo_axpy_profile(profile_guided_test_pgo_axpy_profile_t *__state)
+{
+    __state->report.save(".dacecache/profile_guided_test_pgo_axpy_pgo_profile/perf", __HASH_profile_guided_test_pgo_axpy_profile);
+    delete[] __state->__0___tmp1;
+    delete __state;
+}
+
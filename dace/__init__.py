@@ -1,4 +1,5 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
+import importlib
 import sys
 from .version import __version__
 from .dtypes import *
@@ -6,18 +7,8 @@ from .dtypes import *
 # Import built-in hooks
 from .builtin_hooks import *
 
-# Python frontend
-from .frontend.python.interface import *
-from .frontend.python.wrappers import *
-from .frontend.python.ndloop import ndrange
-from .frontend.operations import reduce, elementwise
-
-from . import data, hooks, subsets
+from . import hooks
 from .config import Config
-from .sdfg import SDFG, SDFGState, InterstateEdge, nodes
-from .sdfg.propagation import propagate_memlets_sdfg, propagate_memlet
-from .memlet import Memlet
-from .symbolic import symbol
 
 # Run Jupyter notebook code
 from .jupyter import *
@@ -25,12 +16,62 @@ from .jupyter import *
 # Import hooks from config last (as it may load classes from within dace)
 hooks._install_hooks_from_config()
 
+# The Python frontend, SDFG classes, and symbolic (sympy-based) functionality are only imported on first access, so that
+# tools that do not need them (e.g., loading precompiled programs) start quickly. Maps attributes to their modules.
+_LAZY_ATTRIBUTES = {
+    # Python frontend
+    **{
+        name: 'dace.frontend.python.interface'
+        for name in ('program', 'function', 'method', 'map', 'consume', 'tasklet', 'unroll', 'nounroll', 'inline',
+                     'in_program', 'MapGenerator', 'MapMetaclass', 'TaskletMetaclass')
+    },
+    **{
+        name: 'dace.frontend.python.wrappers'
+        for name in ('ndarray', 'scalar', 'stream', 'stream_array', 'define_local', 'define_local_scalar',
+                     'define_stream', 'define_streamarray')
+    },
+    'ndrange': 'dace.frontend.python.ndloop',
+    'reduce': 'dace.frontend.operations',
+    'scan': 'dace.frontend.operations',
+    'elementwise': 'dace.frontend.operations',
+    # SDFG classes
+    'SDFG': 'dace.sdfg',
+    'SDFGState': 'dace.sdfg',
+    'InterstateEdge': 'dace.sdfg',
+    'nodes': 'dace.sdfg',
+    'propagate_memlets_sdfg': 'dace.sdfg.propagation',
+    'propagate_memlet': 'dace.sdfg.propagation',
+    'Memlet': 'dace.memlet',
+    'symbol': 'dace.symbolic',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name.startswith('__'):
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    else:
+        # Submodules (e.g., ``dace.data``) are imported on first access
+        try:
+            value = importlib.import_module(f'{__name__}.{name}')
+        except ModuleNotFoundError as ex:
+            if ex.name != f'{__name__}.{name}':
+                raise
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(_LAZY_ATTRIBUTES.keys()))
+
 
 # Hack that enables using @dace as a decorator
 # See https://stackoverflow.com/a/48100440/6489142
 class DaceModule(sys.modules[__name__].__class__):
     def __call__(self, *args, **kwargs):
-        return function(*args, **kwargs)
+        return self.function(*args, **kwargs)
 
 
 sys.modules[__name__].__class__ = DaceModule
@@ -0,0 +1,152 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Ahead-of-time compiler for the DaCe programs of a Python package. """
+
+import argparse
+import concurrent.futures
+import importlib
+import inspect
+import os
+import pkgutil
+import re
+import sys
+import traceback
+from typing import List, Optional, Tuple
+
+from dace import dtypes
+from dace.codegen import aot
+from dace.frontend.python.parser import DaceProgram
+
+
+def has_declared_signature(program: DaceProgram) -> bool:
+    """
+    Returns True if a program can be compiled without example arguments, i.e.,
+    all of its arguments have type hints and none are compile-time constants.
+    """
+    for param in program.signature.parameters.values():
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            return False
+        if param.annotation is inspect.Parameter.empty or param.annotation is dtypes.compiletime:
+            return False
+    return True
+
+
+def find_programs(package: str) -> List[Tuple[str, str]]:
+    """
+    Finds the ``@dace.program`` functions defined at the top level of the
+    modules of a Python package.
+
+    :param package: Name of the Python package (or module).
+    :return: A list of (module name, program name) tuples.
+    """
+    root = importlib.import_module(package)
+    modules = [root]
+    if hasattr(root, '__path__'):
+        for info in pkgutil.walk_packages(root.__path__, prefix=package + '.'):
+            try:
+                modules.append(importlib.import_module(info.name))
+            except Exception as ex:
+                print(f'Skipping module {info.name}: {ex}', file=sys.stderr)
+
+    result = []
+    for module in modules:
+        for name, value in vars(module).items():
+            # Skip programs that were imported from other modules
+            if (isinstance(value, DaceProgram) and value.f.__module__ == module.__name__
+                    and value.f.__qualname__ == name):
+                result.append((module.__name__, name))
+    return result
+
+
+def compile_program(module: str, name: str, bundle: str) -> Tuple[str, str, str]:
+    """
+    Compiles a program into a bundle, without updating the bundle manifest.
+
+    :return: A 3-tuple of (program key, program hash, build folder).
+    """
+    program: DaceProgram = getattr(importlib.import_module(module), name)
+    program_hash, folder = program.aot_compile(bundle, update_manifest=False)
+    return aot.program_key(program.f), program_hash, folder
+
+
+def default_bundle(package: str) -> Optional[str]:
+    """ Returns the bundle folder inside a Python package, which is used automatically by its programs. """
+    root = importlib.import_module(package.split('.')[0])
+    if not getattr(root, '__file__', None):
+        return None
+    return os.path.join(os.path.dirname(os.path.abspath(root.__file__)), aot.PACKAGE_BUNDLE)
+
+
+def main():
+    # Command line options parser
+    parser = argparse.ArgumentParser(description='Ahead-of-time compiler for the DaCe programs of a Python package.')
+
+    # Required argument for the package name
+    parser.add_argument('package', help='<PYTHON PACKAGE OR MODULE NAME>', type=str)
+
+    parser.add_argument('-o',
+                        '--out',
+                        type=str,
+                        help='Bundle folder to write the compiled programs to. By default, writes the bundle into '
+                        f'the "{aot.PACKAGE_BUNDLE}" folder of the package, which its programs load automatically.')
+
+    parser.add_argument('-j',
+                        '--jobs',
+                        type=int,
+                        default=os.cpu_count(),
+                        help='Number of programs to compile in parallel.')
+
+    parser.add_argument('-f',
+                        '--filter',
+                        type=str,
+                        default=None,
+                        help='Only compile programs whose fully-qualified name matches the given regular expression.')
+
+    args = parser.parse_args()
+
+    bundle = args.out or default_bundle(args.package)
+    if bundle is None:
+        print('Cannot determine the package folder, please specify an output bundle with --out')
+        exit(1)
+    bundle = os.path.abspath(bundle)
+
+    # Find programs with declared signatures
+    programs = []
+    for module, name in find_programs(args.package):
+        program = getattr(sys.modules[module], name)
+        qualname = aot.program_key(program.f)
+        if args.filter is not None and re.search(args.filter, qualname) is None:
+            continue
+        if not has_declared_signature(program):
+            print(f'Skipping {qualname}: all arguments must have type hints')
+            continue
+        programs.append((module, name))
+
+    if len(programs) == 0:
+        print('No programs to compile')
+        return
+
+    # Compile in parallel, then write manifest once
+    builds = {}
+    failed = 0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {executor.submit(compile_program, module, name, bundle): (module, name) for module, name in programs}
+        for future in concurrent.futures.as_completed(futures):
+            module, name = futures[future]
+            try:
+                key, program_hash, folder = future.result()
+            except Exception:
+                print(f'Failed to compile {module}.{name}:', file=sys.stderr)
+                traceback.print_exc()
+                failed += 1
+                continue
+            builds.setdefault(key, {})[program_hash] = folder
+            print(f'Compiled {key} -> {folder}')
+
+    aot.write_manifest(bundle, builds)
+    print(f'Wrote {sum(len(b) for b in builds.values())} programs to {bundle}')
+    if failed > 0:
+        exit(1)
+
+
+if __name__ == '__main__':
+    main()
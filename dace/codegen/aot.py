@@ -0,0 +1,156 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Bundles of ahead-of-time (AOT) compiled DaCe programs. A bundle is a folder that contains the compiled libraries of
+programs along with a manifest that maps every program to its builds. Builds are identified by a hash of the parsed
+program, which does not depend on source file locations, such that bundles can be relocated (e.g., installed with a
+package). Bundles are created with the ``daceaot`` command-line tool and loaded automatically by ``@dace.program``
+functions instead of compiling them.
+"""
+import functools
+import json
+import os
+import shutil
+import sys
+from typing import Any, Dict, List
+
+from dace.config import Config
+from dace.sdfg import SDFG
+
+#: Name of the bundle manifest file
+MANIFEST = 'manifest.json'
+
+#: Name of the bundle folder that is picked up automatically inside a Python package
+PACKAGE_BUNDLE = '_dace_aot'
+
+
+def _remove_debuginfo(json_obj: Any) -> None:
+    if isinstance(json_obj, dict):
+        json_obj.pop('debuginfo', None)
+        for value in json_obj.values():
+            _remove_debuginfo(value)
+    elif isinstance(json_obj, list):
+        for value in json_obj:
+            _remove_debuginfo(value)
+
+
+def program_hash(sdfg: SDFG) -> str:
+    """
+    Returns a hash of a parsed program that identifies its builds. Unlike
+    ``SDFG.hash_sdfg``, the hash does not depend on debug information (e.g.,
+    source file paths), so that it remains stable when a package is moved.
+
+    :param sdfg: The parsed (unoptimized) SDFG of the program.
+    :return: The hash (in SHA-256 format).
+    """
+    jsondict = sdfg.to_json()
+    _remove_debuginfo(jsondict)
+    return sdfg.hash_sdfg(jsondict)
+
+
+def program_key(f) -> str:
+    """ Returns the key of a Python function in bundle manifests (its fully-qualified name). """
+    return f'{f.__module__}.{f.__qualname__}'
+
+
+@functools.lru_cache(maxsize=None)
+def read_manifest(bundle: str) -> Dict[str, Dict[str, str]]:
+    """
+    Reads the manifest of a bundle.
+
+    :param bundle: Path to the bundle folder.
+    :return: A dictionary mapping program keys to their builds (a dictionary
+             mapping program hashes to absolute build folders). Empty if the
+             bundle does not exist.
+    """
+    try:
+        with open(os.path.join(bundle, MANIFEST), 'r') as fp:
+            manifest = json.load(fp)
+    except (OSError, ValueError):
+        return {}
+    return {
+        key: {phash: os.path.join(bundle, folder)
+              for phash, folder in builds.items()}
+        for key, builds in manifest.get('programs', {}).items()
+    }
+
+
+def bundle_paths(module: str) -> List[str]:
+    """
+    Returns the bundles that are searched for the programs of a Python module:
+    the bundles in the ``compiler.aot_bundles`` configuration entry, followed
+    by the bundle inside the module's top-level package, if it exists.
+
+    :param module: Name of the Python module.
+    """
+    result = [os.path.abspath(p) for p in Config.get('compiler', 'aot_bundles').split(os.pathsep) if p]
+    package = sys.modules.get((module or '').split('.')[0])
+    if package is not None and getattr(package, '__file__', None):
+        result.append(os.path.join(os.path.dirname(os.path.abspath(package.__file__)), PACKAGE_BUNDLE))
+    return result
+
+
+def find_builds(f) -> Dict[str, str]:
+    """
+    Finds the ahead-of-time compiled builds of a Python function.
+
+    :param f: The Python function of the program.
+    :return: A dictionary mapping program hashes to build folders, which can
+             be loaded with ``dace.sdfg.utils.load_precompiled_sdfg``.
+    """
+    key = program_key(f)
+    result = {}
+    # Earlier bundles take precedence
+    for bundle in reversed(bundle_paths(f.__module__)):
+        result.update(read_manifest(bundle).get(key, {}))
+    return result
+
+
+def add_build(bundle: str, key: str, phash: str, sdfg: SDFG) -> str:
+    """
+    Copies the build of a compiled program into a bundle. Only the files that
+    are necessary to load the program are copied (the SDFG, the library, and
+    the library loader stub). The manifest has to be updated separately with
+    ``write_manifest``.
+
+    :param bundle: Path to the bundle folder.
+    :param key: The program key (see ``program_key``).
+    :param phash: The program hash (see ``program_hash``).
+    :param sdfg: The compiled SDFG, whose build folder contains the build.
+    :return: The build folder, relative to the bundle.
+    """
+    folder = f'{key.replace(".", "_")}_{phash[:16]}'
+    outpath = os.path.join(bundle, folder)
+    if os.path.isdir(outpath):
+        shutil.rmtree(outpath)
+    os.makedirs(os.path.join(outpath, 'build'))
+
+    suffix = Config.get('compiler', 'library_extension')
+    shutil.copyfile(os.path.join(sdfg.build_folder, 'program.sdfg'), os.path.join(outpath, 'program.sdfg'))
+    for library in (f'lib{sdfg.name}.{suffix}', f'libdacestub_{sdfg.name}.{suffix}'):
+        shutil.copyfile(os.path.join(sdfg.build_folder, 'build', library), os.path.join(outpath, 'build', library))
+    return folder
+
+
+def write_manifest(bundle: str, builds: Dict[str, Dict[str, str]]) -> None:
+    """
+    Adds builds to the manifest of a bundle, creating it if necessary.
+
+    :param bundle: Path to the bundle folder.
+    :param builds: A dictionary mapping program keys to their builds (a
+                   dictionary mapping program hashes to build folders,
+                   relative to the bundle).
+    """
+    path = os.path.join(bundle, MANIFEST)
+    try:
+        with open(path, 'r') as fp:
+            manifest = json.load(fp)
+    except (OSError, ValueError):
+        manifest = {}
+    programs = manifest.setdefault('programs', {})
+    for key, program_builds in builds.items():
+        programs.setdefault(key, {}).update(program_builds)
+
+    os.makedirs(bundle, exist_ok=True)
+    with open(path, 'w') as fp:
+        json.dump(manifest, fp, indent=2, sort_keys=True)
+    read_manifest.cache_clear()
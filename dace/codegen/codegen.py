@@ -1,7 +1,7 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 import functools
 import os
-from typing import List, Set
+from typing import List, Optional, Set
 
 import dace
 from dace import dtypes
@@ -9,6 +9,7 @@ from dace import data
 from dace.sdfg import SDFG
 from dace.codegen.targets import framecode
 from dace.codegen.codeobject import CodeObject
+from dace.codegen.common import CodegenTimer
 from dace.config import Config
 from dace.sdfg import infer_types
 
@@ -148,19 +149,49 @@ def _get_codegen_targets(sdfg: SDFG, frame: framecode.DaCeCodeGenerator):
         disp.instrumentation[sdfg.instrument] = provider_mapping[sdfg.instrument]
 
 
-def generate_code(sdfg, validate=True) -> List[CodeObject]:
+def generate_code(sdfg, validate=True, timer: Optional[CodegenTimer] = None) -> List[CodeObject]:
     """
     Generates code as a list of code objects for a given SDFG.
 
     :param sdfg: The SDFG to use
     :param validate: If True, validates the SDFG before generating the code.
+    :param timer: An optional timer to record the time spent in each phase of code generation into. If not given and
+                  ``compiler.codegen_timing`` is enabled, the timing of code generation is printed.
     :return: List of code objects that correspond to files to compile.
     """
-    from dace.codegen.targets.target import TargetCodeGenerator  # Avoid import loop
+    print_timing = timer is None and Config.get_bool('compiler', 'codegen_timing')
+    timer = timer or CodegenTimer()
 
     # Before compiling, validate SDFG correctness
     if validate:
-        sdfg.validate()
+        with timer.phase('validation'):
+            sdfg.validate()
+
+    with timer.phase('preprocessing'):
+        frame, sdfg = _preprocess(sdfg, timer)
+
+    # NOTE: THE SDFG IS ASSUMED TO BE FROZEN (not change) FROM THIS POINT ONWARDS
+
+    # Generate frame code (and the rest of the code)
+    with timer.phase('dispatch'):
+        (global_code, frame_code, used_targets, used_environments) = frame.generate_code(sdfg, None)
+
+    with timer.phase('code objects'):
+        target_objects = _generate_code_objects(sdfg, frame, global_code, frame_code, used_targets, used_environments)
+
+    if print_timing:
+        print(timer.report(f'Code generation timing for SDFG "{sdfg.name}":'))
+
+    return target_objects
+
+
+def _preprocess(sdfg, timer: CodegenTimer):
+    """
+    Prepares an SDFG for code generation and creates the frame code generator and code generation targets.
+
+    :return: A 2-tuple of the frame code generator and the SDFG to generate code for.
+    """
+    from dace.codegen.targets.target import TargetCodeGenerator  # Avoid import loop
 
     if Config.get_bool('testing', 'serialization'):
         from dace.sdfg import SDFG
@@ -196,7 +227,7 @@ def generate_code(sdfg, validate=True) -> List[CodeObject]:
     infer_types.infer_connector_types(sdfg)
     infer_types.set_default_schedule_and_storage_types(sdfg, None)
 
-    frame = framecode.DaCeCodeGenerator(sdfg)
+    frame = framecode.DaCeCodeGenerator(sdfg, timer)
 
     # Instantiate CPU first (as it is used by the other code generators)
     # TODO: Refactor the parts used by other code generators out of CPU
@@ -225,10 +256,12 @@ def generate_code(sdfg, validate=True) -> List[CodeObject]:
         for k, v in frame._dispatcher.instrumentation.items()
     }
 
-    # NOTE: THE SDFG IS ASSUMED TO BE FROZEN (not change) FROM THIS POINT ONWARDS
+    return frame, sdfg
 
-    # Generate frame code (and the rest of the code)
-    (global_code, frame_code, used_targets, used_environments) = frame.generate_code(sdfg, None)
+
+def _generate_code_objects(sdfg, frame: framecode.DaCeCodeGenerator, global_code: str, frame_code: str, used_targets,
+                           used_environments) -> List[CodeObject]:
+    """ Creates the code objects of the generated program, its targets, and environments. """
     target_objects = [
         CodeObject(sdfg.name,
                    global_code + frame_code,
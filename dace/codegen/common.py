@@ -1,5 +1,6 @@
 # Copyright 2019-2022 ETH Zurich and the DaCe authors. All rights reserved.
 import ast
+import contextlib
 from copy import deepcopy
 import ctypes.util
 from dace import config, data, dtypes, sdfg as sd, symbolic
@@ -10,7 +11,8 @@ from functools import lru_cache
 from io import StringIO
 import os
 import subprocess
-from typing import List, Optional, Set, Union
+import time
+from typing import Dict, List, Optional, Set, Union
 import warnings
 
 
@@ -99,6 +101,45 @@ def unparse_interstate_edge(code_ast: Union[ast.AST, str], sdfg: SDFG, symbols=N
     return strio.getvalue().strip()
 
 
+class CodegenTimer:
+    """
+    Measures the time spent in each phase of code generation and compilation. Phases may be nested, in which case the
+    time of the inner phase is only attributed to the inner phase.
+    """
+
+    def __init__(self):
+        #: Maps phase names to the total time (in seconds) spent in them, in order of first appearance
+        self.phases: Dict[str, float] = {}
+        #: Additional statistics to print along with the phases
+        self.counters: Dict[str, int] = {}
+        self._children_time: List[float] = []
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """ Context manager that attributes the time spent within it to the given phase. """
+        self._children_time.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._children_time.pop()
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed - children
+            if self._children_time:
+                self._children_time[-1] += elapsed
+
+    def report(self, title: str) -> str:
+        """ Returns a human-readable summary of the measured phases. """
+        width = max([len(name) for name in self.phases] + [len('total')])
+        lines = [title]
+        for name, seconds in self.phases.items():
+            lines.append(f'  {name:<{width}} {seconds * 1000:12.3f} ms')
+        lines.append(f'  {"total":<{width}} {sum(self.phases.values()) * 1000:12.3f} ms')
+        for name, value in self.counters.items():
+            lines.append(f'  {name}: {value}')
+        return '\n'.join(lines)
+
+
 @lru_cache()
 def get_gpu_backend() -> str:
     """
@@ -6,6 +6,7 @@
 from __future__ import print_function
 
 import collections
+import glob
 import os
 import six
 import shutil
@@ -188,6 +189,9 @@ def configure_and_compile(program_folder, program_name=None, output_stream=None)
 
     cmake_command.append(f"-DCMAKE_BUILD_TYPE={Config.get('compiler', 'build_type')}")
 
+    # Set profile-guided optimization flags (always set to override previous configurations)
+    cmake_command.append(f'-DDACE_PGO_FLAGS="{get_pgo_flags(program_folder)}"')
+
     # Set linker and linker arguments, iff they have been specified
     cmake_linker = Config.get('compiler', 'linker', 'executable') or ''
     cmake_linker = cmake_linker.strip()
@@ -246,6 +250,50 @@ def configure_and_compile(program_folder, program_name=None, output_stream=None)
     return shared_library_path
 
 
+def get_pgo_flags(program_folder: str) -> str:
+    """ Returns the compiler flags for native profile-guided optimization of
+        a program, according to the ``compiler.cpu.pgo`` configuration entry.
+        In the "generate" mode, previous profiles of the program are removed,
+        and in the "use" mode, raw LLVM profiles (if exist) are merged.
+
+        :param program_folder: The program folder.
+        :return: A string of compiler flags, or an empty string if
+                 profile-guided optimization is disabled.
+    """
+    mode = Config.get('compiler', 'cpu', 'pgo')
+    if not mode:
+        return ''
+    if mode not in ('generate', 'use'):
+        raise cgx.CompilerConfigurationError(f'Invalid profile-guided optimization mode "{mode}", '
+                                             'expected "generate" or "use"')
+
+    profile_folder = os.path.join(os.path.abspath(program_folder), 'profile')
+    if mode == 'generate':
+        shutil.rmtree(profile_folder, ignore_errors=True)
+        os.makedirs(profile_folder)
+    else:
+        _merge_llvm_profiles(profile_folder)
+
+    flags = Config.get('compiler', 'cpu', f'pgo_{mode}_args')
+    return flags.format(profile_folder=profile_folder.replace('\\', '/'))
+
+
+def _merge_llvm_profiles(profile_folder: str):
+    """ Merges raw profiles generated by LLVM-based compilers into the profile
+        file read by ``-fprofile-use``. """
+    raw_profiles = sorted(glob.glob(os.path.join(profile_folder, '*.profraw')))
+    if len(raw_profiles) == 0:
+        return
+    try:
+        subprocess.run(['llvm-profdata', 'merge', '-output=' + os.path.join(profile_folder, 'default.profdata')] +
+                       raw_profiles,
+                       check=True,
+                       stdout=subprocess.PIPE,
+                       stderr=subprocess.STDOUT)
+    except (OSError, subprocess.CalledProcessError) as ex:
+        raise cgx.CompilerConfigurationError(f'Failed to merge profiles with llvm-profdata: {ex}')
+
+
 def _get_or_eval(value_or_function: Union[T, Callable[[], T]]) -> T:
     """
     Returns a stored value or lazily evaluates it. Used in environments
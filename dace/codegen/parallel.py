@@ -0,0 +1,427 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Parallel code generation of nested SDFGs.
+
+In large SDFG hierarchies, most of the generated code consists of the bodies of nested SDFGs, which are emitted as
+separate functions. Before the states of the outermost SDFG are generated, worker processes forked from the code
+generator generate the bodies of nested SDFGs ahead of time, in parallel. The main process then generates the program
+in the usual (sequential) order, and when it reaches a nested SDFG whose body was generated ahead of time, uses the
+result of the worker instead. The generated code is thus identical to sequential code generation.
+
+A worker cannot observe the code generator state that the main process will have once it reaches the nested SDFG
+(e.g., definitions made by enclosing scopes or by previously-generated nested SDFGs). Workers thus record every access
+to state shared with the rest of the program. A pre-generated body is only used if all values it read match the state
+of the main process, in which case the values it wrote are applied. Otherwise, or if the body used state that cannot
+be tracked (e.g., other code generation targets or instrumentation), the nested SDFG is generated sequentially.
+"""
+import multiprocessing
+import os
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from dace import config, data, dtypes
+from dace.codegen.dispatcher import DefinedType
+from dace.codegen.prettycode import CodeIOStream
+from dace.sdfg import SDFG, SDFGState, nodes
+
+if TYPE_CHECKING:
+    from dace.codegen.targets.cpu import CPUCodeGen
+    from dace.codegen.targets.framecode import DaCeCodeGenerator
+
+#: Schedules of scopes in which nested SDFGs are considered for parallel code generation
+_CPU_SCHEDULES = (dtypes.ScheduleType.Default, dtypes.ScheduleType.Sequential, dtypes.ScheduleType.CPU_Multicore)
+
+#: Code generator and candidate nested SDFGs, inherited by forked worker processes
+_worker_context: Optional[Tuple['DaCeCodeGenerator', 'CPUCodeGen', List[Tuple[SDFG, SDFGState,
+                                                                              nodes.NestedSDFG]]]] = None
+
+
+class _RecordingDict(dict):
+    """
+    A dictionary that records the first value read from every key that was not written before, as well as the keys
+    that were written.
+    """
+
+    def __init__(self, contents: Dict[Any, Any]):
+        super().__init__(contents)
+        self.reads: Dict[Any, Tuple[bool, Any]] = {}
+        self.written: Set[Any] = set()
+        self.iterated = False
+
+    def _record(self, key):
+        if key not in self.written and key not in self.reads:
+            present = dict.__contains__(self, key)
+            self.reads[key] = (present, dict.__getitem__(self, key) if present else None)
+
+    def __contains__(self, key):
+        self._record(key)
+        return super().__contains__(key)
+
+    def __getitem__(self, key):
+        self._record(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self._record(key)
+        return super().get(key, default)
+
+    def __setitem__(self, key, value):
+        self.written.add(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._record(key)
+        self.written.add(key)
+        super().__delitem__(key)
+
+    def __iter__(self):
+        self.iterated = True
+        return super().__iter__()
+
+    def __len__(self):
+        self.iterated = True
+        return super().__len__()
+
+    def keys(self):
+        self.iterated = True
+        return super().keys()
+
+    def values(self):
+        self.iterated = True
+        return super().values()
+
+    def items(self):
+        self.iterated = True
+        return super().items()
+
+    def writes(self) -> Dict[Any, Tuple[bool, Any]]:
+        """ Returns the final state (presence and value) of every written key. """
+        return {k: (dict.__contains__(self, k), dict.get(self, k)) for k in self.written}
+
+
+class _PregeneratedBody:
+    """ The code of a nested SDFG body generated by a worker process, along with the state it read and wrote. """
+
+    def __init__(self, label: str, global_code: str, local_code: str, environments: Set[str], used_cpu: bool,
+                 scalar_state: Tuple, nested_scope: Dict[str, Any], final_nested_scope: Dict[str, Any],
+                 local_vars: Dict[str, Any], final_local_vars: Dict[str, Any], reads: Dict[Tuple[str, int],
+                                                                                           Dict[Any, Tuple[bool, Any]]],
+                 writes: Dict[Tuple[str, int], Dict[Any, Tuple[bool, Any]]], names: Dict[int, Tuple[str, int]]):
+        self.label = label
+        self.global_code = global_code
+        self.local_code = local_code
+        self.environments = environments
+        self.used_cpu = used_cpu
+        self.scalar_state = scalar_state
+        self.nested_scope = nested_scope
+        self.final_nested_scope = final_nested_scope
+        self.local_vars = local_vars
+        self.final_local_vars = final_local_vars
+        self.reads = reads
+        self.writes = writes
+        self.names = names
+
+
+def _scalar_state(frame: 'DaCeCodeGenerator', cpu: 'CPUCodeGen') -> Tuple:
+    """ Code generator state that affects nested SDFG bodies and must match between a worker and the main process. """
+    from dace.codegen.targets.cuda import CUDACodeGen  # Avoid import loop
+    return (frame.in_omp_task_region, cpu.calling_codegen is cpu, cpu._ldepth, cpu._packed_types,
+            CUDACodeGen._in_device_code)
+
+
+def _shared_dicts(frame: 'DaCeCodeGenerator', cpu: 'CPUCodeGen') -> Dict[Tuple[str, int], dict]:
+    """
+    Returns the dictionaries of code generator state that nested SDFG bodies may access and that are shared with the
+    rest of the program, i.e., the two outermost scopes of defined and declared variables and the generated nested
+    SDFG functions.
+    """
+    dispatcher = frame.dispatcher
+    result = {('nested_sdfgs', 0): cpu._generated_nested_sdfg}
+    for i in range(2):
+        result[('defined_vars', i)] = dispatcher.defined_vars._scopes[i][1]
+        result[('declared_arrays', i)] = dispatcher.declared_arrays._scopes[i][1]
+    return result
+
+
+def _sdfg_names(sdfg: SDFG) -> List[Tuple[str, int]]:
+    """
+    Returns the state of the names of all SDFGs in the hierarchy. Names of nested SDFGs are numbered upon first use,
+    which depends on the order in which they are used.
+    """
+    return [(s._name, s._num) for s in sdfg.sdfg_list]
+
+
+def _nested_sdfg_label(sdfg: SDFG, state: SDFGState, node: nodes.NestedSDFG) -> str:
+    unique_functions = config.Config.get('compiler', 'unique_functions')
+    if unique_functions == 'unique_name' and node.unique_name != '':
+        return node.unique_name
+    return '%s_%d_%d_%d' % (node.sdfg.name, sdfg.sdfg_id, sdfg.node_id(state), state.node_id(node))
+
+
+def _generate_body(frame: 'DaCeCodeGenerator', cpu: 'CPUCodeGen', sdfg: SDFG, state: SDFGState,
+                   node: nodes.NestedSDFG) -> Optional[_PregeneratedBody]:
+    """ Generates the body of a nested SDFG in a worker process, emulating the steps of ``CPUCodeGen``. """
+    from dace.codegen.targets import cpp  # Avoid import loop
+
+    dispatcher = frame.dispatcher
+    defined_vars = dispatcher.defined_vars
+    names = _sdfg_names(sdfg)
+    # The name of the nested SDFG is the first one resolved when it is reached
+    label = _nested_sdfg_label(sdfg, state, node)
+    dispatcher._used_targets = set()
+    dispatcher._used_environments = set()
+    cpu._locals.clear_scope(cpu._ldepth + 1)
+    scalar_state = _scalar_state(frame, cpu)
+    local_vars = dict(cpu._locals.locals)
+    struct_length = len(frame.statestruct)
+    init_length, exit_length = len(frame._initcode.getvalue()), len(frame._exitcode.getvalue())
+
+    # Define the data passed to the nested SDFG the same way as allocated data, unless already defined. If the
+    # definitions differ from the ones at the time the nested SDFG is reached, the body will not be used
+    defined_vars.enter_scope(state, can_access_parent=sdfg.parent is None)
+    for edge in state.all_edges(node):
+        if edge.data.data is None:
+            continue
+        desc = sdfg.arrays[edge.data.data]
+        ptrname = cpp.ptr(edge.data.data, desc, sdfg, frame)
+        if not defined_vars.has(ptrname):
+            if isinstance(desc, data.Scalar):
+                defined_vars.add(ptrname, DefinedType.Scalar, desc.dtype.ctype)
+            else:
+                defined_vars.add(ptrname, DefinedType.Pointer, dtypes.pointer(desc.dtype).ctype)
+
+    defined_vars.enter_scope(sdfg, can_access_parent=False)
+    cpu.generate_nsdfg_arguments(sdfg, state, state, node)
+    frame.generate_constants(node.sdfg, CodeIOStream())
+    nested_scope = dict(defined_vars._scopes[-1][1])
+
+    # Record accesses to shared state. Accesses to other enclosing scopes cannot be tracked
+    shared = {k: _RecordingDict(v) for k, v in _shared_dicts(frame, cpu).items()}
+    cpu._generated_nested_sdfg = shared[('nested_sdfgs', 0)]
+    for i in range(2):
+        parent, _, can_access_parent = defined_vars._scopes[i]
+        defined_vars._scopes[i] = (parent, shared[('defined_vars', i)], can_access_parent)
+        parent, _, can_access_parent = dispatcher.declared_arrays._scopes[i]
+        dispatcher.declared_arrays._scopes[i] = (parent, shared[('declared_arrays', i)], can_access_parent)
+    untracked = _RecordingDict(defined_vars._scopes[2][1])
+    defined_vars._scopes[2] = (state, untracked, sdfg.parent is None)
+
+    cpu._toplevel_schedule = node.schedule
+    global_code, local_code, _, _ = frame.generate_code(node.sdfg, node.schedule, label)
+
+    # Check for modifications to state that cannot be transferred to the main process
+    if (untracked.reads or untracked.written or shared[('defined_vars', 1)].reads or shared[('defined_vars', 1)].written
+            or any(d.iterated for d in shared.values())):
+        return None
+    if dispatcher._used_targets - {cpu} or _scalar_state(frame, cpu) != scalar_state:
+        return None
+    if (len(frame.statestruct) != struct_length or len(frame._initcode.getvalue()) != init_length
+            or len(frame._exitcode.getvalue()) != exit_length):
+        return None
+
+    return _PregeneratedBody(label, global_code, local_code, set(dispatcher._used_environments),
+                             cpu in dispatcher._used_targets, scalar_state, nested_scope,
+                             dict(defined_vars._scopes[-1][1]), local_vars, dict(cpu._locals.locals),
+                             {k: d.reads
+                              for k, d in shared.items()}, {k: d.writes()
+                                                            for k, d in shared.items()},
+                             {i: name
+                              for i, name in enumerate(_sdfg_names(sdfg)) if name != names[i]})
+
+
+def _initialize_worker():
+    config.Config.set('progress', value=False)
+    frame, _, _ = _worker_context
+    frame.pregenerated = None
+
+
+def _pregenerate(index: int) -> Optional[_PregeneratedBody]:
+    frame, cpu, candidates = _worker_context
+    sdfg, state, node = candidates[index]
+    try:
+        return _generate_body(frame, cpu, sdfg, state, node)
+    except Exception:
+        # The main process will generate the nested SDFG (and report any errors)
+        return None
+
+
+class PregeneratedNestedSDFGs:
+    """ Nested SDFG bodies generated by worker processes, which the main process may use in place of generating them. """
+
+    def __init__(self, frame: 'DaCeCodeGenerator', cpu: 'CPUCodeGen',
+                 candidates: List[Tuple[SDFG, SDFGState, nodes.NestedSDFG]], workers: int):
+        global _worker_context
+        self._frame = frame
+        self._cpu = cpu
+        self._indices = {node: i for i, (_, _, node) in enumerate(candidates)}
+        self._names = _sdfg_names(candidates[0][0])
+        self._used = 0
+        self._regenerated = 0
+
+        # Fork worker processes, which inherit the current code generator state
+        _worker_context = (frame, cpu, candidates)
+        try:
+            self._pool = multiprocessing.get_context('fork').Pool(workers, initializer=_initialize_worker)
+        finally:
+            _worker_context = None
+        self._results = [self._pool.apply_async(_pregenerate, (i, )) for i in range(len(candidates))]
+
+    def take(self, cpu: 'CPUCodeGen', node: nodes.NestedSDFG, sdfg_label: str) -> Optional[Tuple[str, str, Set[str]]]:
+        """
+        Returns the pre-generated body of a nested SDFG if it matches the current code generator state, applying
+        the changes to the state that generating the body would make. Must be called at the point where the body would
+        otherwise be generated.
+
+        :return: A 3-tuple of the global code, local code, and environments used by the nested SDFG, or None if the
+                 nested SDFG needs to be generated.
+        """
+        index = self._indices.pop(node, None)
+        if index is None:
+            return None
+        try:
+            result: Optional[_PregeneratedBody] = self._results[index].get()
+        except Exception:
+            result = None
+        if result is None or not self._matches(result, cpu, node, sdfg_label):
+            self._regenerated += 1
+            return None
+
+        # Apply changes
+        shared = _shared_dicts(self._frame, cpu)
+        for key, writes in result.writes.items():
+            for name, (present, value) in writes.items():
+                if present:
+                    shared[key][name] = value
+                else:
+                    shared[key].pop(name, None)
+        nested_scope = self._frame.dispatcher.defined_vars._scopes[-1][1]
+        nested_scope.clear()
+        nested_scope.update(result.final_nested_scope)
+        cpu._locals.locals.clear()
+        cpu._locals.locals.update(result.final_local_vars)
+        sdfg_list = node.sdfg.sdfg_list
+        for i, (name, num) in result.names.items():
+            sdfg_list[i]._name = name
+            sdfg_list[i]._num = num
+        if result.used_cpu:
+            self._frame.dispatcher._used_targets.add(cpu)
+
+        # Code generation modifies the control flow of nested SDFGs in-place
+        if config.Config.get_bool('optimizer', 'detect_control_flow'):
+            from dace.transformation import helpers as xfh  # Avoid import loop
+            for nsdfg in node.sdfg.all_sdfgs_recursive():
+                xfh.split_interstate_edges(nsdfg)
+
+        self._used += 1
+        return result.global_code, result.local_code, result.environments
+
+    def _matches(self, result: _PregeneratedBody, cpu: 'CPUCodeGen', node: nodes.NestedSDFG, sdfg_label: str) -> bool:
+        if cpu is not self._cpu or result.label != sdfg_label:
+            return False
+        if _scalar_state(self._frame, cpu) != result.scalar_state:
+            return False
+        if self._frame.dispatcher.defined_vars._scopes[-1][1] != result.nested_scope:
+            return False
+        if cpu._locals.locals != result.local_vars:
+            return False
+        # SDFG names used in the body must be the same as if it was generated now. As names are numbered in order of
+        # first use, the names of SDFGs that share their original name with the ones named in the body must not have
+        # changed since the body was generated, except for the nested SDFG itself, which was named first
+        sdfg_list = node.sdfg.sdfg_list
+        renamed = set(sdfg_list[i]._orig_name for i in result.names)
+        for i, (sdfg, name) in enumerate(zip(sdfg_list, self._names)):
+            if sdfg._orig_name not in renamed:
+                continue
+            if sdfg is node.sdfg and i in result.names:
+                name = result.names[i]
+            if (sdfg._name, sdfg._num) != name:
+                return False
+        shared = _shared_dicts(self._frame, cpu)
+        for key, reads in result.reads.items():
+            for name, (present, value) in reads.items():
+                if (name in shared[key]) != present or (present and shared[key][name] != value):
+                    return False
+        return True
+
+    def statistics(self) -> Dict[str, int]:
+        return {
+            'nested SDFGs generated in parallel': self._used,
+            'nested SDFGs regenerated sequentially': self._regenerated,
+        }
+
+    def close(self):
+        """ Stops the worker processes. """
+        self._pool.terminate()
+        self._pool.join()
+
+
+def _candidates(frame: 'DaCeCodeGenerator', sdfg: SDFG) -> List[Tuple[SDFG, SDFGState, nodes.NestedSDFG]]:
+    """ Returns the nested SDFGs directly contained in the given SDFG that can be generated ahead of time. """
+    from dace.codegen.targets.cpu import CPUCodeGen  # Avoid import loop
+
+    result = []
+    for state in sdfg.nodes():
+        sdict = None
+        for node in state.nodes():
+            if not isinstance(node, nodes.NestedSDFG):
+                continue
+            if not isinstance(frame.dispatcher.get_node_dispatcher(sdfg, state, node), CPUCodeGen):
+                continue
+            sdict = sdict or state.scope_dict()
+            scope = sdict[node]
+            while scope is not None and scope.schedule in _CPU_SCHEDULES:
+                scope = sdict[scope]
+            if scope is None and node.schedule in _CPU_SCHEDULES:
+                result.append((sdfg, state, node))
+    return result
+
+
+def pregenerate_nested_sdfgs(frame: 'DaCeCodeGenerator', sdfg: SDFG) -> Optional[PregeneratedNestedSDFGs]:
+    """
+    Starts generating the code of the nested SDFGs in the given (top-level) SDFG in parallel, if enabled in
+    ``compiler.codegen_workers``.
+
+    :param frame: The frame code generator, at the point where the states of the SDFG are about to be generated.
+    :param sdfg: The top-level SDFG.
+    :return: The pre-generated nested SDFGs, or None if parallel code generation is disabled or not applicable.
+    """
+    workers = config.Config.get('compiler', 'codegen_workers')
+    if workers < 0:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+    if config.Config.get_bool('compiler', 'inline_sdfgs'):
+        return None
+    # Instrumentation providers keep state that cannot be transferred between processes
+    if any(provider is not None for provider in frame.dispatcher.instrumentation.values()):
+        return None
+
+    # Structural hashes are computed once for the whole SDFG hierarchy, before forking, so that workers share them
+    frame.structural_hash(sdfg)
+
+    candidates = _candidates(frame, sdfg)
+    # If there are too few nested SDFGs to generate in parallel, generate the largest one's nested SDFGs instead
+    while 0 < len(candidates) < workers:
+        largest = max(candidates, key=lambda c: len(list(c[2].sdfg.all_sdfgs_recursive())))
+        inner = _candidates(frame, largest[2].sdfg)
+        if not inner:
+            break
+        index = candidates.index(largest)
+        candidates[index:index + 1] = inner
+    # Structurally equivalent nested SDFGs usually share one function (see ``compiler.unique_functions``), which only
+    # needs to be generated once
+    if config.Config.get('compiler', 'unique_functions') in (True, 'hash'):
+        hashes = set()
+        unique_candidates = []
+        for candidate in candidates:
+            if frame.structural_hash(candidate[2].sdfg) not in hashes:
+                hashes.add(frame.structural_hash(candidate[2].sdfg))
+                unique_candidates.append(candidate)
+        candidates = unique_candidates
+    if len(candidates) < 2:
+        return None
+
+    cpus = set(frame.dispatcher.get_node_dispatcher(*c) for c in candidates)
+    if len(cpus) != 1:
+        return None
+
+    return PregeneratedNestedSDFGs(frame, next(iter(cpus)), candidates, min(workers, len(candidates)))
@@ -567,13 +567,18 @@ def cpp_array_expr(sdfg,
         return offset_cppstr
 
 
-def make_ptr_vector_cast(dst_expr, dst_dtype, src_dtype, is_scalar, defined_type):
+def make_ptr_vector_cast(dst_expr, dst_dtype, src_dtype, is_scalar, defined_type, unaligned=False):
     """
     If there is a type mismatch, cast pointer type. Used mostly in vector types.
+
+    :param unaligned: If True, vector values are accessed through their
+                      unaligned type, which does not assume that the
+                      pointer is aligned to the vector size.
     """
     if src_dtype != dst_dtype:
         if is_scalar:
-            dst_expr = '*(%s *)(&%s)' % (src_dtype.ctype, dst_expr)
+            ctype = src_dtype.ctype_unaligned if unaligned else src_dtype.ctype
+            dst_expr = '*(%s *)(&%s)' % (ctype, dst_expr)
         elif src_dtype.base_type != dst_dtype:
             dst_expr = '(%s)(&%s)' % (src_dtype.ctype, dst_expr)
         elif defined_type in [DefinedType.Pointer, DefinedType.ArrayInterface]:
@@ -7,7 +7,7 @@ import warnings
 
 from sympy.functions.elementary.complexes import arg
 
-from dace import data, dtypes, registry, memlet as mmlt, sdfg as sd, subsets, symbolic, Config
+from dace import data, dtypes, registry, memlet as mmlt, serialize, sdfg as sd, subsets, symbolic, Config
 from dace.codegen import cppunparse, exceptions as cgx
 from dace.codegen.prettycode import CodeIOStream
 from dace.codegen.targets import cpp
@@ -19,7 +19,7 @@ from dace.sdfg import nodes, utils as sdutils
 from dace.sdfg import (ScopeSubgraphView, SDFG, scope_contains_scope, is_array_stream_view, NodeNotExpandedError,
                        dynamic_map_inputs, local_transients)
 from dace.sdfg.scope import is_devicelevel_gpu, is_devicelevel_fpga
-from typing import Union
+from typing import List, Tuple, Union
 from dace.codegen.targets import fpga
 
 
@@ -519,6 +519,122 @@ class CPUCodeGen(TargetCodeGenerator):
             callsite_stream,
         )
 
+    def _copy_templates(self, sdfg, ctype, copy_shape, src_strides, dst_strides):
+        """
+        Returns the template arguments of a ``dace::CopyND`` copy.
+
+        :return: A 3-tuple of (copy template, shape template, variable
+                 argument part of the copy arguments).
+        """
+        # Which numbers to include in the variable argument part
+        dynshape, dynsrc, dyndst = 1, 1, 1
+
+        # Dynamic copy dimensions
+        if any(symbolic.issymbolic(s, sdfg.constants) for s in copy_shape):
+            copy_tmpl = "Dynamic<{type}, {veclen}, {aligned}, {dims}>".format(
+                type=ctype,
+                veclen=1,  # Taken care of in "type"
+                aligned="false",
+                dims=len(copy_shape),
+            )
+        else:  # Static copy dimensions
+            copy_tmpl = "<{type}, {veclen}, {aligned}, {dims}>".format(
+                type=ctype,
+                veclen=1,  # Taken care of in "type"
+                aligned="false",
+                dims=", ".join(cpp.sym2cpp(copy_shape)),
+            )
+            dynshape = 0
+
+        # Constant src/dst dimensions
+        if not any(symbolic.issymbolic(s, sdfg.constants) for s in dst_strides):
+            # Constant destination
+            shape_tmpl = "template ConstDst<%s>" % ", ".join(cpp.sym2cpp(dst_strides))
+            dyndst = 0
+        elif not any(symbolic.issymbolic(s, sdfg.constants) for s in src_strides):
+            # Constant source
+            shape_tmpl = "template ConstSrc<%s>" % ", ".join(cpp.sym2cpp(src_strides))
+            dynsrc = 0
+        else:
+            # Both dynamic
+            shape_tmpl = "Dynamic"
+
+        # Parameter pack handling
+        stride_tmpl_args = [0] * (dynshape + dynsrc + dyndst) * len(copy_shape)
+        j = 0
+        for shape, src, dst in zip(copy_shape, src_strides, dst_strides):
+            if dynshape > 0:
+                stride_tmpl_args[j] = shape
+                j += 1
+            if dynsrc > 0:
+                stride_tmpl_args[j] = src
+                j += 1
+            if dyndst > 0:
+                stride_tmpl_args[j] = dst
+                j += 1
+
+        return copy_tmpl, shape_tmpl, stride_tmpl_args
+
+    def _emit_large_copy(self, sdfg: SDFG, state_id: int, state_dfg: SDFGState, src_node: nodes.AccessNode,
+                         dst_node: nodes.AccessNode, dtype: dtypes.typeclass, copy_shape, src_strides, dst_strides,
+                         src_expr: str, dst_expr: str, stream: CodeIOStream) -> bool:
+        """
+        Emits a copy between large CPU arrays outside of scopes, which is split
+        across OpenMP threads if it is larger than ``compiler.cpu.parallel_copy_bytes``.
+        Contiguous copies use ``dace::LargeCopy``, which also uses non-temporal
+        stores above ``compiler.cpu.nontemporal_copy_bytes``. Strided copies are
+        parallelized over their outermost dimension. The size thresholds are
+        checked at runtime if the copy shape is symbolic.
+
+        :return: True if the copy was emitted, or False if it should be emitted
+                 as a regular copy.
+        """
+        parallel_bytes = Config.get('compiler', 'cpu', 'parallel_copy_bytes')
+        nontemporal_bytes = Config.get('compiler', 'cpu', 'nontemporal_copy_bytes')
+
+        # Thread-local and register storage cannot be accessed from other threads
+        large_copy_storage = (dtypes.StorageType.CPU_Heap, dtypes.StorageType.CPU_Pinned)
+        if (src_node.desc(sdfg).storage not in large_copy_storage
+                or dst_node.desc(sdfg).storage not in large_copy_storage):
+            return False
+
+        # Copies inside scopes (e.g., parallel maps) are not parallelized
+        if state_dfg.entry_node(src_node) is not None or state_dfg.entry_node(dst_node) is not None:
+            return False
+
+        copy_bytes = functools.reduce(lambda a, b: a * b, copy_shape, 1) * dtype.bytes
+        contiguous = len(copy_shape) == 1 and src_strides[0] == 1 and dst_strides[0] == 1
+        thresholds = [t for t in ([parallel_bytes, nontemporal_bytes] if contiguous else [parallel_bytes]) if t > 0]
+        if not thresholds:
+            return False
+        if (not symbolic.issymbolic(copy_bytes, sdfg.constants)
+                and symbolic.evaluate(copy_bytes, sdfg.constants) < min(thresholds)):
+            return False
+
+        if contiguous:
+            stream.write(
+                f'dace::LargeCopy({src_expr}, {dst_expr}, {cpp.sym2cpp(copy_shape[0])}, {parallel_bytes}, '
+                f'{nontemporal_bytes});', sdfg, state_id, [src_node, dst_node])
+            return True
+
+        src_offset = f'__copy_i * {cpp.sym2cpp(src_strides[0])}'
+        dst_offset = f'__copy_i * {cpp.sym2cpp(dst_strides[0])}'
+        if len(copy_shape) == 1:
+            copy = f'({dst_expr})[{dst_offset}] = ({src_expr})[{src_offset}];'
+        else:
+            copy_tmpl, shape_tmpl, stride_tmpl_args = self._copy_templates(sdfg, dtype.ctype, copy_shape[1:],
+                                                                           src_strides[1:], dst_strides[1:])
+            copy_args = [f'({src_expr}) + {src_offset}', f'({dst_expr}) + {dst_offset}'] + cpp.sym2cpp(stride_tmpl_args)
+            copy = f'dace::CopyND{copy_tmpl}::{shape_tmpl}::Copy({", ".join(copy_args)});'
+
+        stream.write(
+            f"""
+            #pragma omp parallel for if(!omp_in_parallel() && {cpp.sym2cpp(copy_bytes)} >= {parallel_bytes})
+            for (int64_t __copy_i = 0; __copy_i < {cpp.sym2cpp(copy_shape[0])}; ++__copy_i) {{
+                {copy}
+            }}""", sdfg, state_id, [src_node, dst_node])
+        return True
+
     def _emit_copy(
         self,
         sdfg,
@@ -677,52 +793,9 @@ class CPUCodeGen(TargetCodeGenerator):
                     self._dispatcher, sdfg, state_dfg, edge, src_node, dst_node,
                     self._packed_types)
 
-            # Which numbers to include in the variable argument part
-            dynshape, dynsrc, dyndst = 1, 1, 1
-
-            # Dynamic copy dimensions
-            if any(symbolic.issymbolic(s, sdfg.constants) for s in copy_shape):
-                copy_tmpl = "Dynamic<{type}, {veclen}, {aligned}, {dims}>".format(
-                    type=ctype,
-                    veclen=1,  # Taken care of in "type"
-                    aligned="false",
-                    dims=len(copy_shape),
-                )
-            else:  # Static copy dimensions
-                copy_tmpl = "<{type}, {veclen}, {aligned}, {dims}>".format(
-                    type=ctype,
-                    veclen=1,  # Taken care of in "type"
-                    aligned="false",
-                    dims=", ".join(cpp.sym2cpp(copy_shape)),
-                )
-                dynshape = 0
-
-            # Constant src/dst dimensions
-            if not any(symbolic.issymbolic(s, sdfg.constants) for s in dst_strides):
-                # Constant destination
-                shape_tmpl = "template ConstDst<%s>" % ", ".join(cpp.sym2cpp(dst_strides))
-                dyndst = 0
-            elif not any(symbolic.issymbolic(s, sdfg.constants) for s in src_strides):
-                # Constant source
-                shape_tmpl = "template ConstSrc<%s>" % ", ".join(cpp.sym2cpp(src_strides))
-                dynsrc = 0
-            else:
-                # Both dynamic
-                shape_tmpl = "Dynamic"
-
-            # Parameter pack handling
-            stride_tmpl_args = [0] * (dynshape + dynsrc + dyndst) * len(copy_shape)
-            j = 0
-            for shape, src, dst in zip(copy_shape, src_strides, dst_strides):
-                if dynshape > 0:
-                    stride_tmpl_args[j] = shape
-                    j += 1
-                if dynsrc > 0:
-                    stride_tmpl_args[j] = src
-                    j += 1
-                if dyndst > 0:
-                    stride_tmpl_args[j] = dst
-                    j += 1
+            copy_tmpl, shape_tmpl, stride_tmpl_args = self._copy_templates(sdfg, ctype, copy_shape, src_strides,
+                                                                           dst_strides)
+            dynshape = any(symbolic.issymbolic(s, sdfg.constants) for s in copy_shape)
 
             copy_args = ([src_expr, dst_expr] +
                          ([] if memlet.wcr is None else [cpp.unparse_cr(sdfg, memlet.wcr, dst_nodedesc.dtype)]) +
@@ -737,7 +810,11 @@ class CPUCodeGen(TargetCodeGenerator):
             nc = True
             if memlet.wcr is not None:
                 nc = not cpp.is_write_conflicted(dfg, edge, sdfg_schedule=self._toplevel_schedule)
-            if nc:
+            if memlet.wcr is None and self._emit_large_copy(sdfg, state_id, state_dfg, src_node, dst_node,
+                                                            dst_nodedesc.dtype, copy_shape, src_strides, dst_strides,
+                                                            src_expr, dst_expr, stream):
+                pass
+            elif nc:
                 stream.write(
                     """
                     dace::CopyND{copy_tmpl}::{shape_tmpl}::{copy_func}(
@@ -752,7 +829,7 @@ class CPUCodeGen(TargetCodeGenerator):
                     [src_node, dst_node],
                 )
             else:  # Conflicted WCR
-                if dynshape == 1:
+                if dynshape:
                     warnings.warn('Performance warning: Emitting dynamically-'
                                   'shaped atomic write-conflict resolution of an array.')
                     stream.write(
@@ -1509,6 +1586,29 @@ class CPUCodeGen(TargetCodeGenerator):
                                               conntype=node.out_connectors[uconn]))
         return memlet_references
 
+    def _nested_sdfg_key(self, sdfg: SDFG, node: nodes.NestedSDFG, memlet_references: List[Tuple[str, str, str]],
+                         codegen: TargetCodeGenerator) -> Tuple:
+        """
+        Returns a key that identifies the generated function of a nested SDFG. Nested SDFGs that only differ in names
+        (see ``dace.sdfg.utils.structural_hashes``) and are called with the same argument types in the same context
+        share a key, and thus a single function.
+        """
+        positions = sdutils.argument_positions(node.sdfg)
+        key = (self._frame.structural_hash(node.sdfg),
+               tuple((atype, positions.get(aname, aname)) for atype, aname, _ in memlet_references),
+               tuple(sorted(aname for aname in node.symbol_mapping.keys() if aname not in sdfg.constants)),
+               tuple(sorted(self._frame.symbols_and_constants(node.sdfg))), node.schedule, codegen is self)
+
+        # Constants may be added during code generation (e.g., by unrolled maps), which structural hashes do not include
+        key += tuple(serialize.dumps(nsdfg.constants_prop) for nsdfg in node.sdfg.all_sdfgs_recursive())
+
+        # Transients that are allocated outside of the function are specific to each nested SDFG
+        if any(desc.transient and desc.lifetime in (dtypes.AllocationLifetime.Global,
+                                                    dtypes.AllocationLifetime.Persistent)
+               for nsdfg in node.sdfg.all_sdfgs_recursive() for desc in nsdfg.arrays.values()):
+            key += (node.sdfg.sdfg_id, )
+        return key
+
     def _generate_NestedSDFG(
         self,
         sdfg,
@@ -1561,12 +1661,18 @@ class CPUCodeGen(TargetCodeGenerator):
         else:
             sdfg_label = "%s_%d_%d_%d" % (node.sdfg.name, sdfg.sdfg_id, state_id, dfg.node_id(node))
 
+        #########################################
+        # Take care of nested SDFG I/O (arguments)
+        # Arguments are input connectors, output connectors, and symbols
+        codegen = self.calling_codegen
+        memlet_references = codegen.generate_nsdfg_arguments(sdfg, dfg, state_dfg, node)
+
         code_already_generated = False
         if unique_functions and not inline:
-            hash = node.sdfg.hash_sdfg()
             if unique_functions_hash:
                 # Use hashing to check whether this Nested SDFG has been already generated. If that is the case,
                 # use the saved name to call it, otherwise save the hash and the associated name
+                hash = self._nested_sdfg_key(sdfg, node, memlet_references, codegen)
                 if hash in self._generated_nested_sdfg:
                     code_already_generated = True
                     sdfg_label = self._generated_nested_sdfg[hash]
@@ -1576,6 +1682,7 @@ class CPUCodeGen(TargetCodeGenerator):
                 # Use the SDFG label to check if this has been already code generated.
                 # Check the hash of the formerly generated SDFG to check that we are not
                 # generating different SDFGs with the same name
+                hash = self._frame.structural_hash(node.sdfg)
                 if sdfg_label in self._generated_nested_sdfg:
                     code_already_generated = True
                     if hash != self._generated_nested_sdfg[sdfg_label]:
@@ -1583,12 +1690,6 @@ class CPUCodeGen(TargetCodeGenerator):
                 else:
                     self._generated_nested_sdfg[sdfg_label] = hash
 
-        #########################################
-        # Take care of nested SDFG I/O (arguments)
-        # Arguments are input connectors, output connectors, and symbols
-        codegen = self.calling_codegen
-        memlet_references = codegen.generate_nsdfg_arguments(sdfg, dfg, state_dfg, node)
-
         if not inline and (not unique_functions or not code_already_generated):
             nested_stream.write(
                 ('inline ' if codegen is self else '') +
@@ -1632,9 +1733,15 @@ class CPUCodeGen(TargetCodeGenerator):
             old_schedule = self._toplevel_schedule
             self._toplevel_schedule = node.schedule
 
-            # Generate code for internal SDFG
-            global_code, local_code, used_targets, used_environments = self._frame.generate_code(
-                node.sdfg, node.schedule, sdfg_label)
+            # Generate code for internal SDFG, unless it was already generated in parallel
+            pregenerated = None
+            if self._frame.pregenerated is not None and not inline:
+                pregenerated = self._frame.pregenerated.take(self, node, sdfg_label)
+            if pregenerated is not None:
+                global_code, local_code, used_environments = pregenerated
+            else:
+                global_code, local_code, used_targets, used_environments = self._frame.generate_code(
+                    node.sdfg, node.schedule, sdfg_label)
             self._dispatcher._used_environments |= used_environments
 
             self._toplevel_schedule = old_schedule
@@ -1707,7 +1814,15 @@ class CPUCodeGen(TargetCodeGenerator):
 
         # TODO: Refactor to generate_scope_preamble once a general code
         #  generator (that CPU inherits from) is implemented
-        if node.map.schedule == dtypes.ScheduleType.CPU_Multicore:
+        if node.map.schedule == dtypes.ScheduleType.CPU_Multicore and self._frame.in_omp_task_region:
+            # Within a task region, a parallel loop would only run on the thread executing the task
+            map_header += "#pragma omp taskloop"
+            if node.map.omp_chunk_size > 0:
+                map_header += f" grainsize({node.map.omp_chunk_size})"
+            if node.map.collapse > 1:
+                map_header += ' collapse(%d)' % node.map.collapse
+            map_header += "\n"
+        elif node.map.schedule == dtypes.ScheduleType.CPU_Multicore:
             map_header += "#pragma omp parallel for"
             if node.map.omp_schedule != dtypes.OMPScheduleType.Default:
                 schedule = " schedule("
@@ -2098,4 +2213,7 @@ class CPUCodeGen(TargetCodeGenerator):
         pass
 
     def make_ptr_vector_cast(self, *args, **kwargs):
+        # Vector accesses on the host cannot assume that the base pointer
+        # (e.g., a NumPy array or an offset into one) is vector-aligned
+        kwargs.setdefault('unaligned', True)
         return cpp.make_ptr_vector_cast(*args, **kwargs)
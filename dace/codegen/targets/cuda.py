@@ -7,7 +7,6 @@ import os
 import warnings
 from typing import Any, Dict, List, Set, Tuple, Union
 
-import networkx as nx
 import sympy
 from six import StringIO
 
@@ -248,7 +247,7 @@ class CUDACodeGen(TargetCodeGenerator):
                     ans = [an for an in anodes if an.data == aname]
                     terminator = None
                     for an1 in ans:
-                        if all(nx.has_path(state.nx, an2, an1) for an2 in ans if an2 is not an1):
+                        if all(state.has_path(an2, an1) for an2 in ans if an2 is not an1):
                             terminator = an1
                             break
 
@@ -14,7 +14,9 @@ from dace.cli import progress
 from dace.codegen import control_flow as cflow
 from dace.codegen import dispatcher as disp
 from dace.codegen.prettycode import CodeIOStream
-from dace.codegen.common import codeblock_to_cpp, sym2cpp, unparse_interstate_edge
+from dace.codegen import parallel
+from dace.codegen.common import CodegenTimer, codeblock_to_cpp, sym2cpp, unparse_interstate_edge
+from dace.codegen.targets import cpp
 from dace.codegen.targets.target import TargetCodeGenerator
 from dace.frontend.python import wrappers
 from dace.sdfg import SDFG, ScopeSubgraphView, SDFGState, nodes
@@ -34,8 +36,11 @@ class DaCeCodeGenerator(object):
         state machines, and uses a dispatcher to generate code for
         individual states based on the target. """
 
-    def __init__(self, sdfg: SDFG):
+    def __init__(self, sdfg: SDFG, timer: Optional[CodegenTimer] = None):
         self._dispatcher = disp.TargetDispatcher(self)
+        self.timer = timer or CodegenTimer()
+        # Nested SDFG code generated ahead of time by worker processes (see ``dace.codegen.parallel``)
+        self.pregenerated: Optional[parallel.PregeneratedNestedSDFGs] = None
         self._dispatcher.register_state_dispatcher(self)
         self._initcode = CodeIOStream()
         self._exitcode = CodeIOStream()
@@ -46,7 +51,11 @@ class DaCeCodeGenerator(object):
                                       List[Tuple[int, int, nodes.AccessNode]]] = collections.defaultdict(list)
         self.where_allocated: Dict[Tuple[SDFG, str], SDFG] = {}
         self.fsyms: Dict[int, Set[str]] = {}
+        # True while generating code that runs within an OpenMP task region
+        self.in_omp_task_region = False
+        self._omp_tasks: Dict[SDFGState, List[Tuple[ScopeSubgraphView, Set[str], Set[str]]]] = {}
         self._symbols_and_constants: Dict[int, Set[str]] = {}
+        self._structural_hashes: Optional[Dict[int, str]] = None
         fsyms = self.free_symbols(sdfg)
         self.arglist = sdfg.arglist(scalars_only=False, free_symbols=fsyms)
 
@@ -78,6 +87,15 @@ class DaCeCodeGenerator(object):
     def symbols_and_constants(self, sdfg: SDFG):
         return self._symbols_and_constants[sdfg.sdfg_id]
 
+    def structural_hash(self, sdfg: SDFG) -> str:
+        """
+        Returns the structural hash of an SDFG in the hierarchy (see ``dace.sdfg.utils.structural_hashes``). The hashes
+        of all SDFGs are computed together upon first use, before any nested SDFG code is generated.
+        """
+        if self._structural_hashes is None:
+            self._structural_hashes = utils.structural_hashes(sdfg.sdfg_list[0])
+        return self._structural_hashes[sdfg.sdfg_id]
+
     def free_symbols(self, obj: Any):
         k = id(obj)
         if k in self.fsyms:
@@ -374,19 +392,134 @@ DACE_EXPORTED void __dace_exit_{sdfg.name}({sdfg.name}_t *__state)
                 if instr is not None:
                     instr.on_state_end(sdfg, state, callsite_stream, global_stream)
 
+    def _omp_task_subgraphs(self, sdfg: SDFG,
+                            state: SDFGState) -> Optional[List[Tuple[ScopeSubgraphView, Set[str], Set[str]]]]:
+        """ Splits a state into OpenMP tasks along with the data containers each task reads and writes, or returns
+            None if the state cannot run as tasks. """
+        if (self._dispatcher.get_state_dispatcher(sdfg, state) is not self
+                or state.instrument != dtypes.InstrumentationType.No_Instrumentation):
+            return None
+
+        # Only CPU code without streams, views, or nested parallel regions
+        for node, parent in state.all_nodes_recursive():
+            if isinstance(node, nodes.EntryNode):
+                if node.schedule == dtypes.ScheduleType.CPU_Multicore:
+                    if parent is not state:
+                        return None
+                elif node.schedule != dtypes.ScheduleType.Sequential:
+                    return None
+            elif isinstance(node, nodes.LibraryNode):
+                return None
+            elif isinstance(node, nodes.Tasklet) and node.has_side_effects(parent.parent):
+                return None
+            elif isinstance(node, nodes.AccessNode):
+                desc = node.desc(parent.parent)
+                if (type(desc) not in (data.Scalar, data.Array) or desc.storage
+                        not in (dtypes.StorageType.Default, dtypes.StorageType.CPU_Heap, dtypes.StorageType.Register)):
+                    return None
+
+        subgraphs = utils.dataflow_tasks(state)
+        if subgraphs is None:
+            return None
+        sdict = state.scope_dict()
+        result = []
+        for subgraph in subgraphs:
+            reads, writes = set(), set()
+            for e in subgraph.edges():
+                if isinstance(e.src, nodes.AccessNode) and sdict[e.src] is None:
+                    reads.add(e.src.data)
+                if isinstance(e.dst, nodes.AccessNode) and sdict[e.dst] is None:
+                    writes.add(e.dst.data)
+            result.append((subgraph, reads, writes))
+        return result
+
+    def _plan_omp_task_regions(self, sdfg: SDFG) -> Dict[SDFGState, List[SDFGState]]:
+        """ Finds the states whose dataflow is generated as OpenMP tasks, grouped into task regions. Consecutive
+            states that always execute one after another (i.e., connected by a single unconditional edge without
+            assignments) share a region, such that their tasks may overlap across the state boundary.
+
+            :return: A dictionary mapping the first state of every task region to the states in the region.
+        """
+        if not sdfg.openmp_tasks or self.in_omp_task_region:
+            return {}
+        # A nested SDFG within a scope would open a parallel region in every iteration
+        parent = sdfg
+        while parent.parent_nsdfg_node is not None:
+            if parent.parent.entry_node(parent.parent_nsdfg_node) is not None:
+                return {}
+            parent = parent.parent_sdfg
+
+        tasks = {}
+        for state in sdfg.nodes():
+            subgraphs = self._omp_task_subgraphs(sdfg, state)
+            if subgraphs is not None:
+                tasks[state] = subgraphs
+
+        successor: Dict[SDFGState, SDFGState] = {}
+        for state in tasks:
+            out_edges = sdfg.out_edges(state)
+            if len(out_edges) != 1:
+                continue
+            e = out_edges[0]
+            if (e.dst in tasks and e.dst is not state and e.dst is not sdfg.start_state and sdfg.in_degree(e.dst) == 1
+                    and e.data.is_unconditional() and not e.data.assignments):
+                successor[state] = e.dst
+
+        regions = {}
+        followers = set(successor.values())
+        for state in sdfg.nodes():
+            if state not in tasks or state in followers:
+                continue
+            region = [state]
+            while region[-1] in successor:
+                region.append(successor[region[-1]])
+            # Only generate tasks if they can run concurrently
+            if sum(len(tasks[s]) for s in region) > 1:
+                regions[state] = region
+                self._omp_tasks.update({s: tasks[s] for s in region})
+        return regions
+
+    def generate_omp_task_region(self, sdfg: SDFG, states: List[SDFGState], global_stream: CodeIOStream,
+                                 callsite_stream: CodeIOStream):
+        """ Generates the dataflow of one or more consecutive states as OpenMP tasks within a single parallel
+            region. Tasks depend on each other through the data containers they read and write. """
+        for state in states:
+            self.allocate_arrays_in_scope(sdfg, state, global_stream, callsite_stream)
+
+        callsite_stream.write('\n')
+
+        for state in states:
+            for instr in self._dispatcher.instrumentation.values():
+                if instr is not None:
+                    instr.on_state_begin(sdfg, state, callsite_stream, global_stream)
+
+        callsite_stream.write('#pragma omp parallel\n{\n#pragma omp single\n{', sdfg)
+        self.in_omp_task_region = True
+        for state in states:
+            sid = sdfg.node_id(state)
+            for subgraph, reads, writes in self._omp_tasks[state]:
+                depend = ''
+                for kind, names in (('in', reads - writes), ('out', writes - reads), ('inout', reads & writes)):
+                    names = sorted(name for name in names if name not in sdfg.constants_prop)
+                    if names:
+                        depend += f' depend({kind}: {", ".join(cpp.ptr(n, sdfg.arrays[n], sdfg, self) for n in names)})'
+                callsite_stream.write(f'#pragma omp task{depend}\n{{', sdfg, sid)
+                self._dispatcher.dispatch_subgraph(sdfg, subgraph, sid, global_stream, callsite_stream)
+                callsite_stream.write('} // End omp task', sdfg, sid)
+        self.in_omp_task_region = False
+        callsite_stream.write('} // End omp single\n} // End omp parallel', sdfg)
+
+        for state in states:
+            self.deallocate_arrays_in_scope(sdfg, state, global_stream, callsite_stream)
+            for instr in self._dispatcher.instrumentation.values():
+                if instr is not None:
+                    instr.on_state_end(sdfg, state, callsite_stream, global_stream)
+
     def generate_states(self, sdfg, global_stream, callsite_stream):
         states_generated = set()
 
         opbar = progress.OptionalProgressBar(sdfg.number_of_nodes(), title=f'Generating code (SDFG {sdfg.sdfg_id})')
 
-        # Create closure + function for state dispatcher
-        def dispatch_state(state: SDFGState) -> str:
-            stream = CodeIOStream()
-            self._dispatcher.dispatch_state(sdfg, state, global_stream, stream)
-            opbar.next()
-            states_generated.add(state)  # For sanity check
-            return stream.getvalue()
-
         # Handle specialized control flow
         if config.Config.get_bool('optimizer', 'detect_control_flow'):
             # Avoid import loop
@@ -396,6 +529,25 @@ DACE_EXPORTED void __dace_exit_{sdfg.name}({sdfg.name}_t *__state)
             # edges.
             xfh.split_interstate_edges(sdfg)
 
+        # States in task regions are generated along with the first state of their region
+        task_regions = self._plan_omp_task_regions(sdfg)
+        task_states = set(s for region in task_regions.values() for s in region)
+
+        # Create closure + function for state dispatcher
+        def dispatch_state(state: SDFGState) -> str:
+            stream = CodeIOStream()
+            if state in task_regions:
+                self._dispatcher.defined_vars.enter_scope(state)
+                self.generate_omp_task_region(sdfg, task_regions[state], global_stream, stream)
+                self._dispatcher.defined_vars.exit_scope(state)
+            elif state not in task_states:
+                self._dispatcher.dispatch_state(sdfg, state, global_stream, stream)
+            opbar.next()
+            states_generated.add(state)  # For sanity check
+            return stream.getvalue()
+
+        # Handle specialized control flow
+        if config.Config.get_bool('optimizer', 'detect_control_flow'):
             cft = cflow.structured_control_flow_tree(sdfg, dispatch_state)
         else:
             # If disabled, generate entire graph as general control flow block
@@ -769,7 +921,8 @@ DACE_EXPORTED void __dace_exit_{sdfg.name}({sdfg.name}_t *__state)
 
         # Analyze allocation lifetime of SDFG and all nested SDFGs
         if is_top_level:
-            self.determine_allocation_lifetime(sdfg)
+            with self.timer.phase('allocation lifetime'):
+                self.determine_allocation_lifetime(sdfg)
 
         # Generate code
         ###########################
@@ -825,10 +978,22 @@ DACE_EXPORTED void __dace_exit_{sdfg.name}({sdfg.name}_t *__state)
 
         callsite_stream.write('\n', sdfg)
 
+        # Generate the code of nested SDFGs in parallel ahead of time. This happens after the outermost SDFG's
+        # variables are defined, as nested SDFG code may depend on them
+        if is_top_level:
+            with self.timer.phase('nested SDFG pre-generation'):
+                self.pregenerated = parallel.pregenerate_nested_sdfgs(self, sdfg)
+
         #######################################################################
         # Generate actual program body
 
-        states_generated = self.generate_states(sdfg, global_stream, callsite_stream)
+        try:
+            states_generated = self.generate_states(sdfg, global_stream, callsite_stream)
+        finally:
+            if is_top_level and self.pregenerated is not None:
+                self.pregenerated.close()
+                self.timer.counters.update(self.pregenerated.statistics())
+                self.pregenerated = None
 
         #######################################################################
 
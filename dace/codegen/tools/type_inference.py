@@ -60,9 +60,9 @@ def infer_expr_type(code, symbols=None):
     if isinstance(code, (str, float, int, complex)):
         parsed_ast = ast.parse(str(code))
     elif isinstance(code, sympy.Basic):
-        parsed_ast = ast.parse(sympy.printing.pycode(code))
+        parsed_ast = ast.parse(_pycode(code))
     elif isinstance(code, SymExpr):
-        parsed_ast = ast.parse(sympy.printing.pycode(code.expr))
+        parsed_ast = ast.parse(_pycode(code.expr))
     else:
         raise TypeError(f"Cannot convert type {type(code)} to a Python AST.")
 
@@ -73,6 +73,12 @@ def infer_expr_type(code, symbols=None):
         raise TypeError("Expected expression, got: {}".format(type(code)))
 
 
+@symbolic.memoize(maxsize=16384)
+def _pycode(expr: sympy.Basic) -> str:
+    """ Returns the Python code of a symbolic expression. """
+    return sympy.printing.pycode(expr)
+
+
 def _dispatch(tree, symbols, inferred_symbols):
     """Dispatcher function, dispatching tree type T to method _T."""
     try:
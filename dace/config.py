@@ -7,6 +7,9 @@ from typing import Any, Dict
 import yaml
 import warnings
 
+# Use the faster LibYAML-based loader if available
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 @contextlib.contextmanager
 def set_temporary(*path, value):
@@ -169,7 +172,7 @@ class Config(object):
 
         # Read configuration file
         with open(filename, 'r') as f:
-            Config._config = yaml.load(f.read(), Loader=yaml.SafeLoader)
+            Config._config = yaml.load(f.read(), Loader=_YamlLoader)
 
         if Config._config is None:
             Config._config = {}
@@ -188,7 +191,7 @@ class Config(object):
         if filename is None:
             filename = Config._metadata_filename
         with open(filename, 'r') as f:
-            Config._config_metadata = yaml.load(f.read(), Loader=yaml.SafeLoader)
+            Config._config_metadata = yaml.load(f.read(), Loader=_YamlLoader)
 
     @staticmethod
     def save(path=None, all: bool = False):
@@ -702,7 +702,7 @@ class vector(typeclass):
 
     @property
     def ctype_unaligned(self):
-        return self.ctype
+        return "dace::vecu<%s, %s>" % (self.vtype.ctype, self.veclen)
 
     def as_ctypes(self):
         """ Returns the ctypes version of the typeclass. """
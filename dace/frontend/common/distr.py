@@ -10,7 +10,8 @@ from dace.sdfg import SDFG, SDFGState
 
 import sympy as sp
 
-from dace.frontend.python.replacements import _define_local_scalar
+# Module import to avoid an import loop (replacements imports this module through dace.frontend.common)
+from dace.frontend.python import replacements
 
 ShapeType = Sequence[Union[Integral, str, symbolic.symbol, symbolic.SymExpr, symbolic.sympy.Basic]]
 RankType = Union[Integral, str, symbolic.symbol, symbolic.SymExpr, symbolic.sympy.Basic]
@@ -34,7 +35,7 @@ def _bcast(pv: ProgramVisitor,
         root_node = state.add_read(root)
     else:
         storage = desc.storage
-        root_name = _define_local_scalar(pv, sdfg, state, dace.int32, storage)
+        root_name = replacements._define_local_scalar(pv, sdfg, state, dace.int32, storage)
         root_node = state.add_access(root_name)
         root_tasklet = state.add_tasklet('_set_root_', {}, {'__out'}, '__out = {}'.format(root))
         state.add_edge(root_tasklet, '__out', root_node, None, Memlet.simple(root_name, '0'))
@@ -64,7 +65,7 @@ def _Reduce(pv: ProgramVisitor,
         root_node = state.add_read(root)
     else:
         storage = desc.storage
-        root_name = _define_local_scalar(pv, sdfg, state, dace.int32, storage)
+        root_name = replacements._define_local_scalar(pv, sdfg, state, dace.int32, storage)
         root_node = state.add_access(root_name)
         root_tasklet = state.add_tasklet('_set_root_', {}, {'__out'}, '__out = {}'.format(root))
         state.add_edge(root_tasklet, '__out', root_node, None, Memlet.simple(root_name, '0'))
@@ -109,7 +110,7 @@ def _scatter(pv: ProgramVisitor,
         root_node = state.add_read(root)
     else:
         storage = in_desc.storage
-        root_name = _define_local_scalar(pv, sdfg, state, dace.int32, storage)
+        root_name = replacements._define_local_scalar(pv, sdfg, state, dace.int32, storage)
         root_node = state.add_access(root_name)
         root_tasklet = state.add_tasklet('_set_root_', {}, {'__out'}, '__out = {}'.format(root))
         state.add_edge(root_tasklet, '__out', root_node, None, Memlet.simple(root_name, '0'))
@@ -139,7 +140,7 @@ def _gather(pv: ProgramVisitor,
         root_node = state.add_read(root)
     else:
         storage = in_desc.storage
-        root_name = _define_local_scalar(pv, sdfg, state, dace.int32, storage)
+        root_name = replacements._define_local_scalar(pv, sdfg, state, dace.int32, storage)
         root_node = state.add_access(root_name)
         root_tasklet = state.add_tasklet('_set_root_', {}, {'__out'}, '__out = {}'.format(root))
         state.add_edge(root_tasklet, '__out', root_node, None, Memlet.simple(root_name, '0'))
@@ -183,7 +184,7 @@ def _send(pv: ProgramVisitor,
         dst_node = state.add_read(dst_name)
     else:
         storage = desc.storage
-        dst_name = _define_local_scalar(pv, sdfg, state, dace.int32, storage)
+        dst_name = replacements._define_local_scalar(pv, sdfg, state, dace.int32, storage)
         dst_node = state.add_access(dst_name)
         dst_tasklet = state.add_tasklet('_set_dst_', {}, {'__out'}, '__out = {}'.format(dst))
         state.add_edge(dst_tasklet, '__out', dst_node, None, Memlet.simple(dst_name, '0'))
@@ -197,7 +198,7 @@ def _send(pv: ProgramVisitor,
         tag_node = state.add_read(tag)
     else:
         storage = desc.storage
-        tag_name = _define_local_scalar(pv, sdfg, state, dace.int32, storage)
+        tag_name = replacements._define_local_scalar(pv, sdfg, state, dace.int32, storage)
         tag_node = state.add_access(tag_name)
         tag_tasklet = state.add_tasklet('_set_tag_', {}, {'__out'}, '__out = {}'.format(tag))
         state.add_edge(tag_tasklet, '__out', tag_node, None, Memlet.simple(tag_name, '0'))
@@ -262,7 +263,7 @@ def _isend(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, buffer: str, dst: U
         dst_node = state.add_read(dst_name)
     else:
         storage = desc.storage
-        dst_name = _define_local_scalar(pv, sdfg, state, dace.int32, storage)
+        dst_name = replacements._define_local_scalar(pv, sdfg, state, dace.int32, storage)
         dst_node = state.add_access(dst_name)
         dst_tasklet = state.add_tasklet('_set_dst_', {}, {'__out'}, '__out = {}'.format(dst))
         state.add_edge(dst_tasklet, '__out', dst_node, None, Memlet.simple(dst_name, '0'))
@@ -276,7 +277,7 @@ def _isend(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, buffer: str, dst: U
         tag_node = state.add_read(tag)
     else:
         storage = desc.storage
-        tag_name = _define_local_scalar(pv, sdfg, state, dace.int32, storage)
+        tag_name = replacements._define_local_scalar(pv, sdfg, state, dace.int32, storage)
         tag_node = state.add_access(tag_name)
         tag_tasklet = state.add_tasklet('_set_tag_', {}, {'__out'}, '__out = {}'.format(tag))
         state.add_edge(tag_tasklet, '__out', tag_node, None, Memlet.simple(tag_name, '0'))
@@ -339,7 +340,7 @@ def _recv(pv: ProgramVisitor,
         src_node = state.add_read(src_name)
     else:
         storage = desc.storage
-        src_name = _define_local_scalar(pv, sdfg, state, dace.int32, storage)
+        src_name = replacements._define_local_scalar(pv, sdfg, state, dace.int32, storage)
         src_node = state.add_access(src_name)
         src_tasklet = state.add_tasklet('_set_src_', {}, {'__out'}, '__out = {}'.format(src))
         state.add_edge(src_tasklet, '__out', src_node, None, Memlet.simple(src_name, '0'))
@@ -353,7 +354,7 @@ def _recv(pv: ProgramVisitor,
         tag_node = state.add_read(tag)
     else:
         storage = desc.storage
-        tag_name = _define_local_scalar(pv, sdfg, state, dace.int32, storage)
+        tag_name = replacements._define_local_scalar(pv, sdfg, state, dace.int32, storage)
         tag_node = state.add_access(tag_name)
         tag_tasklet = state.add_tasklet('_set_tag_', {}, {'__out'}, '__out = {}'.format(tag))
         state.add_edge(tag_tasklet, '__out', tag_node, None, Memlet.simple(tag_name, '0'))
@@ -416,7 +417,7 @@ def _irecv(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, buffer: str, src: U
         src_node = state.add_read(src_name)
     else:
         storage = desc.storage
-        src_name = _define_local_scalar(pv, sdfg, state, dace.int32, storage)
+        src_name = replacements._define_local_scalar(pv, sdfg, state, dace.int32, storage)
         src_node = state.add_access(src_name)
         src_tasklet = state.add_tasklet('_set_src_', {}, {'__out'}, '__out = {}'.format(src))
         state.add_edge(src_tasklet, '__out', src_node, None, Memlet.simple(src_name, '0'))
@@ -430,7 +431,7 @@ def _irecv(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, buffer: str, src: U
         tag_node = state.add_read(tag)
     else:
         storage = desc.storage
-        tag_name = _define_local_scalar(pv, sdfg, state, dace.int32, storage)
+        tag_name = replacements._define_local_scalar(pv, sdfg, state, dace.int32, storage)
         tag_node = state.add_access(tag_name)
         tag_tasklet = state.add_tasklet('_set_tag_', {}, {'__out'}, '__out = {}'.format(tag))
         state.add_edge(tag_tasklet, '__out', tag_node, None, Memlet.simple(tag_name, '0'))
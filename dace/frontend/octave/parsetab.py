@@ -0,0 +1,191 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'toprightCOMMArightDOTDIVEQDOTMULEQEQEXPEQMULEQMINUSEQDIVEQPLUSEQOREQANDEQnonassocHANDLEleftCOLONleftANDANDORORleftEQEQNEGELEGTLTleftORANDleftPLUSMINUSleftMULDIVDOTMULDOTDIVBACKSLASHrightUMINUSNEGrightTRANSPOSErightEXPDOTEXPPOWnonassocLPARENRPARENRBRACELBRACEleftFIELDDOTPLUSPLUSMINUSMINUSAND ANDAND ANDEQ BACKSLASH BREAK CASE CATCH CLASSDEF COLON COMMA COMMENT CONTINUE DIV DIVEQ DOT DOTDIV DOTDIVEQ DOTEXP DOTMUL DOTMULEQ ELSE ELSEIF END_EXPR END_FUNCTION END_STMT END_UNEXPECTED END_UNWIND_PROTECT EQ EQEQ ERROR_STMT EXP EXPEQ FIELD FOR FUNCTION GE GLOBAL GT HANDLE IDENT IF LBRACE LBRACKET LE LPAREN LT MINUS MINUSEQ MINUSMINUS MUL MULEQ NE NEG NUMBER OR OREQ OROR OTHERWISE PERSISTENT PLUS PLUSEQ PLUSPLUS POW RBRACE RBRACKET RETURN RPAREN SEMI STRING SWITCH TRANSPOSE TRY UNWIND_PROTECT UNWIND_PROTECT_CLEANUP WHILE\n    top :\n        | top stmt\n      \n    top : top END_STMT\n    \n    top : top END_FUNCTION\n    \n    arg1 : IDENT\n    \n    arg1 : NUMBER\n         | STRING\n    \n     arg1 : GLOBAL\n    \n    arg_list : ident_init_opt\n             | arg_list COMMA ident_init_opt\n    \n    args : arg1\n         | args arg1\n     break_stmt : BREAK SEMI \n    case_list :\n              | CASE expr sep stmt_list_opt case_list\n              | CASE expr error stmt_list_opt case_list\n              | OTHERWISE stmt_list\n    \n    cellarray : LBRACE RBRACE\n              | LBRACE matrix_row RBRACE\n              | LBRACE matrix_row SEMI RBRACE\n    \n    cellarray : LBRACE expr_list RBRACE\n    expr : expr LBRACE expr_list RBRACE\n            | expr LBRACE RBRACE\n    \n    command : ident args SEMI\n    \n    comment_stmt : COMMENT\n    \n    matrix_row : expr_list SEMI expr_list\n    \n    matrix_row : matrix_row SEMI expr_list\n    continue_stmt : CONTINUE SEMI\n    elseif_stmt :\n                | ELSE stmt_list_opt\n                | ELSEIF expr sep stmt_list_opt elseif_stmt\n                | ELSEIF LPAREN expr RPAREN stmt_list_opt elseif_stmt\n    \n    error_stmt : ERROR_STMT SEMI\n    expr : ident\n            | end\n            | number\n            | string\n            | colon\n            | NEG\n            | matrix\n            | cellarray\n            | expr2\n            | expr1\n            | lambda_expr\n    expr : expr PLUSPLUS\n            | expr MINUSMINUS\n    expr1 : MINUS expr %prec UMINUS\n             | PLUS expr %prec UMINUS\n             | NEG expr\n             | HANDLE ident\n             | PLUSPLUS ident\n             | MINUSMINUS ident\n    expr2 : expr AND expr\n             | expr ANDAND expr\n             | expr BACKSLASH expr\n             | expr COLON expr\n             | expr DIV expr\n             | expr DOT expr\n             | expr DOTDIV expr\n             | expr DOTDIVEQ expr\n             | expr DOTEXP expr\n             | expr DOTMUL expr\n             | expr DOTMULEQ expr\n             | expr EQEQ expr\n             | expr POW expr\n             | expr EXP expr\n             | expr EXPEQ expr\n             | expr GE expr\n             | expr GT expr\n             | expr LE expr\n             | expr LT expr\n             | expr MINUS expr\n             | expr MUL expr\n             | expr NE expr\n             | expr OR expr\n             | expr OROR expr\n             | expr PLUS expr\n             | expr EQ expr\n             | expr MULEQ expr\n             | expr DIVEQ expr\n             | expr MINUSEQ expr\n             | expr PLUSEQ expr\n             | expr OREQ expr\n             | expr ANDEQ expr\n     colon : COLON  end : END_EXPR  ident : IDENT \n    ident_init_opt : NEG\n                   | ident\n                   | ident EQ expr\n    \n    expr_list : exprs\n              | exprs COMMA\n     number : NUMBER \n    expr_stmt : expr_list SEMI\n     string : STRING \n    exprs : expr\n          | exprs COMMA expr\n    \n    expr : expr FIELD\n     foo_stmt : expr OROR expr SEMI \n    for_stmt : FOR ident  EQ expr SEMI stmt_list END_STMT\n             | FOR LPAREN ident EQ expr RPAREN SEMI stmt_list END_STMT\n             | FOR matrix EQ expr SEMI stmt_list END_STMT\n    func_stmt : FUNCTION ident lambda_args SEMI\n                 | FUNCTION ret EQ ident lambda_args SEMI\n    expr : expr LPAREN expr_list RPAREN\n            | expr LPAREN RPAREN\n    global_list : ident\n                   | global_list ident\n    \n    global_stmt : GLOBAL global_list SEMI\n                | GLOBAL ident EQ expr SEMI\n    \n    if_stmt : IF expr sep stmt_list_opt elseif_stmt END_STMT\n            | IF LPAREN expr RPAREN stmt_list_opt elseif_stmt END_STMT\n    lambda_args : LPAREN RPAREN\n                   | LPAREN arg_list RPAREN\n    lambda_expr : HANDLE lambda_args expr\n    matrix : LBRACKET RBRACKET\n              | LBRACKET matrix_row RBRACKET\n              | LBRACKET matrix_row SEMI RBRACKET\n    matrix : LBRACKET expr_list RBRACKET\n              | LBRACKET expr_list SEMI RBRACKET\n    \n    null_stmt : SEMI\n              | COMMA\n    \n    expr :  LPAREN expr RPAREN\n    \n    persistent_stmt :  PERSISTENT global_list SEMI\n                    |  PERSISTENT ident EQ expr SEMI\n    \n    ret : ident\n        | LBRACKET RBRACKET\n        | LBRACKET expr_list RBRACKET\n     return_stmt : RETURN SEMI \n    semi_opt :\n             | semi_opt SEMI\n             | semi_opt COMMA\n    \n    sep : COMMA\n        | SEMI\n    \n    stmt : continue_stmt\n         | comment_stmt\n         | func_stmt\n         | break_stmt\n         | expr_stmt\n         | global_stmt\n         | persistent_stmt\n         | error_stmt\n         | command\n         | for_stmt\n         | if_stmt\n         | null_stmt\n         | return_stmt\n         | switch_stmt\n         | try_catch\n         | while_stmt\n         | foo_stmt\n         | unwind\n    \n    stmt_list : stmt\n              | stmt_list stmt\n    \n    stmt_list_opt :\n                  | stmt_list\n    \n    switch_stmt : SWITCH expr semi_opt case_list END_STMT\n     expr : expr TRANSPOSE \n    try_catch : TRY stmt_list CATCH stmt_list END_STMT\n    \n    unwind : UNWIND_PROTECT stmt_list UNWIND_PROTECT_CLEANUP stmt_list END_UNWIND_PROTECT\n    \n    while_stmt : WHILE expr SEMI stmt_list END_STMT\n    '
+    
+_lr_action_items = {'END_STMT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,36,38,45,47,48,49,50,51,52,53,54,55,58,59,60,61,66,76,77,82,83,84,86,120,125,128,129,131,135,139,140,141,142,145,146,147,154,156,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,200,202,203,204,206,208,212,214,216,218,220,226,230,231,232,237,238,239,240,241,242,243,246,247,249,252,253,258,259,263,264,266,267,269,270,271,272,275,276,278,279,280,283,284,285,286,288,289,291,292,293,294,295,296,297,298,299,300,301,302,],[-1,3,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-40,-122,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-28,-13,-94,-45,-46,-98,-158,-33,-34,-129,-130,-153,-18,-49,-51,-52,-116,-47,-48,-50,-24,-109,-23,-106,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-77,-78,-79,-80,-81,-82,-83,-84,-124,-123,-155,-133,-134,-14,-154,-19,-21,-117,-119,-115,-103,-99,-22,-105,-76,-29,-156,-155,267,-131,-132,270,271,-20,-118,-120,-110,-125,279,-155,-29,-157,-17,-159,-161,-160,-104,286,288,-111,-30,291,-155,-155,-100,-102,-155,-112,-14,-14,299,-29,-155,-15,-16,-101,-31,-29,-32,]),'END_FUNCTION':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,66,76,77,120,128,154,156,195,226,230,258,259,267,270,271,272,275,279,286,288,291,299,],[-1,4,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,-28,-13,-94,-33,-129,-24,-109,-124,-103,-99,-110,-125,-157,-159,-161,-160,-104,-111,-100,-102,-112,-101,]),'CONTINUE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,41,43,66,76,77,120,128,130,131,133,154,156,195,202,203,204,207,208,209,210,226,230,239,240,245,246,247,248,258,259,260,262,264,267,269,270,271,272,275,276,278,279,284,285,286,287,288,289,291,294,296,299,],[-1,23,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,23,23,-28,-13,-94,-33,-129,23,-153,23,-24,-109,-124,23,-133,-134,23,-154,23,23,-103,-99,23,23,23,23,23,23,-110,-125,23,23,23,-157,23,-159,-161,-160,-104,23,23,-111,23,23,-100,23,-102,23,-112,23,23,-101,]),'COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,41,43,66,76,77,120,128,130,131,133,154,156,195,202,203,204,207,208,209,210,226,230,239,240,245,246,247,248,258,259,260,262,264,267,269,270,271,272,275,276,278,279,284,285,286,287,288,289,291,294,296,299,],[-1,25,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,25,25,-28,-13,-94,-33,-129,25,-153,25,-24,-109,-124,25,-133,-134,25,-154,25,25,-103,-99,25,25,25,25,25,25,-110,-125,25,25,25,-157,25,-159,-161,-160,-104,25,25,-111,25,25,-100,25,-102,25,-112,25,25,-101,]),'FUNCTION':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,41,43,66,76,77,120,128,130,131,133,154,156,195,202,203,204,207,208,209,210,226,230,239,240,245,246,247,248,258,259,260,262,264,267,269,270,271,272,275,276,278,279,284,285,286,287,288,289,291,294,296,299,],[-1,26,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,26,26,-28,-13,-94,-33,-129,26,-153,26,-24,-109,-124,26,-133,-134,26,-154,26,26,-103,-99,26,26,26,26,26,26,-110,-125,26,26,26,-157,26,-159,-161,-160,-104,26,26,-111,26,26,-100,26,-102,26,-112,26,26,-101,]),'BREAK':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,41,43,66,76,77,120,128,130,131,133,154,156,195,202,203,204,207,208,209,210,226,230,239,240,245,246,247,248,258,259,260,262,264,267,269,270,271,272,275,276,278,279,284,285,286,287,288,289,291,294,296,299,],[-1,28,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,28,28,-28,-13,-94,-33,-129,28,-153,28,-24,-109,-124,28,-133,-134,28,-154,28,28,-103,-99,28,28,28,28,28,28,-110,-125,28,28,28,-157,28,-159,-161,-160,-104,28,28,-111,28,28,-100,28,-102,28,-112,28,28,-101,]),'GLOBAL':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,27,38,41,43,45,66,70,71,72,73,74,75,76,77,120,128,130,131,133,154,155,156,195,202,203,204,207,208,209,210,226,230,239,240,245,246,247,248,258,259,260,262,264,267,269,270,271,272,275,276,278,279,284,285,286,287,288,289,291,294,296,299,],[-1,30,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,75,-122,30,30,-87,-28,75,-11,-5,-6,-7,-8,-13,-94,-33,-129,30,-153,30,-24,-12,-109,-124,30,-133,-134,30,-154,30,30,-103,-99,30,30,30,30,30,30,-110,-125,30,30,30,-157,30,-159,-161,-160,-104,30,30,-111,30,30,-100,30,-102,30,-112,30,30,-101,]),'PERSISTENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,41,43,66,76,77,120,128,130,131,133,154,156,195,202,203,204,207,208,209,210,226,230,239,240,245,246,247,248,258,259,260,262,264,267,269,270,271,272,275,276,278,279,284,285,286,287,288,289,291,294,296,299,],[-1,32,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,32,32,-28,-13,-94,-33,-129,32,-153,32,-24,-109,-124,32,-133,-134,32,-154,32,32,-103,-99,32,32,32,32,32,32,-110,-125,32,32,32,-157,32,-159,-161,-160,-104,32,32,-111,32,32,-100,32,-102,32,-112,32,32,-101,]),'ERROR_STMT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,41,43,66,76,77,120,128,130,131,133,154,156,195,202,203,204,207,208,209,210,226,230,239,240,245,246,247,248,258,259,260,262,264,267,269,270,271,272,275,276,278,279,284,285,286,287,288,289,291,294,296,299,],[-1,33,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,33,33,-28,-13,-94,-33,-129,33,-153,33,-24,-109,-124,33,-133,-134,33,-154,33,33,-103,-99,33,33,33,33,33,33,-110,-125,33,33,33,-157,33,-159,-161,-160,-104,33,33,-111,33,33,-100,33,-102,33,-112,33,33,-101,]),'FOR':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,41,43,66,76,77,120,128,130,131,133,154,156,195,202,203,204,207,208,209,210,226,230,239,240,245,246,247,248,258,259,260,262,264,267,269,270,271,272,275,276,278,279,284,285,286,287,288,289,291,294,296,299,],[-1,34,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,34,34,-28,-13,-94,-33,-129,34,-153,34,-24,-109,-124,34,-133,-134,34,-154,34,34,-103,-99,34,34,34,34,34,34,-110,-125,34,34,34,-157,34,-159,-161,-160,-104,34,34,-111,34,34,-100,34,-102,34,-112,34,34,-101,]),'IF':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,41,43,66,76,77,120,128,130,131,133,154,156,195,202,203,204,207,208,209,210,226,230,239,240,245,246,247,248,258,259,260,262,264,267,269,270,271,272,275,276,278,279,284,285,286,287,288,289,291,294,296,299,],[-1,37,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,37,37,-28,-13,-94,-33,-129,37,-153,37,-24,-109,-124,37,-133,-134,37,-154,37,37,-103,-99,37,37,37,37,37,37,-110,-125,37,37,37,-157,37,-159,-161,-160,-104,37,37,-111,37,37,-100,37,-102,37,-112,37,37,-101,]),'SEMI':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,27,28,29,31,33,36,38,39,41,43,44,45,47,48,49,50,51,52,53,54,55,58,59,60,61,66,70,71,72,73,74,75,76,77,78,79,82,83,84,86,118,119,120,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,150,154,155,156,157,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,200,202,203,204,206,207,208,209,210,211,212,214,216,218,220,221,226,229,230,231,232,233,234,236,237,239,240,242,243,245,246,247,248,249,250,251,252,253,254,257,258,259,260,262,264,267,268,269,270,271,272,275,276,277,278,279,281,284,285,286,287,288,289,291,294,296,299,],[-1,24,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,66,-121,-25,-34,76,77,-96,120,-40,-122,128,24,24,-91,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-28,154,-11,-5,-6,-7,-8,-13,-94,156,-107,-45,-46,-98,-158,195,-107,-33,-34,204,-129,-130,24,-153,209,24,-92,-18,213,215,-96,-49,-51,-52,-116,217,219,-47,-48,-50,226,-24,-12,-109,-108,-76,-23,-106,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-77,-78,-79,-80,-81,-82,-83,-84,-124,-123,24,-133,-134,242,24,-154,24,24,-97,-19,-21,-117,-119,-115,-113,-103,258,-99,-22,-105,259,260,262,-76,24,-123,-131,-132,24,24,24,24,-20,-27,-26,-118,-120,-114,275,-110,-125,24,24,24,-157,204,24,-159,-161,-160,-104,24,287,24,-111,204,24,24,-100,24,-102,24,-112,24,-123,-101,]),'COMMA':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,27,31,36,38,41,43,44,45,47,48,49,50,51,52,53,54,55,58,59,60,61,66,76,77,82,83,84,86,120,125,126,128,129,130,131,133,135,138,139,140,141,142,145,146,147,154,156,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,200,202,203,204,206,207,208,209,210,211,212,214,216,218,220,222,223,224,225,226,230,231,232,237,239,240,242,243,245,246,247,248,249,252,253,258,259,260,262,264,267,268,269,270,271,272,273,274,275,276,278,279,281,284,285,286,287,288,289,291,294,296,299,],[-1,38,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-34,-96,-40,-122,38,38,134,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-28,-13,-94,-45,-46,-98,-158,-33,-34,203,-129,-130,38,-153,38,-18,-96,-49,-51,-52,-116,-47,-48,-50,-24,-109,-76,-23,-106,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-77,-78,-79,-80,-81,-82,-83,-84,-124,-123,38,-133,-134,243,38,-154,38,38,-97,-19,-21,-117,-119,-115,255,-9,-88,-89,-103,-99,-22,-105,-76,38,-123,-131,-132,38,38,38,38,-20,-118,-120,-110,-125,38,38,38,-157,203,38,-159,-161,-160,-10,-90,-104,38,38,-111,203,38,38,-100,38,-102,38,-112,38,-123,-101,]),'RETURN':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,41,43,66,76,77,120,128,130,131,133,154,156,195,202,203,204,207,208,209,210,226,230,239,240,245,246,247,248,258,259,260,262,264,267,269,270,271,272,275,276,278,279,284,285,286,287,288,289,291,294,296,299,],[-1,39,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,39,39,-28,-13,-94,-33,-129,39,-153,39,-24,-109,-124,39,-133,-134,39,-154,39,39,-103,-99,39,39,39,39,39,39,-110,-125,39,39,39,-157,39,-159,-161,-160,-104,39,39,-111,39,39,-100,39,-102,39,-112,39,39,-101,]),'SWITCH':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,41,43,66,76,77,120,128,130,131,133,154,156,195,202,203,204,207,208,209,210,226,230,239,240,245,246,247,248,258,259,260,262,264,267,269,270,271,272,275,276,278,279,284,285,286,287,288,289,291,294,296,299,],[-1,40,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,40,40,-28,-13,-94,-33,-129,40,-153,40,-24,-109,-124,40,-133,-134,40,-154,40,40,-103,-99,40,40,40,40,40,40,-110,-125,40,40,40,-157,40,-159,-161,-160,-104,40,40,-111,40,40,-100,40,-102,40,-112,40,40,-101,]),'TRY':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,41,43,66,76,77,120,128,130,131,133,154,156,195,202,203,204,207,208,209,210,226,230,239,240,245,246,247,248,258,259,260,262,264,267,269,270,271,272,275,276,278,279,284,285,286,287,288,289,291,294,296,299,],[-1,41,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,41,41,-28,-13,-94,-33,-129,41,-153,41,-24,-109,-124,41,-133,-134,41,-154,41,41,-103,-99,41,41,41,41,41,41,-110,-125,41,41,41,-157,41,-159,-161,-160,-104,41,41,-111,41,41,-100,41,-102,41,-112,41,41,-101,]),'WHILE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,41,43,66,76,77,120,128,130,131,133,154,156,195,202,203,204,207,208,209,210,226,230,239,240,245,246,247,248,258,259,260,262,264,267,269,270,271,272,275,276,278,279,284,285,286,287,288,289,291,294,296,299,],[-1,42,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,42,42,-28,-13,-94,-33,-129,42,-153,42,-24,-109,-124,42,-133,-134,42,-154,42,42,-103,-99,42,42,42,42,42,42,-110,-125,42,42,42,-157,42,-159,-161,-160,-104,42,42,-111,42,42,-100,42,-102,42,-112,42,42,-101,]),'UNWIND_PROTECT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,41,43,66,76,77,120,128,130,131,133,154,156,195,202,203,204,207,208,209,210,226,230,239,240,245,246,247,248,258,259,260,262,264,267,269,270,271,272,275,276,278,279,284,285,286,287,288,289,291,294,296,299,],[-1,43,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,43,43,-28,-13,-94,-33,-129,43,-153,43,-24,-109,-124,43,-133,-134,43,-154,43,43,-103,-99,43,43,43,43,43,43,-110,-125,43,43,43,-157,43,-159,-161,-160,-104,43,43,-111,43,43,-100,43,-102,43,-112,43,43,-101,]),'IDENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,27,30,32,34,35,37,38,40,41,42,43,45,46,51,56,57,62,63,64,65,66,69,70,71,72,73,74,75,76,77,78,79,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,127,128,130,131,133,134,148,149,151,154,155,156,157,158,195,196,197,199,201,202,203,204,207,208,209,210,213,215,217,219,221,226,230,235,239,240,244,245,246,247,248,254,255,256,258,259,260,262,264,265,267,269,270,271,272,275,276,278,279,282,284,285,286,287,288,289,291,294,296,299,],[-1,45,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,45,72,45,45,45,45,45,-122,45,45,45,45,-87,45,45,45,45,45,45,45,45,-28,45,72,-11,-5,-6,-7,-8,-13,-94,45,-107,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,-107,-33,45,45,-129,45,-153,45,45,45,45,45,-24,-12,-109,-108,45,-124,45,45,45,45,45,-133,-134,45,-154,45,45,45,45,45,45,-113,-103,-99,45,45,45,45,45,45,45,45,-114,45,45,-110,-125,45,45,45,45,-157,45,-159,-161,-160,-104,45,45,-111,45,45,45,-100,45,-102,45,-112,45,45,-101,]),'NEG':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,35,37,38,40,41,42,43,46,51,62,63,64,66,69,76,77,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,120,127,128,130,131,133,134,148,149,154,156,158,195,196,197,199,201,202,203,204,207,208,209,210,213,215,217,219,221,226,230,235,239,240,244,245,246,247,248,254,255,256,258,259,260,262,264,265,267,269,270,271,272,275,276,278,279,282,284,285,286,287,288,289,291,294,296,299,],[-1,51,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,51,51,-122,51,51,51,51,51,51,51,51,51,-28,51,-13,-94,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,-33,51,-129,51,-153,51,51,51,224,-24,-109,51,-124,51,51,51,51,51,-133,-134,51,-154,51,51,51,51,51,51,-113,-103,-99,51,51,51,51,51,51,51,51,-114,224,51,-110,-125,51,51,51,51,-157,51,-159,-161,-160,-104,51,51,-111,51,51,51,-100,51,-102,51,-112,51,51,-101,]),'LPAREN':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,27,31,34,35,36,37,38,40,41,42,43,45,46,47,48,49,50,51,52,53,54,55,58,59,60,61,62,63,64,65,66,67,69,76,77,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,120,124,125,126,127,128,129,130,131,132,133,134,135,138,139,140,141,142,145,146,147,148,154,156,158,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,199,200,201,202,203,204,205,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,226,227,229,230,231,232,233,234,235,236,237,239,240,244,245,246,247,248,249,252,253,254,256,258,259,260,261,262,264,265,267,268,269,270,271,272,274,275,276,278,279,281,282,284,285,286,287,288,289,290,291,294,296,299,],[-1,35,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-34,85,122,35,-40,127,-122,35,35,35,35,-87,35,-35,-36,-37,-38,35,-41,-42,-43,-44,-86,-93,-95,-85,35,35,35,149,-28,149,35,-13,-94,35,35,-45,-46,-98,35,-158,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-33,85,-34,85,35,-129,85,35,-153,85,35,35,-18,85,85,-51,-52,-116,85,85,-50,35,-24,-109,35,85,-23,-106,85,85,85,85,85,-58,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-124,35,35,35,-123,35,35,-133,-134,85,35,-154,35,35,85,-19,35,-21,35,-117,35,-119,35,85,-113,-103,149,85,-99,-22,-105,85,85,35,85,85,35,None,35,35,35,35,35,-20,-118,-120,-114,35,-110,-125,35,85,35,35,282,-157,85,35,-159,-161,-160,85,-104,35,35,-111,85,35,35,35,-100,35,-102,35,85,-112,35,None,-101,]),'END_EXPR':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,35,37,38,40,41,42,43,46,51,62,63,64,66,69,76,77,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,120,127,128,130,131,133,134,148,154,156,158,195,196,197,199,201,202,203,204,207,208,209,210,213,215,217,219,221,226,230,235,239,240,244,245,246,247,248,254,256,258,259,260,262,264,265,267,269,270,271,272,275,276,278,279,282,284,285,286,287,288,289,291,294,296,299,],[-1,58,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,58,58,-122,58,58,58,58,58,58,58,58,58,-28,58,-13,-94,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,-33,58,-129,58,-153,58,58,58,-24,-109,58,-124,58,58,58,58,58,-133,-134,58,-154,58,58,58,58,58,58,-113,-103,-99,58,58,58,58,58,58,58,58,-114,58,-110,-125,58,58,58,58,-157,58,-159,-161,-160,-104,58,58,-111,58,58,58,-100,58,-102,58,-112,58,58,-101,]),'NUMBER':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,27,35,37,38,40,41,42,43,45,46,51,62,63,64,66,69,70,71,72,73,74,75,76,77,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,120,127,128,130,131,133,134,148,154,155,156,158,195,196,197,199,201,202,203,204,207,208,209,210,213,215,217,219,221,226,230,235,239,240,244,245,246,247,248,254,256,258,259,260,262,264,265,267,269,270,271,272,275,276,278,279,282,284,285,286,287,288,289,291,294,296,299,],[-1,59,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,73,59,59,-122,59,59,59,59,-87,59,59,59,59,59,-28,59,73,-11,-5,-6,-7,-8,-13,-94,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-33,59,-129,59,-153,59,59,59,-24,-12,-109,59,-124,59,59,59,59,59,-133,-134,59,-154,59,59,59,59,59,59,-113,-103,-99,59,59,59,59,59,59,59,59,-114,59,-110,-125,59,59,59,59,-157,59,-159,-161,-160,-104,59,59,-111,59,59,59,-100,59,-102,59,-112,59,59,-101,]),'STRING':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,27,35,37,38,40,41,42,43,45,46,51,62,63,64,66,69,70,71,72,73,74,75,76,77,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,120,127,128,130,131,133,134,148,154,155,156,158,195,196,197,199,201,202,203,204,207,208,209,210,213,215,217,219,221,226,230,235,239,240,244,245,246,247,248,254,256,258,259,260,262,264,265,267,269,270,271,272,275,276,278,279,282,284,285,286,287,288,289,291,294,296,299,],[-1,60,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,74,60,60,-122,60,60,60,60,-87,60,60,60,60,60,-28,60,74,-11,-5,-6,-7,-8,-13,-94,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-33,60,-129,60,-153,60,60,60,-24,-12,-109,60,-124,60,60,60,60,60,-133,-134,60,-154,60,60,60,60,60,60,-113,-103,-99,60,60,60,60,60,60,60,60,-114,60,-110,-125,60,60,60,60,-157,60,-159,-161,-160,-104,60,60,-111,60,60,60,-100,60,-102,60,-112,60,60,-101,]),'COLON':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,27,31,35,36,37,38,40,41,42,43,45,46,47,48,49,50,51,52,53,54,55,58,59,60,61,62,63,64,66,69,76,77,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,120,124,125,126,127,128,129,130,131,132,133,134,135,138,139,140,141,142,145,146,147,148,154,156,158,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,199,200,201,202,203,204,205,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,226,229,230,231,232,233,234,235,236,237,239,240,244,245,246,247,248,249,252,253,254,256,258,259,260,261,262,264,265,267,268,269,270,271,272,274,275,276,278,279,281,282,284,285,286,287,288,289,290,291,294,296,299,],[-1,61,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-34,90,61,-40,61,-122,61,61,61,61,-87,61,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,61,61,61,-28,61,-13,-94,61,61,-45,-46,-98,61,-158,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-33,90,-34,90,61,-129,90,61,-153,90,61,61,-18,90,-49,-51,-52,-116,-47,-48,-50,61,-24,-109,61,-76,-23,-106,-53,-54,-55,-56,-57,-58,-59,90,-61,-62,90,-64,-65,-66,90,-68,-69,-70,-71,-72,-73,-74,-75,-77,90,90,90,90,90,90,90,-124,61,61,61,-123,61,61,-133,-134,90,61,-154,61,61,90,-19,61,-21,61,-117,61,-119,61,90,-113,-103,90,-99,-22,-105,90,90,61,90,-76,61,-123,61,61,61,61,61,-20,-118,-120,-114,61,-110,-125,61,90,61,61,61,-157,90,61,-159,-161,-160,90,-104,61,61,-111,90,61,61,61,-100,61,-102,61,90,-112,61,-123,-101,]),'LBRACKET':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,34,35,37,38,40,41,42,43,46,51,62,63,64,66,69,76,77,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,120,127,128,130,131,133,134,148,154,156,158,195,196,197,199,201,202,203,204,207,208,209,210,213,215,217,219,221,226,230,235,239,240,244,245,246,247,248,254,256,258,259,260,262,264,265,267,269,270,271,272,275,276,278,279,282,284,285,286,287,288,289,291,294,296,299,],[-1,62,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,69,62,62,62,-122,62,62,62,62,62,62,62,62,62,-28,62,-13,-94,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-33,62,-129,62,-153,62,62,62,-24,-109,62,-124,62,62,62,62,62,-133,-134,62,-154,62,62,62,62,62,62,-113,-103,-99,62,62,62,62,62,62,62,62,-114,62,-110,-125,62,62,62,62,-157,62,-159,-161,-160,-104,62,62,-111,62,62,62,-100,62,-102,62,-112,62,62,-101,]),'LBRACE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,27,31,35,36,37,38,40,41,42,43,45,46,47,48,49,50,51,52,53,54,55,58,59,60,61,62,63,64,66,69,76,77,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,120,124,125,126,127,128,129,130,131,132,133,134,135,138,139,140,141,142,145,146,147,148,154,156,158,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,199,200,201,202,203,204,205,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,226,229,230,231,232,233,234,235,236,237,239,240,244,245,246,247,248,249,252,253,254,256,258,259,260,261,262,264,265,267,268,269,270,271,272,274,275,276,278,279,281,282,284,285,286,287,288,289,290,291,294,296,299,],[-1,46,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-34,81,46,-40,46,-122,46,46,46,46,-87,46,-35,-36,-37,-38,46,-41,-42,-43,-44,-86,-93,-95,-85,46,46,46,-28,46,-13,-94,46,46,-45,-46,-98,46,-158,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,-33,81,-34,81,46,-129,81,46,-153,81,46,46,-18,81,81,-51,-52,-116,81,81,-50,46,-24,-109,46,81,-23,-106,81,81,81,81,81,-58,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,-124,46,46,46,-123,46,46,-133,-134,81,46,-154,46,46,81,-19,46,-21,46,-117,46,-119,46,81,-113,-103,81,-99,-22,-105,81,81,46,81,81,46,46,46,46,46,46,46,-20,-118,-120,-114,46,-110,-125,46,81,46,46,46,-157,81,46,-159,-161,-160,81,-104,46,46,-111,81,46,46,46,-100,46,-102,46,81,-112,46,46,-101,]),'MINUS':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,27,31,35,36,37,38,40,41,42,43,45,46,47,48,49,50,51,52,53,54,55,58,59,60,61,62,63,64,66,69,76,77,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,120,124,125,126,127,128,129,130,131,132,133,134,135,138,139,140,141,142,145,146,147,148,154,156,158,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,199,200,201,202,203,204,205,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,226,229,230,231,232,233,234,235,236,237,239,240,244,245,246,247,248,249,252,253,254,256,258,259,260,261,262,264,265,267,268,269,270,271,272,274,275,276,278,279,281,282,284,285,286,287,288,289,290,291,294,296,299,],[-1,63,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-34,106,63,-40,63,-122,63,63,63,63,-87,63,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,63,63,63,-28,63,-13,-94,63,63,-45,-46,-98,63,-158,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-33,106,-34,106,63,-129,106,63,-153,106,63,63,-18,106,-49,-51,-52,-116,-47,-48,-50,63,-24,-109,63,106,-23,-106,106,106,-55,106,-57,-58,-59,106,-61,-62,106,106,-65,-66,106,106,106,106,106,-72,-73,106,106,-77,106,106,106,106,106,106,106,-124,63,63,63,-123,63,63,-133,-134,106,63,-154,63,63,106,-19,63,-21,63,-117,63,-119,63,106,-113,-103,106,-99,-22,-105,106,106,63,106,106,63,-123,63,63,63,63,63,-20,-118,-120,-114,63,-110,-125,63,106,63,63,63,-157,106,63,-159,-161,-160,106,-104,63,63,-111,106,63,63,63,-100,63,-102,63,106,-112,63,-123,-101,]),'PLUS':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,27,31,35,36,37,38,40,41,42,43,45,46,47,48,49,50,51,52,53,54,55,58,59,60,61,62,63,64,66,69,76,77,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,120,124,125,126,127,128,129,130,131,132,133,134,135,138,139,140,141,142,145,146,147,148,154,156,158,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,199,200,201,202,203,204,205,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,226,229,230,231,232,233,234,235,236,237,239,240,244,245,246,247,248,249,252,253,254,256,258,259,260,261,262,264,265,267,268,269,270,271,272,274,275,276,278,279,281,282,284,285,286,287,288,289,290,291,294,296,299,],[-1,64,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-34,110,64,-40,64,-122,64,64,64,64,-87,64,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,64,64,64,-28,64,-13,-94,64,64,-45,-46,-98,64,-158,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-33,110,-34,110,64,-129,110,64,-153,110,64,64,-18,110,-49,-51,-52,-116,-47,-48,-50,64,-24,-109,64,110,-23,-106,110,110,-55,110,-57,-58,-59,110,-61,-62,110,110,-65,-66,110,110,110,110,110,-72,-73,110,110,-77,110,110,110,110,110,110,110,-124,64,64,64,-123,64,64,-133,-134,110,64,-154,64,64,110,-19,64,-21,64,-117,64,-119,64,110,-113,-103,110,-99,-22,-105,110,110,64,110,110,64,-123,64,64,64,64,64,-20,-118,-120,-114,64,-110,-125,64,110,64,64,64,-157,110,64,-159,-161,-160,110,-104,64,64,-111,110,64,64,64,-100,64,-102,64,110,-112,64,-123,-101,]),'HANDLE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,35,37,38,40,41,42,43,46,51,62,63,64,66,69,76,77,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,120,127,128,130,131,133,134,148,154,156,158,195,196,197,199,201,202,203,204,207,208,209,210,213,215,217,219,221,226,230,235,239,240,244,245,246,247,248,254,256,258,259,260,262,264,265,267,269,270,271,272,275,276,278,279,282,284,285,286,287,288,289,291,294,296,299,],[-1,65,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,65,65,-122,65,65,65,65,65,65,65,65,65,-28,65,-13,-94,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-33,65,-129,65,-153,65,65,65,-24,-109,65,-124,65,65,65,65,65,-133,-134,65,-154,65,65,65,65,65,65,-113,-103,-99,65,65,65,65,65,65,65,65,-114,65,-110,-125,65,65,65,65,-157,65,-159,-161,-160,-104,65,65,-111,65,65,65,-100,65,-102,65,-112,65,65,-101,]),'PLUSPLUS':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,27,31,35,36,37,38,40,41,42,43,45,46,47,48,49,50,51,52,53,54,55,58,59,60,61,62,63,64,66,69,76,77,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,120,124,125,126,127,128,129,130,131,132,133,134,135,138,139,140,141,142,145,146,147,148,154,156,158,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,199,200,201,202,203,204,205,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,226,229,230,231,232,233,234,235,236,237,239,240,244,245,246,247,248,249,252,253,254,256,258,259,260,261,262,264,265,267,268,269,270,271,272,274,275,276,278,279,281,282,284,285,286,287,288,289,290,291,294,296,299,],[-1,56,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-34,82,56,-40,56,-122,56,56,56,56,-87,56,-35,-36,-37,-38,56,-41,-42,-43,-44,-86,-93,-95,-85,56,56,56,-28,56,-13,-94,56,56,-45,-46,-98,56,-158,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,-33,82,-34,82,56,-129,82,56,-153,82,56,56,-18,82,82,-51,-52,-116,82,82,-50,56,-24,-109,56,82,-23,-106,82,82,82,82,82,-58,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-124,56,56,56,-123,56,56,-133,-134,82,56,-154,56,56,82,-19,56,-21,56,-117,56,-119,56,82,-113,-103,82,-99,-22,-105,82,82,56,82,82,56,56,56,56,56,56,56,-20,-118,-120,-114,56,-110,-125,56,82,56,56,56,-157,82,56,-159,-161,-160,82,-104,56,56,-111,82,56,56,56,-100,56,-102,56,82,-112,56,56,-101,]),'MINUSMINUS':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,27,31,35,36,37,38,40,41,42,43,45,46,47,48,49,50,51,52,53,54,55,58,59,60,61,62,63,64,66,69,76,77,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,120,124,125,126,127,128,129,130,131,132,133,134,135,138,139,140,141,142,145,146,147,148,154,156,158,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,199,200,201,202,203,204,205,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,226,229,230,231,232,233,234,235,236,237,239,240,244,245,246,247,248,249,252,253,254,256,258,259,260,261,262,264,265,267,268,269,270,271,272,274,275,276,278,279,281,282,284,285,286,287,288,289,290,291,294,296,299,],[-1,57,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-34,83,57,-40,57,-122,57,57,57,57,-87,57,-35,-36,-37,-38,57,-41,-42,-43,-44,-86,-93,-95,-85,57,57,57,-28,57,-13,-94,57,57,-45,-46,-98,57,-158,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-33,83,-34,83,57,-129,83,57,-153,83,57,57,-18,83,83,-51,-52,-116,83,83,-50,57,-24,-109,57,83,-23,-106,83,83,83,83,83,-58,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-124,57,57,57,-123,57,57,-133,-134,83,57,-154,57,57,83,-19,57,-21,57,-117,57,-119,57,83,-113,-103,83,-99,-22,-105,83,83,57,83,83,57,57,57,57,57,57,57,-20,-118,-120,-114,57,-110,-125,57,83,57,57,57,-157,83,57,-159,-161,-160,83,-104,57,57,-111,83,57,57,57,-100,57,-102,57,83,-112,57,57,-101,]),'$end':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,66,76,77,120,128,154,156,195,226,230,258,259,267,270,271,272,275,279,286,288,291,299,],[-1,0,-2,-3,-4,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,-28,-13,-94,-33,-129,-24,-109,-124,-103,-99,-110,-125,-157,-159,-161,-160,-104,-111,-100,-102,-112,-101,]),'CATCH':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,66,76,77,120,128,130,131,154,156,195,208,226,230,258,259,267,270,271,272,275,279,286,288,291,299,],[-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,-28,-13,-94,-33,-129,207,-153,-24,-109,-124,-154,-103,-99,-110,-125,-157,-159,-161,-160,-104,-111,-100,-102,-112,-101,]),'UNWIND_PROTECT_CLEANUP':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,66,76,77,120,128,131,133,154,156,195,208,226,230,258,259,267,270,271,272,275,279,286,288,291,299,],[-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,-28,-13,-94,-33,-129,-153,210,-24,-109,-124,-154,-103,-99,-110,-125,-157,-159,-161,-160,-104,-111,-100,-102,-112,-101,]),'ELSE':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,66,76,77,120,128,131,154,156,195,202,203,204,208,226,230,238,239,240,258,259,266,267,270,271,272,275,279,286,288,289,291,295,296,299,301,],[-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,-28,-13,-94,-33,-129,-153,-24,-109,-124,-155,-133,-134,-154,-103,-99,264,-156,-155,-110,-125,264,-157,-159,-161,-160,-104,-111,-100,-102,-155,-112,264,-155,-101,264,]),'ELSEIF':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,66,76,77,120,128,131,154,156,195,202,203,204,208,226,230,238,239,240,258,259,266,267,270,271,272,275,279,286,288,289,291,295,296,299,301,],[-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,-28,-13,-94,-33,-129,-153,-24,-109,-124,-155,-133,-134,-154,-103,-99,265,-156,-155,-110,-125,265,-157,-159,-161,-160,-104,-111,-100,-102,-155,-112,265,-155,-101,265,]),'END_UNWIND_PROTECT':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,38,66,76,77,120,128,131,154,156,195,208,226,230,248,258,259,267,270,271,272,275,279,286,288,291,299,],[-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-122,-28,-13,-94,-33,-129,-153,-24,-109,-124,-154,-103,-99,272,-110,-125,-157,-159,-161,-160,-104,-111,-100,-102,-112,-101,]),'CASE':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,36,38,45,47,48,49,50,51,52,53,54,55,58,59,60,61,66,76,77,82,83,84,86,120,125,128,129,131,135,139,140,141,142,145,146,147,154,156,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,200,203,204,206,208,212,214,216,218,220,226,230,231,232,237,239,242,243,249,252,253,258,259,267,270,271,272,275,279,284,285,286,288,291,292,293,299,],[-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-40,-122,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-28,-13,-94,-45,-46,-98,-158,-33,-34,-129,-130,-153,-18,-49,-51,-52,-116,-47,-48,-50,-24,-109,-23,-106,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-77,-78,-79,-80,-81,-82,-83,-84,-124,-123,-133,-134,244,-154,-19,-21,-117,-119,-115,-103,-99,-22,-105,-76,-156,-131,-132,-20,-118,-120,-110,-125,-157,-159,-161,-160,-104,-111,-155,-155,-100,-102,-112,244,244,-101,]),'OTHERWISE':([5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,36,38,45,47,48,49,50,51,52,53,54,55,58,59,60,61,66,76,77,82,83,84,86,120,125,128,129,131,135,139,140,141,142,145,146,147,154,156,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,200,203,204,206,208,212,214,216,218,220,226,230,231,232,237,239,242,243,249,252,253,258,259,267,270,271,272,275,279,284,285,286,288,291,292,293,299,],[-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-121,-25,-40,-122,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-28,-13,-94,-45,-46,-98,-158,-33,-34,-129,-130,-153,-18,-49,-51,-52,-116,-47,-48,-50,-24,-109,-23,-106,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-77,-78,-79,-80,-81,-82,-83,-84,-124,-123,-133,-134,245,-154,-19,-21,-117,-119,-115,-103,-99,-22,-105,-76,-156,-131,-132,-20,-118,-120,-110,-125,-157,-159,-161,-160,-104,-111,-155,-155,-100,-102,-112,245,245,-101,]),'OROR':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,80,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,201,-34,201,201,201,-18,201,-49,-51,-52,-116,-47,-48,-50,-76,-23,-106,-53,-54,-55,201,-57,-58,-59,201,-61,-62,201,-64,-65,-66,201,-68,-69,-70,-71,-72,-73,-74,-75,-77,201,201,201,201,201,201,201,-123,201,201,-19,-21,-117,-119,201,201,-22,-105,201,201,201,-76,-123,-20,-118,-120,201,201,201,201,201,-123,]),'FIELD':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,84,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,84,-34,84,84,84,-18,84,84,-51,-52,-116,84,84,-50,84,-23,-106,84,84,84,84,84,-58,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-123,84,84,-19,-21,-117,-119,84,84,-22,-105,84,84,84,84,-123,-20,-118,-120,84,84,84,84,84,-123,]),'TRANSPOSE':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,86,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,86,-34,86,86,86,-18,86,86,-51,-52,-116,86,86,-50,86,-23,-106,86,86,86,86,86,-58,86,86,-61,86,86,86,-65,-66,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-123,86,86,-19,-21,-117,-119,86,86,-22,-105,86,86,86,86,-123,-20,-118,-120,86,86,86,86,86,-123,]),'AND':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,87,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,87,-34,87,87,87,-18,87,-49,-51,-52,-116,-47,-48,-50,87,-23,-106,-53,87,-55,87,-57,-58,-59,87,-61,-62,87,87,-65,-66,87,87,87,87,87,-72,-73,87,-75,-77,87,87,87,87,87,87,87,-123,87,87,-19,-21,-117,-119,87,87,-22,-105,87,87,87,87,-123,-20,-118,-120,87,87,87,87,87,-123,]),'ANDAND':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,88,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,88,-34,88,88,88,-18,88,-49,-51,-52,-116,-47,-48,-50,-76,-23,-106,-53,-54,-55,88,-57,-58,-59,88,-61,-62,88,-64,-65,-66,88,-68,-69,-70,-71,-72,-73,-74,-75,-77,88,88,88,88,88,88,88,-123,88,88,-19,-21,-117,-119,88,88,-22,-105,88,88,88,-76,-123,-20,-118,-120,88,88,88,88,88,-123,]),'BACKSLASH':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,89,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,89,-34,89,89,89,-18,89,-49,-51,-52,-116,-47,-48,-50,89,-23,-106,89,89,-55,89,-57,-58,-59,89,-61,-62,89,89,-65,-66,89,89,89,89,89,89,-73,89,89,89,89,89,89,89,89,89,89,-123,89,89,-19,-21,-117,-119,89,89,-22,-105,89,89,89,89,-123,-20,-118,-120,89,89,89,89,89,-123,]),'DIV':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,91,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,91,-34,91,91,91,-18,91,-49,-51,-52,-116,-47,-48,-50,91,-23,-106,91,91,-55,91,-57,-58,-59,91,-61,-62,91,91,-65,-66,91,91,91,91,91,91,-73,91,91,91,91,91,91,91,91,91,91,-123,91,91,-19,-21,-117,-119,91,91,-22,-105,91,91,91,91,-123,-20,-118,-120,91,91,91,91,91,-123,]),'DOT':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,92,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,92,-34,92,92,92,-18,92,92,-51,-52,-116,92,92,-50,92,-23,-106,92,92,92,92,92,-58,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,-123,92,92,-19,-21,-117,-119,92,92,-22,-105,92,92,92,92,-123,-20,-118,-120,92,92,92,92,92,-123,]),'DOTDIV':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,93,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,93,-34,93,93,93,-18,93,-49,-51,-52,-116,-47,-48,-50,93,-23,-106,93,93,-55,93,-57,-58,-59,93,-61,-62,93,93,-65,-66,93,93,93,93,93,93,-73,93,93,93,93,93,93,93,93,93,93,-123,93,93,-19,-21,-117,-119,93,93,-22,-105,93,93,93,93,-123,-20,-118,-120,93,93,93,93,93,-123,]),'DOTDIVEQ':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,94,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,94,-34,94,94,94,-18,94,-49,-51,-52,-116,-47,-48,-50,-76,-23,-106,-53,-54,-55,-56,-57,-58,-59,94,-61,-62,94,-64,-65,-66,94,-68,-69,-70,-71,-72,-73,-74,-75,-77,94,94,94,94,94,94,94,-123,94,94,-19,-21,-117,-119,-115,94,-22,-105,94,94,94,-76,-123,-20,-118,-120,94,94,94,94,94,-123,]),'DOTEXP':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,95,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,95,-34,95,95,95,-18,95,95,-51,-52,-116,95,95,-50,95,-23,-106,95,95,95,95,95,-58,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-123,95,95,-19,-21,-117,-119,95,95,-22,-105,95,95,95,95,-123,-20,-118,-120,95,95,95,95,95,-123,]),'DOTMUL':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,96,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,96,-34,96,96,96,-18,96,-49,-51,-52,-116,-47,-48,-50,96,-23,-106,96,96,-55,96,-57,-58,-59,96,-61,-62,96,96,-65,-66,96,96,96,96,96,96,-73,96,96,96,96,96,96,96,96,96,96,-123,96,96,-19,-21,-117,-119,96,96,-22,-105,96,96,96,96,-123,-20,-118,-120,96,96,96,96,96,-123,]),'DOTMULEQ':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,97,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,97,-34,97,97,97,-18,97,-49,-51,-52,-116,-47,-48,-50,-76,-23,-106,-53,-54,-55,-56,-57,-58,-59,97,-61,-62,97,-64,-65,-66,97,-68,-69,-70,-71,-72,-73,-74,-75,-77,97,97,97,97,97,97,97,-123,97,97,-19,-21,-117,-119,-115,97,-22,-105,97,97,97,-76,-123,-20,-118,-120,97,97,97,97,97,-123,]),'EQEQ':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,98,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,98,-34,98,98,98,-18,98,-49,-51,-52,-116,-47,-48,-50,98,-23,-106,-53,98,-55,98,-57,-58,-59,98,-61,-62,98,-64,-65,-66,98,-68,-69,-70,-71,-72,-73,-74,-75,-77,98,98,98,98,98,98,98,-123,98,98,-19,-21,-117,-119,98,98,-22,-105,98,98,98,98,-123,-20,-118,-120,98,98,98,98,98,-123,]),'POW':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,99,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,99,-34,99,99,99,-18,99,99,-51,-52,-116,99,99,-50,99,-23,-106,99,99,99,99,99,-58,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,-123,99,99,-19,-21,-117,-119,99,99,-22,-105,99,99,99,99,-123,-20,-118,-120,99,99,99,99,99,-123,]),'EXP':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,100,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,100,-34,100,100,100,-18,100,100,-51,-52,-116,100,100,-50,100,-23,-106,100,100,100,100,100,-58,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-123,100,100,-19,-21,-117,-119,100,100,-22,-105,100,100,100,100,-123,-20,-118,-120,100,100,100,100,100,-123,]),'EXPEQ':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,101,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,101,-34,101,101,101,-18,101,-49,-51,-52,-116,-47,-48,-50,-76,-23,-106,-53,-54,-55,-56,-57,-58,-59,101,-61,-62,101,-64,-65,-66,101,-68,-69,-70,-71,-72,-73,-74,-75,-77,101,101,101,101,101,101,101,-123,101,101,-19,-21,-117,-119,-115,101,-22,-105,101,101,101,-76,-123,-20,-118,-120,101,101,101,101,101,-123,]),'GE':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,102,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,102,-34,102,102,102,-18,102,-49,-51,-52,-116,-47,-48,-50,102,-23,-106,-53,102,-55,102,-57,-58,-59,102,-61,-62,102,-64,-65,-66,102,-68,-69,-70,-71,-72,-73,-74,-75,-77,102,102,102,102,102,102,102,-123,102,102,-19,-21,-117,-119,102,102,-22,-105,102,102,102,102,-123,-20,-118,-120,102,102,102,102,102,-123,]),'GT':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,103,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,103,-34,103,103,103,-18,103,-49,-51,-52,-116,-47,-48,-50,103,-23,-106,-53,103,-55,103,-57,-58,-59,103,-61,-62,103,-64,-65,-66,103,-68,-69,-70,-71,-72,-73,-74,-75,-77,103,103,103,103,103,103,103,-123,103,103,-19,-21,-117,-119,103,103,-22,-105,103,103,103,103,-123,-20,-118,-120,103,103,103,103,103,-123,]),'LE':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,104,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,104,-34,104,104,104,-18,104,-49,-51,-52,-116,-47,-48,-50,104,-23,-106,-53,104,-55,104,-57,-58,-59,104,-61,-62,104,-64,-65,-66,104,-68,-69,-70,-71,-72,-73,-74,-75,-77,104,104,104,104,104,104,104,-123,104,104,-19,-21,-117,-119,104,104,-22,-105,104,104,104,104,-123,-20,-118,-120,104,104,104,104,104,-123,]),'LT':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,105,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,105,-34,105,105,105,-18,105,-49,-51,-52,-116,-47,-48,-50,105,-23,-106,-53,105,-55,105,-57,-58,-59,105,-61,-62,105,-64,-65,-66,105,-68,-69,-70,-71,-72,-73,-74,-75,-77,105,105,105,105,105,105,105,-123,105,105,-19,-21,-117,-119,105,105,-22,-105,105,105,105,105,-123,-20,-118,-120,105,105,105,105,105,-123,]),'MUL':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,107,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,107,-34,107,107,107,-18,107,-49,-51,-52,-116,-47,-48,-50,107,-23,-106,107,107,-55,107,-57,-58,-59,107,-61,-62,107,107,-65,-66,107,107,107,107,107,107,-73,107,107,107,107,107,107,107,107,107,107,-123,107,107,-19,-21,-117,-119,107,107,-22,-105,107,107,107,107,-123,-20,-118,-120,107,107,107,107,107,-123,]),'NE':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,108,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,108,-34,108,108,108,-18,108,-49,-51,-52,-116,-47,-48,-50,108,-23,-106,-53,108,-55,108,-57,-58,-59,108,-61,-62,108,-64,-65,-66,108,-68,-69,-70,-71,-72,-73,-74,-75,-77,108,108,108,108,108,108,108,-123,108,108,-19,-21,-117,-119,108,108,-22,-105,108,108,108,108,-123,-20,-118,-120,108,108,108,108,108,-123,]),'OR':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,109,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,109,-34,109,109,109,-18,109,-49,-51,-52,-116,-47,-48,-50,109,-23,-106,-53,109,-55,109,-57,-58,-59,109,-61,-62,109,109,-65,-66,109,109,109,109,109,-72,-73,109,-75,-77,109,109,109,109,109,109,109,-123,109,109,-19,-21,-117,-119,109,109,-22,-105,109,109,109,109,-123,-20,-118,-120,109,109,109,109,109,-123,]),'EQ':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,67,68,79,82,83,84,86,119,121,123,124,125,126,129,132,135,138,139,140,141,142,145,146,147,152,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,198,200,205,211,212,214,216,218,220,225,228,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,111,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-126,151,158,-45,-46,-98,-158,196,197,199,111,-34,111,111,111,-18,111,-49,-51,-52,-116,-47,-48,-50,-127,-76,-23,-106,-53,-54,-55,-56,-57,-58,-59,111,-61,-62,111,-64,-65,-66,111,-68,-69,-70,-71,-72,-73,-74,-75,-77,111,111,111,111,111,111,111,235,-123,111,111,-19,-21,-117,-119,-115,256,-128,111,-22,-105,111,111,111,-76,-123,-20,-118,-120,111,111,111,111,111,-123,]),'MULEQ':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,112,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,112,-34,112,112,112,-18,112,-49,-51,-52,-116,-47,-48,-50,-76,-23,-106,-53,-54,-55,-56,-57,-58,-59,112,-61,-62,112,-64,-65,-66,112,-68,-69,-70,-71,-72,-73,-74,-75,-77,112,112,112,112,112,112,112,-123,112,112,-19,-21,-117,-119,-115,112,-22,-105,112,112,112,-76,-123,-20,-118,-120,112,112,112,112,112,-123,]),'DIVEQ':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,113,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,113,-34,113,113,113,-18,113,-49,-51,-52,-116,-47,-48,-50,-76,-23,-106,-53,-54,-55,-56,-57,-58,-59,113,-61,-62,113,-64,-65,-66,113,-68,-69,-70,-71,-72,-73,-74,-75,-77,113,113,113,113,113,113,113,-123,113,113,-19,-21,-117,-119,-115,113,-22,-105,113,113,113,-76,-123,-20,-118,-120,113,113,113,113,113,-123,]),'MINUSEQ':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,114,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,114,-34,114,114,114,-18,114,-49,-51,-52,-116,-47,-48,-50,-76,-23,-106,-53,-54,-55,-56,-57,-58,-59,114,-61,-62,114,-64,-65,-66,114,-68,-69,-70,-71,-72,-73,-74,-75,-77,114,114,114,114,114,114,114,-123,114,114,-19,-21,-117,-119,-115,114,-22,-105,114,114,114,-76,-123,-20,-118,-120,114,114,114,114,114,-123,]),'PLUSEQ':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,115,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,115,-34,115,115,115,-18,115,-49,-51,-52,-116,-47,-48,-50,-76,-23,-106,-53,-54,-55,-56,-57,-58,-59,115,-61,-62,115,-64,-65,-66,115,-68,-69,-70,-71,-72,-73,-74,-75,-77,115,115,115,115,115,115,115,-123,115,115,-19,-21,-117,-119,-115,115,-22,-105,115,115,115,-76,-123,-20,-118,-120,115,115,115,115,115,-123,]),'OREQ':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,116,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,116,-34,116,116,116,-18,116,-49,-51,-52,-116,-47,-48,-50,-76,-23,-106,-53,-54,-55,-56,-57,-58,-59,116,-61,-62,116,-64,-65,-66,116,-68,-69,-70,-71,-72,-73,-74,-75,-77,116,116,116,116,116,116,116,-123,116,116,-19,-21,-117,-119,-115,116,-22,-105,116,116,116,-76,-123,-20,-118,-120,116,116,116,116,116,-123,]),'ANDEQ':([27,31,36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,124,125,126,129,132,135,138,139,140,141,142,145,146,147,159,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,229,231,232,233,234,236,237,240,249,252,253,261,268,274,281,290,296,],[-34,117,-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,117,-34,117,117,117,-18,117,-49,-51,-52,-116,-47,-48,-50,-76,-23,-106,-53,-54,-55,-56,-57,-58,-59,117,-61,-62,117,-64,-65,-66,117,-68,-69,-70,-71,-72,-73,-74,-75,-77,117,117,117,117,117,117,117,-123,117,117,-19,-21,-117,-119,-115,117,-22,-105,117,117,117,-76,-123,-20,-118,-120,117,117,117,117,117,-123,]),'RPAREN':([36,44,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,85,86,124,125,134,135,138,139,140,141,142,145,146,147,149,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,205,211,212,214,216,218,220,222,223,224,225,231,232,237,249,252,253,261,273,274,290,],[-40,-91,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,163,-158,200,-34,-92,-18,-96,-49,-51,-52,-116,-47,-48,-50,221,-23,232,-106,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-77,-78,-79,-80,-81,-82,-83,-84,-123,240,-97,-19,-21,-117,-119,-115,254,-9,-88,-89,-22,-105,-76,-20,-118,-120,277,-10,-90,296,]),'RBRACE':([36,44,45,46,47,48,49,50,51,52,53,54,55,58,59,60,61,81,82,83,84,86,125,134,135,136,137,138,139,140,141,142,145,146,147,160,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,211,212,213,214,216,218,220,231,232,237,249,250,251,252,253,],[-40,-91,-87,135,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,161,-45,-46,-98,-158,-34,-92,-18,212,214,-96,-49,-51,-52,-116,-47,-48,-50,231,-23,-106,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-77,-78,-79,-80,-81,-82,-83,-84,-123,-97,-19,249,-21,-117,-119,-115,-22,-105,-76,-20,-27,-26,-118,-120,]),'RBRACKET':([36,44,45,47,48,49,50,51,52,53,54,55,58,59,60,61,62,69,82,83,84,86,125,134,135,138,139,140,141,142,143,144,145,146,147,153,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,211,212,214,216,217,218,219,220,231,232,237,249,250,251,252,253,],[-40,-91,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,142,152,-45,-46,-98,-158,-34,-92,-18,-96,-49,-51,-52,-116,216,218,-47,-48,-50,228,-23,-106,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-77,-78,-79,-80,-81,-82,-83,-84,-123,-97,-19,-21,-117,252,-119,253,-115,-22,-105,-76,-20,-27,-26,-118,-120,]),'error':([36,45,47,48,49,50,51,52,53,54,55,58,59,60,61,82,83,84,86,125,135,139,140,141,142,145,146,147,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,200,212,214,216,218,220,231,232,237,249,252,253,268,],[-40,-87,-35,-36,-37,-38,-39,-41,-42,-43,-44,-86,-93,-95,-85,-45,-46,-98,-158,-34,-18,-49,-51,-52,-116,-47,-48,-50,-23,-106,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-77,-78,-79,-80,-81,-82,-83,-84,-123,-19,-21,-117,-119,-115,-22,-105,-76,-20,-118,-120,285,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'top':([0,],[1,]),'stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[2,131,131,208,208,131,131,131,131,208,131,131,208,208,208,131,131,131,208,208,208,131,131,131,131,208,131,]),'continue_stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'comment_stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'func_stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'break_stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'expr_stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'global_stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'persistent_stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'error_stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'command':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'for_stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'if_stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'null_stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'return_stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'switch_stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'try_catch':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'while_stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'foo_stmt':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'unwind':([1,41,43,130,133,202,207,209,210,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'ident':([1,26,30,32,34,35,37,40,41,42,43,46,51,56,57,62,63,64,65,69,78,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,122,127,130,133,134,148,149,151,158,196,197,199,201,202,207,209,210,213,215,217,219,235,239,240,244,245,246,247,248,255,256,260,262,264,265,269,276,278,282,284,285,287,289,294,296,],[27,67,79,119,121,125,125,125,27,125,27,125,125,140,141,125,125,125,147,125,157,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,157,198,125,27,27,125,125,225,227,125,125,125,125,125,27,27,27,27,125,125,125,125,125,27,27,125,27,27,27,27,225,125,27,27,27,125,27,27,27,125,27,27,27,27,27,27,]),'expr_list':([1,41,43,46,62,69,81,85,130,133,202,207,209,210,213,215,217,219,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[29,29,29,137,144,153,160,162,29,29,29,29,29,29,250,251,250,251,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'expr':([1,35,37,40,41,42,43,46,51,62,63,64,69,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,127,130,133,134,148,158,196,197,199,201,202,207,209,210,213,215,217,219,235,239,240,244,245,246,247,248,256,260,262,264,265,269,276,278,282,284,285,287,289,294,296,],[31,124,126,129,31,132,31,138,139,138,145,146,138,159,138,138,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,205,31,31,211,220,229,233,234,236,237,31,31,31,31,138,138,138,138,261,31,31,268,31,31,31,31,274,31,31,31,281,31,31,31,290,31,31,31,31,31,31,]),'matrix':([1,34,35,37,40,41,42,43,46,51,62,63,64,69,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,127,130,133,134,148,158,196,197,199,201,202,207,209,210,213,215,217,219,235,239,240,244,245,246,247,248,256,260,262,264,265,269,276,278,282,284,285,287,289,294,296,],[36,123,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'exprs':([1,41,43,46,62,69,81,85,130,133,202,207,209,210,213,215,217,219,239,240,245,246,247,248,260,262,264,269,276,278,284,285,287,289,294,296,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'end':([1,35,37,40,41,42,43,46,51,62,63,64,69,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,127,130,133,134,148,158,196,197,199,201,202,207,209,210,213,215,217,219,235,239,240,244,245,246,247,248,256,260,262,264,265,269,276,278,282,284,285,287,289,294,296,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'number':([1,35,37,40,41,42,43,46,51,62,63,64,69,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,127,130,133,134,148,158,196,197,199,201,202,207,209,210,213,215,217,219,235,239,240,244,245,246,247,248,256,260,262,264,265,269,276,278,282,284,285,287,289,294,296,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'string':([1,35,37,40,41,42,43,46,51,62,63,64,69,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,127,130,133,134,148,158,196,197,199,201,202,207,209,210,213,215,217,219,235,239,240,244,245,246,247,248,256,260,262,264,265,269,276,278,282,284,285,287,289,294,296,],[49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'colon':([1,35,37,40,41,42,43,46,51,62,63,64,69,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,127,130,133,134,148,158,196,197,199,201,202,207,209,210,213,215,217,219,235,239,240,244,245,246,247,248,256,260,262,264,265,269,276,278,282,284,285,287,289,294,296,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'cellarray':([1,35,37,40,41,42,43,46,51,62,63,64,69,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,127,130,133,134,148,158,196,197,199,201,202,207,209,210,213,215,217,219,235,239,240,244,245,246,247,248,256,260,262,264,265,269,276,278,282,284,285,287,289,294,296,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'expr2':([1,35,37,40,41,42,43,46,51,62,63,64,69,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,127,130,133,134,148,158,196,197,199,201,202,207,209,210,213,215,217,219,235,239,240,244,245,246,247,248,256,260,262,264,265,269,276,278,282,284,285,287,289,294,296,],[53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'expr1':([1,35,37,40,41,42,43,46,51,62,63,64,69,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,127,130,133,134,148,158,196,197,199,201,202,207,209,210,213,215,217,219,235,239,240,244,245,246,247,248,256,260,262,264,265,269,276,278,282,284,285,287,289,294,296,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'lambda_expr':([1,35,37,40,41,42,43,46,51,62,63,64,69,80,81,85,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,127,130,133,134,148,158,196,197,199,201,202,207,209,210,213,215,217,219,235,239,240,244,245,246,247,248,256,260,262,264,265,269,276,278,282,284,285,287,289,294,296,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'ret':([26,],[68,]),'args':([27,],[70,]),'arg1':([27,70,],[71,155,]),'global_list':([30,32,],[78,118,]),'stmt_list':([41,43,202,207,209,210,240,245,260,262,264,284,285,287,289,296,],[130,133,239,246,247,248,239,269,276,278,239,239,239,294,239,239,]),'matrix_row':([46,62,],[136,143,]),'lambda_args':([65,67,227,],[148,150,257,]),'sep':([126,268,281,],[202,284,289,]),'semi_opt':([129,],[206,]),'arg_list':([149,],[222,]),'ident_init_opt':([149,255,],[223,273,]),'stmt_list_opt':([202,240,264,284,285,289,296,],[238,266,280,292,293,295,301,]),'case_list':([206,292,293,],[241,297,298,]),'elseif_stmt':([238,266,295,301,],[263,283,300,302,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> top","S'",1,None,None,None),
+  ('top -> <empty>','top',0,'p_top','parse.py',40),
+  ('top -> top stmt','top',2,'p_top','parse.py',41),
+  ('top -> top END_STMT','top',2,'p_end','parse.py',55),
+  ('top -> top END_FUNCTION','top',2,'p_end_function','parse.py',64),
+  ('arg1 -> IDENT','arg1',1,'p_arg1','parse.py',73),
+  ('arg1 -> NUMBER','arg1',1,'p_arg2','parse.py',83),
+  ('arg1 -> STRING','arg1',1,'p_arg2','parse.py',84),
+  ('arg1 -> GLOBAL','arg1',1,'p_global','parse.py',94),
+  ('arg_list -> ident_init_opt','arg_list',1,'p_arg_list','parse.py',101),
+  ('arg_list -> arg_list COMMA ident_init_opt','arg_list',3,'p_arg_list','parse.py',102),
+  ('args -> arg1','args',1,'p_args','parse.py',112),
+  ('args -> args arg1','args',2,'p_args','parse.py',113),
+  ('break_stmt -> BREAK SEMI','break_stmt',2,'p_break_stmt','parse.py',119),
+  ('case_list -> <empty>','case_list',0,'p_case_list','parse.py',125),
+  ('case_list -> CASE expr sep stmt_list_opt case_list','case_list',5,'p_case_list','parse.py',126),
+  ('case_list -> CASE expr error stmt_list_opt case_list','case_list',5,'p_case_list','parse.py',127),
+  ('case_list -> OTHERWISE stmt_list','case_list',2,'p_case_list','parse.py',128),
+  ('cellarray -> LBRACE RBRACE','cellarray',2,'p_cellarray','parse.py',135),
+  ('cellarray -> LBRACE matrix_row RBRACE','cellarray',3,'p_cellarray','parse.py',136),
+  ('cellarray -> LBRACE matrix_row SEMI RBRACE','cellarray',4,'p_cellarray','parse.py',137),
+  ('cellarray -> LBRACE expr_list RBRACE','cellarray',3,'p_cellarray_2','parse.py',151),
+  ('expr -> expr LBRACE expr_list RBRACE','expr',4,'p_cellarrayref','parse.py',157),
+  ('expr -> expr LBRACE RBRACE','expr',3,'p_cellarrayref','parse.py',158),
+  ('command -> ident args SEMI','command',3,'p_command','parse.py',165),
+  ('comment_stmt -> COMMENT','comment_stmt',1,'p_comment_stmt','parse.py',175),
+  ('matrix_row -> expr_list SEMI expr_list','matrix_row',3,'p_concat_list1','parse.py',183),
+  ('matrix_row -> matrix_row SEMI expr_list','matrix_row',3,'p_concat_list2','parse.py',199),
+  ('continue_stmt -> CONTINUE SEMI','continue_stmt',2,'p_continue_stmt','parse.py',209),
+  ('elseif_stmt -> <empty>','elseif_stmt',0,'p_elseif_stmt','parse.py',215),
+  ('elseif_stmt -> ELSE stmt_list_opt','elseif_stmt',2,'p_elseif_stmt','parse.py',216),
+  ('elseif_stmt -> ELSEIF expr sep stmt_list_opt elseif_stmt','elseif_stmt',5,'p_elseif_stmt','parse.py',217),
+  ('elseif_stmt -> ELSEIF LPAREN expr RPAREN stmt_list_opt elseif_stmt','elseif_stmt',6,'p_elseif_stmt','parse.py',218),
+  ('error_stmt -> ERROR_STMT SEMI','error_stmt',2,'p_error_stmt','parse.py',225),
+  ('expr -> ident','expr',1,'p_expr','parse.py',231),
+  ('expr -> end','expr',1,'p_expr','parse.py',232),
+  ('expr -> number','expr',1,'p_expr','parse.py',233),
+  ('expr -> string','expr',1,'p_expr','parse.py',234),
+  ('expr -> colon','expr',1,'p_expr','parse.py',235),
+  ('expr -> NEG','expr',1,'p_expr','parse.py',236),
+  ('expr -> matrix','expr',1,'p_expr','parse.py',237),
+  ('expr -> cellarray','expr',1,'p_expr','parse.py',238),
+  ('expr -> expr2','expr',1,'p_expr','parse.py',239),
+  ('expr -> expr1','expr',1,'p_expr','parse.py',240),
+  ('expr -> lambda_expr','expr',1,'p_expr','parse.py',241),
+  ('expr -> expr PLUSPLUS','expr',2,'p_expr_2','parse.py',247),
+  ('expr -> expr MINUSMINUS','expr',2,'p_expr_2','parse.py',248),
+  ('expr1 -> MINUS expr','expr1',2,'p_expr1','parse.py',258),
+  ('expr1 -> PLUS expr','expr1',2,'p_expr1','parse.py',259),
+  ('expr1 -> NEG expr','expr1',2,'p_expr1','parse.py',260),
+  ('expr1 -> HANDLE ident','expr1',2,'p_expr1','parse.py',261),
+  ('expr1 -> PLUSPLUS ident','expr1',2,'p_expr1','parse.py',262),
+  ('expr1 -> MINUSMINUS ident','expr1',2,'p_expr1','parse.py',263),
+  ('expr2 -> expr AND expr','expr2',3,'p_expr2','parse.py',273),
+  ('expr2 -> expr ANDAND expr','expr2',3,'p_expr2','parse.py',274),
+  ('expr2 -> expr BACKSLASH expr','expr2',3,'p_expr2','parse.py',275),
+  ('expr2 -> expr COLON expr','expr2',3,'p_expr2','parse.py',276),
+  ('expr2 -> expr DIV expr','expr2',3,'p_expr2','parse.py',277),
+  ('expr2 -> expr DOT expr','expr2',3,'p_expr2','parse.py',278),
+  ('expr2 -> expr DOTDIV expr','expr2',3,'p_expr2','parse.py',279),
+  ('expr2 -> expr DOTDIVEQ expr','expr2',3,'p_expr2','parse.py',280),
+  ('expr2 -> expr DOTEXP expr','expr2',3,'p_expr2','parse.py',281),
+  ('expr2 -> expr DOTMUL expr','expr2',3,'p_expr2','parse.py',282),
+  ('expr2 -> expr DOTMULEQ expr','expr2',3,'p_expr2','parse.py',283),
+  ('expr2 -> expr EQEQ expr','expr2',3,'p_expr2','parse.py',284),
+  ('expr2 -> expr POW expr','expr2',3,'p_expr2','parse.py',285),
+  ('expr2 -> expr EXP expr','expr2',3,'p_expr2','parse.py',286),
+  ('expr2 -> expr EXPEQ expr','expr2',3,'p_expr2','parse.py',287),
+  ('expr2 -> expr GE expr','expr2',3,'p_expr2','parse.py',288),
+  ('expr2 -> expr GT expr','expr2',3,'p_expr2','parse.py',289),
+  ('expr2 -> expr LE expr','expr2',3,'p_expr2','parse.py',290),
+  ('expr2 -> expr LT expr','expr2',3,'p_expr2','parse.py',291),
+  ('expr2 -> expr MINUS expr','expr2',3,'p_expr2','parse.py',292),
+  ('expr2 -> expr MUL expr','expr2',3,'p_expr2','parse.py',293),
+  ('expr2 -> expr NE expr','expr2',3,'p_expr2','parse.py',294),
+  ('expr2 -> expr OR expr','expr2',3,'p_expr2','parse.py',295),
+  ('expr2 -> expr OROR expr','expr2',3,'p_expr2','parse.py',296),
+  ('expr2 -> expr PLUS expr','expr2',3,'p_expr2','parse.py',297),
+  ('expr2 -> expr EQ expr','expr2',3,'p_expr2','parse.py',298),
+  ('expr2 -> expr MULEQ expr','expr2',3,'p_expr2','parse.py',299),
+  ('expr2 -> expr DIVEQ expr','expr2',3,'p_expr2','parse.py',300),
+  ('expr2 -> expr MINUSEQ expr','expr2',3,'p_expr2','parse.py',301),
+  ('expr2 -> expr PLUSEQ expr','expr2',3,'p_expr2','parse.py',302),
+  ('expr2 -> expr OREQ expr','expr2',3,'p_expr2','parse.py',303),
+  ('expr2 -> expr ANDEQ expr','expr2',3,'p_expr2','parse.py',304),
+  ('colon -> COLON','colon',1,'p_expr_colon','parse.py',319),
+  ('end -> END_EXPR','end',1,'p_expr_end','parse.py',328),
+  ('ident -> IDENT','ident',1,'p_expr_ident','parse.py',333),
+  ('ident_init_opt -> NEG','ident_init_opt',1,'p_ident_init_opt','parse.py',343),
+  ('ident_init_opt -> ident','ident_init_opt',1,'p_ident_init_opt','parse.py',344),
+  ('ident_init_opt -> ident EQ expr','ident_init_opt',3,'p_ident_init_opt','parse.py',345),
+  ('expr_list -> exprs','expr_list',1,'p_expr_list','parse.py',357),
+  ('expr_list -> exprs COMMA','expr_list',2,'p_expr_list','parse.py',358),
+  ('number -> NUMBER','number',1,'p_expr_number','parse.py',364),
+  ('expr_stmt -> expr_list SEMI','expr_stmt',2,'p_expr_stmt','parse.py',374),
+  ('string -> STRING','string',1,'p_expr_string','parse.py',380),
+  ('exprs -> expr','exprs',1,'p_exprs','parse.py',390),
+  ('exprs -> exprs COMMA expr','exprs',3,'p_exprs','parse.py',391),
+  ('expr -> expr FIELD','expr',2,'p_field_expr','parse.py',402),
+  ('foo_stmt -> expr OROR expr SEMI','foo_stmt',4,'p_foo_stmt','parse.py',408),
+  ('for_stmt -> FOR ident EQ expr SEMI stmt_list END_STMT','for_stmt',7,'p_for_stmt','parse.py',414),
+  ('for_stmt -> FOR LPAREN ident EQ expr RPAREN SEMI stmt_list END_STMT','for_stmt',9,'p_for_stmt','parse.py',415),
+  ('for_stmt -> FOR matrix EQ expr SEMI stmt_list END_STMT','for_stmt',7,'p_for_stmt','parse.py',416),
+  ('func_stmt -> FUNCTION ident lambda_args SEMI','func_stmt',4,'p_func_stmt','parse.py',426),
+  ('func_stmt -> FUNCTION ret EQ ident lambda_args SEMI','func_stmt',6,'p_func_stmt','parse.py',427),
+  ('expr -> expr LPAREN expr_list RPAREN','expr',4,'p_funcall_expr','parse.py',437),
+  ('expr -> expr LPAREN RPAREN','expr',3,'p_funcall_expr','parse.py',438),
+  ('global_list -> ident','global_list',1,'p_global_list','parse.py',451),
+  ('global_list -> global_list ident','global_list',2,'p_global_list','parse.py',452),
+  ('global_stmt -> GLOBAL global_list SEMI','global_stmt',3,'p_global_stmt','parse.py',459),
+  ('global_stmt -> GLOBAL ident EQ expr SEMI','global_stmt',5,'p_global_stmt','parse.py',460),
+  ('if_stmt -> IF expr sep stmt_list_opt elseif_stmt END_STMT','if_stmt',6,'p_if_stmt','parse.py',467),
+  ('if_stmt -> IF LPAREN expr RPAREN stmt_list_opt elseif_stmt END_STMT','if_stmt',7,'p_if_stmt','parse.py',468),
+  ('lambda_args -> LPAREN RPAREN','lambda_args',2,'p_lambda_args','parse.py',474),
+  ('lambda_args -> LPAREN arg_list RPAREN','lambda_args',3,'p_lambda_args','parse.py',475),
+  ('lambda_expr -> HANDLE lambda_args expr','lambda_expr',3,'p_lambda_expr','parse.py',484),
+  ('matrix -> LBRACKET RBRACKET','matrix',2,'p_matrix','parse.py',490),
+  ('matrix -> LBRACKET matrix_row RBRACKET','matrix',3,'p_matrix','parse.py',491),
+  ('matrix -> LBRACKET matrix_row SEMI RBRACKET','matrix',4,'p_matrix','parse.py',492),
+  ('matrix -> LBRACKET expr_list RBRACKET','matrix',3,'p_matrix_2','parse.py',505),
+  ('matrix -> LBRACKET expr_list SEMI RBRACKET','matrix',4,'p_matrix_2','parse.py',506),
+  ('null_stmt -> SEMI','null_stmt',1,'p_null_stmt','parse.py',520),
+  ('null_stmt -> COMMA','null_stmt',1,'p_null_stmt','parse.py',521),
+  ('expr -> LPAREN expr RPAREN','expr',3,'p_parens_expr','parse.py',529),
+  ('persistent_stmt -> PERSISTENT global_list SEMI','persistent_stmt',3,'p_persistent_stmt','parse.py',536),
+  ('persistent_stmt -> PERSISTENT ident EQ expr SEMI','persistent_stmt',5,'p_persistent_stmt','parse.py',537),
+  ('ret -> ident','ret',1,'p_ret','parse.py',544),
+  ('ret -> LBRACKET RBRACKET','ret',2,'p_ret','parse.py',545),
+  ('ret -> LBRACKET expr_list RBRACKET','ret',3,'p_ret','parse.py',546),
+  ('return_stmt -> RETURN SEMI','return_stmt',2,'p_return_stmt','parse.py',557),
+  ('semi_opt -> <empty>','semi_opt',0,'p_semi_opt','parse.py',563),
+  ('semi_opt -> semi_opt SEMI','semi_opt',2,'p_semi_opt','parse.py',564),
+  ('semi_opt -> semi_opt COMMA','semi_opt',2,'p_semi_opt','parse.py',565),
+  ('sep -> COMMA','sep',1,'p_separator','parse.py',572),
+  ('sep -> SEMI','sep',1,'p_separator','parse.py',573),
+  ('stmt -> continue_stmt','stmt',1,'p_stmt','parse.py',580),
+  ('stmt -> comment_stmt','stmt',1,'p_stmt','parse.py',581),
+  ('stmt -> func_stmt','stmt',1,'p_stmt','parse.py',582),
+  ('stmt -> break_stmt','stmt',1,'p_stmt','parse.py',583),
+  ('stmt -> expr_stmt','stmt',1,'p_stmt','parse.py',584),
+  ('stmt -> global_stmt','stmt',1,'p_stmt','parse.py',585),
+  ('stmt -> persistent_stmt','stmt',1,'p_stmt','parse.py',586),
+  ('stmt -> error_stmt','stmt',1,'p_stmt','parse.py',587),
+  ('stmt -> command','stmt',1,'p_stmt','parse.py',588),
+  ('stmt -> for_stmt','stmt',1,'p_stmt','parse.py',589),
+  ('stmt -> if_stmt','stmt',1,'p_stmt','parse.py',590),
+  ('stmt -> null_stmt','stmt',1,'p_stmt','parse.py',591),
+  ('stmt -> return_stmt','stmt',1,'p_stmt','parse.py',592),
+  ('stmt -> switch_stmt','stmt',1,'p_stmt','parse.py',593),
+  ('stmt -> try_catch','stmt',1,'p_stmt','parse.py',594),
+  ('stmt -> while_stmt','stmt',1,'p_stmt','parse.py',595),
+  ('stmt -> foo_stmt','stmt',1,'p_stmt','parse.py',596),
+  ('stmt -> unwind','stmt',1,'p_stmt','parse.py',597),
+  ('stmt_list -> stmt','stmt_list',1,'p_stmt_list','parse.py',605),
+  ('stmt_list -> stmt_list stmt','stmt_list',2,'p_stmt_list','parse.py',606),
+  ('stmt_list_opt -> <empty>','stmt_list_opt',0,'p_stmt_list_opt','parse.py',626),
+  ('stmt_list_opt -> stmt_list','stmt_list_opt',1,'p_stmt_list_opt','parse.py',627),
+  ('switch_stmt -> SWITCH expr semi_opt case_list END_STMT','switch_stmt',5,'p_switch_stmt','parse.py',637),
+  ('expr -> expr TRANSPOSE','expr',2,'p_transpose_expr','parse.py',643),
+  ('try_catch -> TRY stmt_list CATCH stmt_list END_STMT','try_catch',5,'p_try_catch','parse.py',655),
+  ('unwind -> UNWIND_PROTECT stmt_list UNWIND_PROTECT_CLEANUP stmt_list END_UNWIND_PROTECT','unwind',5,'p_unwind','parse.py',662),
+  ('while_stmt -> WHILE expr SEMI stmt_list END_STMT','while_stmt',5,'p_while_stmt','parse.py',669),
+]
@@ -236,6 +236,23 @@ def reduce(op, in_array, out_array=None, axis=None, identity=None):
     return None
 
 
+def scan(op, in_array, out_array=None, axis=0, identity=None, exclusive=False):
+    """ Computes the prefix scan of an array along an axis according to a binary operation `op`, e.g., the
+        cumulative sum for addition. An inclusive scan writes the result of `op` over all elements up to and including
+        each element, an exclusive scan over all preceding elements, starting with `identity`.
+
+        :param op: binary (associative) operation to use for the scan.
+        :param in_array: array to scan.
+        :param out_array: output array to write the result to. If `None`, a new array will be returned.
+        :param axis: the axis to scan along.
+        :param identity: identity value of the operation. Required for exclusive scans.
+        :param exclusive: if True, computes an exclusive scan instead of an inclusive one.
+        :return: `None` if out_array is given, or the newly created `out_array` if `out_array` is `None`.
+    """
+    # The function is empty because it is parsed in the Python frontend
+    return None
+
+
 def elementwise(func, in_array, out_array=None):
     """ Applies a function to each element of the array
     
@@ -1,9 +1,12 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 """ Precompiled DaCe program/method cache. """
 
+import copy
 from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+import numpy as np
 
 import dace
 from dace import config
@@ -15,6 +18,10 @@ ArgTypes = Dict[str, dt.Data]
 ConstantTypes = Dict[str, Any]
 EvalCallback = Callable[[str], Any]
 SpecifiedArgs = Set[str]
+CallGuard = Tuple[Hashable, ...]
+
+#: Scalar types whose values do not affect the compiled program, only their type does
+_GUARDED_SCALAR_TYPES = (bool, int, float, complex, np.number, np.bool_)
 
 
 # Adapted from https://stackoverflow.com/a/2437645/6489142
@@ -50,6 +57,23 @@ def _make_sortable(obj):
         return repr(obj)
 
 
+def argument_guard(value: Any) -> Optional[Hashable]:
+    """
+    Returns a cheap, hashable guard on the properties of an argument that
+    determine its data descriptor, i.e., the type of the argument and, for
+    arrays, their data type, shape, and strides.
+
+    :param value: The argument value.
+    :return: A hashable guard, or None if the argument type is not supported
+             by guards.
+    """
+    if isinstance(value, np.ndarray):
+        return (type(value), value.dtype, value.shape, value.strides)
+    if isinstance(value, _GUARDED_SCALAR_TYPES):
+        return type(value)
+    return None
+
+
 @dataclass
 class ProgramCacheKey:
     """ A key object representing a single instance of a DaCe program. """
@@ -90,6 +114,18 @@ class ProgramCacheEntry:
     compiled_sdfg: 'dace.codegen.compiled_sdfg.CompiledSDFG'
 
 
+@dataclass
+class ProgramGuardEntry:
+    """
+    A value object representing a guarded entry of a DaCe program, which
+    allows calling a compiled program without constructing a cache key.
+    Contains the cache entry and the symbol values that were inferred from
+    the guarded argument shapes and strides.
+    """
+    entry: ProgramCacheEntry
+    symbols: Dict[str, Any]
+
+
 class DaceProgramCache:
     def __init__(self, evaluate: EvalCallback, size: Optional[int] = None) -> None:
         """ 
@@ -102,10 +138,14 @@ class DaceProgramCache:
         self.eval_callback = evaluate
         self.size = size or config.Config.get('frontend', 'cache_size')
         self.cache: OrderedDict[ProgramCacheKey, ProgramCacheEntry] = LimitedSizeDict(size_limit=size)
+        self.guards: OrderedDict[CallGuard, ProgramGuardEntry] = LimitedSizeDict(size_limit=self.size)
+        self.parsed: OrderedDict[Tuple[ProgramCacheKey, bool], SDFG] = LimitedSizeDict(size_limit=self.size)
 
     def clear(self):
         """ Clears the program cache. """
         self.cache.clear()
+        self.guards.clear()
+        self.parsed.clear()
 
     def _evaluate_constants(self, constants: Set[str], extra_constants: Dict[str, Any] = None) -> ConstantTypes:
         # Evaluate closure constants at call time
@@ -133,6 +173,83 @@ class DaceProgramCache:
         """ Adds a new entry to the program cache. """
         self.cache[key] = ProgramCacheEntry(sdfg, compiled_sdfg)
 
+        # Remove guards of evicted entries, so that their programs can be released
+        if self.guards:
+            live_entries = set(id(entry) for entry in self.cache.values())
+            for guard in [g for g, v in self.guards.items() if id(v.entry) not in live_entries]:
+                del self.guards[guard]
+
+    def add_parsed(self, key: ProgramCacheKey, simplify: bool, sdfg: SDFG) -> None:
+        """
+        Adds a parsed (uncompiled) SDFG to the cache, which is used when the
+        program is called from other programs. The SDFG is stored as a copy,
+        since the caller modifies it when nesting it.
+
+        :param key: The program cache key.
+        :param simplify: Whether the SDFG was simplified after parsing.
+        :param sdfg: The parsed SDFG.
+        """
+        self.parsed[(key, simplify)] = copy.deepcopy(sdfg)
+
+    def get_parsed(self, key: ProgramCacheKey, simplify: bool) -> Optional[SDFG]:
+        """
+        Returns a copy of a parsed SDFG from the cache, or None if the program
+        was not parsed with the given key and simplification setting.
+        """
+        sdfg = self.parsed.get((key, simplify))
+        if sdfg is None:
+            return None
+        return copy.deepcopy(sdfg)
+
+    def make_guard(self,
+                   args: Tuple[Any],
+                   kwargs: Dict[str, Any],
+                   closure_arrays: Dict[str, Any],
+                   closure_constants: ConstantTypes,
+                   methodobj: Any = None) -> Optional[CallGuard]:
+        """
+        Creates a call guard from the given arguments. Unlike cache keys, guards
+        do not require parsing argument types or creating data descriptors,
+        and are thus cheap to check on every call. A guard consists of the
+        argument guards (see ``argument_guard``), the values of closure
+        constants, the identity of the object (for methods), and the registered
+        SDFG call hooks.
+
+        :return: The call guard, or None if any of the arguments is not
+                 supported by guards.
+        """
+        arg_guards = tuple(argument_guard(a) for a in args)
+        if None in arg_guards:
+            return None
+        kwarg_guards = tuple((k, argument_guard(v)) for k, v in kwargs.items())
+        closure_guards = tuple((k, argument_guard(v)) for k, v in closure_arrays.items())
+        if any(g is None for _, g in kwarg_guards) or any(g is None for _, g in closure_guards):
+            return None
+
+        return (
+            arg_guards,
+            kwarg_guards,
+            closure_guards,
+            tuple((k, _make_hashable(v)) for k, v in closure_constants.items()),
+            id(methodobj),
+            tuple(id(hook) for hook in hooks._SDFG_CALL_HOOKS),
+        )
+
+    def add_guard(self, guard: CallGuard, key: ProgramCacheKey, symbols: Dict[str, Any]) -> None:
+        """
+        Adds a call guard that dispatches directly to an existing entry of the
+        program cache.
+
+        :param guard: The call guard (see ``DaceProgram._call_guard``).
+        :param key: The cache key of the entry to dispatch to.
+        :param symbols: Symbol values inferred from the guarded arguments.
+        """
+        self.guards[guard] = ProgramGuardEntry(self.cache[key], symbols)
+
+    def get_guard(self, guard: CallGuard) -> Optional[ProgramGuardEntry]:
+        """ Returns the entry of the given call guard, or None if it does not exist. """
+        return self.guards.get(guard)
+
     def get(self, key: ProgramCacheKey) -> ProgramCacheEntry:
         """
         Returns an existing entry if in the program cache, or raises KeyError
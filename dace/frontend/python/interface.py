@@ -3,7 +3,7 @@
 
 import inspect
 from functools import wraps
-from typing import Any, Callable, Deque, Dict, Generator, Optional, Tuple, TypeVar, Union, overload
+from typing import Any, Callable, Deque, Dict, Generator, List, Optional, Tuple, TypeVar, Union, overload
 
 from dace import dtypes
 from dace.dtypes import paramdec
@@ -30,6 +30,7 @@ def program(*args,
             regenerate_code: bool = True,
             recompile: bool = True,
             constant_functions=False,
+            symbol_variants: Optional[List[Union[Dict[str, int], str]]] = None,
             **kwargs) -> Callable[..., parser.DaceProgram]:
     ...
 
@@ -43,6 +44,7 @@ def program(f: F,
             regenerate_code: bool = True,
             recompile: bool = True,
             constant_functions=False,
+            symbol_variants: Optional[List[Union[Dict[str, int], str]]] = None,
             **kwargs) -> Callable[..., parser.DaceProgram]:
     """
     Entry point to a data-centric program. For methods and ``classmethod``s, use
@@ -64,6 +66,12 @@ def program(f: F,
                                not depend on internal variables are constant.
                                This will hardcode their return values into the
                                resulting program.
+    :param symbol_variants: If given, compiles a single library with multiple
+                            versions of the program, each specialized for a
+                            set of symbol values (e.g., ``{'N': 1024}``) or a
+                            condition on symbols (e.g., ``'N <= 64'``), plus a
+                            generic fallback. The version is chosen at call
+                            time from the symbol values.
     :note: If arguments are defined with type hints, the program can be compiled
            ahead-of-time with ``.compile()``.
     """
@@ -78,7 +86,8 @@ def program(f: F,
                               constant_functions,
                               recreate_sdfg=recreate_sdfg,
                               regenerate_code=regenerate_code,
-                              recompile=recompile)
+                              recompile=recompile,
+                              symbol_variants=symbol_variants)
 
 
 function = program
@@ -94,6 +103,7 @@ def method(*args,
            auto_optimize=False,
            device=dtypes.DeviceType.CPU,
            constant_functions=False,
+           symbol_variants: Optional[List[Union[Dict[str, int], str]]] = None,
            **kwargs) -> parser.DaceProgram:
     ...
 
@@ -107,6 +117,7 @@ def method(f: F,
            regenerate_code: bool = True,
            recompile: bool = True,
            constant_functions=False,
+           symbol_variants: Optional[List[Union[Dict[str, int], str]]] = None,
            **kwargs) -> parser.DaceProgram:
     """ 
     Entry point to a data-centric program that is a method or  a ``classmethod``. 
@@ -127,6 +138,12 @@ def method(f: F,
                                not depend on internal variables are constant.
                                This will hardcode their return values into the
                                resulting program.
+    :param symbol_variants: If given, compiles a single library with multiple
+                            versions of the program, each specialized for a
+                            set of symbol values (e.g., ``{'N': 1024}``) or a
+                            condition on symbols (e.g., ``'N <= 64'``), plus a
+                            generic fallback. The version is chosen at call
+                            time from the symbol values.
     :note: If arguments are defined with type hints, the program can be compiled
            ahead-of-time with ``.compile()``.    
     """
@@ -152,7 +169,8 @@ def method(f: F,
                                       recreate_sdfg=recreate_sdfg,
                                       regenerate_code=regenerate_code,
                                       recompile=recompile,
-                                      method=True)
+                                      method=True,
+                                      symbol_variants=symbol_variants)
             prog.methodobj = obj
             self.wrapped[objid] = prog
             return prog
@@ -169,7 +187,8 @@ def method(f: F,
                                           recreate_sdfg=recreate_sdfg,
                                           regenerate_code=regenerate_code,
                                           recompile=recompile,
-                                          method=False)
+                                          method=False,
+                                          symbol_variants=symbol_variants)
                 self.wrapped[None] = prog
             else:
                 prog = self.wrapped[None]
@@ -4,7 +4,6 @@ from collections import OrderedDict
 import copy
 import itertools
 import inspect
-import networkx as nx
 import re
 import sys
 import time
@@ -1979,7 +1978,7 @@ class ProgramVisitor(ExtNodeVisitor):
                     else:
                         name = memlet.data
                         vname = "{c}_in_from_{s}{n}".format(c=conn,
-                                                            s=self.sdfg.nodes().index(state),
+                                                            s=self.sdfg.node_id(state),
                                                             n=('_%s' % state.node_id(entry_node) if entry_node else ''))
                         self.accesses[(name, scope_memlet.subset, 'r')] = (vname, orng)
                         orig_shape = orng.size()
@@ -2069,7 +2068,7 @@ class ProgramVisitor(ExtNodeVisitor):
                     else:
                         name = memlet.data
                         vname = "{c}_out_of_{s}{n}".format(c=conn,
-                                                           s=self.sdfg.nodes().index(state),
+                                                           s=self.sdfg.node_id(state),
                                                            n=('_%s' % state.node_id(exit_node) if exit_node else ''))
                         self.accesses[(name, scope_memlet.subset, 'w')] = (vname, orng)
                         orig_shape = orng.size()
@@ -2325,7 +2324,7 @@ class ProgramVisitor(ExtNodeVisitor):
             self.loop_idx -= 1
 
             for state in body_states:
-                if not nx.has_path(self.sdfg.nx, loop_guard, state):
+                if not self.sdfg.has_path(loop_guard, state):
                     self.sdfg.remove_node(state)
         else:
             raise DaceSyntaxError(self, node, 'Unsupported for-loop iterator "%s"' % iterator)
@@ -2441,7 +2440,7 @@ class ProgramVisitor(ExtNodeVisitor):
         self.loop_idx -= 1
 
         for state in body_states:
-            if not nx.has_path(self.sdfg.nx, end_guard, state):
+            if not self.sdfg.has_path(end_guard, state):
                 self.sdfg.remove_node(state)
 
     def visit_Break(self, node: ast.Break):
@@ -3599,7 +3598,7 @@ class ProgramVisitor(ExtNodeVisitor):
 
                 if isinstance(fcopy, DaceProgram):
                     fcopy.signature = copy.deepcopy(func.signature)
-                    sdfg = fcopy.to_sdfg(*fargs, **fkwargs, simplify=self.simplify, save=False)
+                    sdfg = fcopy._parse(fargs, fkwargs, simplify=self.simplify, save=False, nested=True)
                 else:
                     sdfg = fcopy.__sdfg__(*fargs, **fkwargs)
 
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 import inspect
 import itertools
 import copy
+import json
 import os
 import sympy
 from typing import Any, Callable, Dict, List, Optional, Set, Sequence, Tuple, Union
@@ -37,6 +38,11 @@ def _is_empty(val: Any) -> bool:
     return val is inspect._empty
 
 
+def _should_simplify(simplify: Optional[bool]) -> bool:
+    """ Returns True if a program should be simplified after parsing (None uses the configuration-defined value). """
+    return simplify == True or (simplify is None and Config.get_bool('optimizer', 'automatic_simplification'))
+
+
 def _get_cell_contents_or_none(cell):
     try:
         return cell.cell_contents
@@ -147,8 +153,9 @@ class DaceProgram(pycommon.SDFGConvertible):
                  recreate_sdfg: bool = True,
                  regenerate_code: bool = True,
                  recompile: bool = True,
-                 method: bool = False):
-        from dace.codegen import compiled_sdfg  # Avoid import loops
+                 method: bool = False,
+                 symbol_variants: Optional[List[Union[Dict[str, int], str]]] = None):
+        from dace.codegen import aot, compiled_sdfg  # Avoid import loops
 
         self.f = f
         self.dec_args = args
@@ -167,6 +174,7 @@ class DaceProgram(pycommon.SDFGConvertible):
         self.recreate_sdfg = recreate_sdfg
         self.regenerate_code = regenerate_code
         self.recompile = recompile
+        self.symbol_variants = symbol_variants
 
         self.global_vars = _get_locals_and_globals(f)
         self.signature = inspect.signature(f)
@@ -189,6 +197,14 @@ class DaceProgram(pycommon.SDFGConvertible):
         self.constant_args = set(pname for pname, pval in self.signature.parameters.items()
                                  if pval.annotation is dtypes.compiletime)
 
+        # Calls can be dispatched by argument guards, unless they contain compile-time or variable-length arguments
+        self._guarded_calls = not self.constant_args and all(
+            pval.kind not in (pval.VAR_POSITIONAL, pval.VAR_KEYWORD) for pval in self.signature.parameters.values())
+        self._closure_code: Dict[str, Any] = {}
+
+        # Ahead-of-time compiled builds of this program (see ``dace.codegen.aot``)
+        self._aot_builds: Dict[str, str] = aot.find_builds(f)
+
         if self.argnames is None:
             self.argnames = []
 
@@ -220,6 +236,181 @@ class DaceProgram(pycommon.SDFGConvertible):
         from dace.transformation.auto import auto_optimize as autoopt
         return autoopt.auto_optimize(sdfg, self.device, symbols=symbols)
 
+    def multiversion(self, sdfg: SDFG, optimize: bool) -> SDFG:
+        """
+        Creates a multi-versioned SDFG from the internal program, with one
+        version per entry in ``symbol_variants`` and a generic fallback.
+
+        :param sdfg: The SDFG to multi-version.
+        :param optimize: If True, invokes automatic optimization heuristics
+                         on every version.
+        :return: The multi-versioned SDFG.
+        """
+        # Avoid import loop
+        from dace.transformation.auto import multiversion
+
+        def optimize_version(version: SDFG, _):
+            if optimize:
+                self.auto_optimize(version)
+                version.simplify()
+
+        return multiversion.multiversion(sdfg, self.symbol_variants, optimize_version)
+
+    def _optimize(self, sdfg: SDFG, symbols: Dict[str, Any] = None) -> SDFG:
+        """ Invokes automatic optimization and multi-versioning as requested. """
+        autoopt = Config.get_bool('optimizer', 'autooptimize') or self.autoopt
+        if self.symbol_variants:
+            return self.multiversion(sdfg, autoopt)
+        if autoopt:
+            sdfg = self.auto_optimize(sdfg, symbols=symbols)
+            sdfg.simplify()
+        return sdfg
+
+    @property
+    def profile_guided_build_folder(self) -> str:
+        """ Returns the build folder of the profile-guided optimized version of this program. """
+        return os.path.join(Config.get('default_build_folder'), f'{self.name}_pgo')
+
+    def profile_guided_compile(self,
+                               inputs: Sequence[Union[Tuple[Any, ...], Dict[str, Any]]],
+                               repetitions: int = 3,
+                               native: bool = True,
+                               **kwargs):
+        """
+        Optimizes and compiles the program using profile-guided optimization
+        (see ``dace.transformation.auto.profile_guided``). The program is
+        profiled on the given representative inputs, and the measured
+        runtimes drive further optimizations and native profile-guided
+        compilation. The result is stored in the build folder of the program,
+        such that subsequent calls (also in other processes) use the tuned
+        binary as long as the program and argument types do not change.
+
+        :param inputs: A list of representative inputs, each either a tuple of
+                       positional arguments or a dictionary of keyword
+                       arguments. All inputs must have the same argument types.
+        :param repetitions: Number of profiling runs per input.
+        :param native: If True, uses native profile-guided optimization of the
+                       compiler.
+        :param kwargs: Additional keyword arguments to
+                       ``optimize_from_profile``.
+        :return: The compiled SDFG.
+        """
+        # Avoid import loop
+        from dace.transformation.auto import profile_guided
+
+        if len(inputs) == 0:
+            raise ValueError('Profile-guided optimization requires at least one input')
+        inputs = [((), inp) if isinstance(inp, dict) else (tuple(inp), {}) for inp in inputs]
+
+        # Parse program as in a call with the first input
+        args, call_kwargs = inputs[0]
+        self.global_vars = _get_locals_and_globals(self.f)
+        if self.methodobj is not None:
+            self.global_vars[self.objname] = self.methodobj
+        argtypes, arg_mapping, constant_args, specified = self._get_type_annotations(args, call_kwargs)
+        self.global_vars.update(constant_args)
+        sdfg = self._parse(args, call_kwargs)
+        program_hash = sdfg.hash_sdfg()
+        sdfg_inputs = [self._create_sdfg_args(sdfg, a, {**kw, **arg_mapping}) for a, kw in inputs]
+
+        sdfg.build_folder = self.profile_guided_build_folder
+        binaryobj, decisions = profile_guided.profile_guided_optimize(sdfg,
+                                                                      sdfg_inputs,
+                                                                      self.device,
+                                                                      repetitions=repetitions,
+                                                                      native=native,
+                                                                      **kwargs)
+
+        with open(os.path.join(sdfg.build_folder, 'pgo.json'), 'w') as fp:
+            json.dump({'program_hash': program_hash, 'native': native, 'decisions': decisions}, fp, indent=2)
+
+        cachekey = self._cache.make_key(argtypes, specified, self.closure_array_keys, self.closure_constant_keys,
+                                        constant_args)
+        self._cache.add(cachekey, binaryobj.sdfg, binaryobj)
+        return binaryobj
+
+    def _load_profile_guided_build(self, sdfg: SDFG):
+        """
+        Loads the profile-guided optimized version of this program, if one
+        exists and was created from the given (parsed) SDFG.
+
+        :param sdfg: The parsed SDFG of the program.
+        :return: The compiled SDFG, or None if no matching version exists.
+        """
+        folder = self.profile_guided_build_folder
+        try:
+            with open(os.path.join(folder, 'pgo.json'), 'r') as fp:
+                metadata = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        if metadata.get('program_hash') != sdfg.hash_sdfg():
+            return None
+
+        from dace.sdfg import utils as sdutil  # Avoid import loop
+        return sdutil.load_precompiled_sdfg(folder)
+
+    def aot_compile(self, bundle: str, *args, update_manifest: bool = True, **kwargs) -> Tuple[str, str]:
+        """
+        Compiles the program ahead of time into a bundle (see
+        ``dace.codegen.aot``). Subsequent calls with the same argument types
+        (also in other processes) load the compiled program from the bundle
+        instead of compiling it, as long as the bundle is in the
+        ``compiler.aot_bundles`` configuration entry or inside the Python
+        package of the program.
+
+        :param bundle: Path to the bundle folder.
+        :param args: JIT (i.e., without type hints) argument examples.
+        :param update_manifest: If True, adds the build to the bundle manifest.
+                                Otherwise, the manifest has to be updated with
+                                ``dace.codegen.aot.write_manifest``.
+        :param kwargs: JIT (i.e., without type hints) keyword argument examples.
+        :return: A 2-tuple of the program hash and the build folder, relative to
+                 the bundle.
+        """
+        import tempfile
+        from dace.codegen import aot  # Avoid import loop
+
+        # Parse program as in a call
+        self.global_vars = _get_locals_and_globals(self.f)
+        if self.methodobj is not None:
+            self.global_vars[self.objname] = self.methodobj
+        _, _, constant_args, _ = self._get_type_annotations(args, kwargs)
+        self.global_vars.update(constant_args)
+        sdfg = self._parse(args, kwargs)
+        program_hash = aot.program_hash(sdfg)
+
+        if self.recreate_sdfg:
+            sdfg = self._optimize(sdfg)
+
+        key = aot.program_key(self.f)
+        with tempfile.TemporaryDirectory() as build_folder:
+            sdfg.build_folder = build_folder
+            sdfg.compile(validate=self.validate)
+            folder = aot.add_build(bundle, key, program_hash, sdfg)
+
+        if update_manifest:
+            aot.write_manifest(bundle, {key: {program_hash: folder}})
+        return program_hash, folder
+
+    def _load_aot_build(self, sdfg: SDFG):
+        """
+        Loads an ahead-of-time compiled version of this program from a bundle
+        (see ``dace.codegen.aot``), if one was created from the given (parsed)
+        SDFG.
+
+        :param sdfg: The parsed SDFG of the program.
+        :return: The compiled SDFG, or None if no matching version exists.
+        """
+        if not self._aot_builds:
+            return None
+        from dace.codegen import aot  # Avoid import loop
+        folder = self._aot_builds.get(aot.program_hash(sdfg))
+        if folder is None:
+            return None
+
+        from dace.sdfg import utils as sdutil  # Avoid import loop
+        return sdutil.load_precompiled_sdfg(folder)
+
     def to_sdfg(self, *args, simplify=None, save=False, validate=False, use_cache=False, **kwargs) -> SDFG:
         """
         Creates an SDFG from the DaCe function. If no type hints are provided on the function, example arrays/scalars
@@ -280,10 +471,15 @@ class DaceProgram(pycommon.SDFGConvertible):
         sdfg = self._parse(args, kwargs, simplify=simplify, save=save)
 
         if self.recreate_sdfg:
-            # Invoke auto-optimization as necessary
-            if Config.get_bool('optimizer', 'autooptimize') or self.autoopt:
-                sdfg = self.auto_optimize(sdfg)
-                sdfg.simplify()
+            # Use a profile-guided optimized or ahead-of-time compiled version if one exists
+            binaryobj = self._load_profile_guided_build(sdfg)
+            if binaryobj is None:
+                binaryobj = self._load_aot_build(sdfg)
+            if binaryobj is not None:
+                return binaryobj
+
+            # Invoke auto-optimization and multi-versioning as necessary
+            sdfg = self._optimize(sdfg)
 
         return sdfg.compile(validate=self.validate)
 
@@ -378,7 +574,12 @@ class DaceProgram(pycommon.SDFGConvertible):
             return self.closure_arg_mapping[arg]()
         return eval(arg, self.global_vars, extra_constants)
 
-    def _create_sdfg_args(self, sdfg: SDFG, args: Tuple[Any], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_sdfg_args(self,
+                          sdfg: SDFG,
+                          args: Tuple[Any],
+                          kwargs: Dict[str, Any],
+                          closure: Optional[Dict[str, Any]] = None,
+                          symbols: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         # Start with default arguments, then add other arguments
         result = {**self.default_args}
         # Reconstruct keyword arguments
@@ -386,21 +587,88 @@ class DaceProgram(pycommon.SDFGConvertible):
         result.update(kwargs)
 
         # Add closure arguments to the call
-        result.update(self.__sdfg_closure__())
+        result.update(self.__sdfg_closure__() if closure is None else closure)
 
         # Update closure with respect to callback mapping
         result.update({k: result[v] for k, v in sdfg.callback_mapping.items()})
 
         # Update arguments with symbols in data shapes
-        result.update(
-            infer_symbols_from_datadescriptor(
+        if symbols is None:
+            symbols = infer_symbols_from_datadescriptor(
                 sdfg, {k: create_datadescriptor(v)
-                       for k, v in result.items() if k not in self.constant_args}))
+                       for k, v in result.items() if k not in self.constant_args})
+        result.update(symbols)
         return result
 
+    def _eval_closure_constants(self) -> Dict[str, Any]:
+        """ Evaluates the closure constants in the current scope of the function, without copying its globals. """
+        local_vars = {}
+        if self.f.__closure__ is not None:
+            local_vars.update(zip(self.f.__code__.co_freevars, map(_get_cell_contents_or_none, self.f.__closure__)))
+        if self.methodobj is not None:
+            local_vars[self.objname] = self.methodobj
+
+        result = {}
+        for k in self.closure_constant_keys:
+            if k in self.closure_arg_mapping:
+                result[k] = self.closure_arg_mapping[k]()
+                continue
+            if k not in self._closure_code:
+                self._closure_code[k] = compile(k, '<closure>', 'eval')
+            result[k] = eval(self._closure_code[k], self.f.__globals__, local_vars)
+        return result
+
+    def _call_guard(self, args: Tuple[Any], kwargs: Dict[str, Any]) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """
+        Creates a guard on the given arguments and the current closure, which
+        identifies a compiled program in the cache without parsing argument
+        types or constructing a cache key (see ``DaceProgramCache.make_guard``).
+
+        :param args: The given arguments to the function.
+        :param kwargs: The given keyword arguments to the function.
+        :return: A 2-tuple of (guard, evaluated closure), or None if the call
+                 cannot be guarded.
+        """
+        if not self._guarded_calls:
+            return None
+        closure = self.__sdfg_closure__()
+        try:
+            constants = self._eval_closure_constants()
+        except Exception:
+            return None
+        guard = self._cache.make_guard(args, kwargs, {k: closure[k]
+                                                      for k in self.closure_arg_mapping.keys()}, constants,
+                                       self.methodobj)
+        if guard is None:
+            return None
+        return guard, closure
+
+    def _add_call_guard(self, cachekey: cached_program.ProgramCacheKey, sdfg: SDFG, args: Tuple[Any],
+                        kwargs: Dict[str, Any], sdfg_args: Dict[str, Any]) -> None:
+        """ Registers a guard for the current call, such that subsequent calls dispatch directly to the cache entry. """
+        guarded = self._call_guard(args, kwargs)
+        if guarded is None:
+            return
+        guard, closure = guarded
+        # Inferred symbols are the arguments that were not given explicitly
+        given_args = self._create_sdfg_args(sdfg, args, kwargs, closure, symbols={})
+        symbols = {k: v for k, v in sdfg_args.items() if k not in given_args}
+        self._cache.add_guard(guard, cachekey, symbols)
+
     def __call__(self, *args, **kwargs):
         """ Convenience function that parses, compiles, and runs a DaCe 
             program. """
+        # Fast path: dispatch directly to a compiled program if the argument guards of a previous call match
+        if self._cache.guards:
+            guarded = self._call_guard(args, kwargs)
+            if guarded is not None:
+                guard_entry = self._cache.get_guard(guarded[0])
+                if guard_entry is not None:
+                    entry = guard_entry.entry
+                    entry.compiled_sdfg.clear_return_values()
+                    return entry.compiled_sdfg(**self._create_sdfg_args(entry.sdfg, args, kwargs, guarded[1],
+                                                                         guard_entry.symbols))
+
         # Update global variables with current closure
         self.global_vars = _get_locals_and_globals(self.f)
 
@@ -422,8 +690,10 @@ class DaceProgram(pycommon.SDFGConvertible):
             # If the cache does not just contain a parsed SDFG
             if entry.compiled_sdfg is not None:
                 kwargs.update(arg_mapping)
+                sdfg_args = self._create_sdfg_args(entry.sdfg, args, kwargs)
+                self._add_call_guard(cachekey, entry.sdfg, args, kwargs, sdfg_args)
                 entry.compiled_sdfg.clear_return_values()
-                return entry.compiled_sdfg(**self._create_sdfg_args(entry.sdfg, args, kwargs))
+                return entry.compiled_sdfg(**sdfg_args)
 
         # Clear cache to enforce deletion and closure of compiled program
         # self._cache.pop()
@@ -436,10 +706,19 @@ class DaceProgram(pycommon.SDFGConvertible):
         sdfg_args = self._create_sdfg_args(sdfg, args, kwargs)
 
         if self.recreate_sdfg:
-            # Invoke auto-optimization as necessary
-            if Config.get_bool('optimizer', 'autooptimize') or self.autoopt:
-                sdfg = self.auto_optimize(sdfg, symbols=sdfg_args)
-                sdfg.simplify()
+            # Use a profile-guided optimized or ahead-of-time compiled version if one exists
+            binaryobj = self._load_profile_guided_build(sdfg)
+            if binaryobj is None:
+                binaryobj = self._load_aot_build(sdfg)
+            if binaryobj is not None:
+                cachekey = self._cache.make_key(argtypes, specified, self.closure_array_keys,
+                                                self.closure_constant_keys, constant_args)
+                self._cache.add(cachekey, binaryobj.sdfg, binaryobj)
+                self._add_call_guard(cachekey, sdfg, args, kwargs, sdfg_args)
+                return binaryobj(**sdfg_args)
+
+            # Invoke auto-optimization and multi-versioning as necessary
+            sdfg = self._optimize(sdfg, symbols=sdfg_args)
 
         with hooks.invoke_sdfg_call_hooks(sdfg) as sdfg:
             # Compile SDFG (note: this is done after symbol inference due to shape
@@ -450,13 +729,14 @@ class DaceProgram(pycommon.SDFGConvertible):
             cachekey = self._cache.make_key(argtypes, specified, self.closure_array_keys, self.closure_constant_keys,
                                             constant_args)
             self._cache.add(cachekey, sdfg, binaryobj)
+            self._add_call_guard(cachekey, sdfg, args, kwargs, sdfg_args)
 
             # Call SDFG
             result = binaryobj(**sdfg_args)
 
         return result
 
-    def _parse(self, args, kwargs, simplify=None, save=False, validate=False) -> SDFG:
+    def _parse(self, args, kwargs, simplify=None, save=False, validate=False, nested=False) -> SDFG:
         """ 
         Try to parse a DaceProgram object and return the `dace.SDFG` object
         that corresponds to it.
@@ -470,6 +750,9 @@ class DaceProgram(pycommon.SDFGConvertible):
         :param save: If True, saves the generated SDFG to 
                     ``_dacegraphs/program.sdfg`` after parsing.
         :param validate: If True, validates the resulting SDFG after creation.
+        :param nested: If True, the program is parsed as a call from another
+                       program. Parse results are then cached and reused
+                       (as copies) across call sites.
         :return: The generated SDFG object.
         """
         # Avoid import loop
@@ -477,13 +760,16 @@ class DaceProgram(pycommon.SDFGConvertible):
         from dace.transformation import helpers as xfh
 
         # Obtain DaCe program as SDFG
-        sdfg, cached = self._generate_pdp(args, kwargs, simplify=simplify)
+        sdfg, cached, cachekey = self._generate_pdp(args, kwargs, simplify=simplify, nested=nested)
 
         # Apply simplification pass automatically
-        if not cached and (simplify == True or
-                           (simplify is None and Config.get_bool('optimizer', 'automatic_simplification'))):
+        if not cached and _should_simplify(simplify):
             sdfg.simplify(validate=False)
 
+        # Cache the result of parsing a nested program call
+        if not cached and cachekey is not None:
+            self._cache.add_parsed(cachekey, _should_simplify(simplify), sdfg)
+
         # Save the SDFG. Skip this step if running from a cached SDFG, as
         # it might overwrite the cached SDFG.
         if not cached and not Config.get_bool('compiler', 'use_cache') and save:
@@ -785,15 +1071,22 @@ class DaceProgram(pycommon.SDFGConvertible):
         _, key = self._load_sdfg(None, *args, **kwargs)
         return key
 
-    def _generate_pdp(self, args: Tuple[Any], kwargs: Dict[str, Any], simplify: Optional[bool] = None) -> SDFG:
+    def _generate_pdp(self,
+                      args: Tuple[Any],
+                      kwargs: Dict[str, Any],
+                      simplify: Optional[bool] = None,
+                      nested: bool = False) -> Tuple[SDFG, bool, Optional[cached_program.ProgramCacheKey]]:
         """ Generates the parsed AST representation of a DaCe program.
         
             :param args: The given arguments to the program.
             :param kwargs: The given keyword arguments to the program.
             :param simplify: Whether to apply simplification pass when parsing 
                            nested dace programs.
-            :return: A 2-tuple of (parsed SDFG object, was the SDFG retrieved
-                     from cache).
+            :param nested: Whether the program is called from another program,
+                           in which case previously parsed SDFGs are reused.
+            :return: A 3-tuple of (parsed SDFG object, was the SDFG retrieved
+                     from cache, the key to add the parsed SDFG to the parsed
+                     program cache with, or None if it should not be cached).
         """
         dace_func = self.f
 
@@ -866,17 +1159,24 @@ class DaceProgram(pycommon.SDFGConvertible):
             build_folder = SDFG(self.name).build_folder
             sdfg, _ = self.load_sdfg(os.path.join(build_folder, 'program.sdfg'), *args, **kwargs)
             if sdfg is not None:
-                return sdfg, True
+                return sdfg, True, None
 
         # If parsed SDFG is already cached, use it
         cachekey = self._cache.make_key(argtypes, specified, self.closure_array_keys, self.closure_constant_keys, gvars)
-        if self._cache.has(cachekey):
+        parsed_key = cachekey if nested and Config.get_bool('frontend', 'cache_nested_programs') else None
+        sdfg = None if parsed_key is None else self._cache.get_parsed(parsed_key, _should_simplify(simplify))
+
+        if sdfg is not None:
+            cached = True
+            parsed_key = None
+        elif self._cache.has(cachekey):
             sdfg = self._cache.get(cachekey).sdfg
 
             # We might be in a parsing context (parsing a nested SDFG), do not reuse existing reference
             sdfg = copy.deepcopy(sdfg)
 
             cached = True
+            parsed_key = None
         else:
             cached = False
 
@@ -897,10 +1197,8 @@ class DaceProgram(pycommon.SDFGConvertible):
             # Set SDFG argument names, filtering out constants
             sdfg.arg_names = [a for a in self.argnames if a in argtypes]
 
-            # TODO: Add to parsed SDFG cache
-
             # Set regenerate and recompile flags
             sdfg._regenerate_code = self.regenerate_code
             sdfg._recompile = self.recompile
 
-        return sdfg, cached
+        return sdfg, cached, parsed_key
@@ -232,6 +232,40 @@ def _reduce(pv: ProgramVisitor,
         return []
 
 
+@oprepo.replaces('dace.scan')
+def _scan(pv: ProgramVisitor,
+          sdfg: SDFG,
+          state: SDFGState,
+          redfunction: Callable[[Any, Any], Any],
+          in_array: str,
+          out_array=None,
+          axis=0,
+          identity=None,
+          exclusive=False,
+          dtype: dtypes.typeclass = None):
+    from dace.libraries.standard import Scan
+
+    inarr = in_array
+    indesc = sdfg.arrays[inarr]
+    axis = normalize_axes([axis], len(indesc.shape))[0]
+    if out_array is None:
+        outarr, _ = sdfg.add_temp_transient(indesc.shape, dtype or indesc.dtype, indesc.storage)
+    else:
+        outarr = out_array
+
+    # Create scan subgraph
+    inpnode = state.add_read(inarr)
+    scannode = Scan(redfunction, axis=axis, identity=identity, exclusive=bool(exclusive))
+    outnode = state.add_write(outarr)
+    state.add_edge(inpnode, None, scannode, '_in', Memlet.from_array(inarr, indesc))
+    state.add_edge(scannode, '_out', outnode, None, Memlet.from_array(outarr, sdfg.arrays[outarr]))
+
+    if out_array is None:
+        return outarr
+    else:
+        return []
+
+
 @oprepo.replaces('numpy.eye')
 def eye(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, N, M=None, k=0, dtype=dace.float64):
     M = M or N
@@ -825,6 +859,278 @@ def _mean(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, axis=None):
     return nest, nest(_elementwise)("lambda x: x / ({})".format(div_amount), sum)
 
 
+def _cumulative(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, redfunction: str, identity, a: str, axis,
+                dtype) -> str:
+    """ Implements NumPy cumulative operations (e.g., ``numpy.cumsum``) as inclusive scans. """
+    if axis is None:
+        # Scan the flattened array
+        if len(sdfg.arrays[a].shape) > 1:
+            a = flat(pv, sdfg, state, a)
+        axis = 0
+
+    if dtype is None:
+        # Like NumPy, accumulate small integers in the default (64-bit) integer types
+        dtype = sdfg.arrays[a].dtype
+        if dtype in (dtypes.bool_, dtypes.int8, dtypes.int16, dtypes.int32):
+            dtype = dtypes.int64
+        elif dtype in (dtypes.uint8, dtypes.uint16, dtypes.uint32):
+            dtype = dtypes.uint64
+    elif not isinstance(dtype, dtypes.typeclass):
+        dtype = dtypes.typeclass(dtype)
+
+    return _scan(pv, sdfg, state, redfunction, a, axis=axis, identity=identity, dtype=dtype)
+
+
+@oprepo.replaces('numpy.cumsum')
+def _cumsum(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, axis=None, dtype=None):
+    return _cumulative(pv, sdfg, state, 'lambda x, y: x + y', 0, a, axis, dtype)
+
+
+@oprepo.replaces('numpy.cumprod')
+def _cumprod(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, axis=None, dtype=None):
+    return _cumulative(pv, sdfg, state, 'lambda x, y: x * y', 1, a, axis, dtype)
+
+
+def _sort_along_axis(pv: ProgramVisitor,
+                     sdfg: SDFG,
+                     state: SDFGState,
+                     a: str,
+                     axis,
+                     kind,
+                     order,
+                     keys_out: bool,
+                     indices_out: bool,
+                     out: str = None) -> Tuple[str, ...]:
+    """ Sorts an array along an axis (or the flattened array if ``axis`` is None), returning the sorted keys and/or
+        the indices that sort them. If ``out`` is given, the sorted keys are written to it. """
+    from dace.libraries.standard import Sort
+
+    if order is not None:
+        raise NotImplementedError('Sorting structured arrays by fields is not supported')
+    if axis is None:
+        # Sort the flattened array
+        if len(sdfg.arrays[a].shape) > 1:
+            a = flat(pv, sdfg, state, a)
+        axis = 0
+    kind = str(kind) if kind is not None else 'quicksort'
+    if kind not in ('quicksort', 'mergesort', 'heapsort', 'stable'):
+        raise ValueError(f'Unknown sorting algorithm "{kind}"')
+
+    desc = sdfg.arrays[a]
+    axis = normalize_axes([axis], len(desc.shape))[0]
+    sortnode = Sort(axis=axis, stable=kind in ('mergesort', 'stable'), keys_out=keys_out, values_out=indices_out)
+    state.add_edge(state.add_read(a), None, sortnode, '_keys', Memlet.from_array(a, desc))
+
+    results = []
+    for conn, enabled, dtype in (('_keys_out', keys_out, desc.dtype), ('_values_out', indices_out, dtypes.int64)):
+        if enabled:
+            if conn == '_keys_out' and out is not None:
+                outarr, outdesc = out, sdfg.arrays[out]
+            else:
+                outarr, outdesc = sdfg.add_temp_transient(desc.shape, dtype, desc.storage)
+            state.add_edge(sortnode, conn, state.add_write(outarr), None, Memlet.from_array(outarr, outdesc))
+            results.append(outarr)
+    return tuple(results)
+
+
+@oprepo.replaces('numpy.sort')
+def _sort(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, axis=-1, kind=None, order=None) -> str:
+    return _sort_along_axis(pv, sdfg, state, a, axis, kind, order, keys_out=True, indices_out=False)[0]
+
+
+@oprepo.replaces('numpy.argsort')
+def _argsort(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, axis=-1, kind=None, order=None) -> str:
+    return _sort_along_axis(pv, sdfg, state, a, axis, kind, order, keys_out=False, indices_out=True)[0]
+
+
+@oprepo.replaces('numpy.unique')
+def _unique(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, ar: str):
+    """ Implements ``numpy.unique`` by sorting the flattened array and compacting the first occurrence of every value.
+        The size of the result is a data-dependent symbol, which is defined after the number of unique values is
+        computed. """
+    nest = NestedCall(pv, sdfg, state)
+    sorted_arr = nest(_sort)(ar, axis=None)
+    desc = sdfg.arrays[sorted_arr]
+    size = desc.shape[0]
+
+    # Mark the first occurrence of every value and compute its position in the output with an exclusive scan
+    flags, _ = sdfg.add_temp_transient([size], dtypes.int64, desc.storage)
+    nest.add_state().add_mapped_tasklet('unique_flags', {'__i': f'0:{size}'},
+                                        {'__s': Memlet.from_array(sorted_arr, desc)},
+                                        '__f = 1 if __i == 0 else int(__s[__i] != __s[__i - 1])',
+                                        {'__f': Memlet(f'{flags}[__i]')},
+                                        external_edges=True)
+    positions = nest(_scan)('lambda x, y: x + y', flags, identity=0, exclusive=True)
+
+    # Count unique values
+    count, _ = sdfg.add_scalar(sdfg.temp_data_name(), dtypes.int64, transient=True)
+    count_state = nest.add_state()
+    tasklet = count_state.add_tasklet('unique_count', {'__p', '__f'}, {'__c'},
+                                      f'__c = (__p[{size} - 1] + __f[{size} - 1]) if {size} > 0 else 0')
+    count_state.add_edge(count_state.add_read(positions), None, tasklet, '__p',
+                         Memlet.from_array(positions, sdfg.arrays[positions]))
+    count_state.add_edge(count_state.add_read(flags), None, tasklet, '__f', Memlet.from_array(flags, sdfg.arrays[flags]))
+    count_state.add_edge(tasklet, '__c', count_state.add_write(count), None, Memlet(f'{count}[0]'))
+
+    # Define the number of unique values as a symbol and compact the sorted array into the result
+    symbol = sdfg.find_new_symbol('__unique_count')
+    sdfg.add_symbol(symbol, dtypes.int64)
+    compact_state = nest.add_state()
+    sdfg.edges_between(count_state, compact_state)[0].data.assignments[symbol] = count
+    result, _ = sdfg.add_temp_transient([symbolic.symbol(symbol)], desc.dtype, desc.storage)
+    compact_state.add_mapped_tasklet('unique_compact', {'__i': f'0:{size}'}, {
+        '__s': Memlet(f'{sorted_arr}[__i]'),
+        '__f': Memlet(f'{flags}[__i]'),
+        '__p': Memlet(f'{positions}[__i]')
+    },
+                                     'if __f:\n    __o[__p] = __s', {'__o': Memlet(f'{result}[0:{symbol}]', dynamic=True)},
+                                     external_edges=True)
+    return nest, result
+
+
+def _scatter_add(state: SDFGState, indices: str, out: str, sdfg: SDFG, values: str = None, bins: str = None):
+    """ Adds a scatter-add library node that adds ``values`` (or ones) to the bins of ``out`` selected by
+        ``indices``, starting from the contents of ``bins`` (or zeros). """
+    from dace.libraries.standard import ScatterAdd
+
+    node = ScatterAdd(values=values is not None, bins=bins is not None)
+    for conn, arr in (('_indices', indices), ('_values', values), ('_bins', bins)):
+        if arr is not None:
+            state.add_edge(state.add_read(arr), None, node, conn, Memlet.from_array(arr, sdfg.arrays[arr]))
+    state.add_edge(node, '_out', state.add_write(out), None, Memlet.from_array(out, sdfg.arrays[out]))
+
+
+@oprepo.replaces('numpy.bincount')
+def _bincount(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, x: str, weights: str = None, minlength=0):
+    """ Implements ``numpy.bincount`` with a scatter-add library node. The number of bins is a data-dependent symbol,
+        which is defined after the maximal value is computed. Unlike NumPy, negative values are not checked. """
+    desc = sdfg.arrays[x]
+    if len(desc.shape) != 1 or desc.dtype not in dtypes.INTEGER_TYPES:
+        raise ValueError('numpy.bincount requires a one-dimensional array of integers')
+    if weights is not None and (len(sdfg.arrays[weights].shape) != 1 or
+                                (sdfg.arrays[weights].shape[0] != desc.shape[0]) == True):
+        raise ValueError('The weights and list of numpy.bincount do not have the same length')
+
+    # Count the bins
+    nest = NestedCall(pv, sdfg, state)
+    maximum = nest(_max)(x)
+    count, _ = sdfg.add_scalar(sdfg.temp_data_name(), dtypes.int64, transient=True)
+    count_state = nest.add_state()
+    count_state.add_mapped_tasklet('bincount_count', {'__i': '0:1'}, {'__m': Memlet(f'{maximum}[0]')},
+                                   f'__c = max(__m + 1, {minlength})', {'__c': Memlet(f'{count}[0]')},
+                                   external_edges=True)
+
+    # Define the number of bins as a symbol and scatter into the bins
+    symbol = sdfg.find_new_symbol('__bincount_size')
+    sdfg.add_symbol(symbol, dtypes.int64)
+    scatter_state = nest.add_state()
+    sdfg.edges_between(count_state, scatter_state)[0].data.assignments[symbol] = count
+    dtype = dtypes.int64 if weights is None else dtypes.float64
+    result, _ = sdfg.add_temp_transient([symbolic.symbol(symbol)], dtype, desc.storage)
+    _scatter_add(scatter_state, x, result, sdfg, values=weights)
+    return nest, result
+
+
+@oprepo.replaces('numpy.histogram')
+def _histogram(pv: ProgramVisitor,
+               sdfg: SDFG,
+               state: SDFGState,
+               a: str,
+               bins=10,
+               range=None,
+               weights: str = None,
+               density=None) -> Tuple[str, str]:
+    """ Implements ``numpy.histogram`` with equal-width bins, by computing the bin of every value (as NumPy does) and
+        counting the values in every bin with a scatter-add library node. Values outside of the range are skipped. """
+    if isinstance(bins, str) or not isinstance(bins, (Integral, symbolic.sympy.Basic)):
+        raise NotImplementedError('numpy.histogram is only supported with an integer number of bins')
+    if range is not None:
+        if len(range) != 2:
+            raise ValueError('The range of numpy.histogram must be a pair of values')
+        if isinstance(range[0], Number) and isinstance(range[1], Number) and range[0] > range[1]:
+            raise ValueError('max must be larger than min in range parameter')
+
+    nest = NestedCall(pv, sdfg, state)
+    if len(sdfg.arrays[a].shape) > 1:
+        a = nest(flat)(a)
+    desc = sdfg.arrays[a]
+    size = desc.shape[0]
+    if weights is not None:
+        if len(sdfg.arrays[weights].shape) > 1:
+            weights = nest(flat)(weights)
+        if (sdfg.arrays[weights].shape[0] != size) == True:
+            raise ValueError('weights should have the same shape as a')
+
+    # Compute the outer bin edges
+    limits, _ = sdfg.add_temp_transient([2], dtypes.float64, desc.storage)
+    if range is None:
+        minimum, maximum = nest(_min)(a), nest(_max)(a)
+        inputs = {'__mn': Memlet(f'{minimum}[0]'), '__mx': Memlet(f'{maximum}[0]')}
+        first, last = (f'(__mn if {size} > 0 else 0)', f'(__mx if {size} > 0 else 1)')
+    else:
+        inputs = {}
+        first, last = range
+    nest.add_state().add_mapped_tasklet('histogram_limits', {'__i': '0:1'},
+                                        inputs,
+                                        f'''
+__lo = dace.float64({first})
+__hi = dace.float64({last})
+if __lo == __hi:
+    __lo = __lo - 0.5
+    __hi = __hi + 0.5
+__l[0] = __lo
+__l[1] = __hi''', {'__l': Memlet(f'{limits}[0:2]')},
+                                        external_edges=True)
+
+    # Compute the bin edges as numpy.linspace does
+    edges, edesc = sdfg.add_temp_transient([bins + 1], dtypes.float64, desc.storage)
+    nest.add_state().add_mapped_tasklet(
+        'histogram_edges', {'__i': f'0:{bins} + 1'}, {'__l': Memlet(f'{limits}[0:2]')},
+        f'__e = __l[1] if __i == {bins} else __i * ((__l[1] - __l[0]) / {bins}) + __l[0]',
+        {'__e': Memlet(f'{edges}[__i]')},
+        external_edges=True)
+
+    # Compute the bin of every value as NumPy does, or an index past the bins for values outside of the range
+    indices, _ = sdfg.add_temp_transient([size], dtypes.int64, desc.storage)
+    nest.add_state().add_mapped_tasklet('histogram_bins', {'__i': f'0:{size}'}, {
+        '__a': Memlet(f'{a}[__i]'),
+        '__l': Memlet(f'{limits}[0:2]'),
+        '__e': Memlet.from_array(edges, edesc)
+    },
+                                        f'''
+__o = {bins}
+if __a >= __l[0] and __a <= __l[1]:
+    __b = dace.int64((__a - __l[0]) / (__l[1] - __l[0]) * {bins})
+    if __b == {bins}:
+        __b = {bins} - 1
+    if __a < __e[__b]:
+        __b = __b - 1
+    elif __a >= __e[__b + 1] and __b != {bins} - 1:
+        __b = __b + 1
+    __o = __b''', {'__o': Memlet(f'{indices}[__i]')},
+                                        external_edges=True)
+
+    # Count the values in every bin
+    dtype = dtypes.int64 if weights is None else sdfg.arrays[weights].dtype
+    hist, hdesc = sdfg.add_temp_transient([bins], dtype, desc.storage)
+    _scatter_add(nest.add_state(), indices, hist, sdfg, values=weights)
+
+    if density:
+        total = nest(_sum)(hist)
+        density_hist, _ = sdfg.add_temp_transient([bins], dtypes.float64, desc.storage)
+        nest.add_state().add_mapped_tasklet('histogram_density', {'__i': f'0:{bins}'}, {
+            '__h': Memlet(f'{hist}[__i]'),
+            '__s': Memlet(f'{total}[0]'),
+            '__e': Memlet.from_array(edges, edesc)
+        },
+                                            '__d = dace.float64(__h) / (__e[__i + 1] - __e[__i]) / __s',
+                                            {'__d': Memlet(f'{density_hist}[__i]')},
+                                            external_edges=True)
+        hist = density_hist
+
+    return nest, (hist, edges)
+
+
 @oprepo.replaces('numpy.max')
 @oprepo.replaces('numpy.amax')
 def _max(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, axis=None):
@@ -3993,6 +4299,55 @@ def implement_ufunc_outer(visitor: ProgramVisitor, ast_node: ast.Call, sdfg: SDF
     return outputs
 
 
+@oprepo.replaces_ufunc('at')
+def implement_ufunc_at(visitor: ProgramVisitor, ast_node: ast.Call, sdfg: SDFG, state: SDFGState, ufunc_name: str,
+                       args: Sequence[UfuncInput], kwargs: Dict[str, Any]) -> List[UfuncOutput]:
+    """ Implements the 'at' method of a NumPy ufunc, i.e., an unbuffered in-place operation on the elements selected
+        by an array of indices. Only ``numpy.add.at`` on one-dimensional arrays is supported, which is implemented with
+        a scatter-add library node.
+
+        :param visitor: ProgramVisitor object handling the ufunc call
+        :param ast_node: AST node corresponding to the ufunc call
+        :param sdfg: SDFG object
+        :param state: SDFG State object
+        :param ufunc_name: Name of the ufunc
+        :param args: Positional arguments of the ufunc call
+        :param kwargs: Keyword arguments of the ufunc call
+
+        :raises DaCeSyntaxError: When validation fails
+
+        :return: No outputs, since the operation is performed in-place
+    """
+
+    if ufunc_name != 'add':
+        raise NotImplementedError(f"The 'at' method is only supported for ufunc 'add' and not '{ufunc_name}'")
+    if kwargs or len(args) not in (2, 3):
+        raise DaceSyntaxError(visitor, ast_node, "Ufunc method 'at' expects an array, indices and (optionally) values")
+
+    arr, indices = args[0], args[1]
+    values = args[2] if len(args) == 3 else 1
+    for name in (arr, indices):
+        if not isinstance(name, str) or name not in sdfg.arrays or len(sdfg.arrays[name].shape) != 1:
+            raise NotImplementedError("Ufunc method 'at' is only supported for one-dimensional arrays and indices")
+    size = sdfg.arrays[indices].shape[0]
+
+    # Broadcast scalar values
+    if not isinstance(values, str) or sdfg.arrays[values].total_size == 1:
+        value = f'{values}[0]' if isinstance(values, str) else values
+        inputs = {'__v': Memlet(value)} if isinstance(values, str) else {}
+        values, _ = sdfg.add_temp_transient([size], sdfg.arrays[arr].dtype, sdfg.arrays[arr].storage)
+        state.add_mapped_tasklet('add_at_values', {'__i': f'0:{size}'},
+                                 inputs,
+                                 '__o = %s' % ('__v' if inputs else value), {'__o': Memlet(f'{values}[__i]')},
+                                 external_edges=True)
+    elif len(sdfg.arrays[values].shape) != 1 or (sdfg.arrays[values].shape[0] != size) == True:
+        raise NotImplementedError("Ufunc method 'at' is only supported for values of the same shape as the indices")
+
+    nest = NestedCall(visitor, sdfg, state)
+    _scatter_add(nest.add_state(), indices, arr, sdfg, values=values, bins=arr)
+    return nest, []
+
+
 @oprepo.replaces('numpy.reshape')
 def reshape(
     pv: ProgramVisitor,
@@ -4288,6 +4643,34 @@ def _ndarray_sum(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, arr: str, kwa
     return implement_ufunc_reduce(pv, None, sdfg, state, 'add', [arr], kwargs)[0]
 
 
+@oprepo.replaces_method('Array', 'cumsum')
+@oprepo.replaces_method('View', 'cumsum')
+def _ndarray_cumsum(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, arr: str, axis=None, dtype=None) -> str:
+    return _cumsum(pv, sdfg, state, arr, axis, dtype)
+
+
+@oprepo.replaces_method('Array', 'cumprod')
+@oprepo.replaces_method('View', 'cumprod')
+def _ndarray_cumprod(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, arr: str, axis=None, dtype=None) -> str:
+    return _cumprod(pv, sdfg, state, arr, axis, dtype)
+
+
+@oprepo.replaces_method('Array', 'sort')
+@oprepo.replaces_method('View', 'sort')
+def _ndarray_sort(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, arr: str, axis=-1, kind=None, order=None) -> str:
+    # Sorts in-place
+    if axis is None:
+        raise mem_parser.DaceSyntaxError(pv, None, 'In-place sorting requires an axis')
+    return _sort_along_axis(pv, sdfg, state, arr, axis, kind, order, keys_out=True, indices_out=False, out=arr)[0]
+
+
+@oprepo.replaces_method('Array', 'argsort')
+@oprepo.replaces_method('View', 'argsort')
+def _ndarray_argsort(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, arr: str, axis=-1, kind=None,
+                     order=None) -> str:
+    return _argsort(pv, sdfg, state, arr, axis, kind, order)
+
+
 @oprepo.replaces_method('Array', 'mean')
 @oprepo.replaces_method('Scalar', 'mean')
 @oprepo.replaces_method('View', 'mean')
@@ -4537,6 +4920,154 @@ def _inv(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, inp_op: str):
     return out_arr[0]
 
 
+# NumPy FFT replacements ######################################################
+
+
+def _fft_resize(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, axes: List[int], sizes: List[Size]) -> str:
+    """ Zero-pads or truncates an array along the given axes, as ``numpy.fft`` does with the ``n`` and ``s``
+        arguments. """
+    desc = sdfg.arrays[a]
+    shape = list(desc.shape)
+    for axis, size in zip(axes, sizes):
+        shape[axis] = size
+    result, _ = sdfg.add_temp_transient(shape, desc.dtype, desc.storage)
+
+    params = [f'__i{i}' for i in range(len(shape))]
+    index = ', '.join(params)
+    cond = ' and '.join(f'__i{axis} < {symbolic.symstr(desc.shape[axis])}' for axis in axes)
+    state.add_mapped_tasklet('fft_resize', {p: f'0:{symbolic.symstr(s)}'
+                                            for p, s in zip(params, shape)}, {'__inp': Memlet.from_array(a, desc)},
+                             f'__out = __inp[{index}] if {cond} else 0', {'__out': Memlet(f'{result}[{index}]')},
+                             external_edges=True)
+    return result
+
+
+def _fftn(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, s, axes, norm, inverse: bool, real: bool = False):
+    """ Implements the ``numpy.fft`` transforms. If ``real`` is True, a forward transform is real-to-complex and an
+        inverse transform is complex-to-real. Sizes and axes follow the semantics of ``numpy.fft.fftn``, ``rfftn`` and
+        ``irfftn``. """
+    from dace.libraries.fft import FFT
+
+    if not isinstance(a, str) or a not in sdfg.arrays:
+        raise TypeError(f'FFT input must be an array, got {a}')
+    norm = str(norm) if norm is not None else 'backward'
+    if norm not in ('backward', 'ortho', 'forward'):
+        raise ValueError(f'Invalid norm value {norm}; should be "backward", "ortho" or "forward"')
+    c2r = real and inverse
+    r2c = real and not inverse
+
+    desc = sdfg.arrays[a]
+    ndim = len(desc.shape)
+    if s is None:
+        axes = list(range(ndim)) if axes is None else list(axes)
+        s = [desc.shape[axis] for axis in axes]
+        if c2r:
+            s[-1] = (desc.shape[axes[-1]] - 1) * 2
+    else:
+        s = list(s)
+        axes = list(range(-len(s), 0)) if axes is None else list(axes)
+    if len(s) != len(axes):
+        raise ValueError('Shape and axes have different lengths')
+    if len(axes) == 0:
+        raise ValueError('At least one axis must be transformed')
+    axes = normalize_axes(axes, ndim)
+    if len(set(axes)) != len(axes):
+        raise ValueError('FFT axes must be unique')
+    if any((size < 1) == True for size in s):
+        raise ValueError(f'Invalid number of FFT data points {s}')
+
+    # NumPy computes all transforms in double precision
+    nest = NestedCall(pv, sdfg, state)
+    if r2c:
+        if desc.dtype in (dtypes.complex64, dtypes.complex128):
+            a = nest(_real)(a)
+        if sdfg.arrays[a].dtype != dtypes.float64:
+            a = nest(_ndarray_astype)(a, dtypes.float64)
+    elif desc.dtype != dtypes.complex128:
+        a = nest(_ndarray_astype)(a, dtypes.complex128)
+
+    # Resize the input along the transformed axes, where the last axis of real inverse transforms is halved
+    in_sizes = list(s)
+    if c2r:
+        in_sizes[-1] = s[-1] // 2 + 1
+    if any(size != sdfg.arrays[a].shape[axis] for axis, size in zip(axes, in_sizes)):
+        a = _fft_resize(pv, sdfg, nest.add_state(), a, axes, in_sizes)
+    desc = sdfg.arrays[a]
+
+    out_shape = list(desc.shape)
+    if r2c:
+        out_shape[axes[-1]] = s[-1] // 2 + 1
+    elif c2r:
+        out_shape[axes[-1]] = s[-1]
+    result, result_desc = sdfg.add_temp_transient(out_shape, dtypes.float64 if c2r else dtypes.complex128, desc.storage)
+
+    fft_state = nest.add_state()
+    fft_node = FFT('fft', axes=axes, inverse=inverse, norm=norm)
+    fft_state.add_edge(fft_state.add_read(a), None, fft_node, '_inp', Memlet.from_array(a, desc))
+    fft_state.add_edge(fft_node, '_out', fft_state.add_write(result), None, Memlet.from_array(result, result_desc))
+    return nest, result
+
+
+@oprepo.replaces('numpy.fft.fft')
+def _fft(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, n=None, axis=-1, norm=None):
+    return _fftn(pv, sdfg, state, a, None if n is None else [n], [axis], norm, inverse=False)
+
+
+@oprepo.replaces('numpy.fft.ifft')
+def _ifft(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, n=None, axis=-1, norm=None):
+    return _fftn(pv, sdfg, state, a, None if n is None else [n], [axis], norm, inverse=True)
+
+
+@oprepo.replaces('numpy.fft.fft2')
+def _fft2(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, s=None, axes=(-2, -1), norm=None):
+    return _fftn(pv, sdfg, state, a, s, axes, norm, inverse=False)
+
+
+@oprepo.replaces('numpy.fft.ifft2')
+def _ifft2(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, s=None, axes=(-2, -1), norm=None):
+    return _fftn(pv, sdfg, state, a, s, axes, norm, inverse=True)
+
+
+@oprepo.replaces('numpy.fft.fftn')
+def _np_fftn(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, s=None, axes=None, norm=None):
+    return _fftn(pv, sdfg, state, a, s, axes, norm, inverse=False)
+
+
+@oprepo.replaces('numpy.fft.ifftn')
+def _np_ifftn(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, s=None, axes=None, norm=None):
+    return _fftn(pv, sdfg, state, a, s, axes, norm, inverse=True)
+
+
+@oprepo.replaces('numpy.fft.rfft')
+def _rfft(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, n=None, axis=-1, norm=None):
+    return _fftn(pv, sdfg, state, a, None if n is None else [n], [axis], norm, inverse=False, real=True)
+
+
+@oprepo.replaces('numpy.fft.irfft')
+def _irfft(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, n=None, axis=-1, norm=None):
+    return _fftn(pv, sdfg, state, a, None if n is None else [n], [axis], norm, inverse=True, real=True)
+
+
+@oprepo.replaces('numpy.fft.rfft2')
+def _rfft2(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, s=None, axes=(-2, -1), norm=None):
+    return _fftn(pv, sdfg, state, a, s, axes, norm, inverse=False, real=True)
+
+
+@oprepo.replaces('numpy.fft.irfft2')
+def _irfft2(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, s=None, axes=(-2, -1), norm=None):
+    return _fftn(pv, sdfg, state, a, s, axes, norm, inverse=True, real=True)
+
+
+@oprepo.replaces('numpy.fft.rfftn')
+def _rfftn(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, s=None, axes=None, norm=None):
+    return _fftn(pv, sdfg, state, a, s, axes, norm, inverse=False, real=True)
+
+
+@oprepo.replaces('numpy.fft.irfftn')
+def _irfftn(pv: ProgramVisitor, sdfg: SDFG, state: SDFGState, a: str, s=None, axes=None, norm=None):
+    return _fftn(pv, sdfg, state, a, s, axes, norm, inverse=True, real=True)
+
+
 # CuPy replacements
 
 
@@ -2,11 +2,11 @@
 """ Jupyter Notebook support for DaCe. """
 
 import os
-import urllib.request
-import urllib.error
 
 
 def _connected():
+    import urllib.request
+    import urllib.error
     try:
         urllib.request.urlopen('https://spcl.github.io/dace/webclient2/dist/sdfv.js', timeout=1)
         return True
@@ -0,0 +1,3 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+from .fftw import *
+from .cufft import *
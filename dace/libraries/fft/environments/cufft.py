@@ -0,0 +1,39 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import dace.library
+import ctypes.util
+
+
+@dace.library.environment
+class cuFFT:
+
+    cmake_minimum_version = None
+    cmake_packages = ["CUDA"]
+    cmake_variables = {}
+    cmake_includes = []
+    cmake_libraries = ["cufft"]
+    cmake_compile_flags = []
+    cmake_link_flags = []
+    cmake_files = []
+
+    headers = {'frame': ["../include/dace_cufft.h"], 'cuda': ["../include/dace_cufft.h"]}
+    state_fields = ["dace::fft::CufftPlanCache cufft_plans;"]
+    init_code = ""
+    finalize_code = ""
+    dependencies = []
+
+    @staticmethod
+    def handle_setup_code(node):
+        location = node.location
+        if not location or "gpu" not in node.location:
+            location = 0
+        else:
+            try:
+                location = int(location["gpu"])
+            except ValueError:
+                raise ValueError("Invalid GPU identifier: {}".format(location))
+
+        return "const int __dace_cuda_device = {location};\n".format(location=location)
+
+    @staticmethod
+    def is_installed():
+        return ctypes.util.find_library('cufft') is not None
@@ -0,0 +1,39 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import ctypes.util
+
+import dace.library
+
+
+@dace.library.environment
+class FFTW:
+    """
+    An environment for the FFTW library (double and single precision). Plans are created on first use and cached in
+    the persistent state of the SDFG for subsequent invocations.
+    """
+
+    cmake_minimum_version = None
+    cmake_packages = []
+    cmake_variables = {}
+    cmake_includes = []
+    cmake_compile_flags = []
+    cmake_link_flags = []
+    cmake_files = []
+
+    headers = ["../include/dace_fftw.h"]
+    state_fields = ["dace::fft::FFTWPlanCache fftw_plans;"]
+    init_code = ""
+    finalize_code = ""
+    dependencies = []
+
+    @staticmethod
+    def cmake_libraries():
+        result = []
+        for lib in ('fftw3', 'fftw3f'):
+            path = ctypes.util.find_library(lib)
+            if path:
+                result.append(path)
+        return result
+
+    @staticmethod
+    def is_installed():
+        return ctypes.util.find_library('fftw3') is not None
@@ -0,0 +1,72 @@
+// Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+#pragma once
+
+#include <cuda_runtime.h>
+#include <cufft.h>
+
+#include <map>
+#include <mutex>
+#include <stdexcept>  // std::runtime_error
+#include <string>     // std::to_string
+#include <vector>
+
+namespace dace {
+
+namespace fft {
+
+static void CheckCufftError(cufftResult const& status) {
+    if (status != CUFFT_SUCCESS) {
+        throw std::runtime_error("cuFFT failed with error code: " + std::to_string(status));
+    }
+}
+
+/**
+ * Caches cuFFT plans across invocations of an SDFG. Plans are keyed by their device, transform type and (advanced)
+ * data layout, which is given as in cufftPlanMany.
+ **/
+class CufftPlanCache {
+ public:
+    CufftPlanCache() = default;
+    CufftPlanCache(CufftPlanCache const&) = delete;
+    CufftPlanCache& operator=(CufftPlanCache const&) = delete;
+
+    ~CufftPlanCache() {
+        for (auto& kv : plans_) {
+            cudaSetDevice((int)kv.first[0]);
+            cufftDestroy(kv.second);
+        }
+    }
+
+    cufftHandle Get(int device, cufftType type, int rank, const long long* n, const long long* inembed,
+                    long long istride, long long idist, const long long* onembed, long long ostride,
+                    long long odist, long long batch) {
+        std::vector<long long> key = {device, (long long)type, rank, istride, idist, ostride, odist, batch};
+        key.insert(key.end(), n, n + rank);
+        key.insert(key.end(), inembed, inembed + rank);
+        key.insert(key.end(), onembed, onembed + rank);
+
+        std::lock_guard<std::mutex> guard(mutex_);
+        auto it = plans_.find(key);
+        if (it != plans_.end()) return it->second;
+
+        if (cudaSetDevice(device) != cudaSuccess) {
+            throw std::runtime_error("Failed to set CUDA device.");
+        }
+        std::vector<long long> n_(n, n + rank), inembed_(inembed, inembed + rank), onembed_(onembed, onembed + rank);
+        cufftHandle plan;
+        size_t workspace_size;
+        CheckCufftError(cufftCreate(&plan));
+        CheckCufftError(cufftMakePlanMany64(plan, rank, n_.data(), inembed_.data(), istride, idist, onembed_.data(),
+                                            ostride, odist, type, batch, &workspace_size));
+        plans_[key] = plan;
+        return plan;
+    }
+
+ private:
+    std::map<std::vector<long long>, cufftHandle> plans_;
+    std::mutex mutex_;
+};
+
+}  // namespace fft
+
+}  // namespace dace
@@ -0,0 +1,187 @@
+// Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+#pragma once
+
+#include <fftw3.h>
+
+#include <algorithm>  // std::max
+#include <map>
+#include <mutex>
+#include <stdexcept>  // std::runtime_error
+#include <vector>
+
+namespace dace {
+
+namespace fft {
+
+enum class Kind { C2C = 0, R2C = 1, C2R = 2 };
+
+// Precision-dependent FFTW interface. FFTW uses the same dimension type (fftw_iodim64) in all precisions.
+template <typename T>
+struct FFTW;
+
+template <>
+struct FFTW<double> {
+    using Plan = fftw_plan;
+
+    static Plan Create(Kind kind, int sign, int rank, const fftw_iodim64* dims, int howmany_rank,
+                       const fftw_iodim64* howmany_dims, void* in, void* out, unsigned flags) {
+        switch (kind) {
+            case Kind::R2C:
+                return fftw_plan_guru64_dft_r2c(rank, dims, howmany_rank, howmany_dims, (double*)in,
+                                                (fftw_complex*)out, flags);
+            case Kind::C2R:
+                return fftw_plan_guru64_dft_c2r(rank, dims, howmany_rank, howmany_dims, (fftw_complex*)in,
+                                                (double*)out, flags);
+            default:
+                return fftw_plan_guru64_dft(rank, dims, howmany_rank, howmany_dims, (fftw_complex*)in,
+                                            (fftw_complex*)out, sign, flags);
+        }
+    }
+
+    static void Execute(Plan plan, Kind kind, void* in, void* out) {
+        switch (kind) {
+            case Kind::R2C:
+                fftw_execute_dft_r2c(plan, (double*)in, (fftw_complex*)out);
+                break;
+            case Kind::C2R:
+                fftw_execute_dft_c2r(plan, (fftw_complex*)in, (double*)out);
+                break;
+            default:
+                fftw_execute_dft(plan, (fftw_complex*)in, (fftw_complex*)out);
+        }
+    }
+
+    static void Destroy(Plan plan) { fftw_destroy_plan(plan); }
+    static int AlignmentOf(void* ptr) { return fftw_alignment_of((double*)ptr); }
+    static void* Malloc(size_t size) { return fftw_malloc(size); }
+    static void Free(void* ptr) { fftw_free(ptr); }
+};
+
+template <>
+struct FFTW<float> {
+    using Plan = fftwf_plan;
+
+    static Plan Create(Kind kind, int sign, int rank, const fftw_iodim64* dims, int howmany_rank,
+                       const fftw_iodim64* howmany_dims, void* in, void* out, unsigned flags) {
+        switch (kind) {
+            case Kind::R2C:
+                return fftwf_plan_guru64_dft_r2c(rank, dims, howmany_rank, howmany_dims, (float*)in,
+                                                 (fftwf_complex*)out, flags);
+            case Kind::C2R:
+                return fftwf_plan_guru64_dft_c2r(rank, dims, howmany_rank, howmany_dims, (fftwf_complex*)in,
+                                                 (float*)out, flags);
+            default:
+                return fftwf_plan_guru64_dft(rank, dims, howmany_rank, howmany_dims, (fftwf_complex*)in,
+                                             (fftwf_complex*)out, sign, flags);
+        }
+    }
+
+    static void Execute(Plan plan, Kind kind, void* in, void* out) {
+        switch (kind) {
+            case Kind::R2C:
+                fftwf_execute_dft_r2c(plan, (float*)in, (fftwf_complex*)out);
+                break;
+            case Kind::C2R:
+                fftwf_execute_dft_c2r(plan, (fftwf_complex*)in, (float*)out);
+                break;
+            default:
+                fftwf_execute_dft(plan, (fftwf_complex*)in, (fftwf_complex*)out);
+        }
+    }
+
+    static void Destroy(Plan plan) { fftwf_destroy_plan(plan); }
+    static int AlignmentOf(void* ptr) { return fftwf_alignment_of((float*)ptr); }
+    static void* Malloc(size_t size) { return fftwf_malloc(size); }
+    static void Free(void* ptr) { fftwf_free(ptr); }
+};
+
+/**
+ * Caches FFTW plans across invocations of an SDFG. Creating a plan is expensive (and may even run the transform
+ * multiple times with planner flags other than FFTW_ESTIMATE), whereas executing a cached plan on new data through the
+ * new-array execute interface is not. Plans are keyed by their transform and layout, and by the alignment and
+ * placement of the data, which the new-array interface requires to match those used during planning.
+ **/
+class FFTWPlanCache {
+ public:
+    FFTWPlanCache() = default;
+    FFTWPlanCache(FFTWPlanCache const&) = delete;
+    FFTWPlanCache& operator=(FFTWPlanCache const&) = delete;
+
+    ~FFTWPlanCache() {
+        std::lock_guard<std::mutex> guard(PlannerMutex());
+        for (auto& kv : plans_) {
+            if (kv.first[0] == sizeof(float))
+                FFTW<float>::Destroy((FFTW<float>::Plan)kv.second);
+            else
+                FFTW<double>::Destroy((FFTW<double>::Plan)kv.second);
+        }
+    }
+
+    /**
+     * Computes a (batched) transform. Dimensions and strides are given in elements of the respective data types.
+     * @param in_elements, out_elements The number of elements spanned by the input and output data.
+     **/
+    template <typename T>
+    void Execute(Kind kind, int sign, int rank, const fftw_iodim64* dims, int howmany_rank,
+                 const fftw_iodim64* howmany_dims, const void* in, void* out, long long in_elements,
+                 long long out_elements, unsigned flags) {
+        void* inptr = const_cast<void*>(in);
+        const bool inplace = (inptr == out);
+        const int in_alignment = FFTW<T>::AlignmentOf(inptr), out_alignment = FFTW<T>::AlignmentOf(out);
+
+        std::vector<long long> key = {(long long)sizeof(T), (long long)kind, sign, (long long)flags, inplace,
+                                      in_alignment, out_alignment, rank, howmany_rank};
+        for (int i = 0; i < rank; ++i) key.insert(key.end(), {dims[i].n, dims[i].is, dims[i].os});
+        for (int i = 0; i < howmany_rank; ++i)
+            key.insert(key.end(), {howmany_dims[i].n, howmany_dims[i].is, howmany_dims[i].os});
+
+        typename FFTW<T>::Plan plan;
+        {
+            // The FFTW planner is not thread-safe
+            std::lock_guard<std::mutex> guard(PlannerMutex());
+            auto it = plans_.find(key);
+            if (it != plans_.end()) {
+                plan = (typename FFTW<T>::Plan)it->second;
+            } else {
+                plan = CreatePlan<T>(kind, sign, rank, dims, howmany_rank, howmany_dims, inptr, out, in_elements,
+                               out_elements, in_alignment != 0 || out_alignment != 0, inplace, flags);
+                if (!plan) throw std::runtime_error("FFTW failed to create a plan");
+                plans_[key] = (void*)plan;
+            }
+        }
+        FFTW<T>::Execute(plan, kind, inptr, out);
+    }
+
+ private:
+    static std::mutex& PlannerMutex() {
+        static std::mutex mutex;
+        return mutex;
+    }
+
+    template <typename T>
+    static typename FFTW<T>::Plan CreatePlan(Kind kind, int sign, int rank, const fftw_iodim64* dims,
+                                             int howmany_rank, const fftw_iodim64* howmany_dims, void* in, void* out,
+                                             long long in_elements, long long out_elements, bool unaligned,
+                                             bool inplace, unsigned flags) {
+        // Planning with FFTW_ESTIMATE does not access the data
+        if (flags & FFTW_ESTIMATE)
+            return FFTW<T>::Create(kind, sign, rank, dims, howmany_rank, howmany_dims, in, out, flags);
+
+        // Other planner flags overwrite the given arrays, so plan on scratch memory with the same layout instead
+        const size_t in_size = in_elements * sizeof(T) * (kind == Kind::R2C ? 1 : 2);
+        const size_t out_size = out_elements * sizeof(T) * (kind == Kind::C2R ? 1 : 2);
+        void* scratch_in = FFTW<T>::Malloc(inplace ? std::max(in_size, out_size) : in_size);
+        void* scratch_out = inplace ? scratch_in : FFTW<T>::Malloc(out_size);
+        auto plan = FFTW<T>::Create(kind, sign, rank, dims, howmany_rank, howmany_dims, scratch_in, scratch_out,
+                                    flags | (unaligned ? FFTW_UNALIGNED : 0));
+        if (!inplace) FFTW<T>::Free(scratch_out);
+        FFTW<T>::Free(scratch_in);
+        return plan;
+    }
+
+    std::map<std::vector<long long>, void*> plans_;
+};
+
+}  // namespace fft
+
+}  // namespace dace
@@ -0,0 +1 @@
+from .fft import FFT
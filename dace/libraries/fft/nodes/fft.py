@@ -0,0 +1,487 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import functools
+import operator
+import warnings
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+import dace.library
+import dace.properties
+import dace.sdfg.nodes
+from dace import data as dt, dtypes, symbolic, Memlet, SDFG, SDFGState
+from dace.config import Config
+from dace.libraries.fft import environments
+from dace.transformation.transformation import ExpandTransformation
+
+_TWO_PI = '6.283185307179586'
+
+_FFTW_PLANNER_FLAGS = {
+    'estimate': 'FFTW_ESTIMATE',
+    'measure': 'FFTW_MEASURE',
+    'patient': 'FFTW_PATIENT',
+    'exhaustive': 'FFTW_EXHAUSTIVE',
+}
+
+
+def _is_complex(dtype: dtypes.typeclass) -> bool:
+    return dtype.type in (np.complex64, np.complex128)
+
+
+def _transform(node: 'FFT', state: SDFGState, sdfg: SDFG) -> Dict[str, Any]:
+    """ Returns the properties of the transform computed by an FFT node: its kind (``c2c``, ``r2c`` or ``c2r``), the
+        transformed axes, their logical sizes, the input and output descriptors and shapes, the input strides used in
+        library calls, and the floating-point type of the computation. """
+    in_desc, in_shape, out_desc, out_shape = node.validate(sdfg, state)
+    if _is_complex(in_desc.dtype):
+        kind = 'c2c' if _is_complex(out_desc.dtype) else 'c2r'
+    else:
+        kind = 'r2c'
+    axes = node.transform_axes(len(in_shape))
+
+    # Logical sizes of the transformed axes. The last axis of real transforms is halved on the complex side.
+    sizes = [in_shape[a] for a in axes]
+    if kind == 'c2r':
+        sizes[-1] = out_shape[axes[-1]]
+
+    # Input and output have the same precision
+    ftype = dace.float32 if in_desc.dtype in (dace.float32, dace.complex64) else dace.float64
+
+    # Complex-to-real library calls overwrite their input, which is copied to a contiguous buffer beforehand
+    if kind == 'c2r':
+        in_strides = [dt._prod(in_shape[i + 1:]) for i in range(len(in_shape))]
+    else:
+        in_strides = in_desc.strides
+
+    return dict(kind=kind,
+                axes=axes,
+                sizes=sizes,
+                in_desc=in_desc,
+                in_shape=in_shape,
+                in_strides=in_strides,
+                out_desc=out_desc,
+                out_shape=out_shape,
+                ftype=ftype)
+
+
+def _scale_factor(node: 'FFT', sizes: List[symbolic.SymbolicType], ftype: dtypes.typeclass) -> Optional[str]:
+    """ Returns the normalization factor of the transform as an expression, or None if the output is unscaled. """
+    total = symbolic.symstr(functools.reduce(operator.mul, sizes, 1))
+    if node.norm == 'ortho':
+        return '({t}(1) / sqrt({t}({n})))'.format(t='dace.' + ftype.to_string(), n=total)
+    if (node.norm == 'backward') == node.inverse:
+        return '({t}(1) / {t}({n}))'.format(t='dace.' + ftype.to_string(), n=total)
+    return None
+
+
+def _add_array(sdfg: SDFG, name: str, desc: dt.Data, shape) -> None:
+    """ Adds a non-transient array with the layout of an outer data descriptor to a nested SDFG. """
+    sdfg.add_array(name, shape, desc.dtype, storage=desc.storage, strides=desc.strides)
+
+
+def _schedule(desc: dt.Data) -> dtypes.ScheduleType:
+    """ Returns the schedule of maps that access the given data. """
+    if desc.storage == dtypes.StorageType.GPU_Global:
+        return dtypes.ScheduleType.GPU_Device
+    return dtypes.ScheduleType.Default
+
+
+def _add_scaling(sdfg: SDFG, state: SDFGState, name: str, factor: str) -> SDFGState:
+    """ Adds a state that scales an array in-place by a factor. """
+    desc = sdfg.arrays[name]
+    scale_state = sdfg.add_state_after(state, 'fft_scale')
+    params = ['__i%d' % i for i in range(len(desc.shape))]
+    index = ', '.join(params)
+    scale_state.add_mapped_tasklet('fft_scale', {p: '0:%s' % s
+                                                 for p, s in zip(params, desc.shape)},
+                                   {'__x': Memlet('%s[%s]' % (name, index))},
+                                   '__y = __x * %s' % factor, {'__y': Memlet('%s[%s]' % (name, index))},
+                                   schedule=_schedule(desc),
+                                   external_edges=True)
+    return scale_state
+
+
+@dace.library.expansion
+class ExpandFFTPure(ExpandTransformation):
+    """
+    Naive backend-agnostic expansion of FFT nodes, which computes a discrete Fourier transform in O(n^2) operations
+    along each axis.
+    """
+
+    environments = []
+
+    @staticmethod
+    def _add_step(sdfg: SDFG, state: SDFGState, src: str, dst: str, axis: int, size, kind: str, sign: int,
+                  factor: Optional[str], ftype: dtypes.typeclass) -> SDFGState:
+        """ Adds states that compute the one-dimensional DFT of ``src`` along one axis into ``dst``. """
+        ddesc = sdfg.arrays[dst]
+        params = ['__i%d' % i for i in range(len(ddesc.shape))]
+        out_index = ', '.join(params)
+        n = symbolic.symstr(size)
+        ft = 'dace.' + ftype.to_string()
+
+        init_state = sdfg.add_state_after(state, 'dft_init')
+        init_state.add_mapped_tasklet('dft_init', {p: '0:%s' % s
+                                                   for p, s in zip(params, ddesc.shape)}, {},
+                                      '__out = 0', {'__out': Memlet('%s[%s]' % (dst, out_index))},
+                                      schedule=_schedule(ddesc),
+                                      external_edges=True)
+
+        # Sum over all inputs along the axis. The inputs of complex-to-real transforms are Hermitian-symmetric, where
+        # element n - j is the complex conjugate of element j, such that only the first n // 2 + 1 elements are stored.
+        in_params = list(params)
+        if kind == 'c2r':
+            in_params[axis] = 'min(__j, %s - __j)' % n
+            code = '__m = min(__j, {n} - __j)\n'
+        else:
+            in_params[axis] = '__j'
+            code = '__m = __j\n'
+        code += '__t = {pi} * {ft}(dace.int64(__m) * __i{axis} % {n}) / {ft}({n})\n'
+        if kind == 'c2r':
+            code += '__out = (real(__inp) * cos(__t) - {sign}imag(__inp) * sin(__t))'
+        else:
+            code += '__out = __inp * dace.{ct}(cos(__t), {sign}sin(__t))'
+        if factor is not None:
+            code += ' * %s' % factor
+        code = code.format(n=n,
+                           pi=_TWO_PI,
+                           ft=ft,
+                           ct=('complex64' if ftype == dace.float32 else 'complex128'),
+                           axis=axis,
+                           sign='' if sign > 0 else '-')
+
+        acc_state = sdfg.add_state_after(init_state, 'dft')
+        map_ranges = {p: '0:%s' % s for p, s in zip(params, ddesc.shape)}
+        map_ranges['__j'] = '0:%s' % n
+        acc_state.add_mapped_tasklet('dft',
+                                     map_ranges, {'__inp': Memlet('%s[%s]' % (src, ', '.join(in_params)))},
+                                     code, {'__out': Memlet('%s[%s]' % (dst, out_index), wcr='lambda a, b: a + b')},
+                                     schedule=_schedule(ddesc),
+                                     external_edges=True)
+        return acc_state
+
+    @staticmethod
+    def expansion(node, parent_state, parent_sdfg, **kwargs):
+        t = _transform(node, parent_state, parent_sdfg)
+        kind, axes, sizes = t['kind'], t['axes'], t['sizes']
+        sign = 1 if node.inverse else -1
+        ctype = t['out_desc'].dtype if kind == 'r2c' else t['in_desc'].dtype
+
+        sdfg = dace.SDFG('{l}_sdfg'.format(l=node.label))
+        _add_array(sdfg, '_inp', t['in_desc'], t['in_shape'])
+        _add_array(sdfg, '_out', t['out_desc'], t['out_shape'])
+        state = sdfg.add_state('{l}_state'.format(l=node.label))
+
+        # Real-to-complex transforms start with the last axis, complex-to-real transforms end with it
+        steps = [(a, n, 'c2c') for a, n in zip(axes, sizes)]
+        if kind == 'r2c':
+            steps = [(axes[-1], sizes[-1], 'r2c')] + steps[:-1]
+        elif kind == 'c2r':
+            steps[-1] = (axes[-1], sizes[-1], 'c2r')
+
+        # Every step is scaled by its share of the normalization factor
+        src = '_inp'
+        for i, (axis, size, step_kind) in enumerate(steps):
+            if i == len(steps) - 1:
+                dst = '_out'
+            else:
+                shape = t['out_shape'] if kind == 'r2c' else t['in_shape']
+                dst, _ = sdfg.add_temp_transient(shape, ctype, storage=t['in_desc'].storage)
+            state = ExpandFFTPure._add_step(sdfg, state, src, dst, axis, size, step_kind, sign,
+                                            _scale_factor(node, [size], t['ftype']), t['ftype'])
+            src = dst
+
+        return sdfg
+
+
+def _library_sdfg(node: 'FFT', t: Dict[str, Any], code: str) -> SDFG:
+    """ Creates the nested SDFG of an FFT node expanded to a library call, given as the code of a tasklet that
+        transforms ``_inp`` into ``_out``. Complex-to-real transforms overwrite their input, so it is first copied
+        to a contiguous buffer (``__inp_buffer``), whose layout is used in the call. The output is normalized
+        afterwards if necessary. """
+    sdfg = dace.SDFG('{l}_sdfg'.format(l=node.label))
+    _add_array(sdfg, '_inp', t['in_desc'], t['in_shape'])
+    _add_array(sdfg, '_out', t['out_desc'], t['out_shape'])
+    state = sdfg.add_state('{l}_state'.format(l=node.label))
+
+    inp = '_inp'
+    if t['kind'] == 'c2r':
+        inp = '__inp_buffer'
+        sdfg.add_array(inp, t['in_shape'], t['in_desc'].dtype, storage=t['in_desc'].storage, transient=True)
+        state.add_nedge(state.add_read('_inp'), state.add_write(inp), Memlet.from_array('_inp', sdfg.arrays['_inp']))
+        state = sdfg.add_state_after(state, '{l}_transform'.format(l=node.label))
+
+    tasklet = state.add_tasklet(node.name, {'_in': dace.pointer(t['in_desc'].dtype)},
+                                {'_o': dace.pointer(t['out_desc'].dtype)},
+                                code,
+                                language=dtypes.Language.CPP)
+    state.add_edge(state.add_read(inp), None, tasklet, '_in', Memlet.from_array(inp, sdfg.arrays[inp]))
+    state.add_edge(tasklet, '_o', state.add_write('_out'), None, Memlet.from_array('_out', sdfg.arrays['_out']))
+
+    factor = _scale_factor(node, t['sizes'], t['ftype'])
+    if factor is not None:
+        _add_scaling(sdfg, state, '_out', factor)
+    return sdfg
+
+
+@dace.library.expansion
+class ExpandFFTFFTW(ExpandTransformation):
+    """
+    Expands FFT nodes to FFTW calls. Any number of axes and any data layout are supported through the guru interface,
+    where the non-transformed axes form the batch. Plans are created once (see ``library.fft.fftw_planner``) and
+    reused in subsequent invocations of the SDFG.
+    """
+
+    environments = [environments.fftw.FFTW]
+
+    @staticmethod
+    def expansion(node, parent_state, parent_sdfg, **kwargs):
+        from dace.codegen.targets.cpp import sym2cpp
+
+        t = _transform(node, parent_state, parent_sdfg)
+        kind, axes, sizes = t['kind'], t['axes'], t['sizes']
+        in_strides, out_strides = t['in_strides'], t['out_desc'].strides
+        batch_axes = [a for a in range(len(t['in_shape'])) if a not in axes]
+
+        def iodims(axes, sizes):
+            return ', '.join('{%s, %s, %s}' % (sym2cpp(n), sym2cpp(in_strides[a]), sym2cpp(out_strides[a]))
+                             for a, n in zip(axes, sizes))
+
+        def extent(shape, strides):
+            return ' + '.join(['1'] + ['(%s - 1) * %s' % (sym2cpp(s), sym2cpp(st)) for s, st in zip(shape, strides)])
+
+        planner = Config.get('library', 'fft', 'fftw_planner')
+        if planner not in _FFTW_PLANNER_FLAGS:
+            raise ValueError('Unknown FFTW planner mode "%s"' % planner)
+
+        code = '''
+fftw_iodim64 __dims[] = {{{dims}}};
+{batch_decl}
+__state->fftw_plans.Execute<{ftype}>(dace::fft::Kind::{kind}, {sign}, {rank}, __dims, {batch_rank}, {batch}, _in, _o,
+                                     {in_extent}, {out_extent}, {flags});
+'''.format(dims=iodims(axes, sizes),
+           batch_decl=('fftw_iodim64 __batch[] = {%s};' %
+                       iodims(batch_axes, [t['in_shape'][a] for a in batch_axes])) if batch_axes else '',
+           ftype=t['ftype'].ctype,
+           kind=kind.upper(),
+           sign='FFTW_BACKWARD' if node.inverse else 'FFTW_FORWARD',
+           rank=len(axes),
+           batch_rank=len(batch_axes),
+           batch='__batch' if batch_axes else 'nullptr',
+           in_extent=extent(t['in_shape'], in_strides),
+           out_extent=extent(t['out_shape'], out_strides),
+           flags=_FFTW_PLANNER_FLAGS[planner])
+
+        return _library_sdfg(node, t, code)
+
+
+@dace.library.expansion
+class ExpandFFTcuFFT(ExpandTransformation):
+    """
+    Expands FFT nodes to cuFFT calls on GPU data. Up to three axes can be transformed, whose strides must be multiples
+    of one another (i.e., any permutation-free layout of the transformed axes). One of the other axes is batched in
+    the cuFFT plan, and transforms over the remaining ones are launched in a loop. Plans are cached across
+    invocations of the SDFG.
+    """
+
+    environments = [environments.cufft.cuFFT]
+
+    @staticmethod
+    def expansion(node, parent_state, parent_sdfg, **kwargs):
+        from dace.codegen.targets.cpp import sym2cpp
+
+        t = _transform(node, parent_state, parent_sdfg)
+        kind, axes, sizes = t['kind'], t['axes'], t['sizes']
+        in_strides, out_strides = t['in_strides'], t['out_desc'].strides
+
+        for desc in (t['in_desc'], t['out_desc']):
+            if desc.storage != dtypes.StorageType.GPU_Global:
+                warnings.warn('cuFFT requires data in GPU memory. Falling back to the pure expansion.')
+                return ExpandFFTPure.expansion(node, parent_state, parent_sdfg)
+        if len(axes) > 3:
+            warnings.warn('cuFFT supports transforms of up to three axes. Falling back to the pure expansion.')
+            return ExpandFFTPure.expansion(node, parent_state, parent_sdfg)
+
+        # Express the layout of the transformed axes as embedded sizes, which requires nested strides
+        def embed(strides):
+            result = ['1']
+            for outer, inner in zip(axes[:-1], axes[1:]):
+                ratio = symbolic.pystr_to_symbolic(strides[outer]) / symbolic.pystr_to_symbolic(strides[inner])
+                ratio = symbolic.simplify(ratio)
+                if not symbolic.issymbolic(ratio) and (ratio != int(ratio) or ratio < 1):
+                    return None
+                if symbolic.issymbolic(ratio) and not ratio.is_polynomial():
+                    return None
+                result.append(sym2cpp(ratio))
+            return result
+
+        inembed, onembed = embed(in_strides), embed(out_strides)
+        if inembed is None or onembed is None:
+            warnings.warn('Data layout is not supported by cuFFT. Falling back to the pure expansion.')
+            return ExpandFFTPure.expansion(node, parent_state, parent_sdfg)
+
+        # Batch over the largest remaining axis, loop over the others
+        batch_axes = [a for a in range(len(t['in_shape'])) if a not in axes]
+        loop_axes = list(batch_axes)
+        if batch_axes:
+            batch_axis = max(batch_axes,
+                             key=lambda a: t['in_shape'][a] if not symbolic.issymbolic(t['in_shape'][a]) else np.inf)
+            loop_axes.remove(batch_axis)
+            batch, idist, odist = (sym2cpp(t['in_shape'][batch_axis]), sym2cpp(in_strides[batch_axis]),
+                                   sym2cpp(out_strides[batch_axis]))
+        else:
+            batch, idist, odist = '1', '0', '0'
+
+        is_double = t['ftype'] == dace.float64
+        cutype = {
+            'c2c': 'CUFFT_Z2Z' if is_double else 'CUFFT_C2C',
+            'r2c': 'CUFFT_D2Z' if is_double else 'CUFFT_R2C',
+            'c2r': 'CUFFT_Z2D' if is_double else 'CUFFT_C2R'
+        }[kind]
+        ctype = 'cufftDoubleComplex' if is_double else 'cufftComplex'
+        rtype = 'cufftDoubleReal' if is_double else 'cufftReal'
+        intype, outtype = {'c2c': (ctype, ctype), 'r2c': (rtype, ctype), 'c2r': (ctype, rtype)}[kind]
+        func = {
+            'CUFFT_Z2Z': 'Z2Z',
+            'CUFFT_C2C': 'C2C',
+            'CUFFT_D2Z': 'D2Z',
+            'CUFFT_R2C': 'R2C',
+            'CUFFT_Z2D': 'Z2D',
+            'CUFFT_C2R': 'C2R'
+        }[cutype]
+        direction = (', CUFFT_INVERSE' if node.inverse else ', CUFFT_FORWARD') if kind == 'c2c' else ''
+
+        call = ('dace::fft::CheckCufftError(cufftExec{func}(__plan, ({intype} *)(_in + __ioff), '
+                '({outtype} *)(_o + __ooff){direction}));').format(func=func,
+                                                                   intype=intype,
+                                                                   outtype=outtype,
+                                                                   direction=direction)
+        # Offsets of the looped batches
+        offsets = 'const long long __ioff = {}, __ooff = {};'.format(
+            ' + '.join(['0'] + ['__b%d * %s' % (a, sym2cpp(in_strides[a])) for a in loop_axes]),
+            ' + '.join(['0'] + ['__b%d * %s' % (a, sym2cpp(out_strides[a])) for a in loop_axes]))
+        call = offsets + '\n' + call
+        for a in reversed(loop_axes):
+            call = 'for (long long __b{a} = 0; __b{a} < {n}; ++__b{a}) {{\n{body}\n}}'.format(a=a,
+                                                                                              n=sym2cpp(
+                                                                                                  t['in_shape'][a]),
+                                                                                              body=call)
+
+        code = environments.cufft.cuFFT.handle_setup_code(node)
+        code += '''
+long long __n[] = {{{n}}}, __inembed[] = {{{inembed}}}, __onembed[] = {{{onembed}}};
+cufftHandle __plan = __state->cufft_plans.Get(__dace_cuda_device, {cutype}, {rank}, __n, __inembed, {istride},
+                                              {idist}, __onembed, {ostride}, {odist}, {batch});
+dace::fft::CheckCufftError(cufftSetStream(__plan, __dace_current_stream));
+{call}
+'''.format(n=', '.join(sym2cpp(s) for s in sizes),
+           inembed=', '.join(inembed),
+           onembed=', '.join(onembed),
+           cutype=cutype,
+           rank=len(axes),
+           istride=sym2cpp(in_strides[axes[-1]]),
+           ostride=sym2cpp(out_strides[axes[-1]]),
+           idist=idist,
+           odist=odist,
+           batch=batch,
+           call=call)
+
+        return _library_sdfg(node, t, code)
+
+
+@dace.library.node
+class FFT(dace.sdfg.nodes.LibraryNode):
+    """
+    Computes the discrete Fourier transform of an N-dimensional array (``_inp``) over one or more of its axes into
+    ``_out``. All other axes are transformed independently (batched). The kind of the transform is determined by the
+    data types: complex-to-complex, real-to-complex (forward only, where the last transformed axis of the output has
+    ``n // 2 + 1`` elements) or complex-to-real (inverse only, the converse).
+    """
+
+    # Global properties
+    implementations = {
+        "pure": ExpandFFTPure,
+        "FFTW": ExpandFFTFFTW,
+        "cuFFT": ExpandFFTcuFFT,
+    }
+    default_implementation = None
+
+    # Object fields
+    axes = dace.properties.ListProperty(element_type=int,
+                                        allow_none=True,
+                                        default=None,
+                                        desc='Axes to transform. If None, all axes are transformed')
+    inverse = dace.properties.Property(dtype=bool, default=False, desc='Compute the inverse transform')
+    norm = dace.properties.Property(dtype=str,
+                                    default='backward',
+                                    desc='Normalization mode, as in NumPy: "backward" scales the inverse transform '
+                                    'by 1/n, "ortho" scales both directions by 1/sqrt(n), and "forward" scales the '
+                                    'forward transform by 1/n')
+
+    def __init__(self, name, axes=None, inverse=False, norm='backward', *args, **kwargs):
+        super().__init__(name, *args, inputs={"_inp"}, outputs={"_out"}, **kwargs)
+        self.axes = axes
+        self.inverse = inverse
+        self.norm = norm
+
+    def transform_axes(self, ndim: int) -> List[int]:
+        """ Returns the (non-negative) transformed axes of an ``ndim``-dimensional input. """
+        if self.axes is None:
+            return list(range(ndim))
+        return [a % ndim for a in self.axes]
+
+    def validate(self, sdfg, state):
+        """
+        :return: A four-tuple of the input and output descriptors and shapes.
+        """
+        in_edges = state.in_edges(self)
+        out_edges = state.out_edges(self)
+        if len(in_edges) != 1 or in_edges[0].dst_conn != '_inp':
+            raise ValueError('Expected exactly one input to FFT node, connected to "_inp"')
+        if len(out_edges) != 1 or out_edges[0].src_conn != '_out':
+            raise ValueError('Expected exactly one output from FFT node, connected to "_out"')
+        if self.norm not in ('backward', 'ortho', 'forward'):
+            raise ValueError('Invalid FFT normalization mode "%s"' % self.norm)
+
+        in_desc = sdfg.arrays[in_edges[0].data.data]
+        out_desc = sdfg.arrays[out_edges[0].data.data]
+        in_shape = in_edges[0].data.subset.size()
+        out_shape = out_edges[0].data.subset.size()
+        if len(in_shape) != len(out_shape):
+            raise ValueError('FFT input and output must have the same number of dimensions')
+        ndim = len(in_shape)
+        if self.axes is not None:
+            if len(self.axes) == 0 or any(a < -ndim or a >= ndim for a in self.axes):
+                raise ValueError('Invalid FFT axes %s for %d-dimensional data' % (self.axes, ndim))
+            if len(set(self.transform_axes(ndim))) != len(self.axes):
+                raise ValueError('FFT axes must be unique')
+        axes = self.transform_axes(ndim)
+
+        for desc in (in_desc, out_desc):
+            if desc.dtype not in (dace.float32, dace.float64, dace.complex64, dace.complex128):
+                raise TypeError('FFT only supports single- and double-precision real and complex data')
+        if not _is_complex(in_desc.dtype) and not _is_complex(out_desc.dtype):
+            raise TypeError('Either the input or the output of an FFT must be complex')
+        if (in_desc.dtype in (dace.float32, dace.complex64)) != (out_desc.dtype in (dace.float32, dace.complex64)):
+            raise TypeError('FFT input and output must have the same precision')
+
+        # Check shapes, where the last transformed axis of real transforms is halved on the complex side
+        halved = None
+        if not _is_complex(in_desc.dtype):
+            if self.inverse:
+                raise ValueError('Real-to-complex FFTs can only compute the forward transform')
+            halved = (out_shape, in_shape)
+        elif not _is_complex(out_desc.dtype):
+            if not self.inverse:
+                raise ValueError('Complex-to-real FFTs can only compute the inverse transform')
+            halved = (in_shape, out_shape)
+        for i, (isize, osize) in enumerate(zip(in_shape, out_shape)):
+            if halved is not None and i == axes[-1]:
+                complex_size, real_size = halved[0][i], halved[1][i]
+                if (complex_size != real_size // 2 + 1) == True:
+                    raise ValueError('Size of the complex side of real FFT along axis %d must be %s, got %s' %
+                                     (i, real_size // 2 + 1, complex_size))
+            elif (isize != osize) == True:
+                raise ValueError('FFT input and output sizes mismatch along axis %d' % i)
+
+        return in_desc, in_shape, out_desc, out_shape
@@ -1,2 +1,4 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
-from .cuda import CUDA
\ No newline at end of file
+from .cuda import CUDA
+from .parallel_sort import ParallelSort
+from .parallel_scatter_add import ParallelScatterAdd
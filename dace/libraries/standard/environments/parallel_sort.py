@@ -0,0 +1,22 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import dace.library
+
+
+@dace.library.environment
+class ParallelSort:
+    """ Header-only parallel CPU sorting routines used by the ``Sort`` library node. """
+
+    cmake_minimum_version = None
+    cmake_packages = []
+    cmake_variables = {}
+    cmake_includes = []
+    cmake_libraries = []
+    cmake_compile_flags = []
+    cmake_link_flags = []
+    cmake_files = []
+
+    headers = ["../include/dace_sort.h"]
+    state_fields = []
+    init_code = ""
+    finalize_code = ""
+    dependencies = []
@@ -0,0 +1,149 @@
+// Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+#pragma once
+
+#include <algorithm>
+#include <memory>
+#include <utility>
+#include <vector>
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+namespace dace {
+
+namespace scatter {
+
+// Minimal number of indices to scatter in parallel
+constexpr long long min_parallel_size = 1 << 14;
+
+// Maximal size (in bytes) of the bins for which every thread accumulates into a private copy
+constexpr long long max_private_bytes = 1 << 18;
+
+namespace detail {
+
+// Wraps negative indices as in NumPy indexing, returns -1 for indices outside of the bins
+template <typename I>
+inline long long bin_of(I index, long long nbins) {
+    long long idx = (long long)index;
+    if (idx < 0) idx += nbins;
+    return (idx >= 0 && idx < nbins) ? idx : -1;
+}
+
+template <typename O, typename V>
+inline O value_of(const V* values, long long value_stride, long long i) {
+    return values ? O(values[i * value_stride]) : O(1);
+}
+
+}  // namespace detail
+
+/**
+ * Adds `n` values (or ones if `values` is null) to the bins of `out` selected by `indices`, i.e.,
+ * `out[indices[i]] += values[i]`. Indices outside of the bins are skipped. The bins are first initialized with the
+ * contents of `bins`, or with zeros if `bins` is null. All arrays are strided.
+ *
+ * Small bins are privatized: every thread accumulates into its own copy of the bins, which are summed in the end.
+ * Larger bins are split among the threads, and the indices are first partitioned by the thread that owns their bin
+ * (a single-pass bucket sort), such that every thread then reduces into its own bins without conflicts.
+ **/
+template <typename O, typename I, typename V>
+void scatter_add(const I* indices, long long index_stride, const V* values, long long value_stride, long long n,
+                 const O* bins, long long bins_stride, O* out, long long out_stride, long long nbins) {
+    int nthreads = 1;
+#ifdef _OPENMP
+    if (n >= min_parallel_size) nthreads = omp_get_max_threads();
+#endif
+
+    // Initialize bins
+    if (bins != out || bins_stride != out_stride) {
+        #pragma omp parallel for num_threads(nthreads) schedule(static)
+        for (long long b = 0; b < nbins; ++b) out[b * out_stride] = bins ? bins[b * bins_stride] : O(0);
+    }
+    if (nbins <= 0) return;
+
+    if (nthreads <= 1) {
+        for (long long i = 0; i < n; ++i) {
+            const long long b = detail::bin_of(indices[i * index_stride], nbins);
+            if (b >= 0) out[b * out_stride] += detail::value_of<O>(values, value_stride, i);
+        }
+        return;
+    }
+
+    // Every loop over threads below runs one iteration per thread, but remains correct if fewer threads are spawned
+    if (nbins * (long long)sizeof(O) <= max_private_bytes) {
+        std::unique_ptr<O[]> private_bins(new O[nthreads * nbins]);
+
+        #pragma omp parallel num_threads(nthreads)
+        {
+            #pragma omp for schedule(static, 1)
+            for (int t = 0; t < nthreads; ++t) std::fill(&private_bins[t * nbins], &private_bins[(t + 1) * nbins], O(0));
+
+#ifdef _OPENMP
+            O* local = &private_bins[omp_get_thread_num() * nbins];
+#else
+            O* local = &private_bins[0];
+#endif
+            #pragma omp for schedule(static)
+            for (long long i = 0; i < n; ++i) {
+                const long long b = detail::bin_of(indices[i * index_stride], nbins);
+                if (b >= 0) local[b] += detail::value_of<O>(values, value_stride, i);
+            }
+
+            #pragma omp for schedule(static)
+            for (long long b = 0; b < nbins; ++b) {
+                O sum = out[b * out_stride];
+                for (int t = 0; t < nthreads; ++t) sum += private_bins[t * nbins + b];
+                out[b * out_stride] = sum;
+            }
+        }
+        return;
+    }
+
+    // Thread `t` owns bins [t * block, (t + 1) * block) and partitions chunk `t` of the indices
+    const long long block = (nbins + nthreads - 1) / nthreads;
+    std::vector<long long> offsets(nthreads * nthreads + 1, 0);  // Indexed by [owner][chunk]
+    std::unique_ptr<std::pair<long long, O>[]> partitioned(new std::pair<long long, O>[n]);
+
+    #pragma omp parallel num_threads(nthreads)
+    {
+        // Count the indices of every owner in every chunk
+        #pragma omp for schedule(static, 1)
+        for (int t = 0; t < nthreads; ++t) {
+            const long long begin = n * t / nthreads, end = n * (t + 1) / nthreads;
+            std::vector<long long> counts(nthreads, 0);
+            for (long long i = begin; i < end; ++i) {
+                const long long b = detail::bin_of(indices[i * index_stride], nbins);
+                if (b >= 0) ++counts[b / block];
+            }
+            for (int owner = 0; owner < nthreads; ++owner) offsets[owner * nthreads + t + 1] = counts[owner];
+        }
+
+        #pragma omp single
+        for (int k = 1; k <= nthreads * nthreads; ++k) offsets[k] += offsets[k - 1];
+
+        // Partition the values of every chunk by owner
+        #pragma omp for schedule(static, 1)
+        for (int t = 0; t < nthreads; ++t) {
+            const long long begin = n * t / nthreads, end = n * (t + 1) / nthreads;
+            std::vector<long long> positions(nthreads);
+            for (int owner = 0; owner < nthreads; ++owner) positions[owner] = offsets[owner * nthreads + t];
+            for (long long i = begin; i < end; ++i) {
+                const long long b = detail::bin_of(indices[i * index_stride], nbins);
+                if (b >= 0)
+                    partitioned[positions[b / block]++] =
+                        std::make_pair(b, detail::value_of<O>(values, value_stride, i));
+            }
+        }
+
+        // Reduce into the owned bins without conflicts
+        #pragma omp for schedule(static, 1)
+        for (int t = 0; t < nthreads; ++t) {
+            for (long long k = offsets[t * nthreads]; k < offsets[(t + 1) * nthreads]; ++k)
+                out[partitioned[k].first * out_stride] += partitioned[k].second;
+        }
+    }
+}
+
+}  // namespace scatter
+
+}  // namespace dace
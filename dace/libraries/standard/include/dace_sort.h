@@ -0,0 +1,151 @@
+// Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+#pragma once
+
+#include <algorithm>
+#include <functional>
+#include <utility>
+#include <vector>
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+namespace dace {
+
+namespace sort {
+
+// Minimal number of elements to sort in parallel
+constexpr long long min_parallel_size = 1 << 14;
+
+// Strict weak ordering that places NaNs last (as NumPy does)
+template <typename T>
+struct less {
+    inline bool operator()(const T& a, const T& b) const {
+        return a < b || (b != b && a == a);
+    }
+};
+
+// Orders key-index pairs by key, then by index, which makes every sort stable
+template <typename K>
+struct pair_less {
+    inline bool operator()(const std::pair<K, long long>& a, const std::pair<K, long long>& b) const {
+        less<K> comp;
+        if (comp(a.first, b.first)) return true;
+        if (comp(b.first, a.first)) return false;
+        return a.second < b.second;
+    }
+};
+
+namespace detail {
+
+// Returns the number of elements taken from `a` among the first `d` outputs of a stable merge of `a` and `b`
+template <typename T, typename Compare>
+long long merge_path(const T* a, long long na, const T* b, long long nb, long long d, Compare comp) {
+    long long lo = d > nb ? d - nb : 0, hi = d < na ? d : na;
+    while (lo < hi) {
+        long long i = lo + (hi - lo) / 2, j = d - i;
+        if (j > 0 && i < na && !comp(b[j - 1], a[i]))
+            lo = i + 1;
+        else
+            hi = i;
+    }
+    return lo;
+}
+
+// Sorts `n` elements in parallel: threads first sort contiguous chunks, then sorted runs are merged pairwise. Every
+// merge is split among multiple threads along its merge path.
+template <typename T, typename Compare>
+void parallel_sort(T* data, long long n, Compare comp, bool stable) {
+    int nchunks = 1;
+#ifdef _OPENMP
+    if (n >= min_parallel_size) nchunks = omp_get_max_threads();
+#endif
+    if (nchunks <= 1) {
+        if (stable)
+            std::stable_sort(data, data + n, comp);
+        else
+            std::sort(data, data + n, comp);
+        return;
+    }
+
+    std::vector<long long> bounds(nchunks + 1);
+    for (int c = 0; c <= nchunks; ++c) bounds[c] = n * c / nchunks;
+
+    #pragma omp parallel for schedule(static, 1) num_threads(nchunks)
+    for (int c = 0; c < nchunks; ++c) {
+        if (stable)
+            std::stable_sort(data + bounds[c], data + bounds[c + 1], comp);
+        else
+            std::sort(data + bounds[c], data + bounds[c + 1], comp);
+    }
+
+    std::vector<T> buffer(n);
+    T *src = data, *dst = buffer.data();
+    for (int width = 1; width < nchunks; width *= 2) {
+        const int merges = (nchunks + 2 * width - 1) / (2 * width);
+        const int parts = (nchunks + merges - 1) / merges;
+
+        #pragma omp parallel for schedule(static, 1) num_threads(nchunks)
+        for (int task = 0; task < merges * parts; ++task) {
+            const int m = task / parts, p = task % parts;
+            const int c = m * 2 * width;
+            const long long lo = bounds[c], mid = bounds[std::min(c + width, nchunks)],
+                            hi = bounds[std::min(c + 2 * width, nchunks)];
+            const T *a = src + lo, *b = src + mid;
+            const long long na = mid - lo, nb = hi - mid;
+
+            // Output range of this part and the corresponding input ranges
+            const long long dbegin = (na + nb) * p / parts, dend = (na + nb) * (p + 1) / parts;
+            const long long ibegin = merge_path(a, na, b, nb, dbegin, comp),
+                            iend = merge_path(a, na, b, nb, dend, comp);
+            std::merge(a + ibegin, a + iend, b + dbegin - ibegin, b + dend - iend, dst + lo + dbegin, comp);
+        }
+        std::swap(src, dst);
+    }
+    if (src != data) std::copy(src, src + n, data);
+}
+
+}  // namespace detail
+
+// Sorts a strided line of `n` keys into `out`
+template <typename K>
+void sort_keys(const K* in, long long in_stride, K* out, long long out_stride, long long n, bool stable,
+               bool parallel) {
+    std::vector<K> keys(n);
+    for (long long i = 0; i < n; ++i) keys[i] = in[i * in_stride];
+    if (parallel)
+        detail::parallel_sort(keys.data(), n, less<K>(), stable);
+    else if (stable)
+        std::stable_sort(keys.begin(), keys.end(), less<K>());
+    else
+        std::sort(keys.begin(), keys.end(), less<K>());
+    for (long long i = 0; i < n; ++i) out[i * out_stride] = keys[i];
+}
+
+// Sorts a strided line of `n` keys along with their values. If `values` is null, the values are the original indices
+// of the keys (i.e., an argsort). Either output may be null. The sort is always stable.
+template <typename K, typename V>
+void sort_pairs(const K* keys, long long key_stride, const V* values, long long value_stride, K* keys_out,
+                long long keys_out_stride, V* values_out, long long values_out_stride, long long n, bool parallel) {
+    std::vector<std::pair<K, long long>> pairs(n);
+    for (long long i = 0; i < n; ++i) pairs[i] = std::make_pair(keys[i * key_stride], i);
+    if (parallel)
+        detail::parallel_sort(pairs.data(), n, pair_less<K>(), false);
+    else
+        std::sort(pairs.begin(), pairs.end(), pair_less<K>());
+
+    // Gather values before writing to support in-place sorting
+    if (values_out) {
+        std::vector<V> sorted_values(n);
+        for (long long i = 0; i < n; ++i)
+            sorted_values[i] = values ? values[pairs[i].second * value_stride] : V(pairs[i].second);
+        for (long long i = 0; i < n; ++i) values_out[i * values_out_stride] = sorted_values[i];
+    }
+    if (keys_out) {
+        for (long long i = 0; i < n; ++i) keys_out[i * keys_out_stride] = pairs[i].first;
+    }
+}
+
+}  // namespace sort
+
+}  // namespace dace
@@ -2,3 +2,6 @@
 from .code import CodeLibraryNode
 from .gearbox import Gearbox
 from .reduce import Reduce
+from .scan import Scan
+from .scatter_add import ScatterAdd
+from .sort import Sort
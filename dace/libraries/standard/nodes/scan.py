@@ -0,0 +1,439 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" File defining the scan (prefix sum) library node. """
+
+import ast
+import warnings
+from typing import Tuple
+
+import dace
+import dace.library
+import dace.serialize
+from dace import dtypes
+from dace.frontend.operations import detect_reduction_type
+from dace.frontend.python.astutils import ASTFindReplace, unparse
+from dace.properties import Property, LambdaProperty
+from dace.sdfg import SDFG, SDFGState, graph
+from dace.symbolic import symstr
+from dace.transformation import transformation as pm
+from dace.libraries.standard.environments.cuda import CUDA
+from dace.libraries.standard.utils import can_expand_on_host, line_offsets
+
+
+def _scan_edges(node: 'Scan', state: SDFGState,
+                sdfg: SDFG) -> Tuple[graph.MultiConnectorEdge, graph.MultiConnectorEdge, int]:
+    """ Returns the input and output edges of a scan node, along with its (non-negative) axis. """
+    node.validate(sdfg, state)
+    inedge: graph.MultiConnectorEdge = state.in_edges(node)[0]
+    outedge: graph.MultiConnectorEdge = state.out_edges(node)[0]
+    return inedge, outedge, node.axis % inedge.data.subset.dims()
+
+
+def _op_expression(wcr: str, lhs: str, rhs: str) -> str:
+    """ Returns the body of a binary lambda function as a Python expression applied to ``lhs`` and ``rhs``. """
+    func = ast.parse(wcr).body[0].value
+    args = [arg.arg for arg in func.args.args]
+    body = ASTFindReplace({args[0]: lhs, args[1]: rhs}).visit(func.body)
+    return unparse(body)
+
+
+@dace.library.expansion
+class ExpandScanPure(pm.ExpandTransformation):
+    """
+        Pure SDFG Scan expansion, which scans every line along the axis
+        sequentially in a loop. Lines are scanned in parallel in a map.
+    """
+    environments = []
+
+    @staticmethod
+    def expansion(node: 'Scan', state: SDFGState, sdfg: SDFG):
+        inedge, outedge, axis = _scan_edges(node, state, sdfg)
+        input_data = sdfg.arrays[inedge.data.data]
+        output_data = sdfg.arrays[outedge.data.data]
+        shape = inedge.data.subset.size()
+        length = shape[axis]
+
+        # Create a nested SDFG that scans one line
+        lsdfg = SDFG('scan_line')
+        lsdfg.add_array('_in', [length],
+                        input_data.dtype,
+                        strides=[input_data.strides[axis]],
+                        storage=input_data.storage)
+        lsdfg.add_array('_out', [length],
+                        output_data.dtype,
+                        strides=[output_data.strides[axis]],
+                        storage=output_data.storage)
+        lsdfg.add_scalar('_acc', output_data.dtype, transient=True)
+
+        init_state = lsdfg.add_state('scan_init')
+        if node.identity is not None:
+            tinit = init_state.add_tasklet('scan_init', {}, {'__acc'}, '__acc = %s' % node.identity)
+            init_state.add_edge(tinit, '__acc', init_state.add_write('_acc'), None, dace.Memlet('_acc[0]'))
+            start = 0
+        else:
+            # Without an identity, the first element initializes the scan
+            tinit = init_state.add_tasklet('scan_init', {'__b'}, {'__acc', '__o'}, '__acc = __b\n__o = __b')
+            init_state.add_edge(init_state.add_read('_in'), None, tinit, '__b', dace.Memlet('_in[0]'))
+            init_state.add_edge(tinit, '__acc', init_state.add_write('_acc'), None, dace.Memlet('_acc[0]'))
+            init_state.add_edge(tinit, '__o', init_state.add_write('_out'), None, dace.Memlet('_out[0]'))
+            start = 1
+
+            # Skip empty lines
+            guard = lsdfg.add_state('scan_guard', is_start_state=True)
+            lsdfg.add_edge(guard, init_state, dace.InterstateEdge('%s > 0' % symstr(length)))
+
+        body = lsdfg.add_state('scan_body')
+        end = lsdfg.add_state('scan_end')
+        lsdfg.add_loop(init_state, body, end, '_i', str(start), '_i < %s' % symstr(length), '_i + 1')
+        if node.identity is None:
+            lsdfg.add_edge(guard, end, dace.InterstateEdge('%s <= 0' % symstr(length)))
+
+        expr = _op_expression(node.wcr, '__a', '__b')
+        if node.exclusive:
+            code = '__o = __a\n__acc = %s' % expr
+        else:
+            code = '__acc = %s\n__o = __acc' % expr
+        tasklet = body.add_tasklet('scan', {'__a', '__b'}, {'__acc', '__o'}, code)
+        body.add_edge(body.add_read('_acc'), None, tasklet, '__a', dace.Memlet('_acc[0]'))
+        body.add_edge(body.add_read('_in'), None, tasklet, '__b', dace.Memlet('_in[_i]'))
+        body.add_edge(tasklet, '__acc', body.add_write('_acc'), None, dace.Memlet('_acc[0]'))
+        body.add_edge(tasklet, '__o', body.add_write('_out'), None, dace.Memlet('_out[_i]'))
+
+        if len(shape) == 1:
+            return lsdfg
+
+        # Scan all lines in a map
+        nsdfg = SDFG('scan')
+        nsdfg.add_array('_in', shape, input_data.dtype, strides=input_data.strides, storage=input_data.storage)
+        nsdfg.add_array('_out',
+                        outedge.data.subset.size(),
+                        output_data.dtype,
+                        strides=output_data.strides,
+                        storage=output_data.storage)
+        nstate = nsdfg.add_state()
+        me, mx = nstate.add_map('scan_lines',
+                                {'_o%d' % i: '0:%s' % symstr(sz)
+                                 for i, sz in enumerate(shape) if i != axis})
+        subset = ','.join('0:%s' % symstr(length) if i == axis else '_o%d' % i for i in range(len(shape)))
+        line = nstate.add_nested_sdfg(lsdfg, nsdfg, {'_in'}, {'_out'})
+        nstate.add_memlet_path(nstate.add_read('_in'), me, line, dst_conn='_in', memlet=dace.Memlet('_in[%s]' % subset))
+        nstate.add_memlet_path(line,
+                               mx,
+                               nstate.add_write('_out'),
+                               src_conn='_out',
+                               memlet=dace.Memlet('_out[%s]' % subset))
+
+        return nsdfg
+
+
+@dace.library.expansion
+class ExpandScanOpenMP(pm.ExpandTransformation):
+    """
+        OpenMP-based implementation of the scan node. Scans of many lines run
+        one line per thread, otherwise each line is scanned in two passes:
+        every thread first combines a contiguous chunk, then the chunk
+        partials are scanned, and finally each thread scans its chunk again
+        starting from its partial. Requires an associative operation with an
+        identity.
+    """
+    environments = []
+
+    # Minimal number of elements in a line to scan it in parallel
+    _MIN_PARALLEL_LENGTH = 4096
+
+    @staticmethod
+    def expansion(node: 'Scan', state: SDFGState, sdfg: SDFG):
+        from dace.codegen.targets.cpp import sym2cpp, unparse_cr
+
+        inedge, outedge, axis = _scan_edges(node, state, sdfg)
+        input_data = sdfg.arrays[inedge.data.data]
+        output_data = sdfg.arrays[outedge.data.data]
+        shape = inedge.data.subset.size()
+
+        if node.identity is None:
+            warnings.warn('OpenMP scan expansion requires an identity value, falling back to the pure expansion')
+            return ExpandScanPure.expansion(node, state, sdfg)
+        if not can_expand_on_host(node, state, sdfg):
+            return ExpandScanPure.expansion(node, state, sdfg)
+
+        itype, otype = input_data.dtype.ctype, output_data.dtype.ctype
+        others = [i for i in range(len(shape)) if i != axis]
+
+        code = '''
+auto __op = {op};
+const {otype} __identity = {identity};
+const long long __len = {length}, __is = {istride}, __os = {ostride};
+'''.format(op=unparse_cr(sdfg, node.wcr, output_data.dtype),
+           otype=otype,
+           identity=sym2cpp(node.identity),
+           length=sym2cpp(shape[axis]),
+           istride=sym2cpp(input_data.strides[axis]),
+           ostride=sym2cpp(output_data.strides[axis]))
+
+        # Scan loop body over the range [__begin, __end) starting from __acc
+        if node.exclusive:
+            scan_body = '%s __v = __in[__i * __is]; __out[__i * __os] = __acc; __acc = __op(__acc, __v);' % otype
+        else:
+            scan_body = '__acc = __op(__acc, __in[__i * __is]); __out[__i * __os] = __acc;'
+        scan_loop = 'for (long long __i = __begin; __i < __end; ++__i) { %s }' % scan_body
+
+        code += '''
+auto __scan_parallel = [&](const {itype} *__in, {otype} *__out) {{
+    {otype} *__partial = nullptr;
+    #pragma omp parallel if(__len >= {threshold})
+    {{
+        const int __nt = omp_get_num_threads(), __t = omp_get_thread_num();
+        #pragma omp single
+        __partial = new {otype}[__nt + 1];
+
+        const long long __begin = __len * __t / __nt, __end = __len * (__t + 1) / __nt;
+        {otype} __acc = __identity;
+        for (long long __i = __begin; __i < __end; ++__i)
+            __acc = __op(__acc, __in[__i * __is]);
+        __partial[__t + 1] = __acc;
+
+        #pragma omp barrier
+        #pragma omp single
+        {{
+            __partial[0] = __identity;
+            for (int __k = 1; __k <= __nt; ++__k)
+                __partial[__k] = __op(__partial[__k - 1], __partial[__k]);
+        }}
+
+        __acc = __partial[__t];
+        {scan_loop}
+    }}
+    delete[] __partial;
+}};
+'''.format(itype=itype, otype=otype, threshold=ExpandScanOpenMP._MIN_PARALLEL_LENGTH, scan_loop=scan_loop)
+
+        if not others:
+            code += '__scan_parallel(_in, _out);\n'
+        else:
+            offsets = line_offsets(shape, axis, {'__ioff': input_data.strides, '__ooff': output_data.strides})
+
+            code += '''
+const long long __lines = {lines};
+if (__lines >= omp_get_max_threads()) {{
+    #pragma omp parallel for
+    for (long long __l = 0; __l < __lines; ++__l) {{
+        {offsets}
+        const {itype} *__in = _in + __ioff;
+        {otype} *__out = _out + __ooff;
+        const long long __begin = 0, __end = __len;
+        {otype} __acc = __identity;
+        {scan_loop}
+    }}
+}} else {{
+    for (long long __l = 0; __l < __lines; ++__l) {{
+        {offsets}
+        __scan_parallel(_in + __ioff, _out + __ooff);
+    }}
+}}
+'''.format(lines=' * '.join('(%s)' % sym2cpp(shape[i]) for i in others),
+            offsets=offsets,
+            itype=itype,
+            otype=otype,
+            scan_loop=scan_loop)
+
+        # Make tasklet
+        return dace.nodes.Tasklet('scan', {'_in': dace.pointer(input_data.dtype)},
+                                  {'_out': dace.pointer(output_data.dtype)},
+                                  code,
+                                  language=dace.Language.CPP)
+
+
+@dace.library.expansion
+class ExpandScanCUDADevice(pm.ExpandTransformation):
+    """
+        GPU implementation of the scan node running as a device-wide kernel
+        (uses Thrust). Multiple lines are scanned in one segmented scan.
+        Requires contiguous data that is scanned along its last axis.
+    """
+    environments = [CUDA]
+
+    @staticmethod
+    def expansion(node: 'Scan', state: SDFGState, sdfg: SDFG):
+        from dace.codegen.prettycode import CodeIOStream
+        from dace.codegen.targets.cpp import unparse_cr_split, sym2cpp
+
+        inedge, outedge, axis = _scan_edges(node, state, sdfg)
+        input_data = sdfg.arrays[inedge.data.data]
+        output_data = sdfg.arrays[outedge.data.data]
+        shape = inedge.data.subset.size()
+
+        for desc in (input_data, output_data):
+            if desc.storage != dtypes.StorageType.GPU_Global:
+                warnings.warn('Input and output of GPU scan must reside in global GPU memory')
+                return ExpandScanPure.expansion(node, state, sdfg)
+        if node.exclusive and node.identity is None:
+            raise ValueError('For exclusive device scan nodes, initial value must be specified')
+
+        # Lines must be contiguous and follow each other in memory
+        if axis != len(shape) - 1:
+            warnings.warn('GPU scan is only supported along the last axis. Falling back to the pure expansion.')
+            return ExpandScanPure.expansion(node, state, sdfg)
+        for edge, desc in ((inedge, input_data), (outedge, output_data)):
+            strides = [s for i, s in enumerate(desc.strides) if i < len(shape)]
+            expected = [dace.data._prod(shape[i + 1:]) for i in range(len(shape))]
+            if any(str(s) != str(e) for s, e in zip(strides, expected)):
+                warnings.warn('GPU scan requires contiguous data. Falling back to the pure expansion.')
+                return ExpandScanPure.expansion(node, state, sdfg)
+
+        cuda_globalcode = CodeIOStream()
+        host_globalcode = CodeIOStream()
+
+        node_id = state.node_id(node)
+        state_id = sdfg.node_id(state)
+        idstr = '{sdfg}_{state}_{node}'.format(sdfg=sdfg.name, state=state_id, node=node_id)
+        itype, otype = input_data.dtype.ctype, output_data.dtype.ctype
+
+        body, [arg1, arg2] = unparse_cr_split(sdfg, node.wcr)
+        if node.exclusive:
+            single = 'thrust::exclusive_scan(policy, input, input + len, output, ({otype})({identity}), op);'
+            segmented = ('thrust::exclusive_scan_by_key(policy, keys, keys + lines * len, input, output, '
+                         '({otype})({identity}), thrust::equal_to<long long>(), op);')
+        else:
+            single = 'thrust::inclusive_scan(policy, input, input + len, output, op);'
+            segmented = ('thrust::inclusive_scan_by_key(policy, keys, keys + lines * len, input, output, '
+                         'thrust::equal_to<long long>(), op);')
+        identity = sym2cpp(node.identity) if node.identity is not None else ''
+
+        cuda_globalcode.write(
+            """
+#include <thrust/execution_policy.h>
+#include <thrust/functional.h>
+#include <thrust/iterator/counting_iterator.h>
+#include <thrust/iterator/transform_iterator.h>
+#include <thrust/scan.h>
+
+struct __scan_{id} {{
+    DACE_HDFI {otype} operator()(const {otype} &{arg1}, const {otype} &{arg2}) const {{
+        {contents}
+    }}
+}};
+
+struct __scan_key_{id} {{
+    long long len;
+    DACE_HDFI long long operator()(long long i) const {{ return i / len; }}
+}};
+
+DACE_EXPORTED void __dace_scan_{id}({itype} *input, {otype} *output, long long lines, long long len, cudaStream_t stream);
+void __dace_scan_{id}({itype} *input, {otype} *output, long long lines, long long len, cudaStream_t stream)
+{{
+    auto policy = thrust::cuda::par.on(stream);
+    __scan_{id} op;
+    if (lines == 1) {{
+        {single}
+    }} else {{
+        auto keys = thrust::make_transform_iterator(thrust::counting_iterator<long long>(0), __scan_key_{id}{{len}});
+        {segmented}
+    }}
+}}
+""".format(id=idstr,
+           itype=itype,
+           otype=otype,
+           arg1=arg1,
+           arg2=arg2,
+           contents=body,
+           single=single.format(otype=otype, identity=identity),
+           segmented=segmented.format(otype=otype, identity=identity)), sdfg, state_id, node_id)
+
+        host_globalcode.write(
+            """
+DACE_EXPORTED void __dace_scan_{id}({itype} *input, {otype} *output, long long lines, long long len, cudaStream_t stream);
+        """.format(id=idstr, itype=itype, otype=otype), sdfg, state_id, node)
+
+        # Call scan function with all lines
+        lines = ' * '.join('(%s)' % sym2cpp(s) for s in shape[:-1]) or '1'
+        host_localcode = '__dace_scan_{id}(_in, _out, {lines}, {len}, __dace_current_stream);'.format(id=idstr,
+                                                                                                      lines=lines,
+                                                                                                      len=sym2cpp(
+                                                                                                          shape[-1]))
+
+        # Make tasklet
+        tnode = dace.nodes.Tasklet('scan', {'_in': dace.pointer(input_data.dtype)},
+                                   {'_out': dace.pointer(output_data.dtype)},
+                                   host_localcode,
+                                   language=dace.Language.CPP)
+
+        sdfg.append_global_code(host_globalcode.getvalue())
+        sdfg.append_global_code(cuda_globalcode.getvalue(), 'cuda')
+
+        return tnode
+
+
+@dace.library.node
+class Scan(dace.sdfg.nodes.LibraryNode):
+    """ An SDFG node that computes the prefix scan (e.g., cumulative sum) of
+        an N-dimensional array along an axis with a binary function. An
+        inclusive scan writes the combination of all elements up to and
+        including the current one, an exclusive scan the combination of all
+        preceding elements, starting from the identity. """
+
+    # Global properties
+    implementations = {
+        'pure': ExpandScanPure,
+        'OpenMP': ExpandScanOpenMP,
+        'CUDA (device)': ExpandScanCUDADevice,
+    }
+
+    default_implementation = 'OpenMP'
+
+    # Properties
+    axis = Property(dtype=int, default=0, desc='Axis to scan along')
+    wcr = LambdaProperty(default='lambda a, b: a + b')
+    identity = Property(allow_none=True)
+    exclusive = Property(dtype=bool, default=False, desc='If True, excludes the current element from its result')
+
+    def __init__(self,
+                 wcr='lambda a, b: a + b',
+                 axis=0,
+                 identity=None,
+                 exclusive=False,
+                 schedule=dtypes.ScheduleType.Default,
+                 debuginfo=None,
+                 **kwargs):
+        super().__init__(name='Scan', inputs={'_in'}, outputs={'_out'}, **kwargs)
+        self.wcr = wcr
+        self.axis = axis
+        self.identity = identity
+        self.exclusive = exclusive
+        self.debuginfo = debuginfo
+        self.schedule = schedule
+
+    @staticmethod
+    def from_json(json_obj, context=None):
+        ret = Scan()
+        dace.serialize.set_properties_from_json(ret, json_obj, context=context)
+        return ret
+
+    def __str__(self):
+        # Autodetect reduction type
+        redtype = detect_reduction_type(self.wcr)
+        if redtype == dtypes.ReductionType.Custom:
+            wcrstr = unparse(ast.parse(self.wcr).body[0].value.body)
+        else:
+            wcrstr = str(redtype)
+            wcrstr = wcrstr[wcrstr.find('.') + 1:]  # Skip "ReductionType."
+
+        return '{kind} scan ({op}), Axis: {axis}'.format(kind='Exclusive' if self.exclusive else 'Inclusive',
+                                                         op=wcrstr,
+                                                         axis=self.axis)
+
+    def __label__(self, sdfg, state):
+        return str(self).replace(' Axis', '\nAxis')
+
+    def validate(self, sdfg, state):
+        in_edges = state.in_edges(self)
+        out_edges = state.out_edges(self)
+        if len(in_edges) != 1 or in_edges[0].dst_conn != '_in':
+            raise ValueError('Scan node must have one input connected to "_in"')
+        if len(out_edges) != 1 or out_edges[0].src_conn != '_out':
+            raise ValueError('Scan node must have one output connected to "_out"')
+        dims = in_edges[0].data.subset.dims()
+        if out_edges[0].data.subset.dims() != dims:
+            raise ValueError('Scan node input and output must have the same number of dimensions')
+        if self.axis < -dims or self.axis >= dims:
+            raise ValueError('Scan axis %d out of range for %d-dimensional input' % (self.axis, dims))
+        if self.exclusive and self.identity is None:
+            raise ValueError('Exclusive scan requires an identity value')
@@ -0,0 +1,323 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" File defining the scatter-add (histogram) library node. """
+
+import warnings
+from typing import Dict
+
+import dace
+import dace.library
+import dace.serialize
+from dace import dtypes
+from dace.memlet import Memlet
+from dace.sdfg import SDFG, SDFGState, graph
+from dace.symbolic import symstr
+from dace.transformation import transformation as pm
+from dace.libraries.standard.environments.cuda import CUDA
+from dace.libraries.standard.environments.parallel_scatter_add import ParallelScatterAdd
+from dace.libraries.standard.utils import can_expand_on_host
+
+
+def _scatter_edges(node: 'ScatterAdd', state: SDFGState, sdfg: SDFG) -> Dict[str, graph.MultiConnectorEdge]:
+    """ Returns the edges connected to a scatter-add node, keyed by connector name. """
+    node.validate(sdfg, state)
+    edges = {e.dst_conn: e for e in state.in_edges(node)}
+    edges.update({e.src_conn: e for e in state.out_edges(node)})
+    return edges
+
+
+@dace.library.expansion
+class ExpandScatterAddPure(pm.ExpandTransformation):
+    """
+        Pure SDFG ScatterAdd expansion, which adds every value to its bin in a
+        map with write-conflict resolution (i.e., an atomic addition per
+        element).
+    """
+    environments = []
+
+    @staticmethod
+    def expansion(node: 'ScatterAdd', state: SDFGState, sdfg: SDFG):
+        edges = _scatter_edges(node, state, sdfg)
+        length = edges['_indices'].data.subset.num_elements()
+        nbins = symstr(edges['_out'].data.subset.num_elements())
+
+        nsdfg = SDFG('scatter_add')
+        for conn, edge in edges.items():
+            desc = sdfg.arrays[edge.data.data]
+            nsdfg.add_array(conn, edge.data.subset.size(), desc.dtype, strides=desc.strides, storage=desc.storage)
+
+        # Initialize bins
+        init_state = nsdfg.add_state('scatter_init')
+        if '_bins' in edges:
+            init_state.add_mapped_tasklet('scatter_init', {'_b': '0:%s' % nbins}, {'__b': Memlet('_bins[_b]')},
+                                          '__o = __b', {'__o': Memlet('_out[_b]')},
+                                          external_edges=True)
+        else:
+            init_state.add_mapped_tasklet('scatter_init', {'_b': '0:%s' % nbins}, {},
+                                          '__o = 0', {'__o': Memlet('_out[_b]')},
+                                          external_edges=True)
+
+        # Scatter values into bins, wrapping negative indices
+        inputs = {'__idx': Memlet('_indices[_i]')}
+        value = '1'
+        if '_values' in edges:
+            inputs['__v'] = Memlet('_values[_i]')
+            value = '__v'
+        code = '''
+__b = __idx + {n} if __idx < 0 else __idx
+if __b >= 0 and __b < {n}:
+    __o[__b] = {value}'''.format(n=nbins, value=value)
+        scatter_state = nsdfg.add_state_after(init_state, 'scatter')
+        scatter_state.add_mapped_tasklet('scatter', {'_i': '0:%s' % symstr(length)},
+                                         inputs,
+                                         code,
+                                         {'__o': Memlet('_out[0:%s]' % nbins, dynamic=True, wcr='lambda a, b: a + b')},
+                                         external_edges=True)
+
+        return nsdfg
+
+
+@dace.library.expansion
+class ExpandScatterAddOpenMP(pm.ExpandTransformation):
+    """
+        OpenMP-based implementation of the scatter-add node. Small bins are
+        privatized per thread and summed in the end. Larger bins are split
+        among threads, and indices are partitioned by the thread that owns
+        their bin before every thread reduces into its own bins.
+    """
+    environments = [ParallelScatterAdd]
+
+    @staticmethod
+    def expansion(node: 'ScatterAdd', state: SDFGState, sdfg: SDFG):
+        from dace.codegen.targets.cpp import sym2cpp
+
+        edges = _scatter_edges(node, state, sdfg)
+        if not can_expand_on_host(node, state, sdfg):
+            return ExpandScatterAddPure.expansion(node, state, sdfg)
+
+        descs = {conn: sdfg.arrays[edge.data.data] for conn, edge in edges.items()}
+        otype = descs['_out'].dtype.ctype
+
+        def array(conn: str) -> str:
+            """ Returns the pointer and stride of the given connector. """
+            if conn not in descs:
+                return '(const %s *)nullptr, 0' % otype
+            return '%s, %s' % (conn, sym2cpp(descs[conn].strides[0]))
+
+        code = 'dace::scatter::scatter_add<{otype}>({indices}, {values}, {length}, {bins}, {out}, {nbins});'.format(
+            otype=otype,
+            indices=array('_indices'),
+            values=array('_values'),
+            length=sym2cpp(edges['_indices'].data.subset.num_elements()),
+            bins=array('_bins'),
+            out=array('_out'),
+            nbins=sym2cpp(edges['_out'].data.subset.num_elements()))
+
+        # Make tasklet
+        return dace.nodes.Tasklet(
+            'scatter_add',
+            {conn: dace.pointer(desc.dtype)
+             for conn, desc in descs.items() if conn in node.in_connectors},
+            {'_out': dace.pointer(descs['_out'].dtype)},
+            code,
+            language=dace.Language.CPP)
+
+
+@dace.library.expansion
+class ExpandScatterAddCUDADevice(pm.ExpandTransformation):
+    """
+        GPU implementation of the scatter-add node. If the bins fit in shared
+        memory, every thread-block accumulates into its own bins in shared
+        memory, which are added to the global bins in the end. Otherwise,
+        values are added to the global bins directly. Both use atomics.
+    """
+    environments = [CUDA]
+
+    # Maximal size (in bytes) of bins to accumulate in shared memory
+    _MAX_SHARED_BYTES = 32 * 1024
+
+    @staticmethod
+    def expansion(node: 'ScatterAdd', state: SDFGState, sdfg: SDFG):
+        from dace.codegen.prettycode import CodeIOStream
+        from dace.codegen.targets.cpp import sym2cpp
+
+        edges = _scatter_edges(node, state, sdfg)
+        descs = {conn: sdfg.arrays[edge.data.data] for conn, edge in edges.items()}
+
+        for desc in descs.values():
+            if desc.storage != dtypes.StorageType.GPU_Global:
+                warnings.warn('Inputs and outputs of GPU scatter-add must reside in global GPU memory')
+                return ExpandScatterAddPure.expansion(node, state, sdfg)
+
+        cuda_globalcode = CodeIOStream()
+        host_globalcode = CodeIOStream()
+
+        node_id = state.node_id(node)
+        state_id = sdfg.node_id(state)
+        idstr = '{sdfg}_{state}_{node}'.format(sdfg=sdfg.name, state=state_id, node=node_id)
+        otype = descs['_out'].dtype.ctype
+        conns = sorted(descs.keys())
+        signature = ', '.join('%s%s *%s' %
+                              ('const ' if conn in node.in_connectors else '', descs[conn].dtype.ctype, conn)
+                              for conn in conns)
+        strides = ', '.join('%s_stride = %s' % (conn, sym2cpp(descs[conn].strides[0])) for conn in conns)
+        value = '(%s)_values[i * _values_stride]' % otype if '_values' in descs else '(%s)1' % otype
+        init = '_bins[b * _bins_stride]' if '_bins' in descs else '(%s)0' % otype
+        skip_init = '_bins == _out && _bins_stride == _out_stride' if '_bins' in descs else 'false'
+
+        cuda_globalcode.write(
+            """
+__global__ void __scatter_init_{id}({signature}, long long nbins) {{
+    const long long {strides};
+    for (long long b = blockIdx.x * (long long)blockDim.x + threadIdx.x; b < nbins; b += gridDim.x * (long long)blockDim.x)
+        _out[b * _out_stride] = {init};
+}}
+
+__global__ void __scatter_global_{id}({signature}, long long n, long long nbins) {{
+    const long long {strides};
+    for (long long i = blockIdx.x * (long long)blockDim.x + threadIdx.x; i < n; i += gridDim.x * (long long)blockDim.x) {{
+        long long b = (long long)_indices[i * _indices_stride];
+        if (b < 0) b += nbins;
+        if (b >= 0 && b < nbins)
+            dace::wcr_fixed<dace::ReductionType::Sum, {otype}>::reduce_atomic(_out + b * _out_stride, {value});
+    }}
+}}
+
+__global__ void __scatter_shared_{id}({signature}, long long n, long long nbins) {{
+    const long long {strides};
+    extern __shared__ char __shared_bins[];
+    {otype} *bins = ({otype} *)__shared_bins;
+    for (long long b = threadIdx.x; b < nbins; b += blockDim.x)
+        bins[b] = ({otype})0;
+    __syncthreads();
+
+    for (long long i = blockIdx.x * (long long)blockDim.x + threadIdx.x; i < n; i += gridDim.x * (long long)blockDim.x) {{
+        long long b = (long long)_indices[i * _indices_stride];
+        if (b < 0) b += nbins;
+        if (b >= 0 && b < nbins)
+            dace::wcr_fixed<dace::ReductionType::Sum, {otype}>::reduce_atomic(bins + b, {value});
+    }}
+    __syncthreads();
+
+    for (long long b = threadIdx.x; b < nbins; b += blockDim.x)
+        if (bins[b] != ({otype})0)
+            dace::wcr_fixed<dace::ReductionType::Sum, {otype}>::reduce_atomic(_out + b * _out_stride, bins[b]);
+}}
+
+DACE_EXPORTED void __dace_scatter_add_{id}({signature}, long long n, long long nbins, cudaStream_t stream);
+void __dace_scatter_add_{id}({signature}, long long n, long long nbins, cudaStream_t stream)
+{{
+    const long long {strides};
+    const int threads = 256;
+    int device, sms;
+    cudaGetDevice(&device);
+    cudaDeviceGetAttribute(&sms, cudaDevAttrMultiProcessorCount, device);
+
+    if (nbins > 0 && !({skip_init})) {{
+        const long long blocks = std::min<long long>((nbins + threads - 1) / threads, 32LL * sms);
+        __scatter_init_{id}<<<blocks, threads, 0, stream>>>({args}, nbins);
+    }}
+    if (n <= 0 || nbins <= 0) return;
+    const long long blocks = std::min<long long>((n + threads - 1) / threads, 4LL * sms);
+    const size_t shared_bytes = nbins * sizeof({otype});
+    if (shared_bytes <= {max_shared})
+        __scatter_shared_{id}<<<blocks, threads, shared_bytes, stream>>>({args}, n, nbins);
+    else
+        __scatter_global_{id}<<<blocks, threads, 0, stream>>>({args}, n, nbins);
+}}
+""".format(id=idstr,
+           signature=signature,
+           strides=strides,
+           otype=otype,
+           value=value,
+           init=init,
+           skip_init=skip_init,
+           args=', '.join(conns),
+           max_shared=ExpandScatterAddCUDADevice._MAX_SHARED_BYTES), sdfg, state_id, node_id)
+
+        host_globalcode.write(
+            """
+DACE_EXPORTED void __dace_scatter_add_{id}({signature}, long long n, long long nbins, cudaStream_t stream);
+        """.format(id=idstr, signature=signature), sdfg, state_id, node)
+
+        host_localcode = '__dace_scatter_add_{id}({args}, {n}, {nbins}, __dace_current_stream);'.format(
+            id=idstr,
+            args=', '.join(conns),
+            n=sym2cpp(edges['_indices'].data.subset.num_elements()),
+            nbins=sym2cpp(edges['_out'].data.subset.num_elements()))
+
+        # Make tasklet
+        tnode = dace.nodes.Tasklet(
+            'scatter_add', {conn: dace.pointer(descs[conn].dtype)
+                            for conn in conns if conn in node.in_connectors},
+            {'_out': dace.pointer(descs['_out'].dtype)},
+            host_localcode,
+            language=dace.Language.CPP)
+
+        sdfg.append_global_code(host_globalcode.getvalue())
+        sdfg.append_global_code(cuda_globalcode.getvalue(), 'cuda')
+
+        return tnode
+
+
+@dace.library.node
+class ScatterAdd(dace.sdfg.nodes.LibraryNode):
+    """ An SDFG node that adds values (``_values``), or ones if no values are
+        given, to the bins of a one-dimensional array (``_out``) selected by
+        an array of indices (``_indices``), i.e., computes
+        ``_out[_indices[i]] += _values[i]`` for all ``i``. Repeated indices
+        accumulate, negative indices count from the end (as in NumPy) and
+        indices outside of the bins are skipped. This computes histograms,
+        weighted histograms and unbuffered in-place additions (e.g.,
+        ``numpy.add.at``). The bins are initialized with the contents of the
+        optional ``_bins`` input (which may be the same data as ``_out``), or
+        with zeros otherwise. """
+
+    # Global properties
+    implementations = {
+        'pure': ExpandScatterAddPure,
+        'OpenMP': ExpandScatterAddOpenMP,
+        'CUDA (device)': ExpandScatterAddCUDADevice,
+    }
+
+    default_implementation = 'OpenMP'
+
+    def __init__(self, values=False, bins=False, schedule=dtypes.ScheduleType.Default, debuginfo=None, **kwargs):
+        inputs = {'_indices'} | ({'_values'} if values else set()) | ({'_bins'} if bins else set())
+        super().__init__(name='ScatterAdd', inputs=inputs, outputs={'_out'}, **kwargs)
+        self.debuginfo = debuginfo
+        self.schedule = schedule
+
+    @staticmethod
+    def from_json(json_obj, context=None):
+        ret = ScatterAdd()
+        dace.serialize.set_properties_from_json(ret, json_obj, context=context)
+        return ret
+
+    def __str__(self):
+        return 'Scatter-add%s' % (' (weighted)' if '_values' in self.in_connectors else '')
+
+    def __label__(self, sdfg, state):
+        return str(self)
+
+    def validate(self, sdfg, state):
+        in_edges = {e.dst_conn: e for e in state.in_edges(self)}
+        out_edges = {e.src_conn: e for e in state.out_edges(self)}
+        if '_indices' not in in_edges:
+            raise ValueError('Scatter-add node must have indices connected to "_indices"')
+        if len(in_edges) != len(state.in_edges(self)) or not set(in_edges.keys()) <= {'_indices', '_values', '_bins'}:
+            raise ValueError('Scatter-add node inputs must be connected to "_indices", and optionally to "_values" '
+                             'and "_bins"')
+        if len(state.out_edges(self)) != 1 or '_out' not in out_edges:
+            raise ValueError('Scatter-add node must have one output connected to "_out"')
+
+        for conn, edge in list(in_edges.items()) + list(out_edges.items()):
+            if len(edge.data.subset.size()) != 1:
+                raise ValueError('Scatter-add node "%s" must be one-dimensional' % conn)
+        if sdfg.arrays[in_edges['_indices'].data.data].dtype not in dtypes.INTEGER_TYPES:
+            raise TypeError('Scatter-add indices must be integers')
+        if '_values' in in_edges and (in_edges['_values'].data.subset.num_elements() !=
+                                      in_edges['_indices'].data.subset.num_elements()) == True:
+            raise ValueError('Scatter-add values and indices must have the same size')
+        if '_bins' in in_edges and (in_edges['_bins'].data.subset.num_elements() !=
+                                    out_edges['_out'].data.subset.num_elements()) == True:
+            raise ValueError('Scatter-add input and output bins must have the same size')
@@ -0,0 +1,402 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" File defining the sort library node. """
+
+import warnings
+from typing import Dict
+
+import numpy as np
+
+import dace
+import dace.library
+import dace.serialize
+from dace import data, dtypes
+from dace.memlet import Memlet
+from dace.properties import Property
+from dace.sdfg import SDFG, SDFGState, graph
+from dace.symbolic import symstr
+from dace.transformation import transformation as pm
+from dace.libraries.standard.environments.cuda import CUDA
+from dace.libraries.standard.environments.parallel_sort import ParallelSort
+from dace.libraries.standard.utils import can_expand_on_host, line_offsets
+
+
+def _sort_edges(node: 'Sort', state: SDFGState, sdfg: SDFG) -> Dict[str, graph.MultiConnectorEdge]:
+    """ Returns the edges connected to a sort node, keyed by connector name. """
+    node.validate(sdfg, state)
+    edges = {e.dst_conn: e for e in state.in_edges(node)}
+    edges.update({e.src_conn: e for e in state.out_edges(node)})
+    return edges
+
+
+@dace.library.expansion
+class ExpandSortPure(pm.ExpandTransformation):
+    """
+        Pure SDFG Sort expansion, which sorts all lines in parallel with an
+        odd-even transposition sort. Stable, but requires a quadratic number
+        of comparisons.
+    """
+    environments = []
+
+    @staticmethod
+    def expansion(node: 'Sort', state: SDFGState, sdfg: SDFG):
+        edges = _sort_edges(node, state, sdfg)
+        shape = edges['_keys'].data.subset.size()
+        axis = node.axis % len(shape)
+        length = shape[axis]
+
+        # Create nested SDFG
+        nsdfg = SDFG('sort')
+        for conn, edge in edges.items():
+            desc = sdfg.arrays[edge.data.data]
+            nsdfg.add_array(conn, edge.data.subset.size(), desc.dtype, strides=desc.strides, storage=desc.storage)
+
+        # Sort keys in the keys output, or in a temporary buffer
+        keys = '_keys_out'
+        if keys not in edges:
+            keys = '_keys_buffer'
+            nsdfg.add_transient(keys, shape, nsdfg.arrays['_keys'].dtype, storage=nsdfg.arrays['_keys'].storage)
+        values = '_values_out' if '_values_out' in edges else None
+
+        # Initialize outputs with keys and values (or indices for an argsort)
+        index = ', '.join('_i%d' % i for i in range(len(shape)))
+        init_inputs = {'__k': Memlet('_keys[%s]' % index)}
+        init_outputs = {'__ko': Memlet('%s[%s]' % (keys, index))}
+        init_code = '__ko = __k'
+        if values is not None:
+            init_outputs['__vo'] = Memlet('%s[%s]' % (values, index))
+            if '_values' in edges:
+                init_inputs['__v'] = Memlet('_values[%s]' % index)
+                init_code += '\n__vo = __v'
+            else:
+                init_code += '\n__vo = _i%d' % axis
+        init_state = nsdfg.add_state('sort_init')
+        init_state.add_mapped_tasklet('sort_init', {'_i%d' % i: '0:%s' % symstr(s)
+                                                    for i, s in enumerate(shape)},
+                                      init_inputs,
+                                      init_code,
+                                      init_outputs,
+                                      external_edges=True)
+
+        # Compare and swap neighboring pairs, alternating between even and odd pairs
+        condition = '__k1 < __k0'
+        if np.issubdtype(nsdfg.arrays['_keys'].dtype.type, np.floating):
+            condition += ' or (__k0 != __k0 and __k1 == __k1)'  # Place NaNs last
+        swap_code = 'if %s:\n    __ko0 = __k1\n    __ko1 = __k0\nelse:\n    __ko0 = __k0\n    __ko1 = __k1' % condition
+        if values is not None:
+            swap_code = ('if %s:\n    __ko0 = __k1\n    __ko1 = __k0\n    __vo0 = __v1\n    __vo1 = __v0\n'
+                         'else:\n    __ko0 = __k0\n    __ko1 = __k1\n    __vo0 = __v0\n    __vo1 = __v1' % condition)
+
+        phases = []
+        for phase, (first, pairs) in enumerate([('2 * _p', '(%s) // 2'), ('2 * _p + 1', '(%s - 1) // 2')]):
+            pstate = nsdfg.add_state('sort_%s' % ('even' if phase == 0 else 'odd'))
+            map_range = {'_i%d' % i: '0:%s' % symstr(s) for i, s in enumerate(shape) if i != axis}
+            map_range['_p'] = '0:%s' % (pairs % symstr(length))
+            subsets = []
+            for offset in ('', ' + 1'):
+                subsets.append(', '.join(first + offset if i == axis else '_i%d' % i for i in range(len(shape))))
+            inputs = {'__k%d' % j: Memlet('%s[%s]' % (keys, s)) for j, s in enumerate(subsets)}
+            outputs = {'__ko%d' % j: Memlet('%s[%s]' % (keys, s)) for j, s in enumerate(subsets)}
+            if values is not None:
+                inputs.update({'__v%d' % j: Memlet('%s[%s]' % (values, s)) for j, s in enumerate(subsets)})
+                outputs.update({'__vo%d' % j: Memlet('%s[%s]' % (values, s)) for j, s in enumerate(subsets)})
+            pstate.add_mapped_tasklet('sort_swap', map_range, inputs, swap_code, outputs, external_edges=True)
+            phases.append(pstate)
+
+        end_state = nsdfg.add_state('sort_end')
+        nsdfg.add_edge(phases[0], phases[1], dace.InterstateEdge())
+        nsdfg.add_loop(init_state,
+                       phases[0],
+                       end_state,
+                       '_r',
+                       '0',
+                       '_r < (%s + 1) // 2' % symstr(length),
+                       '_r + 1',
+                       loop_end_state=phases[1])
+
+        return nsdfg
+
+
+@dace.library.expansion
+class ExpandSortOpenMP(pm.ExpandTransformation):
+    """
+        OpenMP-based implementation of the sort node. Sorts of many lines run
+        one line per thread, otherwise each line is sorted with a parallel
+        merge sort. Sorts with values (or indices) are always stable.
+    """
+    environments = [ParallelSort]
+
+    @staticmethod
+    def expansion(node: 'Sort', state: SDFGState, sdfg: SDFG):
+        from dace.codegen.targets.cpp import sym2cpp
+
+        edges = _sort_edges(node, state, sdfg)
+        if not can_expand_on_host(node, state, sdfg):
+            return ExpandSortPure.expansion(node, state, sdfg)
+
+        descs = {conn: sdfg.arrays[edge.data.data] for conn, edge in edges.items()}
+        shape = edges['_keys'].data.subset.size()
+        axis = node.axis % len(shape)
+        others = [i for i in range(len(shape)) if i != axis]
+
+        def line(conn: str) -> str:
+            """ Returns the pointer and stride of a line of the given connector. """
+            if conn not in descs:
+                return 'nullptr, 0'
+            return '%s + __off%s, %s' % (conn, conn, sym2cpp(descs[conn].strides[axis]))
+
+        if '_values_out' in edges:
+            vtype = descs['_values_out'].dtype.ctype
+            values = line('_values') if '_values' in edges else '(const %s *)nullptr, 0' % vtype
+            call = 'dace::sort::sort_pairs<{ktype}, {vtype}>({keys}, {values}, {keys_out}, {values_out}, __len, ' \
+                   '__parallel);'.format(ktype=descs['_keys'].dtype.ctype,
+                                         vtype=vtype,
+                                         keys=line('_keys'),
+                                         values=values,
+                                         keys_out=line('_keys_out'),
+                                         values_out=line('_values_out'))
+        else:
+            call = 'dace::sort::sort_keys({keys}, {keys_out}, __len, {stable}, __parallel);'.format(
+                keys=line('_keys'), keys_out=line('_keys_out'), stable='true' if node.stable else 'false')
+
+        code = '''
+const long long __len = {length}, __lines = {lines};
+auto __sort_line = [&](long long __l, bool __parallel) {{
+    {offsets}
+    {call}
+}};
+if (__lines > 1 && __lines >= omp_get_max_threads()) {{
+    #pragma omp parallel for
+    for (long long __l = 0; __l < __lines; ++__l)
+        __sort_line(__l, false);
+}} else {{
+    for (long long __l = 0; __l < __lines; ++__l)
+        __sort_line(__l, true);
+}}
+'''.format(length=sym2cpp(shape[axis]),
+           lines=' * '.join('(%s)' % sym2cpp(shape[i]) for i in others) or '1',
+           offsets=line_offsets(shape, axis, {'__off' + conn: desc.strides
+                                              for conn, desc in descs.items()}),
+           call=call)
+
+        # Make tasklet
+        return dace.nodes.Tasklet(
+            'sort', {conn: dace.pointer(desc.dtype)
+                     for conn, desc in descs.items() if conn in node.in_connectors},
+            {conn: dace.pointer(desc.dtype)
+             for conn, desc in descs.items() if conn in node.out_connectors},
+            code,
+            language=dace.Language.CPP)
+
+
+@dace.library.expansion
+class ExpandSortCUDADevice(pm.ExpandTransformation):
+    """
+        GPU implementation of the sort node running as device-wide kernels
+        (uses Thrust). Multiple lines are sorted with two stable sorts: one
+        by key and one by line. Requires contiguous data that is sorted
+        along its last axis. The position of NaN keys is unspecified.
+    """
+    environments = [CUDA]
+
+    @staticmethod
+    def expansion(node: 'Sort', state: SDFGState, sdfg: SDFG):
+        from dace.codegen.prettycode import CodeIOStream
+        from dace.codegen.targets.cpp import sym2cpp
+
+        edges = _sort_edges(node, state, sdfg)
+        descs = {conn: sdfg.arrays[edge.data.data] for conn, edge in edges.items()}
+        shape = edges['_keys'].data.subset.size()
+        axis = node.axis % len(shape)
+
+        for desc in descs.values():
+            if desc.storage != dtypes.StorageType.GPU_Global:
+                warnings.warn('Inputs and outputs of GPU sort must reside in global GPU memory')
+                return ExpandSortPure.expansion(node, state, sdfg)
+
+        # Lines must be contiguous and follow each other in memory
+        if axis != len(shape) - 1:
+            warnings.warn('GPU sort is only supported along the last axis. Falling back to the pure expansion.')
+            return ExpandSortPure.expansion(node, state, sdfg)
+        expected = [str(data._prod(shape[i + 1:])) for i in range(len(shape))]
+        for desc in descs.values():
+            if [str(s) for s in desc.strides] != expected:
+                warnings.warn('GPU sort requires contiguous data. Falling back to the pure expansion.')
+                return ExpandSortPure.expansion(node, state, sdfg)
+
+        cuda_globalcode = CodeIOStream()
+        host_globalcode = CodeIOStream()
+
+        node_id = state.node_id(node)
+        state_id = sdfg.node_id(state)
+        idstr = '{sdfg}_{state}_{node}'.format(sdfg=sdfg.name, state=state_id, node=node_id)
+        ktype = descs['_keys'].dtype.ctype
+        vtype = descs['_values_out'].dtype.ctype if '_values_out' in descs else None
+        conns = sorted(descs.keys())
+        signature = ', '.join('%s%s *%s' %
+                              ('const ' if conn in node.in_connectors else '', descs[conn].dtype.ctype, conn)
+                              for conn in conns)
+        sort = 'stable_sort' if node.stable else 'sort'
+
+        # Sort in keys output, or in a temporary buffer
+        if '_keys_out' in descs:
+            body = 'if (_keys_out != _keys) thrust::copy(policy, _keys, _keys + n, _keys_out);\n'
+            keys = '_keys_out'
+        else:
+            body = ('thrust::device_vector<{t}> keys_buffer(thrust::device_pointer_cast(_keys), '
+                    'thrust::device_pointer_cast(_keys) + n);\n').format(t=ktype)
+            keys = 'thrust::raw_pointer_cast(keys_buffer.data())'
+
+        if vtype is None:
+            single = 'thrust::{sort}(policy, {k}, {k} + n);'.format(sort=sort, k=keys)
+            segmented = '''
+thrust::stable_sort_by_key(policy, {k}, {k} + n, segments.begin());
+thrust::stable_sort_by_key(policy, segments.begin(), segments.end(), {k});'''.format(k=keys)
+        else:
+            if '_values' in descs:
+                body += 'if (_values_out != _values) thrust::copy(policy, _values, _values + n, _values_out);\n'
+            else:
+                # Argsort: initialize values with indices along the line
+                body += ('thrust::transform(policy, thrust::counting_iterator<long long>(0), '
+                         'thrust::counting_iterator<long long>(n), _values_out, __sort_index_{id}{{len}});\n').format(
+                             id=idstr)
+            single = 'thrust::{sort}_by_key(policy, {k}, {k} + n, _values_out);'.format(sort=sort, k=keys)
+            segmented = '''
+thrust::stable_sort_by_key(policy, {k}, {k} + n,
+                           thrust::make_zip_iterator(thrust::make_tuple(_values_out, segments.begin())));
+thrust::stable_sort_by_key(policy, segments.begin(), segments.end(),
+                           thrust::make_zip_iterator(thrust::make_tuple({k}, _values_out)));'''.format(k=keys)
+
+        cuda_globalcode.write(
+            """
+#include <thrust/copy.h>
+#include <thrust/device_vector.h>
+#include <thrust/execution_policy.h>
+#include <thrust/iterator/counting_iterator.h>
+#include <thrust/iterator/zip_iterator.h>
+#include <thrust/sort.h>
+#include <thrust/transform.h>
+
+struct __sort_index_{id} {{
+    long long len;
+    DACE_HDFI long long operator()(long long i) const {{ return i % len; }}
+}};
+
+struct __sort_segment_{id} {{
+    long long len;
+    DACE_HDFI long long operator()(long long i) const {{ return i / len; }}
+}};
+
+DACE_EXPORTED void __dace_sort_{id}({signature}, long long lines, long long len, cudaStream_t stream);
+void __dace_sort_{id}({signature}, long long lines, long long len, cudaStream_t stream)
+{{
+    auto policy = thrust::cuda::par.on(stream);
+    const long long n = lines * len;
+    {body}
+    if (lines == 1) {{
+        {single}
+    }} else {{
+        thrust::device_vector<long long> segments(n);
+        thrust::transform(policy, thrust::counting_iterator<long long>(0), thrust::counting_iterator<long long>(n),
+                          segments.begin(), __sort_segment_{id}{{len}});
+        {segmented}
+    }}
+}}
+""".format(id=idstr, signature=signature, body=body, single=single, segmented=segmented), sdfg, state_id, node_id)
+
+        host_globalcode.write(
+            """
+DACE_EXPORTED void __dace_sort_{id}({signature}, long long lines, long long len, cudaStream_t stream);
+        """.format(id=idstr, signature=signature), sdfg, state_id, node)
+
+        # Call sort function with all lines
+        lines = ' * '.join('(%s)' % sym2cpp(s) for s in shape[:-1]) or '1'
+        host_localcode = '__dace_sort_{id}({args}, {lines}, {len}, __dace_current_stream);'.format(
+            id=idstr, args=', '.join(conns), lines=lines, len=sym2cpp(shape[-1]))
+
+        # Make tasklet
+        tnode = dace.nodes.Tasklet(
+            'sort', {conn: dace.pointer(descs[conn].dtype)
+                     for conn in conns if conn in node.in_connectors},
+            {conn: dace.pointer(descs[conn].dtype)
+             for conn in conns if conn in node.out_connectors},
+            host_localcode,
+            language=dace.Language.CPP)
+
+        sdfg.append_global_code(host_globalcode.getvalue())
+        sdfg.append_global_code(cuda_globalcode.getvalue(), 'cuda')
+
+        return tnode
+
+
+@dace.library.node
+class Sort(dace.sdfg.nodes.LibraryNode):
+    """ An SDFG node that sorts an N-dimensional array of keys along an axis
+        in ascending order. Optionally sorts values (``_values``) along with
+        the keys, or outputs the indices that sort the keys (an argsort) if
+        the ``_values_out`` output is connected without values. Outputs the
+        sorted keys to ``_keys_out``. """
+
+    # Global properties
+    implementations = {
+        'pure': ExpandSortPure,
+        'OpenMP': ExpandSortOpenMP,
+        'CUDA (device)': ExpandSortCUDADevice,
+    }
+
+    default_implementation = 'OpenMP'
+
+    # Properties
+    axis = Property(dtype=int, default=-1, desc='Axis to sort along')
+    stable = Property(dtype=bool, default=False, desc='If True, preserves the order of equal keys')
+
+    def __init__(self,
+                 axis=-1,
+                 stable=False,
+                 values=False,
+                 keys_out=True,
+                 values_out=False,
+                 schedule=dtypes.ScheduleType.Default,
+                 debuginfo=None,
+                 **kwargs):
+        inputs = {'_keys', '_values'} if values else {'_keys'}
+        outputs = ({'_keys_out'} if keys_out else set()) | ({'_values_out'} if values_out else set())
+        super().__init__(name='Sort', inputs=inputs, outputs=outputs, **kwargs)
+        self.axis = axis
+        self.stable = stable
+        self.debuginfo = debuginfo
+        self.schedule = schedule
+
+    @staticmethod
+    def from_json(json_obj, context=None):
+        ret = Sort()
+        dace.serialize.set_properties_from_json(ret, json_obj, context=context)
+        return ret
+
+    def __str__(self):
+        kind = 'Argsort' if '_values_out' in self.out_connectors and '_values' not in self.in_connectors else 'Sort'
+        return '{kind}{stable}, Axis: {axis}'.format(kind=kind,
+                                                     stable=' (stable)' if self.stable else '',
+                                                     axis=self.axis)
+
+    def __label__(self, sdfg, state):
+        return str(self).replace(' Axis', '\nAxis')
+
+    def validate(self, sdfg, state):
+        in_edges = {e.dst_conn: e for e in state.in_edges(self)}
+        out_edges = {e.src_conn: e for e in state.out_edges(self)}
+        if '_keys' not in in_edges:
+            raise ValueError('Sort node must have keys connected to "_keys"')
+        if len(in_edges) != len(state.in_edges(self)) or not set(in_edges.keys()) <= {'_keys', '_values'}:
+            raise ValueError('Sort node inputs must be connected to "_keys" and (optionally) "_values"')
+        if (not out_edges or len(out_edges) != len(state.out_edges(self))
+                or not set(out_edges.keys()) <= {'_keys_out', '_values_out'}):
+            raise ValueError('Sort node outputs must be connected to "_keys_out" and/or "_values_out"')
+        if '_values' in in_edges and '_values_out' not in out_edges:
+            raise ValueError('Sorted values must be connected to "_values_out"')
+
+        dims = in_edges['_keys'].data.subset.dims()
+        for e in list(in_edges.values()) + list(out_edges.values()):
+            if e.data.subset.dims() != dims:
+                raise ValueError('All inputs and outputs of a sort node must have the same number of dimensions')
+        if self.axis < -dims or self.axis >= dims:
+            raise ValueError('Sort axis %d out of range for %d-dimensional input' % (self.axis, dims))
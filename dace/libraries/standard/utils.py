@@ -0,0 +1,41 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Helper functions for expansions of standard library nodes. """
+from typing import Dict, Sequence
+
+from dace import dtypes
+from dace.sdfg import SDFG, SDFGState, nodes, scope
+
+
+def can_expand_on_host(node: nodes.LibraryNode, state: SDFGState, sdfg: SDFG) -> bool:
+    """ Returns True if the library node is not nested in another scope and all of its data can be accessed by CPU
+        threads. """
+    if state.entry_node(node) is not None:
+        return False
+    if scope.is_devicelevel_gpu(sdfg, state, node) or scope.is_devicelevel_fpga(sdfg, state, node):
+        return False
+    return all(
+        dtypes.can_access(dtypes.ScheduleType.CPU_Multicore, sdfg.arrays[e.data.data].storage)
+        for e in state.all_edges(node))
+
+
+def line_offsets(shape: Sequence, axis: int, strides: Dict[str, Sequence]) -> str:
+    """ Returns C++ code that computes the offsets of line ``__l`` along an axis, where lines are numbered over all
+        other dimensions of the given shape in row-major order.
+
+        :param shape: The shape of the data.
+        :param axis: The axis along which lines run.
+        :param strides: A dictionary mapping each offset variable to define to the strides of its data.
+        :return: C++ code that defines the offset variables.
+    """
+    from dace.codegen.targets.cpp import sym2cpp
+
+    code = 'long long %s;\n' % ', '.join('%s = 0' % name for name in strides)
+    others = [i for i in reversed(range(len(shape))) if i != axis]
+    if not others:
+        return code
+    code += 'long long __r = __l, __idx;\n'
+    for i in others:
+        code += '__idx = __r % ({size}); __r /= ({size});'.format(size=sym2cpp(shape[i]))
+        code += ''.join(' %s += __idx * %s;' % (name, sym2cpp(s[i])) for name, s in strides.items())
+        code += '\n'
+    return code
@@ -5,3 +5,4 @@ from dace.optimization.distributed_cutout_tuner import DistributedCutoutTuner, D
 from dace.optimization.on_the_fly_map_fusion_tuner import OnTheFlyMapFusionTuner
 from dace.optimization.subgraph_fusion_tuner import SubgraphFusionTuner
 from dace.optimization.cutout_tuner import CutoutTuner
+from dace.optimization.tuning_database import TuningDatabase
@@ -1,13 +1,12 @@
 # Copyright 2019-2022 ETH Zurich and the DaCe authors. All rights reserved.
-import os
 import tempfile
 import math
 import dace
-import json
 
-from typing import Dict, Generator, Any, List, Tuple
+from typing import Dict, Generator, Any, List, Optional, Tuple
 from dace.optimization import auto_tuner
 from dace.optimization import utils as optim_utils
+from dace.optimization import tuning_database as tdb
 from dace.sdfg.sdfg import SDFG
 from dace.sdfg.state import SDFGState
 
@@ -23,6 +22,8 @@ class CutoutTuner(auto_tuner.AutoTuner):
     In order to tune an SDFG, a "dry run" must first be called to collect data from intermediate
     access nodes (in order to ensure correctness of the tuned subgraph). Subsequently, sub-classes of
     this cutout tuning interface will select subgraphs to test transformations on.
+    Tuning results are read from and written to a persistent tuning database (see
+    ``TuningDatabase``), keyed by the structural hash of every cutout.
 
     For example::
 
@@ -35,32 +36,38 @@ class CutoutTuner(auto_tuner.AutoTuner):
         # results will now contain the fastest data layout configurations for each array
     """
 
-    def __init__(self, task: str, sdfg: SDFG) -> None:
+    def __init__(self, task: str, sdfg: SDFG, database: Optional[tdb.TuningDatabase] = None) -> None:
         """
         Creates a cutout tuner.
         
-        :param task: Name of tuning task (for filename labeling).
+        :param task: Name of tuning task (for database keys).
         :param sdfg: The SDFG to tune.
+        :param database: The tuning database to use. If None, opens the default
+                         database (see ``optimizer.tuning_database``).
         """
         super().__init__(sdfg=sdfg)
         self._task = task
+        self._database = database
 
     @property
     def task(self) -> str:
         return self._task
 
-    def file_name(self, label: str) -> str:
-        return f"{self._task}.{label}.tuning"
-
-    def try_load(self, file_name) -> Dict:
-        results = None
-        if os.path.exists(file_name):
-            print(f'Using cached {file_name}')
+    @property
+    def database(self) -> tdb.TuningDatabase:
+        if self._database is None:
+            self._database = tdb.TuningDatabase()
+        return self._database
 
-            with open(file_name, 'r') as fp:
-                results = json.load(fp)
+    def try_load(self, cutout: SDFG, complete: bool = True) -> Optional[Dict[str, float]]:
+        """
+        Loads the tuning results of a cutout from the tuning database.
 
-        return results
+        :param cutout: The cutout.
+        :param complete: If True, only returns results of completed searches.
+        :return: A dictionary mapping configuration keys to runtimes, or None.
+        """
+        return self.database.load(self._task, tdb.cutout_hash(cutout), complete=complete)
 
     def cutouts(self) -> Generator[Tuple[SDFGState, str], None, None]:
         raise NotImplementedError
@@ -102,8 +109,9 @@ class CutoutTuner(auto_tuner.AutoTuner):
     def optimize(self, measurements: int = 30, apply: bool = False, **kwargs) -> Dict[Any, Any]:
         tuning_report = {}
         for cutout, label in tqdm(list(self.cutouts())):
-            fn = self.file_name(label)
-            results = self.try_load(fn)
+            # Hash before searching, as the search may modify the cutout
+            key = tdb.cutout_hash(cutout)
+            results = self.database.load(self._task, key)
 
             if results is None:
                 results = self.search(cutout, measurements, **kwargs)
@@ -111,8 +119,7 @@ class CutoutTuner(auto_tuner.AutoTuner):
                     tuning_report[label] = None
                     continue
 
-                with open(fn, 'w') as fp:
-                    json.dump(results, fp)
+                self.database.store(self._task, key, results)
 
             best_config = min(results, key=results.get)
             if apply:
@@ -9,6 +9,7 @@ from typing import Generator, Optional, Tuple, Dict, List, Sequence, Set
 
 from dace import data as dt, SDFG, dtypes
 from dace.optimization import cutout_tuner
+from dace.optimization.tuning_database import TuningDatabase
 from dace.sdfg.state import SDFGState
 from dace.transformation import helpers as xfh
 from dace.sdfg.analysis.cutout import SDFGCutout
@@ -29,8 +30,11 @@ class TuningGroups(enum.Enum):
 
 class DataLayoutTuner(cutout_tuner.CutoutTuner):
 
-    def __init__(self, sdfg: SDFG, measurement: dtypes.InstrumentationType = dtypes.InstrumentationType.Timer) -> None:
-        super().__init__(task="DataLayout", sdfg=sdfg)
+    def __init__(self,
+                 sdfg: SDFG,
+                 measurement: dtypes.InstrumentationType = dtypes.InstrumentationType.Timer,
+                 database: Optional[TuningDatabase] = None) -> None:
+        super().__init__(task="DataLayout", sdfg=sdfg, database=database)
         self.instrument = measurement
 
     def cutouts(self) -> Generator[Tuple[dace.SDFG, str], None, None]:
@@ -1,12 +1,12 @@
 # Copyright 2019-2022 ETH Zurich and the DaCe authors. All rights reserved.
 from collections import OrderedDict
 import dace
-import json
 import itertools
 
 from typing import Dict
 
 from dace.optimization import cutout_tuner as ct
+from dace.optimization import tuning_database as tdb
 from dace.optimization import utils as optim_utils
 
 try:
@@ -23,19 +23,13 @@ class DistributedCutoutTuner:
 
     def optimize(self, measurements: int = 30, **kwargs) -> Dict:
         cutouts = OrderedDict()
-        existing_files = set()
-        for cutout, cutout_hash in self._tuner.cutouts():
-            cutouts[cutout_hash] = cutout
+        for cutout, _ in self._tuner.cutouts():
+            cutouts[tdb.cutout_hash(cutout)] = cutout
 
-            file_name = self._tuner.file_name(cutout_hash)
-            result = self._tuner.try_load(file_name)
-            if result is not None:
-                existing_files.add(cutout_hash)
-
-        # Filter cutouts
+        # Filter cutouts that were already tuned
         new_cutouts = []
         for hash in cutouts:
-            if hash not in existing_files:
+            if self._tuner.database.load(self._tuner.task, hash) is None:
                 new_cutouts.append(hash)
 
         # Split work
@@ -54,10 +48,7 @@ class DistributedCutoutTuner:
         for hash in chunk:
             cutout = cutouts[hash]
             results = self._tuner.search(cutout=cutout, measurements=measurements, **kwargs)
-
-            file_name = self._tuner.file_name(hash)
-            with open(file_name, 'w') as fp:
-                json.dump(results, fp)
+            self._tuner.database.store(self._tuner.task, hash, results)
 
 
 class DistributedSpaceTuner:
@@ -71,20 +62,13 @@ class DistributedSpaceTuner:
         num_ranks = optim_utils.get_world_size()
 
         cutouts = OrderedDict()
-        existing_files = set()
-        for cutout, cutout_hash in self._tuner.cutouts():
-            cutout_hash = f'{cutout_hash}_{rank}'
+        for cutout, _ in self._tuner.cutouts():
+            cutouts[tdb.cutout_hash(cutout)] = cutout
 
-            cutouts[cutout_hash] = cutout
-            file_name = self._tuner.file_name(cutout_hash)
-            result = self._tuner.try_load(file_name)
-            if result is not None:
-                existing_files.add(cutout_hash)
-
-        # Filter cutouts
+        # Filter cutouts that were already tuned
         new_cutouts = []
         for hash in cutouts:
-            if hash not in existing_files:
+            if self._tuner.database.load(self._tuner.task, hash) is None:
                 new_cutouts.append(hash)
 
         self._tuner.rank = rank
@@ -103,14 +87,20 @@ class DistributedSpaceTuner:
             chunk_start = rank * chunk_size
             chunk_end = None if rank == (num_ranks - 1) else ((rank + 1) * chunk_size)
 
+            # Partial results of all ranks are merged in the database, configurations
+            # that were already measured (e.g., in an interrupted run) are skipped
+            existing = self._tuner.database.load(self._tuner.task, cutout_hash, complete=False) or {}
+
             label = f'{rank + 1}/{num_ranks}: {cutout_hash}'
-            results = {}
             key = evaluate_kwargs["key"]
             for config in tqdm(list(itertools.islice(configs, chunk_start, chunk_end)), desc=label):
+                if key(config) in existing:
+                    continue
                 evaluate_kwargs["config"] = config
                 runtime = self._tuner.evaluate(**evaluate_kwargs)
-                results[key(config)] = runtime
+                self._tuner.database.store(self._tuner.task, cutout_hash, {key(config): runtime}, complete=False)
 
-                file_name = self._tuner.file_name(cutout_hash)
-                with open(file_name, 'w') as fp:
-                    json.dump(results, fp)
+            # The search is complete once all ranks have measured their configurations
+            results = self._tuner.database.load(self._tuner.task, cutout_hash, complete=False) or {}
+            if len(results) >= len(configs):
+                self._tuner.database.store(self._tuner.task, cutout_hash, {}, complete=True)
@@ -2,10 +2,11 @@
 import dace
 import itertools
 
-from typing import Generator, Tuple, Dict, List
+from typing import Generator, Tuple, Dict, List, Optional
 
 from dace import SDFG, dtypes
 from dace.optimization import cutout_tuner
+from dace.optimization.tuning_database import TuningDatabase
 from dace.transformation import helpers as xfh
 from dace.sdfg.analysis.cutout import SDFGCutout
 from dace.codegen.instrumentation.data import data_report
@@ -18,8 +19,11 @@ except (ImportError, ModuleNotFoundError):
 
 class MapPermutationTuner(cutout_tuner.CutoutTuner):
 
-    def __init__(self, sdfg: SDFG, measurement: dtypes.InstrumentationType = dtypes.InstrumentationType.Timer) -> None:
-        super().__init__(task="MapPermutation", sdfg=sdfg)
+    def __init__(self,
+                 sdfg: SDFG,
+                 measurement: dtypes.InstrumentationType = dtypes.InstrumentationType.Timer,
+                 database: Optional[TuningDatabase] = None) -> None:
+        super().__init__(task="MapPermutation", sdfg=sdfg, database=database)
         self.instrument = measurement
 
     def cutouts(self) -> Generator[Tuple[dace.SDFGState, str], None, None]:
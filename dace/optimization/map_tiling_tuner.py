@@ -1,10 +1,11 @@
 # Copyright 2019-2022 ETH Zurich and the DaCe authors. All rights reserved.
 import dace
 
-from typing import Generator, Tuple, Dict, List
+from typing import Generator, Tuple, Dict, List, Optional
 
 from dace import dtypes
 from dace.optimization import cutout_tuner
+from dace.optimization.tuning_database import TuningDatabase
 from dace.transformation import dataflow as df
 from dace.transformation import helpers as xfh
 from dace.sdfg.analysis.cutout import SDFGCutout
@@ -19,8 +20,9 @@ class MapTilingTuner(cutout_tuner.CutoutTuner):
 
     def __init__(self,
                  sdfg: dace.SDFG,
-                 measurement: dtypes.InstrumentationType = dtypes.InstrumentationType.Timer) -> None:
-        super().__init__(task="MapTiling", sdfg=sdfg)
+                 measurement: dtypes.InstrumentationType = dtypes.InstrumentationType.Timer,
+                 database: Optional[TuningDatabase] = None) -> None:
+        super().__init__(task="MapTiling", sdfg=sdfg, database=database)
         self.instrument = measurement
 
     def cutouts(self) -> Generator[Tuple[dace.SDFG, str], None, None]:
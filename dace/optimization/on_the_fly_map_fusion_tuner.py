@@ -2,14 +2,14 @@
 import dace
 import tempfile
 import math
-import copy
 import numpy as np
 
-from typing import Generator, Dict, List, Tuple
+from typing import Generator, Dict, List, Tuple, Optional
 from collections import Counter
 
 from dace import SDFG, dtypes
 from dace.optimization import cutout_tuner
+from dace.optimization.tuning_database import TuningDatabase
 from dace.sdfg.analysis.cutout import SDFGCutout
 
 from dace.transformation import subgraph as sg
@@ -26,8 +26,13 @@ except (ImportError, ModuleNotFoundError):
 
 class OnTheFlyMapFusionTuner(cutout_tuner.CutoutTuner):
 
-    def __init__(self, sdfg: SDFG, i, j, measurement: dtypes.InstrumentationType = dtypes.InstrumentationType.Timer) -> None:
-        super().__init__(task="OnTheFlyMapFusion", sdfg=sdfg, i=i, j=j)
+    def __init__(self,
+                 sdfg: SDFG,
+                 i,
+                 j,
+                 measurement: dtypes.InstrumentationType = dtypes.InstrumentationType.Timer,
+                 database: Optional[TuningDatabase] = None) -> None:
+        super().__init__(task="OnTheFlyMapFusion", sdfg=sdfg, database=database)
         self.instrument = measurement
 
     def cutouts(self):
@@ -164,6 +169,10 @@ class OnTheFlyMapFusionTuner(cutout_tuner.CutoutTuner):
         best_configs = cutout_tuner.CutoutTuner.top_k_configs(tuning_report, k=k)
         subgraph_patterns = tuner._extract_patterns(best_configs)
 
+        # Accumulate patterns across programs and runs in the tuning database
+        tuner.database.store_patterns(tuner.task, subgraph_patterns)
+        subgraph_patterns = tuner.database.load_patterns(tuner.task)
+
         i = 0
         for nsdfg in sdfg.all_sdfgs_recursive():
             for state in nsdfg.states():
@@ -247,7 +256,7 @@ class OnTheFlyMapFusionTuner(cutout_tuner.CutoutTuner):
                         experiment_sdfg_ = SDFGCutout.singlestate_cutout(state, *(state.nodes()), make_copy=False)
                         experiment_state_ = experiment_sdfg_.start_state
                         experiment_maps_ids = list(map(lambda me: experiment_state_.node_id(me), subgraph_maps))
-                        experiment_sdfg = copy.deepcopy(experiment_sdfg_)
+                        experiment_sdfg = experiment_sdfg_.lazy_copy()
                         experiment_state = experiment_sdfg.start_state
                         experiment_state.instrument = dace.InstrumentationType.GPU_Events
 
@@ -2,13 +2,13 @@
 import dace
 import pickle
 import math
-import copy
 
-from typing import Generator, Dict, List, Tuple
+from typing import Generator, Dict, List, Tuple, Optional
 from collections import Counter
 
 from dace import SDFG, dtypes
 from dace.optimization import cutout_tuner
+from dace.optimization.tuning_database import TuningDatabase
 from dace.sdfg.analysis.cutout import SDFGCutout
 
 from dace.transformation import subgraph as sg
@@ -25,8 +25,13 @@ except (ImportError, ModuleNotFoundError):
 
 class SubgraphFusionTuner(cutout_tuner.CutoutTuner):
 
-    def __init__(self, sdfg: SDFG, i, j, measurement: dtypes.InstrumentationType = dtypes.InstrumentationType.Timer) -> None:
-        super().__init__(task="SubgraphFusion", sdfg=sdfg, i=i, j=j)
+    def __init__(self,
+                 sdfg: SDFG,
+                 i,
+                 j,
+                 measurement: dtypes.InstrumentationType = dtypes.InstrumentationType.Timer,
+                 database: Optional[TuningDatabase] = None) -> None:
+        super().__init__(task="SubgraphFusion", sdfg=sdfg, database=database)
         self.instrument = measurement
 
     def cutouts(self, sdfg=None):
@@ -166,6 +171,10 @@ class SubgraphFusionTuner(cutout_tuner.CutoutTuner):
         best_configs = cutout_tuner.CutoutTuner.top_k_configs(tuning_report, k=k)
         subgraph_patterns = tuner._extract_patterns(best_configs)
 
+        # Accumulate patterns across programs and runs in the tuning database
+        tuner.database.store_patterns(tuner.task, subgraph_patterns)
+        subgraph_patterns = tuner.database.load_patterns(tuner.task)
+
         i = 0
         for nsdfg in sdfg.all_sdfgs_recursive():
             for state in nsdfg.states():
@@ -252,8 +261,8 @@ class SubgraphFusionTuner(cutout_tuner.CutoutTuner):
                         experiment_state_ = experiment_sdfg_.start_state
                         experiment_maps_ids = list(map(lambda me: experiment_state_.node_id(me), subgraph_maps))
 
-                        # Unnecessary?
-                        experiment_sdfg = copy.deepcopy(experiment_sdfg_)
+                        # The cutout shares its nodes with the original state, apply the fusion on a (lazy) copy
+                        experiment_sdfg = experiment_sdfg_.lazy_copy()
                         experiment_state = experiment_sdfg.start_state
 
                         experiment_maps = list(map(lambda m_id: experiment_state.node(m_id), experiment_maps_ids))
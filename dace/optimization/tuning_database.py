@@ -0,0 +1,225 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+A persistent database of tuning results, shared by all cutout tuners. Results are stored in a local SQLite file and
+keyed by the tuning task, the structural hash of the tuned cutout, and a signature of the hardware they were measured
+on. This way, tuning effort accumulates across programs, runs, and machines of the same type.
+"""
+import contextlib
+import functools
+import json
+import os
+import platform
+import sqlite3
+import time
+
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from dace.config import Config
+from dace.sdfg import SDFG
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS results (
+    task TEXT NOT NULL,
+    cutout TEXT NOT NULL,
+    hardware TEXT NOT NULL,
+    config TEXT NOT NULL,
+    runtime REAL NOT NULL,
+    timestamp REAL NOT NULL,
+    PRIMARY KEY (task, cutout, hardware, config)
+);
+CREATE TABLE IF NOT EXISTS searches (
+    task TEXT NOT NULL,
+    cutout TEXT NOT NULL,
+    hardware TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    PRIMARY KEY (task, cutout, hardware)
+);
+CREATE TABLE IF NOT EXISTS patterns (
+    task TEXT NOT NULL,
+    hardware TEXT NOT NULL,
+    pattern TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    PRIMARY KEY (task, hardware, pattern)
+);
+'''
+
+
+@functools.lru_cache(maxsize=None)
+def hardware_signature() -> str:
+    """
+    Returns a signature of the hardware of the current machine, consisting of
+    the architecture, CPU model, and number of cores. Machines of the same type
+    share the same signature.
+    """
+    cpu = platform.processor()
+    try:
+        with open('/proc/cpuinfo', 'r') as fp:
+            for line in fp:
+                if line.startswith('model name'):
+                    cpu = line.split(':', 1)[1].strip()
+                    break
+    except OSError:
+        pass
+    return f'{platform.system()}-{platform.machine()}-{cpu}-{os.cpu_count()}'
+
+
+def cutout_hash(cutout: SDFG) -> str:
+    """
+    Returns a structural hash of a cutout, which does not depend on names,
+    IDs, or instrumentation.
+    """
+    return cutout.hash_sdfg()
+
+
+class TuningDatabase:
+    """
+    A persistent, queryable database of tuning results, stored in a local
+    SQLite file. Every tuning result (a configuration and its runtime) is
+    keyed by the tuning task, the structural hash of the cutout, and the
+    hardware signature. Additionally, the database keeps track of completed
+    searches and of transferable patterns (e.g., map descriptors of
+    successful fusions) per task.
+
+    For example::
+
+        db = TuningDatabase()
+        results = db.load('MapTiling', cutout_hash(cutout))
+        if results is None:
+            results = tuner.search(cutout, measurements=30)
+            db.store('MapTiling', cutout_hash(cutout), results)
+    """
+
+    def __init__(self, path: Optional[str] = None, hardware: Optional[str] = None) -> None:
+        """
+        Opens (and creates, if necessary) a tuning database.
+
+        :param path: Path to the database file. If None, uses the
+                     ``optimizer.tuning_database`` configuration entry.
+        :param hardware: Hardware signature to use for queries and new
+                         results. If None, uses the signature of the current
+                         machine.
+        """
+        if path is None:
+            path = (Config.get('optimizer', 'tuning_database')
+                    or os.path.join(Config.get('default_build_folder'), 'tuning.db'))
+        self._path = os.path.abspath(path)
+        self._hardware = hardware or hardware_signature()
+
+        folder = os.path.dirname(self._path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def hardware(self) -> str:
+        return self._hardware
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # Connections are opened per operation, so that the database can be
+        # shared by several processes (e.g., MPI ranks) and transactions are
+        # committed immediately
+        conn = sqlite3.connect(self._path, timeout=60.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def load(self, task: str, cutout: str, complete: bool = True) -> Optional[Dict[str, float]]:
+        """
+        Loads the tuning results of a cutout.
+
+        :param task: Name of the tuning task.
+        :param cutout: Structural hash of the cutout (see ``cutout_hash``).
+        :param complete: If True, only returns results of completed searches.
+        :return: A dictionary mapping configuration keys to runtimes, or None
+                 if no (complete) results exist.
+        """
+        with self._connect() as conn:
+            if complete:
+                found = conn.execute('SELECT 1 FROM searches WHERE task = ? AND cutout = ? AND hardware = ?',
+                                     (task, cutout, self._hardware)).fetchone()
+                if found is None:
+                    return None
+            rows = conn.execute('SELECT config, runtime FROM results WHERE task = ? AND cutout = ? AND hardware = ?',
+                                (task, cutout, self._hardware)).fetchall()
+        if not complete and len(rows) == 0:
+            return None
+        return {config: runtime for config, runtime in rows}
+
+    def store(self, task: str, cutout: str, results: Dict[str, float], complete: bool = True) -> None:
+        """
+        Stores tuning results of a cutout, replacing previous results of the
+        same configurations.
+
+        :param task: Name of the tuning task.
+        :param cutout: Structural hash of the cutout (see ``cutout_hash``).
+        :param results: A dictionary mapping configuration keys to runtimes.
+        :param complete: If True, marks the search of the cutout as completed.
+                         Partial results (e.g., of a distributed search) can
+                         be stored with ``complete=False``.
+        """
+        timestamp = time.time()
+        with self._connect() as conn:
+            conn.executemany('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)',
+                             [(task, cutout, self._hardware, str(config), float(runtime), timestamp)
+                              for config, runtime in results.items()])
+            if complete:
+                conn.execute('INSERT OR REPLACE INTO searches VALUES (?, ?, ?, ?)',
+                             (task, cutout, self._hardware, timestamp))
+
+    def top_k(self, task: str, k: int) -> List[Tuple[str, str, float]]:
+        """
+        Returns the best ``k`` configurations of every tuned cutout of a task.
+
+        :param task: Name of the tuning task.
+        :param k: Number of configurations per cutout.
+        :return: A list of (cutout hash, configuration key, runtime) tuples,
+                 sorted by cutout and runtime. Failed configurations (with
+                 infinite runtime) are excluded.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT cutout, config, runtime FROM results WHERE task = ? AND hardware = ? '
+                'AND runtime < ? ORDER BY cutout, runtime', (task, self._hardware, float('inf'))).fetchall()
+
+        result = []
+        counts = Counter()
+        for cutout, config, runtime in rows:
+            if counts[cutout] < k:
+                result.append((cutout, config, runtime))
+                counts[cutout] += 1
+        return result
+
+    def store_patterns(self, task: str, patterns: List[Dict[str, int]]) -> None:
+        """
+        Stores transferable patterns of a task (e.g., counts of map
+        descriptors that were successfully fused).
+
+        :param task: Name of the tuning task.
+        :param patterns: A list of patterns, each a dictionary mapping
+                         descriptors to counts.
+        """
+        timestamp = time.time()
+        with self._connect() as conn:
+            conn.executemany('INSERT OR REPLACE INTO patterns VALUES (?, ?, ?, ?)',
+                             [(task, self._hardware, json.dumps(dict(p), sort_keys=True), timestamp) for p in patterns])
+
+    def load_patterns(self, task: str) -> List[Counter]:
+        """
+        Loads all transferable patterns of a task.
+
+        :param task: Name of the tuning task.
+        :return: A list of patterns, each a counter of descriptors.
+        """
+        with self._connect() as conn:
+            rows = conn.execute('SELECT pattern FROM patterns WHERE task = ? AND hardware = ? ORDER BY pattern',
+                                (task, self._hardware)).fetchall()
+        return [Counter(json.loads(pattern)) for pattern, in rows]
@@ -19,6 +19,24 @@ from typing import List, Set, Type, Union, TypeVar, Generic
 
 T = TypeVar('T')
 
+# The last stamp given to an object whose property was set (see ``property_stamp``)
+_last_property_stamp = 0
+
+
+def last_property_stamp() -> int:
+    """ Returns the stamp given to the last object whose property was set. """
+    return _last_property_stamp
+
+
+def property_stamp(obj) -> int:
+    """
+    Returns a number that increases (across all objects) whenever a property of the given object is set, or 0 if no
+    property of the object was ever set. Modifications made in-place to property values (e.g., to the ranges of a
+    subset) are not tracked.
+    """
+    return getattr(obj, '_property_stamp', 0)
+
+
 ###############################################################################
 # External interface to guarantee correct usage
 ###############################################################################
@@ -199,6 +217,13 @@ class Property(Generic[T]):
         return getattr(obj, "_" + self.attr_name)
 
     def __set__(self, obj, val):
+        global _last_property_stamp
+        _last_property_stamp += 1
+        try:
+            obj.__dict__['_property_stamp'] = _last_property_stamp
+        except AttributeError:  # Objects without a dictionary
+            pass
+
         # If custom setter is specified, use it
         if self.setter:
             return self.setter(obj, val)
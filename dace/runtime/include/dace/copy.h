@@ -2,10 +2,21 @@
 #ifndef __DACE_COPY_H
 #define __DACE_COPY_H
 
+#include <cstring>
+
 #include "types.h"
 #include "reduction.h"
 #include "vector.h"
 
+#ifdef _OPENMP
+    #include <omp.h>
+#endif
+
+#if defined(__SSE2__) && !defined(__CUDACC__) && !defined(__HIPCC__)
+    #include <emmintrin.h>
+    #define DACE_NONTEMPORAL_COPY
+#endif
+
 namespace dace
 {
     template<typename T, typename U>
@@ -398,6 +409,86 @@ namespace dace
         };
     };
 
+    namespace detail
+    {
+        // Copies memory with non-temporal (streaming) stores, which do not
+        // read the destination into the cache before writing it
+        inline void nontemporal_memcpy(char *dst, const char *src, size_t bytes)
+        {
+#ifdef DACE_NONTEMPORAL_COPY
+            // Align destination to 16 bytes
+            size_t head = (16 - (reinterpret_cast<uintptr_t>(dst) & 15)) & 15;
+            if (head > bytes)
+                head = bytes;
+            memcpy(dst, src, head);
+            dst += head;
+            src += head;
+            bytes -= head;
+
+            // Write one cache line per iteration
+            size_t lines = bytes / 64;
+            for (size_t i = 0; i < lines; ++i) {
+                const __m128i *s = reinterpret_cast<const __m128i *>(src + i * 64);
+                __m128i *d = reinterpret_cast<__m128i *>(dst + i * 64);
+                __m128i v0 = _mm_loadu_si128(s), v1 = _mm_loadu_si128(s + 1);
+                __m128i v2 = _mm_loadu_si128(s + 2), v3 = _mm_loadu_si128(s + 3);
+                _mm_stream_si128(d, v0);
+                _mm_stream_si128(d + 1, v1);
+                _mm_stream_si128(d + 2, v2);
+                _mm_stream_si128(d + 3, v3);
+            }
+            memcpy(dst + lines * 64, src + lines * 64, bytes - lines * 64);
+
+            // Order streaming stores before subsequent stores
+            _mm_sfence();
+#else
+            memcpy(dst, src, bytes);
+#endif
+        }
+
+        inline void copy_bytes(char *dst, const char *src, size_t bytes, bool nontemporal)
+        {
+            if (nontemporal)
+                nontemporal_memcpy(dst, src, bytes);
+            else
+                memcpy(dst, src, bytes);
+        }
+    }  // namespace detail
+
+    /**
+     * Copies a large contiguous array on the CPU. If the copy is larger than
+     * ``parallel_bytes`` and called outside of a parallel region, it is split
+     * into cache line-aligned chunks across OpenMP threads. Copies larger than
+     * ``nontemporal_bytes`` use non-temporal stores. A threshold of zero
+     * disables the respective optimization.
+     */
+    template <typename T>
+    inline void LargeCopy(const T *src, T *dst, size_t size, size_t parallel_bytes, size_t nontemporal_bytes)
+    {
+        const char *csrc = reinterpret_cast<const char *>(src);
+        char *cdst = reinterpret_cast<char *>(dst);
+        const size_t bytes = size * sizeof(T);
+        const bool nontemporal = nontemporal_bytes > 0 && bytes >= nontemporal_bytes;
+
+#ifdef _OPENMP
+        if (parallel_bytes > 0 && bytes >= parallel_bytes && !omp_in_parallel()) {
+            #pragma omp parallel
+            {
+                const size_t nthreads = omp_get_num_threads();
+                const size_t chunk = ((bytes + nthreads - 1) / nthreads + 63) / 64 * 64;
+                size_t begin = omp_get_thread_num() * chunk, end = begin + chunk;
+                if (begin > bytes)
+                    begin = bytes;
+                if (end > bytes)
+                    end = bytes;
+                detail::copy_bytes(cdst + begin, csrc + begin, end - begin, nontemporal);
+            }
+            return;
+        }
+#endif
+        detail::copy_bytes(cdst, csrc, bytes, nontemporal);
+    }
+
 }  // namespace dace
 
 #endif  // __DACE_COPY_H
@@ -2,7 +2,10 @@
 #ifndef __DACE_REDUCTION_H
 #define __DACE_REDUCTION_H
 
+#include <atomic>
 #include <cstdint>
+#include <cstring>
+#include <type_traits>
 
 #include "types.h"
 #include "vector.h"
@@ -31,6 +34,110 @@
 
 namespace dace {
 
+    namespace detail
+    {
+        // Custom write-conflict resolution on the CPU. Values whose size
+        // matches a native compare-and-swap (CAS) word (up to 16 bytes) are
+        // updated lock-free, other values lock one of a fixed set of locks
+        // selected by address ("striped" locks), so that only updates to
+        // nearby addresses contend. Define DACE_CPU_WCR_CRITICAL to use a
+        // single OpenMP critical section for all updates instead.
+
+        // Number of striped locks
+        constexpr size_t wcr_lock_stripes = 4096;
+
+        struct alignas(64) wcr_lock {
+            std::atomic<bool> locked;
+        };
+
+        // Non-static, so that all translation units share the same locks
+        inline std::atomic<bool>& wcr_lock_for(const void *ptr) {
+            static wcr_lock locks[wcr_lock_stripes];
+            uintptr_t addr = reinterpret_cast<uintptr_t>(ptr);
+            return locks[((addr >> 4) ^ (addr >> 16)) % wcr_lock_stripes].locked;
+        }
+
+        template <typename T, typename WCR>
+        inline T locked_reduce(WCR wcr, T *ptr, const T& value) {
+            std::atomic<bool>& lock = wcr_lock_for(ptr);
+            while (lock.exchange(true, std::memory_order_acquire)) {
+                while (lock.load(std::memory_order_relaxed)) { }
+            }
+            T old = *ptr;
+            *ptr = wcr(old, value);
+            lock.store(false, std::memory_order_release);
+            return old;
+        }
+
+        // Unsigned integer type that can be updated with CAS, per size
+        template <size_t SIZE> struct cas_word { typedef void type; };
+        #if defined(__GNUC__) || defined(__clang__)
+            template <> struct cas_word<1> { typedef uint8_t type; };
+            template <> struct cas_word<2> { typedef uint16_t type; };
+            template <> struct cas_word<4> { typedef uint32_t type; };
+            template <> struct cas_word<8> { typedef uint64_t type; };
+            #if defined(__GCC_HAVE_SYNC_COMPARE_AND_SWAP_16) && defined(__SIZEOF_INT128__)
+                template <> struct cas_word<16> { typedef unsigned __int128 type; };
+            #endif
+        #endif
+
+        template <typename T>
+        struct has_cas_word {
+            static constexpr bool value = std::is_trivially_copyable<T>::value &&
+                !std::is_void<typename cas_word<sizeof(T)>::type>::value;
+        };
+
+        template <typename T, typename WCR>
+        inline T cas_reduce(WCR wcr, T *ptr, const T& value) {
+            typedef typename cas_word<sizeof(T)>::type word;
+            word *wptr = reinterpret_cast<word *>(ptr);
+            word expected, desired;
+            T old, updated;
+
+            // A torn read only results in a failed CAS
+            std::memcpy(&expected, ptr, sizeof(T));
+            while (true) {
+                std::memcpy(static_cast<void *>(&old), &expected, sizeof(T));
+                updated = wcr(old, value);
+                std::memcpy(&desired, &updated, sizeof(T));
+                word prev = __sync_val_compare_and_swap(wptr, expected, desired);
+                if (prev == expected)
+                    return old;
+                expected = prev;
+            }
+        }
+
+        template <typename T, typename WCR>
+        inline typename std::enable_if<has_cas_word<T>::value, T>::type
+        striped_reduce(WCR wcr, T *ptr, const T& value) {
+            // CAS requires natural alignment
+            if (reinterpret_cast<uintptr_t>(ptr) % sizeof(T) == 0)
+                return cas_reduce(wcr, ptr, value);
+            return locked_reduce(wcr, ptr, value);
+        }
+
+        template <typename T, typename WCR>
+        inline typename std::enable_if<!has_cas_word<T>::value, T>::type
+        striped_reduce(WCR wcr, T *ptr, const T& value) {
+            return locked_reduce(wcr, ptr, value);
+        }
+
+        template <typename T, typename WCR>
+        inline T cpu_reduce_atomic(WCR wcr, T *ptr, const T& value) {
+            #ifdef DACE_CPU_WCR_CRITICAL
+                T old;
+                #pragma omp critical
+                {
+                    old = *ptr;
+                    *ptr = wcr(old, value);
+                }
+                return old;
+            #else
+                return striped_reduce(wcr, ptr, value);
+            #endif
+        }
+    }  // namespace detail
+
     // Internal type. See below for wcr_fixed external type, which selects
     // the implementation according to T's properties.
     template <ReductionType REDTYPE, typename T>
@@ -47,7 +154,7 @@ namespace dace {
     struct wcr_custom {
         template <typename WCR>
         static DACE_HDFI T reduce_atomic(WCR wcr, T *ptr, const T& value) {
-            // The slowest kind of atomic operations (locked/compare-and-swap),
+            // The slowest kind of atomic operations (compare-and-swap/locked),
             // this should only happen in case of unrecognized lambdas
             T old;
             #ifdef DACE_USE_GPU_ATOMICS
@@ -59,11 +166,7 @@ namespace dace {
                     old = atomicCAS(ptr, assumed, wcr(assumed, value));
                 } while (assumed != old);
             #else
-                #pragma omp critical
-                {
-                  old = *ptr;
-                  *ptr = wcr(old, value);
-                }
+                old = detail::cpu_reduce_atomic(wcr, ptr, value);
             #endif
 
             return old;
@@ -96,13 +199,7 @@ namespace dace {
                 } while (assumed != old);
                 return __int_as_float(old);
             #else
-                float old;
-                #pragma omp critical
-                {
-                    old = *ptr;
-                    *ptr = wcr(old, value);
-                }
-                return old;
+                return detail::cpu_reduce_atomic(wcr, ptr, value);
             #endif
         }
 
@@ -135,13 +232,7 @@ namespace dace {
                 } while (assumed != old);
                 return __longlong_as_double(old);
             #else
-                double old;
-                #pragma omp critical
-                {
-                    old = *ptr;
-                    *ptr = wcr(old, value);
-                }
-                return old;
+                return detail::cpu_reduce_atomic(wcr, ptr, value);
             #endif
         }
 
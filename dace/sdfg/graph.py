@@ -6,7 +6,16 @@ import itertools
 import networkx as nx
 from dace.dtypes import deduplicate
 import dace.serialize
-from typing import Any, Callable, Generic, Iterable, List, Sequence, TypeVar, Union
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar, Union
+
+
+# The last modification stamp given to an ordered graph (see ``OrderedDiGraph.modification_stamp``)
+_last_modification_stamp = 0
+
+
+def last_modification_stamp() -> int:
+    """ Returns the modification stamp of the most recently modified ordered graph. """
+    return _last_modification_stamp
 
 
 class NodeNotFoundError(Exception):
@@ -118,8 +127,8 @@ class MultiConnectorEdge(MultiEdge, Generic[T]):
         src_nid = json_obj['src']
         dst_nid = json_obj['dst']
 
-        dst = sdfg.nodes()[int(dst_nid)]
-        src = sdfg.nodes()[int(src_nid)]
+        dst = sdfg.node(int(dst_nid))
+        src = sdfg.node(int(src_nid))
 
         dst_conn = json_obj['dst_connector']
         src_conn = json_obj['src_connector']
@@ -615,30 +624,123 @@ class MultiDiConnectorGraph(MultiDiGraph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
 @dace.serialize.serializable
 class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
     """ Directed graph where nodes and edges are returned in the order they
-        were added. """
+        were added.
+
+        Node and edge IDs are their positions in that order. They are kept in
+        an index that is extended as nodes and edges are added, and rebuilt
+        (compacting the IDs) on the next lookup after an element other than
+        the last one is removed.
+
+        A networkx version of the graph (``nx``) is only built when requested,
+        and is cached until the graph is modified. """
     def __init__(self):
-        self._nx = nx.DiGraph()
         # {node: ({in edge: None}, {out edges: None})}
         self._nodes = OrderedDict()
         # {(src, dst): edge}
         self._edges = OrderedDict()
+        self._nx_cache: Optional[nx.DiGraph] = None
+        self._clear_id_index()
+        self._mark_modified()
+
+    def _mark_modified(self):
+        """ Drops the cached networkx graph and updates the modification stamp of this graph. """
+        global _last_modification_stamp
+        _last_modification_stamp += 1
+        self._nx_cache = None
+        self._modification_stamp = _last_modification_stamp
+
+    @property
+    def modification_stamp(self) -> int:
+        """
+        A number that increases (across all graphs) whenever nodes or edges of this graph are added or removed, or the
+        graph is otherwise marked as modified (e.g., after a transformation was applied to it).
+        """
+        return self._modification_stamp
+
+    def _clear_id_index(self):
+        """ Invalidates the node and edge ID index, which is rebuilt lazily. """
+        # ([node], {node: id}) and ([edge], {edge: id}), or None if invalid
+        self._node_index: Optional[Tuple[List[NodeT], Dict[NodeT, int]]] = None
+        self._edge_index: Optional[Tuple[List[Edge[EdgeT]], Dict[Edge[EdgeT], int]]] = None
+
+    def _get_node_index(self) -> Tuple[List[NodeT], Dict[NodeT, int]]:
+        if self._node_index is None:
+            nodes = list(self._nodes.keys())
+            self._node_index = (nodes, {n: i for i, n in enumerate(nodes)})
+        return self._node_index
+
+    def _get_edge_index(self) -> Tuple[List[Edge[EdgeT]], Dict[Edge[EdgeT], int]]:
+        if self._edge_index is None:
+            edges = list(self._edges.values())
+            self._edge_index = (edges, {e: i for i, e in enumerate(edges)})
+        return self._edge_index
+
+    def _index_added(self, index, element):
+        if index is not None:
+            index[1][element] = len(index[0])
+            index[0].append(element)
+
+    def _index_removed(self, index, element) -> bool:
+        """ Removes an element from an ID index. Returns False if the index
+            must be rebuilt instead (i.e., when IDs would change). """
+        if index is None:
+            return True
+        if index[0] and index[0][-1] is element:
+            index[0].pop()
+            del index[1][element]
+            return True
+        return False
+
+    def _node_added(self, node: NodeT):
+        self._index_added(self._node_index, node)
+
+    def _node_removed(self, node: NodeT):
+        if not self._index_removed(self._node_index, node):
+            self._node_index = None
+
+    def _edge_added(self, edge: Edge[EdgeT]):
+        self._index_added(self._edge_index, edge)
+
+    def _edge_removed(self, edge: Edge[EdgeT]):
+        if not self._index_removed(self._edge_index, edge):
+            self._edge_index = None
+
+    @property
+    def _nx(self) -> nx.DiGraph:
+        if self._nx_cache is None:
+            self._nx_cache = self._make_nx()
+        return self._nx_cache
+
+    def _make_nx(self) -> nx.DiGraph:
+        """ Creates a networkx version of this graph, with the edge data in the ``data`` attribute of every edge. """
+        result = nx.DiGraph()
+        result.add_nodes_from(self._nodes.keys())
+        for edge in self._edges.values():
+            result.add_edge(edge.src, edge.dst, data=edge.data)
+        return result
 
     @property
     def nx(self):
         return self._nx
 
     def node(self, id: int) -> NodeT:
-        try:
-            return next(n for i, n in enumerate(self._nodes.keys()) if i == id)
-        except StopIteration:
+        nodes = self._get_node_index()[0]
+        if id < 0 or id >= len(nodes):
             raise NodeNotFoundError
+        return nodes[id]
 
     def node_id(self, node: NodeT) -> int:
         try:
-            return next(i for i, n in enumerate(self._nodes.keys()) if n is node)
-        except StopIteration:
+            return self._get_node_index()[1][node]
+        except KeyError:
             raise NodeNotFoundError(node)
 
+    def edge_id(self, edge: Edge[EdgeT]) -> int:
+        try:
+            return self._get_edge_index()[1][edge]
+        except KeyError:
+            raise EdgeNotFoundError(edge)
+
     def nodes(self) -> List[NodeT]:
         return list(self._nodes.keys())
 
@@ -655,7 +757,8 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         if node in self._nodes:
             raise RuntimeError("Duplicate node added")
         self._nodes[node] = (OrderedDict(), OrderedDict())
-        self._nx.add_node(node)
+        self._mark_modified()
+        self._node_added(node)
 
     def add_edge(self, src: NodeT, dst: NodeT, data: EdgeT = None):
         t = (src, dst)
@@ -669,7 +772,8 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         self._edges[t] = edge
         self._nodes[src][1][t] = edge
         self._nodes[dst][0][t] = edge
-        self._nx.add_edge(src, dst, data=data)
+        self._mark_modified()
+        self._edge_added(edge)
         return edge
 
     def remove_node(self, node: NodeT):
@@ -677,7 +781,8 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
             for edge in itertools.chain(self.in_edges(node), self.out_edges(node)):
                 self.remove_edge(edge)
             del self._nodes[node]
-            self._nx.remove_node(node)
+            self._mark_modified()
+            self._node_removed(node)
         except KeyError:
             pass
 
@@ -685,16 +790,17 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         src = edge.src
         dst = edge.dst
         t = (src, dst)
-        self._nx.remove_edge(src, dst)
         del self._nodes[src][1][t]
         del self._nodes[dst][0][t]
-        del self._edges[t]
+        edge = self._edges.pop(t)
+        self._mark_modified()
+        self._edge_removed(edge)
 
     def in_degree(self, node):
-        return self._nx.in_degree(node)
+        return len(self._nodes[node][0])
 
     def out_degree(self, node):
-        return self._nx.out_degree(node)
+        return len(self._nodes[node][1])
 
     def number_of_nodes(self):
         return len(self._nodes)
@@ -710,18 +816,49 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
 
     def find_cycles(self):
         return nx.simple_cycles(self._nx)
-    
+
     def has_cycles(self) -> bool:
-        try:
-            nx.find_cycle(self._nx, self.source_nodes())
-            return True
-        except nx.NetworkXNoCycle:
-            return False
+        """ Returns True if a cycle is reachable from the source nodes of the graph. """
+        # Iterative depth-first search, looking for edges back into the current path
+        on_path, finished = set(), set()
+        for source in self.source_nodes():
+            on_path.add(source)
+            stack = [(source, iter(self._nodes[source][1].values()))]
+            while stack:
+                node, out_edges = stack[-1]
+                edge = next(out_edges, None)
+                if edge is None:
+                    stack.pop()
+                    on_path.remove(node)
+                    finished.add(node)
+                elif edge.dst in on_path:
+                    return True
+                elif edge.dst not in finished:
+                    on_path.add(edge.dst)
+                    stack.append((edge.dst, iter(self._nodes[edge.dst][1].values())))
+        return False
+
+    def has_path(self, source: NodeT, destination: NodeT) -> bool:
+        """ Returns True if ``destination`` is reachable from ``source`` (or if they are the same node). """
+        for node in (source, destination):
+            if node not in self._nodes:
+                raise NodeNotFoundError(node)
+        seen = {source}
+        stack = [source]
+        while stack:
+            node = stack.pop()
+            if node is destination:
+                return True
+            for edge in self._nodes[node][1].values():
+                if edge.dst not in seen:
+                    seen.add(edge.dst)
+                    stack.append(edge.dst)
+        return False
 
     def edges_between(self, source: NodeT, destination: NodeT) -> List[Edge[EdgeT]]:
         if (source, destination) in self._edges:
             return [self._edges[(source, destination)]]
-        if source not in self.nodes(): return []
+        if source not in self._nodes: return []
         return [e for e in self.out_edges(source) if e.dst == destination]
 
     def reverse(self):
@@ -733,15 +870,30 @@ class OrderedMultiDiGraph(OrderedDiGraph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
     """ Directed multigraph where nodes and edges are returned in the order
         they were added. """
     def __init__(self):
-        self._nx = nx.MultiDiGraph()
         # {node: ({in edge: edge}, {out edge: edge})}
         self._nodes = OrderedDict()
         # {edge: edge}
         self._edges = OrderedDict()
+        self._nx_cache: Optional[nx.MultiDiGraph] = None
+        # Edge keys are unique within the graph (and thus between every pair of nodes)
+        self._next_edge_key = 0
+        self._clear_id_index()
+        self._mark_modified()
+
+    def _make_nx(self) -> nx.MultiDiGraph:
+        result = nx.MultiDiGraph()
+        result.add_nodes_from(self._nodes.keys())
+        for edge in self._edges.values():
+            result.add_edge(edge.src, edge.dst, key=edge.key, data=edge.data)
+        return result
+
+    def _new_edge_key(self) -> int:
+        key = self._next_edge_key
+        self._next_edge_key += 1
+        return key
 
     def add_edge(self, src: NodeT, dst: NodeT, data: EdgeT) -> MultiEdge[EdgeT]:
-        key = self._nx.add_edge(src, dst, data=data)
-        edge = MultiEdge(src, dst, data, key)
+        edge = MultiEdge(src, dst, data, self._new_edge_key())
         if src not in self._nodes:
             self.add_node(src)
         if dst not in self._nodes:
@@ -749,13 +901,16 @@ class OrderedMultiDiGraph(OrderedDiGraph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         self._nodes[src][1][edge] = edge
         self._nodes[dst][0][edge] = edge
         self._edges[edge] = edge
+        self._mark_modified()
+        self._edge_added(edge)
         return edge
 
     def remove_edge(self, edge: MultiEdge[EdgeT]):
         del self._edges[edge]
         del self._nodes[edge.src][1][edge]
         del self._nodes[edge.dst][0][edge]
-        self._nx.remove_edge(edge.src, edge.dst, edge.key)
+        self._mark_modified()
+        self._edge_removed(edge)
 
     def in_edges(self, node) -> List[MultiEdge[EdgeT]]:
         return super().in_edges(node)
@@ -767,7 +922,7 @@ class OrderedMultiDiGraph(OrderedDiGraph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         return super().edges_between(source, destination)
 
     def reverse(self) -> None:
-        self._nx.reverse(False)
+        self._mark_modified()
         for e in self._edges.keys():
             e.reverse()
         for n, (in_edges, out_edges) in self._nodes.items():
@@ -783,9 +938,20 @@ class OrderedMultiDiConnectorGraph(OrderedMultiDiGraph[NodeT, EdgeT], Generic[No
     def __init__(self):
         super().__init__()
 
+    def _make_nx(self) -> nx.MultiDiGraph:
+        result = nx.MultiDiGraph()
+        result.add_nodes_from(self._nodes.keys())
+        for edge in self._edges.values():
+            result.add_edge(edge.src,
+                            edge.dst,
+                            key=edge.key,
+                            data=edge.data,
+                            src_conn=edge.src_conn,
+                            dst_conn=edge.dst_conn)
+        return result
+
     def add_edge(self, src: NodeT, src_conn: str, dst: NodeT, dst_conn: str, data: EdgeT) -> MultiConnectorEdge[EdgeT]:
-        key = self._nx.add_edge(src, dst, data=data, src_conn=src_conn, dst_conn=dst_conn)
-        edge = MultiConnectorEdge(src, src_conn, dst, dst_conn, data, key)
+        edge = MultiConnectorEdge(src, src_conn, dst, dst_conn, data, self._new_edge_key())
         if src not in self._nodes:
             self.add_node(src)
         if dst not in self._nodes:
@@ -793,6 +959,8 @@ class OrderedMultiDiConnectorGraph(OrderedMultiDiGraph[NodeT, EdgeT], Generic[No
         self._nodes[src][1][edge] = edge
         self._nodes[dst][0][edge] = edge
         self._edges[edge] = edge
+        self._mark_modified()
+        self._edge_added(edge)
         return edge
 
     def add_nedge(self, src: NodeT, dst: NodeT, data: EdgeT) -> MultiConnectorEdge[EdgeT]:
@@ -803,10 +971,11 @@ class OrderedMultiDiConnectorGraph(OrderedMultiDiGraph[NodeT, EdgeT], Generic[No
         del self._edges[edge]
         del self._nodes[edge.src][1][edge]
         del self._nodes[edge.dst][0][edge]
-        self._nx.remove_edge(edge.src, edge.dst, edge.key)
+        self._mark_modified()
+        self._edge_removed(edge)
 
     def reverse(self) -> None:
-        self._nx.reverse(False)
+        self._mark_modified()
         for e in self._edges.keys():
             e.reverse()
         for n, (in_edges, out_edges) in self._nodes.items():
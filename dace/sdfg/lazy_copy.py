@@ -0,0 +1,126 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Contains functionality to lazily copy SDFGs. A lazy copy of an SDFG initially consists of placeholder SDFGs and states
+that only hold the properties of the original elements. The contents of each state (its nodes and edges) and the data
+descriptors of each SDFG are copied from the original SDFG the first time they are accessed, such that parts of the
+SDFG that are never used (e.g., states and nested SDFGs that a transformation does not touch) are shared with the
+original SDFG rather than copied.
+"""
+import copy
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from dace.sdfg.sdfg import SDFG
+    from dace.sdfg.state import SDFGState
+
+#: Attributes of states that are copied on first access.
+LAZY_STATE_ATTRIBUTES = ('_nodes', '_edges', '_node_index', '_edge_index', '_scope_dict_toparent_cached',
+                         '_scope_dict_tochildren_cached', '_scope_leaves_cached', '_scope_tree_cached')
+
+#: Attributes of SDFGs that are copied on first access (the data descriptors).
+LAZY_SDFG_ATTRIBUTES = ('__arrays', )
+
+# Attributes of SDFGs that are not copied from the original SDFG (see ``SDFG.__deepcopy__``)
+_SDFG_SKIPPED_ATTRIBUTES = ('_parent', '_parent_sdfg', '_parent_nsdfg_node', '_sdfg_list', '_nx_cache',
+                            '_analysis_manager')
+
+
+class LazyCopySource:
+    """ The original element of a lazily copied SDFG element, whose remaining attributes are copied on access. """
+
+    __slots__ = ('source', 'attributes', 'memo', 'stamp')
+
+    def __init__(self,
+                 source: Union['SDFG', 'SDFGState'],
+                 attributes: Tuple[str, ...],
+                 memo: Dict[int, Any],
+                 stamp: Optional[int] = None):
+        self.source = source
+        self.attributes = attributes
+        # The memo of the deep copy is shared by all elements of the copy, such that references between them (e.g.,
+        # from nested SDFG nodes to the nested SDFGs or between nodes and edges) map to the copied elements
+        self.memo = memo
+        # Modification stamp of the original element, used to detect structural modifications after copying
+        self.stamp = stamp
+
+
+def lazy_copy(sdfg: 'SDFG') -> 'SDFG':
+    """
+    Creates a lazy copy of an SDFG and all of its nested SDFGs. The copy behaves like a deep copy of the SDFG
+    (``copy.deepcopy``), but the nodes and edges of each state and the data descriptors of each SDFG are only copied when
+    they are first accessed on the copy. This makes copying SDFGs to try out alternatives (e.g., for each candidate
+    transformation in a tuner) proportional to the parts of the SDFG that are actually used.
+
+    :param sdfg: The SDFG to copy.
+    :return: A lazy copy of the SDFG.
+    :note: Until all elements of the copy are accessed, the original SDFG must not be modified, as the modifications
+           would become visible in the copy. Structural modifications of states (adding or removing nodes and edges)
+           are detected when the corresponding state of the copy is accessed.
+    """
+    from dace.sdfg.sdfg import SDFG
+    from dace.sdfg.state import SDFGState
+
+    materialize(sdfg)
+    memo: Dict[int, Any] = {}
+
+    # Create all SDFGs and states of the copy first, so that references between them resolve to the copies
+    sdfgs = []
+    states = []
+    for original in sdfg.all_sdfgs_recursive():
+        memo[id(original)] = result = SDFG.__new__(SDFG)
+        sdfgs.append((original, result))
+        for state in original.nodes():
+            memo[id(state)] = SDFGState.__new__(SDFGState)
+            states.append((state, memo[id(state)]))
+    sdfg_list = [result for _, result in sdfgs]
+
+    for original, result in sdfgs:
+        materialize(original)
+        for k, v in original.__dict__.items():
+            if k in LAZY_SDFG_ATTRIBUTES or k in _SDFG_SKIPPED_ATTRIBUTES:
+                continue
+            result.__dict__[k] = copy.deepcopy(v, memo)
+        result._nx_cache = None
+        result._analysis_manager = None
+        result._sdfg_list = sdfg_list
+        if original is sdfg:
+            result._parent = result._parent_sdfg = result._parent_nsdfg_node = None
+        else:
+            result._parent = memo[id(original.parent)]
+            result._parent_sdfg = memo[id(original.parent_sdfg)]
+            result._parent_nsdfg_node = copy.deepcopy(original.parent_nsdfg_node, memo)
+        result._lazy_copy_source = LazyCopySource(original, LAZY_SDFG_ATTRIBUTES, memo)
+
+    for original, result in states:
+        materialize(original)
+        for k, v in original.__dict__.items():
+            if k in LAZY_STATE_ATTRIBUTES:
+                continue
+            result.__dict__[k] = None if k == '_nx_cache' else copy.deepcopy(v, memo)
+        result._lazy_copy_source = LazyCopySource(original, LAZY_STATE_ATTRIBUTES, memo, original.modification_stamp)
+
+    return memo[id(sdfg)]
+
+
+def is_lazy(obj: Union['SDFG', 'SDFGState']) -> bool:
+    """ Returns True if the given SDFG or state is part of a lazy copy and has not been accessed yet. """
+    return '_lazy_copy_source' in obj.__dict__
+
+
+def materialize(obj: Union['SDFG', 'SDFGState']):
+    """
+    Copies the remaining attributes of a lazily copied SDFG or state from the original element. Does nothing if the
+    element is not part of a lazy copy or has already been accessed.
+
+    :param obj: The SDFG or state to materialize.
+    """
+    lazy: LazyCopySource = obj.__dict__.get('_lazy_copy_source')
+    if lazy is None:
+        return
+    if lazy.stamp is not None and lazy.stamp != lazy.source.modification_stamp:
+        raise RuntimeError(f'{type(obj).__name__} "{lazy.source.label}" was modified after it was lazily copied, its '
+                           'copy cannot be accessed anymore')
+    del obj.__dict__['_lazy_copy_source']
+    for attr in lazy.attributes:
+        if attr in lazy.source.__dict__:
+            obj.__dict__[attr] = copy.deepcopy(lazy.source.__dict__[attr], lazy.memo)
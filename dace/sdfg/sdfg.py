@@ -28,6 +28,7 @@ from dace.sdfg.replace import replace, replace_properties, replace_properties_di
 from dace.sdfg.validation import (InvalidSDFGError, validate_sdfg)
 from dace.config import Config
 from dace.frontend.python import astutils, wrappers
+from dace.sdfg import lazy_copy as lcopy
 from dace.sdfg import nodes as nd
 from dace.sdfg.graph import OrderedDiGraph, Edge, SubgraphView
 from dace.sdfg.state import SDFGState
@@ -383,6 +384,9 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
     openmp_sections = Property(dtype=bool,
                                default=Config.get_bool('compiler', 'cpu', 'openmp_sections'),
                                desc='Whether to generate OpenMP sections in code')
+    openmp_tasks = Property(dtype=bool,
+                            default=Config.get_bool('compiler', 'cpu', 'openmp_tasks'),
+                            desc='Whether to generate the dataflow of states as OpenMP tasks with dependencies')
 
     debuginfo = DebugInfoProperty(allow_none=True)
 
@@ -466,19 +470,27 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
         self._orig_name = name
         self._num = 0
 
+        # Cached analysis results (see ``dace.transformation.pass_pipeline.AnalysisManager``)
+        self._analysis_manager = None
+
     def __deepcopy__(self, memo):
+        lcopy.materialize(self)
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
             # Skip derivative attributes
-            if k in ('_cached_start_state', '_edges', '_nodes', '_parent', '_parent_sdfg', '_parent_nsdfg_node',
-                     '_sdfg_list', '_transformation_hist'):
+            if k in ('_cached_start_state', '_edges', '_nodes', '_node_index', '_edge_index', '_nx_cache',
+                     '_analysis_manager', '_parent', '_parent_sdfg', '_parent_nsdfg_node', '_sdfg_list',
+                     '_transformation_hist'):
                 continue
             setattr(result, k, copy.deepcopy(v, memo))
         # Copy edges and nodes
         result._edges = copy.deepcopy(self._edges, memo)
         result._nodes = copy.deepcopy(self._nodes, memo)
+        result._nx_cache = None
+        result._analysis_manager = None
+        result._clear_id_index()
         result._cached_start_state = copy.deepcopy(self._cached_start_state, memo)
         # Copy parent attributes
         for k in ('_parent', '_parent_sdfg', '_parent_nsdfg_node'):
@@ -494,6 +506,29 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
             result._sdfg_list = result.reset_sdfg_list()
         return result
 
+    def __getattr__(self, name):
+        # Only called for missing attributes, such as the data descriptors of lazy copies that were not accessed yet
+        if name in lcopy.LAZY_SDFG_ATTRIBUTES and lcopy.is_lazy(self):
+            lcopy.materialize(self)
+            return getattr(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __getstate__(self):
+        lcopy.materialize(self)
+        return self.__dict__
+
+    def lazy_copy(self) -> 'SDFG':
+        """
+        Returns a copy of this SDFG that behaves like a deep copy, but only copies the contents of states and the data
+        descriptors of (nested) SDFGs when they are first accessed. Use this method instead of ``copy.deepcopy`` to try
+        out modifications on a copy of a large SDFG, e.g., when evaluating candidate transformations.
+
+        :return: The lazily copied SDFG.
+        :note: This SDFG must not be modified until the parts of the copy that are used were accessed.
+               See ``dace.sdfg.lazy_copy`` for more information.
+        """
+        return lcopy.lazy_copy(self)
+
     @property
     def sdfg_id(self):
         """
@@ -687,6 +722,10 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
         for array in self.arrays.values():
             replace_properties_dict(array, repldict, symrepl)
 
+        # Renaming is not reflected in the graph structure, but invalidates analyses based on names
+        if repldict:
+            self._mark_modified()
+
         if replace_in_graph:
             # Replace in inter-state edges
             for edge in self.edges():
@@ -1069,6 +1108,7 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
                                          f"{node} in state {state}.")
 
         del self._arrays[name]
+        self._mark_modified()
 
     def reset_sdfg_list(self):
         if self.parent_sdfg is not None:
@@ -1500,7 +1540,13 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
 
         return dtypes.deduplicate(shared)
 
-    def save(self, filename: str, use_pickle=False, hash=None, exception=None, compress=False) -> Optional[str]:
+    def save(self,
+             filename: str,
+             use_pickle=False,
+             hash=None,
+             exception=None,
+             compress=False,
+             binary=False) -> Optional[str]:
         """ Save this SDFG to a file.
 
             :param filename: File name to save to.
@@ -1511,10 +1557,14 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
             :param exception: If not None, stores error information along with
                               SDFG.
             :param compress: If True, uses gzip to compress the file upon saving.
+            :param binary: If True, saves the JSON representation of the SDFG in
+                           a compact binary format (see
+                           ``dace.serialize.dump_binary``), which is smaller and
+                           faster to write and read for large SDFGs.
             :return: The hash of the SDFG, or None if failed/not requested.
         """
         if compress:
-            fileopen = lambda file, mode: gzip.open(file, mode + 't')
+            fileopen = lambda file, mode: gzip.open(file, mode if mode.endswith('b') else mode + 't')
         else:
             fileopen = open
 
@@ -1530,11 +1580,14 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
                 return self.hash_sdfg()
         else:
             hash = True if hash is None else hash
-            with fileopen(filename, "w") as fp:
+            with fileopen(filename, "wb" if binary else "w") as fp:
                 json_output = self.to_json(hash=hash)
                 if exception:
                     json_output['error'] = exception.to_json()
-                dace.serialize.dump(json_output, fp)
+                if binary:
+                    dace.serialize.dump_binary(json_output, fp)
+                else:
+                    dace.serialize.dump(json_output, fp)
             if hash and 'hash' in json_output['attributes']:
                 return json_output['attributes']['hash']
 
@@ -1551,11 +1604,14 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
 
     @staticmethod
     def _from_file(fp: BinaryIO) -> 'SDFG':
-        firstbyte = fp.read(1)
+        header = fp.read(len(dace.serialize.BINARY_HEADER))
         fp.seek(0)
-        if firstbyte == b'{':  # JSON file
+        if header[:1] == b'{':  # JSON file
             sdfg_json = json.load(fp)
             sdfg = SDFG.from_json(sdfg_json)
+        elif header == dace.serialize.BINARY_HEADER:  # Binary JSON representation
+            sdfg_json = dace.serialize.load_binary_json(fp)
+            sdfg = SDFG.from_json(sdfg_json)
         else:  # Pickle
             sdfg = symbolic.SympyAwareUnpickler(fp).load()
 
@@ -1969,6 +2025,7 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
                 raise NameError('Array or Stream with name "%s" already exists '
                                 "in SDFG" % name)
         self._arrays[name] = datadesc
+        self._mark_modified()
 
         # Add free symbols to the SDFG global symbol storage
         for sym in datadesc.free_symbols:
@@ -2217,6 +2274,9 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
 
         # Importing these outside creates an import loop
         from dace.codegen import codegen, compiler
+        from dace.codegen.common import CodegenTimer
+
+        timer = CodegenTimer()
 
         # Compute build folder path before running codegen
         build_folder = self.build_folder
@@ -2251,20 +2311,25 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
                 sdfg.fill_scope_connectors()
 
                 # Generate code for the program by traversing the SDFG state by state
-                program_objects = codegen.generate_code(sdfg, validate=validate)
+                program_objects = codegen.generate_code(sdfg, validate=validate, timer=timer)
             except Exception:
                 self.save(os.path.join('_dacegraphs', 'failing.sdfg'))
                 raise
 
             # Generate the program folder and write the source files
-            program_folder = compiler.generate_program_folder(sdfg, program_objects, build_folder)
+            with timer.phase('file writing'):
+                program_folder = compiler.generate_program_folder(sdfg, program_objects, build_folder)
         else:
             # The code was already generated, just load the program folder
             program_folder = build_folder
             sdfg = self
 
         # Compile the code and get the shared library path
-        shared_library = compiler.configure_and_compile(program_folder, sdfg.name)
+        with timer.phase('compilation'):
+            shared_library = compiler.configure_and_compile(program_folder, sdfg.name)
+
+        if Config.get_bool('compiler', 'codegen_timing'):
+            print(timer.report(f'Code generation and compilation timing for SDFG "{sdfg.name}":'))
 
         # If provided, save output to path or filename
         if output_file is not None:
@@ -2363,8 +2428,17 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
             before computing the given state. """
         return (e.src for e in self.bfs_edges(state, reverse=True))
 
-    def validate(self, references: Optional[Set[int]] = None) -> None:
-        validate_sdfg(self, references)
+    def validate(self, references: Optional[Set[int]] = None, incremental: bool = False) -> None:
+        """
+        Verifies the correctness of this SDFG, raising an ``InvalidSDFGError`` on failure.
+
+        :param references: An optional set keeping seen IDs for object miscopy validation.
+        :param incremental: If True, only validates the states and nested SDFGs that were modified since the last
+                            successful validation of this SDFG. Modifications made in-place to property values (e.g.,
+                            to memlet subsets) are only detected if the graph they were made in is marked as modified,
+                            as transformations applied through pattern matching do.
+        """
+        validate_sdfg(self, references, incremental)
 
     def is_valid(self) -> bool:
         """ Returns True if the SDFG is verified correctly (using `validate`).
@@ -18,6 +18,7 @@ from dace import subsets as sbs
 from dace import symbolic
 from dace.properties import (CodeBlock, DictProperty, EnumProperty, Property, SubsetProperty, SymbolicProperty,
                              CodeProperty, make_properties)
+from dace.sdfg import lazy_copy as lcopy
 from dace.sdfg import nodes as nd
 from dace.sdfg.graph import MultiConnectorEdge, OrderedMultiDiConnectorGraph, SubgraphView
 from dace.sdfg.propagation import propagate_memlet
@@ -108,13 +109,17 @@ class StateGraphView(object):
     def entry_node(self, node: nd.Node) -> nd.EntryNode:
         """ Returns the entry node that wraps the current node, or None if
             it is top-level in a state. """
-        return self.scope_dict()[node]
+        # Use the cached scope dictionary directly, as copying it for every node is quadratic in the number of nodes
+        if self._scope_dict_toparent_cached is None:
+            self.scope_dict()
+        return self._scope_dict_toparent_cached[node]
 
     def exit_node(self, entry_node: nd.EntryNode) -> nd.ExitNode:
         """ Returns the exit node leaving the context opened by
             the given entry node. """
-        node_to_children = self.scope_children()
-        return next(v for v in node_to_children[entry_node] if isinstance(v, nd.ExitNode))
+        if self._scope_dict_tochildren_cached is None:
+            self.scope_children()
+        return next(v for v in self._scope_dict_tochildren_cached[entry_node] if isinstance(v, nd.ExitNode))
 
     ###################################################################
     # Memlet-tracking methods
@@ -767,10 +772,14 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], StateGraphView
         self._default_lineinfo = None
     
     def __deepcopy__(self, memo):
+        lcopy.materialize(self)
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
+            if k == '_nx_cache':  # Rebuilt on demand
+                setattr(result, k, None)
+                continue
             setattr(result, k, copy.deepcopy(v, memo))
         for node in result.nodes():
             if isinstance(node, nd.NestedSDFG):
@@ -782,6 +791,17 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], StateGraphView
                     pass
         return result
 
+    def __getattr__(self, name):
+        # Only called for missing attributes, such as the contents of lazily copied states that were not accessed yet
+        if name in lcopy.LAZY_STATE_ATTRIBUTES and lcopy.is_lazy(self):
+            lcopy.materialize(self)
+            return getattr(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __getstate__(self):
+        lcopy.materialize(self)
+        return self.__dict__
+
     @property
     def parent(self):
         """ Returns the parent SDFG of this state. """
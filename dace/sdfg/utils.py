@@ -1,9 +1,13 @@
 # Copyright 2019-2022 ETH Zurich and the DaCe authors. All rights reserved.
 """ Various utility functions to create, traverse, and modify SDFGs. """
 
+import ast
 import collections
 import copy
+import hashlib
+import json
 import os
+import re
 import warnings
 import networkx as nx
 import time
@@ -18,6 +22,7 @@ from dace.sdfg.scope import ScopeSubgraphView
 from dace.sdfg import nodes as nd, graph as gr
 from dace import config, data as dt, dtypes, memlet as mm, subsets as sbs, symbolic
 from dace.cli.progress import optional_progressbar
+from dace.frontend.python import astutils
 from string import ascii_uppercase
 from typing import Any, Callable, Dict, Generator, List, Optional, Set, Sequence, Tuple, Union
 
@@ -1019,6 +1024,107 @@ def concurrent_subgraphs(graph):
     return [ScopeSubgraphView(graph, [n for n in all_nodes if n in sg], None) for sg in subgraphs]
 
 
+def dataflow_tasks(state: SDFGState) -> Optional[List[ScopeSubgraphView]]:
+    """ Splits the top-level dataflow of a state into subgraphs that can run as separate tasks. Every top-level scope
+        or code node becomes a task together with its adjacent access nodes, and every copy between two access nodes
+        becomes a task of its own. Access nodes that connect tasks appear in all of them, but no edge appears in more
+        than one subgraph (tasks that would share an edge are merged).
+
+        :param state: The state to split.
+        :return: A list of subgraphs, in which every subgraph appears after the subgraphs that write the access nodes
+                 it reads, or None if the tasks depend on each other cyclically.
+    """
+    sdict = state.scope_dict()
+    toplevel = set(n for n in state.nodes() if sdict[n] is None)
+    toplevel |= set(state.exit_node(n) for n in toplevel if isinstance(n, nd.EntryNode))
+    parents: Dict[Any, Any] = {}
+
+    def find(x):
+        parents.setdefault(x, x)
+        while parents[x] is not x:
+            parents[x] = parents[parents[x]]
+            x = parents[x]
+        return x
+
+    def union(x, y):
+        x, y = find(x), find(y)
+        if x is not y:
+            parents[y] = x
+            return True
+        return False
+
+    # Scopes and code nodes form tasks, copies between access nodes are tasks of their own
+    adjacent: Dict[Any, Set[nd.AccessNode]] = collections.defaultdict(set)
+    copies: List[MultiConnectorEdge] = []
+    for node in toplevel:
+        if isinstance(node, nd.AccessNode):
+            if state.degree(node) == 0:
+                adjacent[node].add(node)
+        elif isinstance(node, nd.ExitNode):
+            union(state.entry_node(node), node)
+        else:
+            find(node)
+    for e in state.edges():
+        if e.src not in toplevel or e.dst not in toplevel:
+            continue
+        if isinstance(e.src, nd.AccessNode) and isinstance(e.dst, nd.AccessNode):
+            copies.append(e)
+            find(e)
+            adjacent[e].update((e.src, e.dst))
+        elif isinstance(e.src, nd.AccessNode):
+            adjacent[e.dst].add(e.src)
+        elif isinstance(e.dst, nd.AccessNode):
+            adjacent[e.src].add(e.dst)
+        else:
+            union(e.src, e.dst)
+
+    # Merge tasks until every copy edge is contained in exactly one of them
+    changed = True
+    while changed:
+        changed = False
+        access_nodes: Dict[Any, Set[nd.AccessNode]] = collections.defaultdict(set)
+        for element, anodes in adjacent.items():
+            access_nodes[find(element)].update(anodes)
+        for e in copies:
+            for root, anodes in access_nodes.items():
+                if e.src in anodes and e.dst in anodes:
+                    changed |= union(e, root)
+
+    # Collect task contents
+    order = {n: i for i, n in enumerate(dfs_topological_sort(state))}
+    contents: Dict[Any, Set[nd.Node]] = collections.defaultdict(set)
+    for element in list(parents.keys()) + list(adjacent.keys()):
+        root = find(element)
+        contents[root].update(adjacent[element])
+        if isinstance(element, nd.EntryNode):
+            contents[root].update(state.scope_subgraph(element).nodes())
+        elif isinstance(element, nd.Node):
+            contents[root].add(element)
+
+    # Order tasks by their dependencies on the access nodes written by other tasks
+    writers: Dict[nd.AccessNode, Set[Any]] = collections.defaultdict(set)
+    for e in state.edges():
+        if isinstance(e.dst, nd.AccessNode) and e.dst in toplevel:
+            writers[e.dst].add(find(e) if e in parents else find(e.src))
+    predecessors: Dict[Any, Set[Any]] = {root: set() for root in contents}
+    for e in state.edges():
+        if isinstance(e.src, nd.AccessNode) and e.src in toplevel:
+            reader = find(e) if e in parents else find(e.dst)
+            predecessors[reader] |= writers[e.src] - {reader}
+
+    result = []
+    remaining = sorted(contents.keys(), key=lambda root: min(order[n] for n in contents[root]))
+    while remaining:
+        ready = next((root for root in remaining if not predecessors[root]), None)
+        if ready is None:
+            return None
+        remaining.remove(ready)
+        for root in remaining:
+            predecessors[root].discard(ready)
+        result.append(ScopeSubgraphView(state, [n for n in state.nodes() if n in contents[ready]], None))
+    return result
+
+
 def separate_maps(state, dfg, schedule):
     """ Separates the given ScopeSubgraphView into subgraphs with and without
         maps of the given schedule type. The function assumes that the given
@@ -1304,6 +1410,9 @@ def load_precompiled_sdfg(folder: str):
 
     :param folder: Path to SDFG output folder.
     :return: A callable CompiledSDFG object.
+    :note: This function does not import the Python frontend, transformations,
+           or code generators, and is thus suitable for short-lived processes
+           that only call precompiled programs.
     """
     sdfg = SDFG.from_file(os.path.join(folder, 'program.sdfg'))
     suffix = config.Config.get('compiler', 'library_extension')
@@ -1651,3 +1760,109 @@ def check_sdfg(sdfg: SDFG):
                 assert node.sdfg.parent_sdfg is sdfg
                 assert node.sdfg.parent.parent is sdfg
                 check_sdfg(node.sdfg)
+
+
+# Properties that do not affect the generated code of an SDFG
+_NONSTRUCTURAL_KEYS = {'name', 'label', 'hash', 'orig_sdfg', 'transformation_hist', 'instrument', 'debuginfo'}
+
+
+def structural_hashes(sdfg: SDFG) -> Dict[int, str]:
+    """
+    Computes a structural hash for every SDFG in an SDFG hierarchy. Two SDFGs have the same structural hash if they
+    only differ in names and labels (of the SDFGs, states, nodes, and data containers), debug information,
+    and transformation history, i.e., if the same code can be generated for both. Non-transient data containers may
+    only be renamed if their order is kept (see ``argument_positions``), as it determines the order of the arguments
+    of the SDFG.
+
+    The SDFG hierarchy is serialized once and hashed bottom-up, where every nested SDFG contributes its hash rather
+    than its contents to the hash of its parent.
+
+    :param sdfg: The root of the SDFG hierarchy.
+    :return: A dictionary mapping the ID of each SDFG in the hierarchy to its hash (in SHA-256 format).
+    """
+    result: Dict[int, str] = {}
+    _structural_hash(sdfg.to_json(), result)
+    return result
+
+
+def argument_positions(sdfg: SDFG) -> Dict[str, int]:
+    """
+    Returns the position of each non-transient data container of an SDFG in sorted order, by which structural hashes
+    (see ``structural_hashes``) identify non-transients. Two SDFGs that only differ in the names of their
+    non-transients thus have the same structural hash if the names are in the same order.
+
+    :param sdfg: The SDFG.
+    :return: A dictionary mapping the name of each non-transient data container to its position.
+    """
+    return {name: i for i, name in enumerate(sorted(name for name, desc in sdfg.arrays.items() if not desc.transient))}
+
+
+def _structural_hash(sdfg_json: Dict[str, Any], result: Dict[int, str]) -> str:
+    contents = {
+        key: _strip_nonstructural(value, result)
+        for key, value in sdfg_json.items() if key not in _NONSTRUCTURAL_KEYS and key != 'sdfg_list_id'
+    }
+
+    # Replace the names of transients by their position in the data descriptor dictionary, and the names of
+    # non-transients by their position in sorted order (see ``argument_positions``), including in the names of scope
+    # connectors (e.g., ``IN_A``)
+    arrays = contents['attributes']['_arrays']
+    renaming = {
+        name: f'${i}'
+        for i, name in enumerate(n for n, desc in arrays.items() if desc['attributes']['transient'])
+    }
+    renaming.update({
+        name: f'@{i}'
+        for i, name in enumerate(sorted(n for n, desc in arrays.items() if not desc['attributes']['transient']))
+    })
+    if renaming:
+        pattern = re.compile(r'(?<!\w)(IN_|OUT_)?(' + '|'.join(re.escape(name) for name in renaming) + r')(?!\w)')
+        contents = _rename_identifiers(contents, pattern, renaming)
+
+    result[sdfg_json['sdfg_list_id']] = hashlib.sha256(json.dumps(contents, sort_keys=True).encode()).hexdigest()
+    return result[sdfg_json['sdfg_list_id']]
+
+
+def _strip_nonstructural(json_obj: Any, result: Dict[int, str]) -> Any:
+    if isinstance(json_obj, dict):
+        if json_obj.get('type') == 'SDFG' and 'sdfg_list_id' in json_obj:
+            return _structural_hash(json_obj, result)
+        if json_obj.get('type') == 'InterstateEdge':
+            json_obj = _normalize_interstate_edge(json_obj)
+        return {
+            key: _strip_nonstructural(value, result)
+            for key, value in json_obj.items()
+            if not isinstance(key, str) or (key not in _NONSTRUCTURAL_KEYS and not key.startswith('_meta_'))
+        }
+    if isinstance(json_obj, (list, tuple)):
+        return [_strip_nonstructural(value, result) for value in json_obj]
+    return json_obj
+
+
+def _normalize_interstate_edge(edge_json: Dict[str, Any]) -> Dict[str, Any]:
+    # Replacing names in inter-state edges re-formats their code (e.g., ``i + 1`` becomes ``(i + 1)``)
+    def normalize(code: str) -> str:
+        try:
+            return astutils.unparse(ast.parse(code))
+        except SyntaxError:
+            return code
+
+    attributes = dict(edge_json['attributes'])
+    attributes['assignments'] = {k: normalize(v) for k, v in attributes.get('assignments', {}).items()}
+    if attributes.get('condition', {}).get('language') == 'Python':
+        attributes['condition'] = dict(attributes['condition'],
+                                       string_data=normalize(attributes['condition']['string_data']))
+    return dict(edge_json, attributes=attributes)
+
+
+def _rename_identifiers(json_obj: Any, pattern: 're.Pattern', renaming: Dict[str, str]) -> Any:
+    if isinstance(json_obj, str):
+        return pattern.sub(lambda match: (match.group(1) or '') + renaming[match.group(2)], json_obj)
+    if isinstance(json_obj, dict):
+        return {
+            _rename_identifiers(key, pattern, renaming): _rename_identifiers(value, pattern, renaming)
+            for key, value in json_obj.items()
+        }
+    if isinstance(json_obj, (list, tuple)):
+        return [_rename_identifiers(value, pattern, renaming) for value in json_obj]
+    return json_obj
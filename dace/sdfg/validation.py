@@ -3,8 +3,9 @@
 import copy
 from dace.dtypes import DebugInfo, StorageType
 import os
-from typing import TYPE_CHECKING, Dict, Set, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple, Union
 import warnings
+import weakref
 from dace import dtypes, data as dt, subsets
 from dace import symbolic
 
@@ -25,21 +26,33 @@ def validate(graph: 'dace.sdfg.graph.SubgraphView'):
         validate_state(graph)
 
 
-def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None):
+def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None, incremental: bool = False):
     """ Verifies the correctness of an SDFG by applying multiple tests.
     
         :param sdfg: The SDFG to verify.
         :param references: An optional set keeping seen IDs for object
                            miscopy validation.
+        :param incremental: If True, only validates the states (and nested
+                            SDFGs) that were modified since the last
+                            successful validation of the SDFG. SDFG-level
+                            checks are always performed.
 
         Raises an InvalidSDFGError with the erroneous node/edge
         on failure.
     """
     # Avoid import loop
+    from dace import properties
     from dace.codegen.targets import fpga
+    from dace.sdfg import graph as gr
 
     references = references or set()
 
+    # Modifications made during validation are only considered in the next validation
+    graph_stamp, property_stamp = gr.last_modification_stamp(), properties.last_property_stamp()
+    record = _validation_records.get(sdfg) if incremental else None
+    if record is not None and _context_modified(sdfg, record):
+        record = None
+
     # Reference check
     if id(sdfg) in references:
         raise InvalidSDFGError(
@@ -113,6 +126,14 @@ def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None):
                 symbols[str(sym)] = sym.dtype
         visited = set()
         visited_edges = set()
+
+        def _validate_state(state: 'dace.sdfg.SDFGState'):
+            if record is None or _state_modified(state, record):
+                validate_state(state, sdfg.node_id(state), sdfg, symbols, initialized_transients, references,
+                               incremental)
+            else:
+                _validate_unmodified_state(state, sdfg, initialized_transients, references)
+
         # Run through states via DFS, ensuring that only the defined symbols
         # are available for validation
         for edge in sdfg.dfs_edges(start_state):
@@ -135,7 +156,7 @@ def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None):
             # Source
             if edge.src not in visited:
                 visited.add(edge.src)
-                validate_state(edge.src, sdfg.node_id(edge.src), sdfg, symbols, initialized_transients, references)
+                _validate_state(edge.src)
 
             ##########################################
             # Edge
@@ -161,12 +182,12 @@ def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None):
             # Destination
             if edge.dst not in visited:
                 visited.add(edge.dst)
-                validate_state(edge.dst, sdfg.node_id(edge.dst), sdfg, symbols, initialized_transients, references)
+                _validate_state(edge.dst)
         # End of state DFS
 
         # If there is only one state, the DFS will miss it
         if start_state not in visited:
-            validate_state(start_state, sdfg.node_id(start_state), sdfg, symbols, initialized_transients, references)
+            _validate_state(start_state)
 
         # Validate all inter-state edges (including self-loops not found by DFS)
         for eid, edge in enumerate(sdfg.edges()):
@@ -195,16 +216,20 @@ def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None):
         sdfg.save(os.path.join('_dacegraphs', 'invalid.sdfg'), exception=ex)
         raise
 
+    _validation_records[sdfg] = _ValidationRecord(graph_stamp, property_stamp, _validation_context(sdfg))
+
 
 def validate_state(state: 'dace.sdfg.SDFGState',
                    state_id: int = None,
                    sdfg: 'dace.sdfg.SDFG' = None,
                    symbols: Dict[str, dtypes.typeclass] = None,
                    initialized_transients: Set[str] = None,
-                   references: Set[int] = None):
+                   references: Set[int] = None,
+                   incremental: bool = False):
     """ Verifies the correctness of an SDFG state by applying multiple
         tests. Raises an InvalidSDFGError with the erroneous node on
-        failure.
+        failure. If ``incremental`` is True, nested SDFGs are validated
+        incrementally (see ``validate_sdfg``).
     """
     # Avoid import loops
     from dace import data as dt
@@ -256,7 +281,7 @@ def validate_state(state: 'dace.sdfg.SDFGState',
         # Node validation
         try:
             if isinstance(node, nd.NestedSDFG):
-                node.validate(sdfg, state, references)
+                node.validate(sdfg, state, references, incremental)
             else:
                 node.validate(sdfg, state)
         except InvalidSDFGError:
@@ -615,6 +640,121 @@ def validate_state(state: 'dace.sdfg.SDFGState',
     ########################################
 
 
+###########################################
+# Incremental validation
+
+
+class _ValidationRecord:
+    """ Modification stamps at the beginning of the last successful validation of an SDFG, along with the parts of the
+        SDFG its states are validated against that can be modified without updating a stamp. """
+
+    __slots__ = ('graph_stamp', 'property_stamp', 'context')
+
+    def __init__(self, graph_stamp: int, property_stamp: int, context: Tuple):
+        self.graph_stamp = graph_stamp
+        self.property_stamp = property_stamp
+        self.context = context
+
+
+# The last successful validation of each SDFG (see ``validate_sdfg``)
+_validation_records: 'weakref.WeakKeyDictionary[SDFG, _ValidationRecord]' = weakref.WeakKeyDictionary()
+
+
+def _validation_context(sdfg: 'SDFG') -> Tuple:
+    return (list(sdfg.arrays.items()), dict(sdfg.symbols), list(sdfg.constants_prop.items()), sdfg.parent_nsdfg_node)
+
+
+def _same_items(items: List[Tuple], other: List[Tuple]) -> bool:
+    """ Compares lists of key-value pairs by key equality and value identity. """
+    return len(items) == len(other) and all(k1 == k2 and v1 is v2 for (k1, v1), (k2, v2) in zip(items, other))
+
+
+def _context_modified(sdfg: 'SDFG', record: _ValidationRecord) -> bool:
+    """ Returns True if an SDFG was modified since its last successful validation in a way that requires validating
+        all of its states (e.g., its data descriptors, symbols or inter-state edges changed). """
+    from dace.properties import property_stamp  # Avoid import loop
+
+    arrays, symbols, constants, nsdfg_node = record.context
+    if sdfg.modification_stamp > record.graph_stamp or property_stamp(sdfg) > record.property_stamp:
+        return True
+    if (not _same_items(arrays, list(sdfg.arrays.items())) or symbols != sdfg.symbols
+            or not _same_items(constants, list(sdfg.constants_prop.items()))):
+        return True
+    if nsdfg_node is not sdfg.parent_nsdfg_node:
+        return True
+    if nsdfg_node is not None and property_stamp(nsdfg_node) > record.property_stamp:
+        return True
+    if any(property_stamp(desc) > record.property_stamp for desc in sdfg.arrays.values()):
+        return True
+    return any(property_stamp(e.data) > record.property_stamp for e in sdfg.edges())
+
+
+def _state_modified(state: 'dace.sdfg.SDFGState', record: _ValidationRecord) -> bool:
+    """ Returns True if a state, its nodes, memlets or nested SDFGs were modified since the given validation. """
+    # Avoid import loop
+    from dace.properties import property_stamp
+    from dace.sdfg import nodes as nd
+
+    if state.modification_stamp > record.graph_stamp or property_stamp(state) > record.property_stamp:
+        return True
+    for node in state.nodes():
+        if property_stamp(node) > record.property_stamp:
+            return True
+        if isinstance(node, (nd.MapEntry, nd.MapExit)) and property_stamp(node.map) > record.property_stamp:
+            return True
+        if isinstance(node, (nd.ConsumeEntry, nd.ConsumeExit)) and property_stamp(node.consume) > record.property_stamp:
+            return True
+        if isinstance(node, nd.NestedSDFG) and _sdfg_modified(node.sdfg):
+            return True
+    return any(property_stamp(e.data) > record.property_stamp for e in state.edges())
+
+
+def _sdfg_modified(sdfg: 'SDFG') -> bool:
+    """ Returns True if any part of an SDFG (including its nested SDFGs) was modified since its last successful
+        validation, or if it was never validated. """
+    record = _validation_records.get(sdfg)
+    if record is None or _context_modified(sdfg, record):
+        return True
+    return any(_state_modified(state, record) for state in sdfg.nodes())
+
+
+def _validate_unmodified_state(state: 'dace.sdfg.SDFGState', sdfg: 'SDFG', initialized_transients: Set[str],
+                               references: Set[int]):
+    """ Performs the checks of ``validate_state`` that involve other states on a state that was not modified since
+        the last successful validation of its SDFG: object reference checks and initialized transients. """
+    from dace.sdfg import nodes as nd  # Avoid import loop
+
+    if id(state) in references:
+        raise InvalidSDFGError(
+            f'Duplicate SDFG state detected: "{state.label}". Please copy objects '
+            'rather than using multiple references to the same one', sdfg, sdfg.node_id(state))
+    references.add(id(state))
+
+    for nid, node in enumerate(state.nodes()):
+        if id(node) in references:
+            raise InvalidSDFGNodeError(
+                f'Duplicate node detected: "{node}". Please copy objects '
+                'rather than using multiple references to the same one', sdfg, sdfg.node_id(state), nid)
+        references.add(id(node))
+        if isinstance(node, nd.NestedSDFG):
+            validate_sdfg(node.sdfg, references, incremental=True)
+        elif isinstance(node, nd.AccessNode):
+            if sdfg.arrays[node.data].transient and state.in_degree(node) > 0:
+                initialized_transients.add(node.data)
+
+    for eid, e in enumerate(state.edges()):
+        if id(e) in references:
+            raise InvalidSDFGEdgeError(
+                f'Duplicate memlet detected: "{e}". Please copy objects '
+                'rather than using multiple references to the same one', sdfg, sdfg.node_id(state), eid)
+        references.add(id(e))
+        if id(e.data) in references:
+            raise InvalidSDFGEdgeError(
+                f'Duplicate memlet detected: "{e.data}". Please copy objects '
+                'rather than using multiple references to the same one', sdfg, sdfg.node_id(state), eid)
+        references.add(id(e.data))
+
+
 ###########################################
 # Exception classes
 
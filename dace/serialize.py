@@ -2,6 +2,7 @@
 import aenum
 import json
 import numpy as np
+import pickle
 import warnings
 import dace.dtypes
 from dace import config
@@ -174,6 +175,133 @@ def dump(*args, **kwargs):
     return json.dump(*args, default=to_json, indent=2, **kwargs)
 
 
+#: Header of the binary serialization format (see ``dump_binary``), followed by a single format version byte.
+BINARY_HEADER = b'\x00DACE'
+BINARY_VERSION = 1
+
+
+class _BinaryUnpickler(pickle.Unpickler):
+    """ Unpickler for the binary serialization format, which only consists of builtin containers and scalars. """
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f'Unexpected type in binary serialization format: {module}.{name}')
+
+
+def _json_key(key) -> str:
+    # Converts dictionary keys as the JSON encoder does
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return 'true'
+    if key is False:
+        return 'false'
+    if key is None:
+        return 'null'
+    if isinstance(key, (int, float)):
+        return json.dumps(key)
+    raise TypeError(f'Keys must be str, int, float, bool or None, not {type(key).__name__}')
+
+
+def _to_binary_tree(obj):
+    """
+    Converts a JSON-serializable object into the tree stored in the binary serialization format. Strings are interned,
+    such that each string (e.g., a name or a symbolic expression) is stored once, and dictionaries are stored as tuples
+    of their values, preceded by their keys the first time a set of keys (a schema) occurs, or by the index of the
+    schema otherwise.
+    """
+    strings = {}
+    schemas = {}
+
+    def encode(value):
+        vtype = type(value)
+        if vtype is str:
+            return strings.setdefault(value, value)
+        if vtype is dict:
+            keys = tuple(strings.setdefault(k, k) for k in map(_json_key, value.keys()))
+            schema = schemas.get(keys)
+            if schema is None:
+                schemas[keys] = len(schemas)
+                return (keys, *map(encode, value.values()))
+            return (schema, *map(encode, value.values()))
+        if vtype is list or vtype is tuple:
+            return list(map(encode, value))
+        if value is None or vtype is bool or vtype is int or vtype is float:
+            return value
+        # Subclasses of builtin types are stored as their base types, and other objects as their JSON representation
+        if isinstance(value, str):
+            return encode(str(value))
+        if isinstance(value, (int, float)):
+            return (int if isinstance(value, int) else float)(value)
+        if isinstance(value, dict):
+            return encode(dict(value))
+        if isinstance(value, (list, tuple)):
+            return encode(list(value))
+        return encode(to_json(value))
+
+    return encode(obj)
+
+
+def _from_binary_tree(tree):
+    """ Converts a tree stored in the binary serialization format back into its JSON representation. """
+    schemas = []
+
+    def decode(value):
+        vtype = type(value)
+        if vtype is tuple:
+            keys = value[0]
+            if type(keys) is tuple:
+                schemas.append(keys)
+            else:
+                keys = schemas[keys]
+            return dict(zip(keys, map(decode, value[1:])))
+        if vtype is list:
+            return list(map(decode, value))
+        return value
+
+    return decode(tree)
+
+
+def dump_binary(obj, fp):
+    """
+    Writes an object to a binary file in a compact binary serialization format. The format stores the JSON
+    representation of the object (see ``dump``), such that loading it yields the same JSON representation. Strings are
+    stored once and referenced afterwards, and the keys of dictionaries with the same keys (e.g., the properties of
+    nodes and memlets) are stored once per file. The object is written as a stream of builtin containers and scalars
+    in the pickle format.
+
+    :param obj: The object to write.
+    :param fp: A file object opened for writing in binary mode.
+    """
+    fp.write(BINARY_HEADER + bytes([BINARY_VERSION]))
+    pickle.Pickler(fp, protocol=4).dump(_to_binary_tree(obj))
+
+
+def load_binary_json(fp):
+    """
+    Reads the JSON representation of an object from a binary file written by ``dump_binary``.
+
+    :param fp: A file object opened for reading in binary mode.
+    :return: The JSON representation of the stored object.
+    """
+    header = fp.read(len(BINARY_HEADER) + 1)
+    if header[:len(BINARY_HEADER)] != BINARY_HEADER:
+        raise ValueError('File is not in the binary serialization format')
+    if header[len(BINARY_HEADER)] != BINARY_VERSION:
+        raise ValueError(f'Unsupported binary serialization format version {header[len(BINARY_HEADER)]}')
+    return _from_binary_tree(_BinaryUnpickler(fp).load())
+
+
+def load_binary(fp, context=None):
+    """
+    Reads and deserializes an object from a binary file written by ``dump_binary``.
+
+    :param fp: A file object opened for reading in binary mode.
+    :param context: The deserialization context (see ``from_json``).
+    :return: The deserialized object.
+    """
+    return from_json(load_binary_json(fp), context)
+
+
 def all_properties_to_json(object_with_properties):
     retdict = {}
     for x, v in object_with_properties.properties():
@@ -1,65 +1,103 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 import dace.serialize
-from dace import data, symbolic, dtypes
+from dace import symbolic, dtypes
+import operator
 import re
 import sympy as sp
 from functools import reduce
 import sympy.core.sympify
-from typing import List, Optional, Sequence, Set, Union
+from typing import Any, Callable, List, Optional, Sequence, Set, Union
 import warnings
 from dace.config import Config
 
 
+def _nng(expr):
+    # When dealing with set sizes, assume symbols are non-negative
+    try:
+        # TODO: Fix in symbol definition, not here
+        for sym in list(expr.free_symbols):
+            expr = expr.subs({sym: sp.Symbol(sym.name, nonnegative=True)})
+        return expr
+    except AttributeError:  # No free_symbols in expr
+        return expr
+
+
+def _nonnegative_compare(a, b, op: Callable[[Any, Any], Any], or_equal: bool = False) -> bool:
+    """ Returns True if ``op(a, b)`` (``operator.le`` or ``operator.ge``) holds for non-negative symbols. If
+        ``or_equal`` is True, first tests for (structural) equality and raises a TypeError if the comparison cannot be
+        decided. """
+    # Affine expressions with a constant difference can be compared without SymPy
+    difference = symbolic.affine_difference(a, b, by_name=True)
+    if difference is not None:
+        return op(difference, 0)
+    a, b = symbolic.simplify_ext(_nng(a)), symbolic.simplify_ext(_nng(b))
+    if or_equal:
+        return bool(a == b or op(a, b))
+    return op(a, b) == True
+
+
+@symbolic.memoize(maxsize=16384)
+def _covers_dimension(rb, re, orb, ore, symbolic_positive: bool) -> bool:
+    """ Returns True if the range ``[rb, re]`` covers the range ``[orb, ore]`` (see ``Subset.covers``). """
+    if not symbolic_positive:
+        return _nonnegative_compare(rb, orb, operator.le) and _nonnegative_compare(re, ore, operator.ge)
+
+    # NOTE: We first test for equality, which always returns True or False. If the equality test returns
+    # False, then we test for less-equal and greater-equal, which may return an expression, leading to
+    # TypeError. This is a workaround for the case where two expressions are the same or equal and
+    # SymPy confirms this but fails to return True when testing less-equal and greater-equal.
+
+    # lower bound: first check whether symbolic positive condition applies
+    if not (len(rb.free_symbols) == 0 and len(orb.free_symbols) == 1):
+        if not _nonnegative_compare(rb, orb, operator.le, or_equal=True):
+            return False
+
+    # upper bound: first check whether symbolic positive condition applies
+    if not (len(re.free_symbols) == 1 and len(ore.free_symbols) == 0):
+        if not _nonnegative_compare(re, ore, operator.ge, or_equal=True):
+            return False
+
+    return True
+
+
+@symbolic.memoize(maxsize=16384)
+def _intersects_dimension(rb, re, orb, ore) -> Optional[bool]:
+    """ Returns True if the range ``[rb, re]`` intersects the range ``[orb, ore]``, False if it does not, or None if
+        the answer cannot be determined (see ``Range.intersects``). """
+    # Special case: ranges match
+    if rb == orb or re == ore:
+        return True
+
+    # Affine expressions with a constant difference can be compared without SymPy
+    difference1 = symbolic.affine_difference(ore, rb)
+    difference2 = symbolic.affine_difference(re, orb)
+    # Since conditions can be indeterminate, we check them separately
+    # for being False, then check whether they are both True
+    cond1 = (rb <= ore) if difference1 is None else difference1 >= 0
+    cond2 = (orb <= re) if difference2 is None else difference2 >= 0
+    # NOTE: We have to use the "==" operator because of SymPy returning
+    #       a special boolean type!
+    if cond1 == False or cond2 == False:
+        return False
+    if cond1 == True and cond2 == True:
+        return True
+    return None
+
+
 class Subset(object):
     """ Defines a subset of a data descriptor. """
     def covers(self, other):
         """ Returns True if this subset covers (using a bounding box) another
             subset. """
-        def nng(expr):
-            # When dealing with set sizes, assume symbols are non-negative
-            try:
-                # TODO: Fix in symbol definition, not here
-                for sym in list(expr.free_symbols):
-                    expr = expr.subs({sym: sp.Symbol(sym.name, nonnegative=True)})
-                return expr
-            except AttributeError:  # No free_symbols in expr
-                return expr
-
         symbolic_positive = Config.get('optimizer', 'symbolic_positive')
 
-        if not symbolic_positive:
-            try:
-                return all([(symbolic.simplify_ext(nng(rb)) <= symbolic.simplify_ext(nng(orb))) == True
-                            and (symbolic.simplify_ext(nng(re)) >= symbolic.simplify_ext(nng(ore))) == True
-                            for rb, re, orb, ore in zip(self.min_element_approx(), self.max_element_approx(),
-                                                        other.min_element_approx(), other.max_element_approx())])
-            except TypeError:
-                return False
-
-        else:
-            try:
+        try:
+            return all(
+                _covers_dimension(rb, re, orb, ore, symbolic_positive)
                 for rb, re, orb, ore in zip(self.min_element_approx(), self.max_element_approx(),
-                                            other.min_element_approx(), other.max_element_approx()):
-                    # NOTE: We first test for equality, which always returns True or False. If the equality test returns
-                    # False, then we test for less-equal and greater-equal, which may return an expression, leading to
-                    # TypeError. This is a workaround for the case where two expressions are the same or equal and
-                    # SymPy confirms this but fails to return True when testing less-equal and greater-equal.
-
-                    # lower bound: first check whether symbolic positive condition applies
-                    if not (len(rb.free_symbols) == 0 and len(orb.free_symbols) == 1):
-                        if not (symbolic.simplify_ext(nng(rb)) == symbolic.simplify_ext(nng(orb)) or
-                                symbolic.simplify_ext(nng(rb)) <= symbolic.simplify_ext(nng(orb))):
-                            return False
-
-                    # upper bound: first check whether symbolic positive condition applies
-                    if not (len(re.free_symbols) == 1 and len(ore.free_symbols) == 0):
-                        if not (symbolic.simplify_ext(nng(re)) == symbolic.simplify_ext(nng(ore)) or
-                                symbolic.simplify_ext(nng(re)) >= symbolic.simplify_ext(nng(ore))):
-                            return False
-            except TypeError:
-                return False
-
-            return True
+                                            other.min_element_approx(), other.max_element_approx()))
+        except TypeError:
+            return False
 
     def __repr__(self):
         return '%s (%s)' % (type(self).__name__, self.__str__())
@@ -696,22 +734,10 @@ class Range(Subset):
                 # TODO: This function does not consider strides or tiles
                 return None
 
-            # Special case: ranges match
-            if rng[0] == orng[0] or rng[1] == orng[1]:
-                continue
-
-            # Since conditions can be indeterminate, we check them separately
-            # for being False, then make a check that may raise a TypeError
-            cond1 = (rng[0] <= orng[1])
-            cond2 = (orng[0] <= rng[1])
-            # NOTE: We have to use the "==" operator because of SymPy returning
-            #       a special boolean type!
-            try:
-                if cond1 == False or cond2 == False:
-                    return False
-                if not (cond1 and cond2):
-                    return False
-            except TypeError:  # cannot determine truth value of Relational
+            result = _intersects_dimension(rng[0], rng[1], orng[0], orng[1])
+            if result is False:
+                return False
+            if result is None:  # cannot determine truth value of Relational
                 type_error = True
 
         if type_error:
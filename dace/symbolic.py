@@ -1,10 +1,12 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 import ast
+import functools
 from functools import lru_cache
 import sympy
 import pickle
 import re
-from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple, Union
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
 import warnings
 import numpy
 
@@ -21,6 +23,153 @@ DEFAULT_SYMBOL_TYPE = dtypes.int32
 # below, we recreate it to be as in versions < 1.9.
 _sympy_clash = {k: v if v else getattr(sympy.abc, k) for k, v in sympy.abc._clash.items()}
 
+###############################################################################
+# Memoization of symbolic computations
+
+
+class CacheStatistics(NamedTuple):
+    """ Statistics of a memoized symbolic function (see ``cache_statistics``). """
+
+    #: Number of calls whose result was taken from the cache
+    hits: int
+    #: Number of calls whose result was computed
+    misses: int
+    #: Number of results in the cache
+    size: int
+    #: Maximal number of results in the cache, after which the least recently used results are evicted
+    maxsize: int
+    #: Time (in seconds) spent computing results
+    time: float
+
+    @property
+    def time_saved(self) -> float:
+        """ An estimate of the time (in seconds) saved by the cache, assuming each hit would take the average time of a
+            miss. """
+        return self.hits * self.time / self.misses if self.misses > 0 else 0.0
+
+
+class _MemoizedFunction:
+    """ A symbolic function whose results are memoized in a bounded cache (see ``memoize``). """
+
+    def __init__(self, func: Callable, maxsize: int):
+        self._func = func
+        self._time = 0.0
+        # Typed, as SymPy numbers compare (and hash) equal to the Python numbers they represent
+        self._cached = lru_cache(maxsize=maxsize, typed=True)(self._compute)
+        functools.update_wrapper(self, func)
+
+    def _compute(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._func(*args, **kwargs)
+        finally:
+            self._time += time.perf_counter() - start
+
+    def __call__(self, *args, **kwargs):
+        try:
+            hash((args, tuple(kwargs.items())))
+        except TypeError:  # Unhashable arguments are not cached
+            return self._func(*args, **kwargs)
+        return self._cached(*args, **kwargs)
+
+    def statistics(self) -> CacheStatistics:
+        info = self._cached.cache_info()
+        return CacheStatistics(info.hits, info.misses, info.currsize, info.maxsize, self._time)
+
+    def cache_info(self):
+        return self._cached.cache_info()
+
+    def cache_clear(self):
+        self._cached.cache_clear()
+        self._time = 0.0
+
+
+_memoized_functions: List[_MemoizedFunction] = []
+
+
+def memoize(maxsize: int = 4096) -> Callable[[Callable], Callable]:
+    """
+    Decorator that memoizes the results of a function on symbolic expressions, evicting the least recently used results
+    once ``maxsize`` results are cached. SymPy expressions are immutable and cache their structural hash, so equal
+    expressions share their results. Calls with unhashable arguments are not cached. The statistics of all memoized
+    functions can be obtained with ``cache_statistics``.
+
+    :param maxsize: The maximal number of cached results.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        result = _MemoizedFunction(func, maxsize)
+        _memoized_functions.append(result)
+        return result
+
+    return decorator
+
+
+def cache_statistics() -> Dict[str, CacheStatistics]:
+    """ Returns the cache statistics of each memoized symbolic function, by qualified function name. """
+    return {f'{f.__module__}.{f.__qualname__}': f.statistics() for f in _memoized_functions}
+
+
+def clear_caches():
+    """ Clears the caches (and statistics) of all memoized symbolic functions. """
+    for f in _memoized_functions:
+        f.cache_clear()
+
+
+def _affine_coefficients(expr: Any, by_name: bool) -> Optional[Dict[Any, int]]:
+    """ Returns the integer coefficients of the symbols of an affine integer expression (and its constant under the
+        key 1), or None if the expression is not affine or contains non-real symbols. """
+    if isinstance(expr, (int, numpy.integer)) and not isinstance(expr, bool):
+        return {1: int(expr)} if expr != 0 else {}
+    if isinstance(expr, sympy.Integer):
+        return {1: int(expr)} if expr != 0 else {}
+    if isinstance(expr, sympy.Symbol):
+        if not expr.is_extended_real:
+            return None
+        return {expr.name if by_name else expr: 1}
+    if isinstance(expr, sympy.Mul):
+        if len(expr.args) != 2 or not isinstance(expr.args[0], sympy.Integer):
+            return None
+        coefficients = _affine_coefficients(expr.args[1], by_name)
+        if coefficients is None:
+            return None
+        return {k: int(expr.args[0]) * v for k, v in coefficients.items()}
+    if isinstance(expr, sympy.Add):
+        result = {}
+        for arg in expr.args:
+            coefficients = _affine_coefficients(arg, by_name)
+            if coefficients is None:
+                return None
+            for k, v in coefficients.items():
+                result[k] = result.get(k, 0) + v
+        return {k: v for k, v in result.items() if v != 0}
+    return None
+
+
+def affine_difference(a: Any, b: Any, by_name: bool = False) -> Optional[int]:
+    """
+    Computes the difference ``a - b`` of two affine integer expressions (sums of integer multiples of real symbols and
+    an integer constant) without using SymPy. Relations between such expressions evaluate to a boolean in SymPy if and
+    only if their difference is constant.
+
+    :param a: The first expression.
+    :param b: The second expression.
+    :param by_name: If True, symbols with the same name are considered equal regardless of their assumptions.
+    :return: The difference if it is an integer constant, or None if it is not constant or either expression is not
+             affine.
+    """
+    ca = _affine_coefficients(a, by_name)
+    if ca is None:
+        return None
+    cb = _affine_coefficients(b, by_name)
+    if cb is None:
+        return None
+    for k, v in cb.items():
+        ca[k] = ca.get(k, 0) - v
+    if any(v != 0 for k, v in ca.items() if k != 1):
+        return None
+    return ca.get(1, 0)
+
 
 class symbol(sympy.Symbol):
     """ Defines a symbolic expression. Extends SymPy symbols with DaCe-related
@@ -395,7 +544,7 @@ def overapproximate(expr):
     return _overapproximate(expr)
 
 
-@lru_cache(maxsize=2048)
+@memoize(maxsize=2048)
 def _overapproximate(expr):
     if isinstance(expr, SymExpr):
         if expr.expr != expr.approx:
@@ -823,6 +972,7 @@ def sympy_divide_fix(expr):
     return nexpr
 
 
+@memoize(maxsize=16384)
 def simplify_ext(expr):
     """
     An extended version of simplification with expression fixes for sympy.
@@ -1002,7 +1152,7 @@ class BitwiseOpConverter(ast.NodeTransformer):
         return self.generic_visit(node)
 
 
-@lru_cache(maxsize=16384)
+@memoize(maxsize=16384)
 def pystr_to_symbolic(expr, symbol_map=None, simplify=None) -> sympy.Basic:
     """ Takes a Python string and converts it into a symbolic expression. """
     from dace.frontend.python.astutils import unparse  # Avoid import loops
@@ -1077,7 +1227,7 @@ def pystr_to_symbolic(expr, symbol_map=None, simplify=None) -> sympy.Basic:
         return sympy_to_dace(sympy.sympify(expr, locals, evaluate=simplify), symbol_map)
 
 
-@lru_cache(maxsize=2048)
+@memoize(maxsize=2048)
 def simplify(expr: SymbolicType) -> SymbolicType:
     return sympy.simplify(expr)
 
@@ -1169,7 +1319,7 @@ class DaceSympyPrinter(sympy.printing.str.StrPrinter):
                 return f'({self._print(expr.args[0])}) ** ({self._print(expr.args[1])})'
 
 
-@lru_cache(maxsize=16384)
+@memoize(maxsize=16384)
 def symstr(sym, arrayexprs: Optional[Set[str]] = None, cpp_mode=False) -> str:
     """ 
     Convert a symbolic expression to a compilable expression. 
@@ -1324,6 +1474,7 @@ def equalize_symbols(a: sympy.Expr, b: sympy.Expr) -> Tuple[sympy.Expr, sympy.Ex
     return a, b
 
 
+@memoize(maxsize=16384)
 def inequal_symbols(a: Union[sympy.Expr, Any], b: Union[sympy.Expr, Any]) -> bool:
     """
     Compares 2 symbolic expressions and returns True if they are not equal.
@@ -1331,6 +1482,9 @@ def inequal_symbols(a: Union[sympy.Expr, Any], b: Union[sympy.Expr, Any]) -> boo
     if not isinstance(a, sympy.Expr) or not isinstance(b, sympy.Expr):
         return a != b
     else:
+        difference = affine_difference(a, b, by_name=True)
+        if difference is not None:
+            return difference != 0
         a, b = equalize_symbols(a, b)
         # NOTE: We simplify in an attempt to remove inconvenient methods, such
         # as `ceiling` and `floor`, if the symbol assumptions allow it.
@@ -1,16 +1,18 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 """ Automatic optimization routines for SDFGs. """
 
+import ast
 import dace
+import numpy
 import sympy
 from dace.sdfg import infer_types
 from dace.sdfg.state import SDFGState
 from dace.sdfg.graph import SubgraphView
 from dace.sdfg.propagation import propagate_states
-from dace.sdfg.scope import is_devicelevel_gpu_kernel
+from dace.sdfg.scope import is_devicelevel_gpu, is_devicelevel_gpu_kernel
 from dace import config, data as dt, dtypes, Memlet, symbolic
 from dace.sdfg import SDFG, nodes, graph as gr
-from typing import Set, Tuple, Union, List, Iterable, Dict
+from typing import Optional, Set, Tuple, Union, List, Iterable, Dict
 import warnings
 
 # Transformations
@@ -22,6 +24,7 @@ from dace.transformation import helpers as xfh
 
 # Environments
 from dace.libraries.blas.environments import intel_mkl as mkl, openblas
+from dace.libraries.fft.environments import fftw
 
 # Enumerator
 from dace.transformation.estimator.enumeration import GreedyEnumerator
@@ -29,6 +32,9 @@ from dace.transformation.estimator.enumeration import GreedyEnumerator
 # FPGA AutoOpt
 from dace.transformation.auto import fpga as fpga_auto_opt
 
+# Cache-aware tiling
+from dace.transformation.auto.cache_tiling import cache_tile_maps
+
 GraphViewType = Union[SDFG, SDFGState, gr.SubgraphView]
 
 
@@ -318,6 +324,210 @@ def tile_wcrs(graph_or_subgraph: GraphViewType, validate_all: bool, prefer_parti
         print(f'Optimized {len(transformed)} write-conflicted maps')
 
 
+def _vectorizable_tasklet_code(tasklet: nodes.Tasklet, dtype: dtypes.typeclass) -> bool:
+    """
+    Checks whether the code of a tasklet only consists of assignments of
+    element-wise arithmetic expressions on its connectors, which are supported
+    on vector types without implicit conversions.
+    """
+    if tasklet.code.language != dtypes.Language.Python:
+        return False
+    is_float = dtype.type in (numpy.float32, numpy.float64)
+    allowed_binops = (ast.Add, ast.Sub, ast.Mult)
+    allowed_constants = (int, )
+    if is_float:
+        allowed_binops += (ast.Div, )
+    if dtype.type == numpy.float64:
+        allowed_constants += (float, )
+    names = set(tasklet.in_connectors.keys()) | set(tasklet.out_connectors.keys())
+
+    def is_constant(node: ast.AST) -> bool:
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+            return is_constant(node.operand)
+        return (isinstance(node, ast.Constant) and not isinstance(node.value, bool)
+                and isinstance(node.value, allowed_constants))
+
+    def is_vectorizable(node: ast.AST) -> bool:
+        if isinstance(node, ast.Name):
+            return node.id in names
+        if isinstance(node, ast.BinOp):
+            return (isinstance(node.op, allowed_binops) and is_vectorizable(node.left) and is_vectorizable(node.right))
+        if isinstance(node, ast.UnaryOp):
+            return isinstance(node.op, (ast.UAdd, ast.USub)) and is_vectorizable(node.operand)
+        if isinstance(node, ast.Call):
+            # Casts of constants to the vector element type (e.g., ``dace.float32(3)``)
+            return (isinstance(node.func, ast.Attribute) and isinstance(node.func.value, ast.Name)
+                    and node.func.value.id == 'dace' and node.func.attr == dtype.to_string()
+                    and len(node.args) == 1 and not node.keywords and is_constant(node.args[0]))
+        return is_constant(node)
+
+    for stmt in tasklet.code.code:
+        if not isinstance(stmt, ast.Assign) or not all(isinstance(t, ast.Name) for t in stmt.targets):
+            return False
+        if not is_vectorizable(stmt.value):
+            return False
+        # Local variables (e.g., from fused tasklets) are inferred as vectors
+        names |= set(t.id for t in stmt.targets)
+    return True
+
+
+def can_vectorize_map(sdfg: SDFG, state: SDFGState, map_entry: nodes.MapEntry, vector_bytes: int) -> int:
+    """
+    Analyzes whether an innermost CPU map can be safely vectorized, and on
+    which vector length.
+
+    A map is considered safe to vectorize if it contains a single Python
+    tasklet that performs element-wise arithmetic on a single data type, all
+    of its memlets access one element without write-conflict resolution, and
+    every access that depends on the innermost map parameter does so with
+    unit stride in a contiguous dimension. Data that is both read and written
+    must be accessed at the same index, in order to avoid loop-carried
+    dependencies.
+
+    :param sdfg: The SDFG in which the map resides.
+    :param state: The state in which the map resides.
+    :param map_entry: The map entry node to analyze.
+    :param vector_bytes: Width of the target vector registers in bytes.
+    :return: The vector length to use, or 0 if the map cannot be vectorized.
+    """
+    if map_entry.map.schedule not in (dtypes.ScheduleType.Default, dtypes.ScheduleType.CPU_Multicore,
+                                      dtypes.ScheduleType.Sequential):
+        return 0
+
+    scope = state.scope_subgraph(map_entry, include_entry=False, include_exit=False)
+    if len(scope.nodes()) != 1 or not isinstance(scope.nodes()[0], nodes.Tasklet):
+        return 0
+    tasklet: nodes.Tasklet = scope.nodes()[0]
+
+    param = symbolic.pystr_to_symbolic(map_entry.map.params[-1])
+    start, _, step = map_entry.map.range[-1]
+    if step != 1:
+        return 0
+
+    base_type: dtypes.typeclass = None
+    reads: Dict[str, Set[str]] = {}
+    writes: Dict[str, Set[str]] = {}
+    for e, conntype in state.all_edges_and_connectors(tasklet):
+        if e.data.is_empty():
+            continue
+        desc = sdfg.arrays[e.data.data]
+        if not isinstance(desc, (dt.Array, dt.Scalar)) or isinstance(desc, dt.View):
+            return 0
+        if e.data.wcr is not None or e.data.dynamic:
+            return 0
+        if (e.data.subset.num_elements() == 1) != True:
+            return 0
+        if conntype is None or conntype.type is None:
+            conntype = desc.dtype
+        if isinstance(conntype, (dtypes.vector, dtypes.pointer)) or conntype != desc.dtype:
+            return 0
+        if base_type is None:
+            base_type = conntype
+        elif base_type != conntype:
+            return 0
+
+        # The innermost map parameter must appear (with unit coefficient)
+        # in exactly one dimension, which has to be contiguous
+        indices = [symbolic.pystr_to_symbolic(rb) for rb, _, _ in e.data.subset.ndrange()]
+        dependent_dims = [i for i, idx in enumerate(indices) if param in idx.free_symbols]
+        if len(dependent_dims) > 1:
+            return 0
+        if dependent_dims:
+            dim = dependent_dims[0]
+            if (desc.strides[dim] == 1) != True:
+                return 0
+            if sympy.diff(indices[dim], param) != 1:
+                return 0
+        elif e.src is tasklet:
+            # Writing a vector to a single element
+            return 0
+
+        accesses = writes if e.src is tasklet else reads
+        accesses.setdefault(e.data.data, set()).add(str(e.data.subset))
+
+    if base_type is None or base_type.type not in (numpy.float32, numpy.float64, numpy.int32, numpy.int64):
+        return 0
+
+    # Avoid loop-carried dependencies through data that is read and written
+    for name, wsubsets in writes.items():
+        if len(wsubsets) > 1:
+            return 0
+        if name in reads and reads[name] != wsubsets:
+            return 0
+
+    if not _vectorizable_tasklet_code(tasklet, base_type):
+        return 0
+
+    vector_len = vector_bytes // base_type.bytes
+    if vector_len < 2:
+        return 0
+
+    # Only vectorize maps that do not require a scalar preamble to align
+    # the vectorized range
+    if (start % vector_len == 0) != True:
+        return 0
+
+    return vector_len
+
+
+def auto_vectorize(sdfg: SDFG,
+                   vector_bytes: int = None,
+                   validate_all: bool = False,
+                   map_entries: Optional[Set[nodes.MapEntry]] = None) -> int:
+    """
+    Vectorizes all innermost CPU maps in an SDFG that can be proven safe to
+    vectorize (see ``can_vectorize_map``). Iterations that do not fill a whole
+    vector are computed by a scalar postamble map.
+
+    :param sdfg: The SDFG to vectorize.
+    :param vector_bytes: Width of the target vector registers in bytes. If
+                         None, uses the ``optimizer.autovectorize_bytes``
+                         configuration entry.
+    :param validate_all: If True, validates the SDFG after every vectorized
+                         map.
+    :param map_entries: If given, only considers the maps in this set.
+    :return: The number of vectorized maps.
+    :note: Operates in-place on the given SDFG.
+    """
+    from dace.transformation.dataflow import TaskletFusion, Vectorization
+
+    if vector_bytes is None:
+        vector_bytes = config.Config.get('optimizer', 'autovectorize_bytes')
+
+    # Fuse chains of element-wise tasklets (e.g., from NumPy expressions)
+    # so that each innermost map contains a single tasklet
+    sdfg.apply_transformations_repeated(TaskletFusion, validate=False, validate_all=validate_all)
+
+    # Collect candidates first, since vectorization replicates scopes
+    candidates: List[Tuple[SDFG, SDFGState, nodes.MapEntry, int]] = []
+    for nsdfg in sdfg.all_sdfgs_recursive():
+        for state in nsdfg.nodes():
+            for node in state.nodes():
+                if not isinstance(node, nodes.MapEntry):
+                    continue
+                if map_entries is not None and node not in map_entries:
+                    continue
+                if is_devicelevel_gpu(nsdfg, state, node):
+                    continue
+                vector_len = can_vectorize_map(nsdfg, state, node, vector_bytes)
+                if vector_len > 0:
+                    candidates.append((nsdfg, state, node, vector_len))
+
+    for nsdfg, state, map_entry, vector_len in candidates:
+        Vectorization.apply_to(nsdfg,
+                               dict(vector_len=vector_len, preamble=False),
+                               verify=False,
+                               save=False,
+                               map_entry=map_entry)
+        if validate_all:
+            nsdfg.validate()
+
+    if config.Config.get_bool('debugprint') and len(candidates) > 0:
+        print(f'Vectorized {len(candidates)} maps')
+
+    return len(candidates)
+
+
 def find_fast_library(device: dtypes.DeviceType) -> List[str]:
     from dace.codegen.common import get_gpu_backend
 
@@ -330,7 +540,7 @@ def find_fast_library(device: dtypes.DeviceType) -> List[str]:
             backend = 'none'
 
         if backend == 'cuda':
-            return ['cuBLAS', 'cuSolverDn', 'GPUAuto', 'CUB', 'pure']
+            return ['cuBLAS', 'cuSolverDn', 'cuFFT', 'GPUAuto', 'CUB', 'pure']
         elif backend == 'hip':
             return ['rocBLAS', 'GPUAuto', 'pure']
         else:
@@ -347,6 +557,10 @@ def find_fast_library(device: dtypes.DeviceType) -> List[str]:
         if openblas.OpenBLAS.is_installed():
             result.append('OpenBLAS')
 
+        # FFT calls
+        if fftw.FFTW.is_installed():
+            result.append('FFTW')
+
         return result + ['pure']
 
     return ['pure']
@@ -515,7 +729,9 @@ def auto_optimize(sdfg: SDFG,
                   device: dtypes.DeviceType,
                   validate: bool = True,
                   validate_all: bool = False,
-                  symbols: Dict[str, int] = None) -> SDFG:
+                  symbols: Dict[str, int] = None,
+                  vectorize: bool = None,
+                  tile_for_cache: bool = None) -> SDFG:
     """
     Runs a basic sequence of transformations to optimize a given SDFG to decent
     performance. In particular, performs the following:
@@ -526,8 +742,10 @@ def auto_optimize(sdfg: SDFG,
         * Tiled write-conflict resolution (MapTiling -> AccumulateTransient)
         * Tiled stream accumulation (MapTiling -> AccumulateTransient)
         * Collapse all maps to parallelize across all dimensions
+        * Tile maps with data reuse for cache locality (optional)
         * Set all library nodes to expand to ``fast`` expansion, which calls
           the fastest library on the target device
+        * Vectorize innermost CPU maps with contiguous accesses (optional)
 
     :param sdfg: The SDFG to optimize.
     :param device: the device to optimize for.
@@ -535,6 +753,13 @@ def auto_optimize(sdfg: SDFG,
                      have been applied.
     :param validate_all: If True, validates the SDFG after every step.
     :param symbols: Optional dict that maps symbols (str/symbolic) to int/float
+    :param vectorize: If True, vectorizes innermost maps on CPUs where it is
+                      safe to do so. If None, uses the
+                      ``optimizer.autovectorize`` configuration entry.
+    :param tile_for_cache: If True, tiles CPU maps such that the data
+                           footprint of each tile fits into the cache. If None,
+                           uses the ``optimizer.autotile_cache`` configuration
+                           entry.
     :return: The optimized SDFG.
     :note: Operates in-place on the given SDFG.
     :note: This function is still experimental and may harm correctness in
@@ -599,6 +824,12 @@ def auto_optimize(sdfg: SDFG,
             # node.map.collapse = len(node.map.range)
             pass
 
+    # Tile maps for cache locality
+    if tile_for_cache is None:
+        tile_for_cache = config.Config.get_bool('optimizer', 'autotile_cache')
+    if tile_for_cache and device == dtypes.DeviceType.CPU:
+        cache_tile_maps(sdfg, validate_all=validate_all)
+
     # Set all library nodes to expand to fast library calls
     set_fast_implementations(sdfg, device)
 
@@ -607,7 +838,11 @@ def auto_optimize(sdfg: SDFG,
     infer_types.set_default_schedule_and_storage_types(sdfg, None)
     sdfg.expand_library_nodes()
 
-    # TODO(later): Safe vectorization
+    # Safe vectorization of innermost maps
+    if vectorize is None:
+        vectorize = config.Config.get_bool('optimizer', 'autovectorize')
+    if vectorize and device == dtypes.DeviceType.CPU:
+        auto_vectorize(sdfg, validate_all=validate_all)
 
     # Disable OpenMP parallel sections on a per-SDFG basis
     for nsdfg in sdfg.all_sdfgs_recursive():
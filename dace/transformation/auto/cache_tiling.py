@@ -0,0 +1,275 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Cache-aware automatic tiling of CPU maps. Tile sizes are chosen such that the static data footprint of the memlets
+inside each tile fits into a target cache level.
+"""
+
+import functools
+import glob
+import os
+from typing import Dict, List, Optional, Set, Tuple
+
+from dace import config, data as dt, dtypes, subsets, symbolic
+from dace.sdfg import SDFG, SDFGState, nodes, propagation
+from dace.sdfg.scope import is_devicelevel_gpu
+from dace.transformation import helpers as xfh
+
+#: Default cache sizes (L1, L2, L3) in bytes, used if they cannot be detected
+DEFAULT_CACHE_SIZES = (32 * 1024, 1024 * 1024, 32 * 1024 * 1024)
+
+#: Candidate tile sizes, tried from largest to smallest
+TILE_SIZES = (1024, 512, 256, 128, 64, 32, 16, 8)
+
+
+def _parse_cache_size(size: str) -> int:
+    size = size.strip().upper()
+    multipliers = {'K': 1024, 'M': 1024 * 1024, 'G': 1024 * 1024 * 1024}
+    if size and size[-1] in multipliers:
+        return int(size[:-1]) * multipliers[size[-1]]
+    return int(size)
+
+
+@functools.lru_cache(maxsize=None)
+def _detect_cache_sizes() -> Optional[Tuple[int, ...]]:
+    """
+    Detects the data cache sizes of the first CPU core from ``/sys``.
+
+    :return: A tuple of cache sizes in bytes, ordered by cache level, or None
+             if the cache hierarchy cannot be read.
+    """
+    levels: Dict[int, int] = {}
+    for path in glob.glob('/sys/devices/system/cpu/cpu0/cache/index*'):
+        try:
+            with open(os.path.join(path, 'type'), 'r') as fp:
+                if fp.read().strip() == 'Instruction':
+                    continue
+            with open(os.path.join(path, 'level'), 'r') as fp:
+                level = int(fp.read())
+            with open(os.path.join(path, 'size'), 'r') as fp:
+                levels[level] = _parse_cache_size(fp.read())
+        except (OSError, ValueError):
+            continue
+    if not levels:
+        return None
+    return tuple(levels[l] for l in sorted(levels.keys()))
+
+
+def get_cache_sizes() -> List[int]:
+    """
+    Returns the data cache sizes of the target CPU, ordered by cache level.
+    Uses the ``optimizer.autotile_cache_sizes`` configuration entry if set,
+    otherwise detects the sizes from the operating system.
+
+    :return: A list of cache sizes in bytes (e.g., ``[L1, L2, L3]``).
+    """
+    configured = config.Config.get('optimizer', 'autotile_cache_sizes')
+    if configured:
+        return [_parse_cache_size(s) for s in configured.split(',')]
+    return list(_detect_cache_sizes() or DEFAULT_CACHE_SIZES)
+
+
+def _internal_memlets(state: SDFGState, map_entry: nodes.MapEntry) -> Dict[str, List]:
+    """ Collects the memlets inside a map scope, grouped by data container. """
+    result = {}
+    map_exit = state.exit_node(map_entry)
+    for e in state.out_edges(map_entry):
+        if not e.data.is_empty():
+            result.setdefault(e.data.data, []).append(e.data)
+    for e in state.in_edges(map_exit):
+        if not e.data.is_empty():
+            result.setdefault(e.data.data, []).append(e.data)
+    return result
+
+
+def map_data_footprint(sdfg: SDFG,
+                       state: SDFGState,
+                       map_entry: nodes.MapEntry,
+                       tile_sizes: Optional[List[int]] = None) -> Dict[str, symbolic.SymbolicType]:
+    """
+    Computes the static data footprint of a map (or a tile thereof), i.e., the
+    number of bytes of every data container that is accessed by the memlets
+    inside the map scope.
+
+    :param sdfg: The SDFG in which the map resides.
+    :param state: The state in which the map resides.
+    :param map_entry: The map entry node.
+    :param tile_sizes: If given, computes the footprint of a single tile with
+                       the given size in every map dimension, rather than the
+                       footprint of the entire map.
+    :return: A dictionary mapping data container names to their footprint in
+             bytes.
+    """
+    if tile_sizes is None:
+        rng = map_entry.map.range
+    else:
+        rng = subsets.Range([(0, ts - 1, 1) for ts in tile_sizes])
+
+    result = {}
+    for data, memlets in _internal_memlets(state, map_entry).items():
+        desc = sdfg.arrays[data]
+        if isinstance(desc, dt.Stream):
+            continue
+        propagated = propagation.propagate_subset(memlets, desc, map_entry.map.params, rng)
+        result[data] = propagated.subset.num_elements() * desc.dtype.bytes
+    return result
+
+
+def _accessed_elements(memlet) -> symbolic.SymbolicType:
+    """ Returns the number of accessed elements, assuming that dynamic memlets access their entire subset. """
+    if memlet.dynamic:
+        return memlet.subset.num_elements()
+    return memlet.volume
+
+
+def _evaluate(expr: symbolic.SymbolicType, sdfg: SDFG) -> Optional[int]:
+    value = symbolic.resolve_symbol_to_constant(expr, sdfg)
+    if value is None:
+        return None
+    return int(value)
+
+
+def _tile_sizes_for_map(sdfg: SDFG, state: SDFGState, map_entry: nodes.MapEntry,
+                        cache_size: int) -> Optional[Tuple[List[int], int]]:
+    """
+    Chooses tile sizes for a map such that the data footprint of a tile fits
+    into the given cache size. Returns None if tiling is not profitable.
+    """
+    map_sizes = [_evaluate(s, sdfg) for s in map_entry.map.range.size()]
+
+    # Tiling is only profitable if the entire map does not fit into the cache
+    full_footprint = sum(map_data_footprint(sdfg, state, map_entry).values())
+    full_footprint = _evaluate(full_footprint, sdfg)
+    if full_footprint is not None and full_footprint <= cache_size:
+        return None
+
+    # ...and if data is reused across iterations, i.e., the footprint of a
+    # tile is smaller than the number of accessed elements in the tile
+    reference_tile = [TILE_SIZES[-1]] * len(map_sizes)
+    tile_iterations = TILE_SIZES[-1]**len(map_sizes)
+    has_reuse = False
+    for data, memlets in _internal_memlets(state, map_entry).items():
+        desc = sdfg.arrays[data]
+        if isinstance(desc, dt.Stream):
+            continue
+        accesses = _evaluate(sum(_accessed_elements(m) for m in memlets) * tile_iterations, sdfg)
+        footprint = _evaluate(
+            propagation.propagate_subset(memlets, desc, map_entry.map.params,
+                                         subsets.Range([(0, ts - 1, 1)
+                                                        for ts in reference_tile])).subset.num_elements(), sdfg)
+        if accesses is None or footprint is None:
+            continue
+        if footprint < accesses:
+            has_reuse = True
+            break
+    if not has_reuse:
+        return None
+
+    # Pick the largest uniform tile size whose footprint fits the cache
+    for tile_size in TILE_SIZES:
+        tile_sizes = [tile_size if ms is None else min(tile_size, ms) for ms in map_sizes]
+        footprint = _evaluate(sum(map_data_footprint(sdfg, state, map_entry, tile_sizes).values()), sdfg)
+        if footprint is None:
+            return None
+        if footprint <= cache_size:
+            # Tiling does not change the iteration order
+            if all(ms is not None and ts >= ms for ts, ms in zip(tile_sizes, map_sizes)):
+                return None
+            return tile_sizes, footprint
+
+    return None
+
+
+def cache_tile_maps(sdfg: SDFG,
+                    cache_level: int = None,
+                    cache_fraction: float = 0.5,
+                    local_storage: bool = False,
+                    validate_all: bool = False,
+                    map_entries: Optional[Set[nodes.MapEntry]] = None) -> List[Tuple[str, List[int], int]]:
+    """
+    Tiles the top-level CPU maps of an SDFG for cache locality. For every map
+    with data reuse whose footprint exceeds the target cache, chooses the
+    largest tile such that the static data footprint of the memlets inside a
+    tile fits into a fraction of the cache, and applies ``MapTiling``.
+    Optionally, inputs whose per-tile footprint fits into the first-level cache
+    are buffered in tile-local transients (``InLocalStorage``).
+
+    The decisions are recorded in the transformation history of the SDFG, as
+    every transformation is applied through the SDFG API.
+
+    :param sdfg: The SDFG to optimize.
+    :param cache_level: The (1-based) cache level to target. If None, uses the
+                        ``optimizer.autotile_cache_level`` configuration entry.
+    :param cache_fraction: Fraction of the cache that a tile may occupy.
+    :param local_storage: If True, buffers reused inputs in local storage.
+    :param validate_all: If True, validates the SDFG after every tiled map.
+    :param map_entries: If given, only considers the maps in this set.
+    :return: A list of (map label, tile sizes, tile footprint in bytes)
+             tuples for every tiled map.
+    :note: Operates in-place on the given SDFG.
+    """
+    from dace.transformation.dataflow import InLocalStorage, MapTiling
+
+    if cache_level is None:
+        cache_level = config.Config.get('optimizer', 'autotile_cache_level')
+    cache_sizes = get_cache_sizes()
+    cache_size = int(cache_sizes[min(cache_level, len(cache_sizes)) - 1] * cache_fraction)
+    l1_size = int(cache_sizes[0] * cache_fraction)
+
+    # Collect candidates first, since tiling modifies the graphs
+    candidates = []
+    for nsdfg in sdfg.all_sdfgs_recursive():
+        for state in nsdfg.nodes():
+            for node in state.nodes():
+                if not isinstance(node, nodes.MapEntry):
+                    continue
+                if map_entries is not None and node not in map_entries:
+                    continue
+                if node.map.schedule not in (dtypes.ScheduleType.Default, dtypes.ScheduleType.CPU_Multicore):
+                    continue
+                if xfh.get_parent_map(state, node) is not None or is_devicelevel_gpu(nsdfg, state, node):
+                    continue
+                # Only tile fully-parallel maps (no write-conflicts)
+                if any(e.data.wcr is not None for e in state.in_edges(state.exit_node(node))):
+                    continue
+                try:
+                    decision = _tile_sizes_for_map(nsdfg, state, node, cache_size)
+                except (TypeError, ValueError, NotImplementedError):
+                    continue
+                if decision is not None:
+                    candidates.append((nsdfg, state, node, *decision))
+
+    result = []
+    for nsdfg, state, map_entry, tile_sizes, footprint in candidates:
+        label = map_entry.map.label
+        outer_entry = MapTiling.apply_to(nsdfg, dict(tile_sizes=tuple(tile_sizes)), map_entry=map_entry)
+        map_entry.map.schedule = dtypes.ScheduleType.Sequential
+        result.append((label, tile_sizes, footprint))
+
+        if local_storage:
+            for e in list(state.out_edges(outer_entry)):
+                if e.dst is not map_entry or e.data.is_empty():
+                    continue
+                desc = nsdfg.arrays[e.data.data]
+                if not isinstance(desc, dt.Array) or isinstance(desc, dt.View):
+                    continue
+                tile_footprint = _evaluate(
+                    symbolic.overapproximate(e.data.subset.num_elements()) * desc.dtype.bytes, nsdfg)
+                accesses = _evaluate(
+                    sum(
+                        _accessed_elements(ie.data)
+                        for ie in state.out_edges(map_entry) if ie.data.data == e.data.data) *
+                    functools.reduce(lambda a, b: a * b, tile_sizes, 1), nsdfg)
+                if tile_footprint is None or accesses is None:
+                    continue
+                if tile_footprint <= l1_size and accesses >= 2 * (tile_footprint // desc.dtype.bytes):
+                    InLocalStorage.apply_to(nsdfg, dict(array=e.data.data), node_a=outer_entry, node_b=map_entry)
+
+        if validate_all:
+            nsdfg.validate()
+
+    if config.Config.get_bool('debugprint') and len(result) > 0:
+        print(f'Tiled {len(result)} maps for cache locality:')
+        for label, tile_sizes, footprint in result:
+            print(f'  {label}: tile sizes {tile_sizes}, footprint {footprint} bytes')
+
+    return result
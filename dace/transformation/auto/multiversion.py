@@ -0,0 +1,130 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Symbol-based multi-versioning of SDFGs. Creates a single SDFG that contains several variants of a program, each
+specialized (and optionally optimized) for a set of symbol values or a condition on symbols, along with a generic
+fallback. The variant to execute is chosen at runtime from the symbol values given to the SDFG.
+"""
+
+import copy
+from typing import Callable, Dict, List, Optional, Union
+
+from dace import data as dt, symbolic
+from dace.properties import CodeBlock
+from dace.sdfg import SDFG, InterstateEdge
+
+#: A variant is either a mapping from symbol names to exact values, or a condition on symbols (e.g., ``'N <= 64'``)
+SymbolVariant = Union[Dict[str, int], str]
+
+
+def variant_condition(variant: SymbolVariant) -> str:
+    """
+    Returns the runtime condition (as a Python expression on symbols) under
+    which a variant is valid.
+
+    :param variant: A mapping from symbol names to values, or a condition.
+    :return: A string containing the condition.
+    """
+    if isinstance(variant, str):
+        return variant
+    if not variant:
+        raise ValueError('Symbol variants must specify at least one symbol value')
+    return ' and '.join(f'({k} == {symbolic.symstr(v)})' for k, v in sorted(variant.items()))
+
+
+def specialize_variant(sdfg: SDFG, values: Dict[str, int]) -> None:
+    """
+    Specializes an SDFG for the given symbol values by replacing the symbols
+    with constants throughout the SDFG (including data descriptor shapes and
+    map ranges) and removing them from the symbolic parameters.
+
+    :param sdfg: The SDFG to specialize.
+    :param values: A mapping from symbol names to their values.
+    :note: Operates in-place on the given SDFG.
+    """
+    values = {str(k): v for k, v in values.items() if str(k) in sdfg.free_symbols}
+    sdfg.replace_dict({k: symbolic.symstr(v) for k, v in values.items()}, replace_keys=False)
+    for k in values.keys():
+        if k in sdfg.symbols:
+            sdfg.remove_symbol(k)
+    # Keep the values as constants for remaining references (e.g., in code)
+    sdfg.specialize(values)
+
+
+def multiversion(sdfg: SDFG,
+                 variants: List[SymbolVariant],
+                 optimize: Optional[Callable[[SDFG, Optional[SymbolVariant]], None]] = None) -> SDFG:
+    """
+    Creates a multi-versioned SDFG, which dispatches at runtime to one of
+    several specialized versions of the given SDFG based on symbol values.
+
+    Each variant becomes a nested SDFG in its own state. Variants given as
+    dictionaries of symbol values are specialized for these values, which
+    makes sizes constant for subsequent optimizations (e.g., unrolling and
+    vectorization). Variants given as strings are conditions on symbols (e.g.,
+    ``'N <= 64'``) that are not specialized, but may be optimized differently.
+    Variants are checked in the given order, and the first one whose condition
+    holds is executed. If none holds, a generic version is executed.
+
+    :param sdfg: The SDFG to multi-version. Must be a top-level SDFG.
+    :param variants: A list of variants, each either a mapping from symbol
+                     names to values or a condition on symbols.
+    :param optimize: An optional function that is called on every version
+                     (including the generic one) with the version's SDFG and
+                     variant (None for the generic version), and optimizes it
+                     in-place.
+    :return: A new SDFG with the same name and arguments as the given one.
+    """
+    if sdfg.parent_sdfg is not None:
+        raise ValueError('Only top-level SDFGs can be multi-versioned')
+
+    result = SDFG(sdfg.name, constants=copy.deepcopy(sdfg.constants_prop))
+    result.arg_names = list(sdfg.arg_names)
+    result.callback_mapping = dict(sdfg.callback_mapping)
+    result.debuginfo = copy.deepcopy(sdfg.debuginfo)
+    for sym, stype in sdfg.symbols.items():
+        result.add_symbol(sym, stype)
+    for name, desc in sdfg.arrays.items():
+        if not desc.transient:
+            result.add_datadesc(name, copy.deepcopy(desc))
+
+    free_symbols = sdfg.free_symbols
+    inputs, outputs = sdfg.read_and_write_sets()
+    inputs = set(n for n in inputs if n in result.arrays)
+    outputs = set(n for n in outputs if n in result.arrays)
+
+    dispatch = result.add_state('dispatch', is_start_state=True)
+    end = result.add_state('end')
+
+    conditions = [variant_condition(v) for v in variants]
+    versions = list(enumerate(variants)) + [(len(variants), None)]
+    for i, variant in versions:
+        version = copy.deepcopy(sdfg)
+        version.name = f'{sdfg.name}_v{i}' if variant is not None else f'{sdfg.name}_generic'
+        version.arg_names = []
+        version.callback_mapping = {}
+        if isinstance(variant, dict):
+            specialize_variant(version, variant)
+        if optimize is not None:
+            optimize(version, variant)
+
+        # Only map symbols that remain in the version
+        version_symbols = version.free_symbols
+        symbol_mapping = {s: s for s in free_symbols if s in version_symbols}
+
+        state = result.add_state(version.name)
+        nsdfg = state.add_nested_sdfg(version, result, inputs, outputs, symbol_mapping)
+        for name in inputs:
+            state.add_edge(state.add_read(name), None, nsdfg, name, result.make_array_memlet(name))
+        for name in outputs:
+            state.add_edge(nsdfg, name, state.add_write(name), None, result.make_array_memlet(name))
+
+        # Conditions are made mutually exclusive by negating previous variants
+        preceding = ' or '.join(f'({c})' for c in conditions[:i])
+        if variant is not None:
+            condition = conditions[i] if not preceding else f'({conditions[i]}) and not ({preceding})'
+        else:
+            condition = f'not ({preceding})' if preceding else '1'
+        result.add_edge(dispatch, state, InterstateEdge(condition=CodeBlock(condition)))
+        result.add_edge(state, end, InterstateEdge())
+
+    return result
@@ -0,0 +1,241 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Profile-guided optimization (PGO) of SDFGs. Programs are instrumented with timers on their maps and run with
+representative inputs. The measured runtimes then drive optimization decisions (which maps to tile, vectorize, or run
+sequentially), and the final program is compiled with the native profile-guided optimization of the compiler.
+"""
+
+import copy
+from typing import Any, Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+
+from dace import config, dtypes
+from dace.sdfg import SDFG, SDFGState, nodes
+
+#: Map identifier in instrumentation reports (SDFG ID, state ID, node ID)
+MapUUID = Tuple[int, int, int]
+
+
+def _in_map_scope(sdfg: SDFG) -> bool:
+    """ Returns True if the given (nested) SDFG is executed within a map scope. """
+    while sdfg.parent is not None:
+        if sdfg.parent.entry_node(sdfg.parent_nsdfg_node) is not None:
+            return True
+        sdfg = sdfg.parent_sdfg
+    return False
+
+
+def _copy_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """ Copies array arguments, such that repeated runs see the same inputs. """
+    return {k: v.copy() if isinstance(v, np.ndarray) else v for k, v in arguments.items()}
+
+
+def instrument_maps(sdfg: SDFG) -> List[MapUUID]:
+    """
+    Instruments all outermost maps of an SDFG (including those in nested SDFGs
+    that are not executed within a map) with timers.
+
+    :param sdfg: The SDFG to instrument.
+    :return: A list of identifiers of the instrumented maps.
+    :note: Operates in-place on the given SDFG.
+    """
+    result = []
+    for nsdfg in sdfg.all_sdfgs_recursive():
+        if _in_map_scope(nsdfg):
+            continue
+        for state in nsdfg.nodes():
+            for node in state.nodes():
+                if isinstance(node, nodes.MapEntry) and state.entry_node(node) is None:
+                    node.map.instrument = dtypes.InstrumentationType.Timer
+                    result.append((nsdfg.sdfg_id, nsdfg.node_id(state), state.node_id(node)))
+    return result
+
+
+def profile_maps(sdfg: SDFG, inputs: Sequence[Dict[str, Any]], repetitions: int = 3) -> Dict[MapUUID, float]:
+    """
+    Measures the runtime of the outermost maps of an SDFG on a set of
+    representative inputs. The SDFG itself is not modified; an instrumented
+    copy is compiled into a separate build folder.
+
+    :param sdfg: The SDFG to profile.
+    :param inputs: A list of inputs, each a dictionary of SDFG arguments.
+    :param repetitions: Number of runs per input.
+    :return: A dictionary mapping map identifiers to their average runtime
+             per program invocation, in milliseconds.
+    """
+    profiled = copy.deepcopy(sdfg)
+    profiled.name = f'{sdfg.name}_profile'
+    profiled.build_folder = f'{sdfg.build_folder}_profile'
+    instrumented = instrument_maps(profiled)
+    if len(instrumented) == 0 or len(inputs) == 0:
+        return {}
+
+    # Collect all timings into one report that is written when the program exits
+    with config.temporary_config():
+        config.Config.set('instrumentation', 'report_each_invocation', value=False)
+        csdfg = profiled.compile()
+        for arguments in inputs:
+            for _ in range(repetitions):
+                csdfg(**_copy_arguments(arguments))
+        csdfg.finalize()
+
+    report = profiled.get_latest_report()
+    if report is None:
+        return {}
+
+    invocations = len(inputs) * repetitions
+    result = {}
+    for uuid in instrumented:
+        if uuid not in report.durations:
+            continue
+        times = [t for threads in report.durations[uuid].values() for tlist in threads.values() for t in tlist]
+        result[uuid] = sum(times) / invocations
+    return result
+
+
+def _maps_within(sdfg: SDFG, state: SDFGState, map_entry: nodes.MapEntry) -> Set[nodes.MapEntry]:
+    """ Returns a map entry and all map entries within its scope, including those in nested SDFGs. """
+    result = {map_entry}
+    for node in state.scope_subgraph(map_entry).nodes():
+        if isinstance(node, nodes.MapEntry):
+            result.add(node)
+        elif isinstance(node, nodes.NestedSDFG):
+            result.update(n for n, _ in node.sdfg.all_nodes_recursive() if isinstance(n, nodes.MapEntry))
+    return result
+
+
+def optimize_from_profile(sdfg: SDFG,
+                          runtimes: Dict[MapUUID, float],
+                          hot_fraction: float = 0.1,
+                          parallel_threshold: float = 0.01,
+                          vectorize: bool = True,
+                          tile_for_cache: bool = True) -> Dict[str, List[str]]:
+    """
+    Applies optimizations to an SDFG according to measured map runtimes (see
+    ``profile_maps``):
+
+    * Parallel maps that run shorter than ``parallel_threshold`` are made
+      sequential, since their runtime is dominated by the parallelization
+      overhead.
+    * Maps that take at least ``hot_fraction`` of the total measured runtime
+      are tiled for cache locality and vectorized, if found to be profitable
+      and safe.
+
+    :param sdfg: The SDFG to optimize. Must be structurally identical to the
+                 profiled SDFG.
+    :param runtimes: A dictionary mapping map identifiers to runtimes (in ms).
+    :param hot_fraction: Fraction of the total runtime above which a map is
+                         optimized further.
+    :param parallel_threshold: Runtime (in ms) below which a parallel map is
+                               made sequential.
+    :param vectorize: If True, vectorizes hot maps.
+    :param tile_for_cache: If True, tiles hot maps for cache locality.
+    :return: A dictionary of the applied decisions, mapping the decision
+             ("sequential", "tiled", or "vectorized") to map labels.
+    :note: Operates in-place on the given SDFG.
+    """
+    from dace.transformation.auto.auto_optimize import auto_vectorize
+    from dace.transformation.auto.cache_tiling import cache_tile_maps
+
+    decisions = {'sequential': [], 'tiled': [], 'vectorized': []}
+    total = sum(runtimes.values())
+    if total <= 0:
+        return decisions
+
+    hot_maps: Set[nodes.MapEntry] = set()
+    for (sdfg_id, state_id, node_id), runtime in runtimes.items():
+        state = sdfg.sdfg_list[sdfg_id].node(state_id)
+        map_entry = state.node(node_id)
+        if runtime < parallel_threshold and map_entry.map.schedule == dtypes.ScheduleType.CPU_Multicore:
+            map_entry.map.schedule = dtypes.ScheduleType.Sequential
+            decisions['sequential'].append(map_entry.map.label)
+        elif runtime >= hot_fraction * total:
+            hot_maps |= _maps_within(sdfg.sdfg_list[sdfg_id], state, map_entry)
+
+    if len(hot_maps) == 0:
+        return decisions
+
+    if tile_for_cache:
+        decisions['tiled'] = [label for label, _, _ in cache_tile_maps(sdfg, map_entries=hot_maps)]
+    if vectorize:
+        # Vectorized maps are detected by their modified ranges
+        ranges = {m: copy.deepcopy(m.map.range) for m in hot_maps}
+        if auto_vectorize(sdfg, map_entries=hot_maps) > 0:
+            decisions['vectorized'] = [m.map.label for m, rng in ranges.items() if m.map.range != rng]
+
+    return decisions
+
+
+def compile_with_profile(sdfg: SDFG,
+                         inputs: Sequence[Dict[str, Any]],
+                         repetitions: int = 1) -> 'dace.codegen.compiled_sdfg.CompiledSDFG':
+    """
+    Compiles an SDFG using the native profile-guided optimization of the
+    compiler. The program is first compiled with profile instrumentation and
+    run with the given inputs, and then recompiled with the collected
+    profiles.
+
+    :param sdfg: The SDFG to compile.
+    :param inputs: A list of inputs, each a dictionary of SDFG arguments.
+    :param repetitions: Number of runs per input.
+    :return: The compiled SDFG, optimized with the collected profiles.
+    """
+    with config.temporary_config():
+        config.Config.set('compiler', 'cpu', 'pgo', value='generate')
+        csdfg = sdfg.compile()
+        for arguments in inputs:
+            for _ in range(repetitions):
+                csdfg(**_copy_arguments(arguments))
+
+        # Profiles are written when the library is unloaded
+        csdfg.finalize()
+        csdfg._lib.unload()
+        del csdfg
+
+        config.Config.set('compiler', 'cpu', 'pgo', value='use')
+        return sdfg.compile()
+
+
+def profile_guided_optimize(sdfg: SDFG,
+                            inputs: Sequence[Dict[str, Any]],
+                            device: dtypes.DeviceType = dtypes.DeviceType.CPU,
+                            repetitions: int = 3,
+                            native: bool = True,
+                            **kwargs) -> Tuple['dace.codegen.compiled_sdfg.CompiledSDFG', Dict[str, List[str]]]:
+    """
+    Optimizes and compiles an SDFG with profile-guided optimization. First,
+    the SDFG is automatically optimized (see ``auto_optimize``), without
+    vectorization and cache tiling. Then, its maps are profiled on the given
+    inputs and further optimized according to their runtimes (see
+    ``optimize_from_profile``). Lastly, if ``native`` is True and the target
+    device is a CPU, the program is compiled with the native profile-guided
+    optimization of the compiler (see ``compile_with_profile``).
+
+    :param sdfg: The SDFG to optimize.
+    :param inputs: A list of representative inputs, each a dictionary of SDFG
+                   arguments.
+    :param device: The device to optimize for.
+    :param repetitions: Number of profiling runs per input.
+    :param native: If True, uses native profile-guided optimization of the
+                   compiler.
+    :param kwargs: Additional keyword arguments to ``optimize_from_profile``.
+    :return: A 2-tuple of the compiled SDFG and the applied decisions.
+    :note: Operates in-place on the given SDFG.
+    """
+    from dace.transformation.auto.auto_optimize import auto_optimize
+
+    auto_optimize(sdfg, device, vectorize=False, tile_for_cache=False)
+    sdfg.simplify()
+
+    runtimes = profile_maps(sdfg, inputs, repetitions)
+    decisions = optimize_from_profile(sdfg, runtimes, **kwargs)
+
+    if config.Config.get_bool('debugprint'):
+        print('Profile-guided optimization decisions:')
+        for decision, labels in decisions.items():
+            print(f'  {decision}: {", ".join(labels) or "(none)"}')
+
+    if native and device == dtypes.DeviceType.CPU:
+        return compile_with_profile(sdfg, inputs), decisions
+    return sdfg.compile(), decisions
@@ -300,11 +300,11 @@ class RedundantArray(pm.SingleStateTransformation):
                     try:
                         has_bward_path = nx.has_path(G, a, true_out_array)
                     except NodeNotFound:
-                        has_bward_path = nx.has_path(graph.nx, a, true_out_array)
+                        has_bward_path = graph.has_path(a, true_out_array)
                     try:
                         has_fward_path = nx.has_path(G, true_out_array, a)
                     except NodeNotFound:
-                        has_fward_path = nx.has_path(graph.nx, true_out_array, a)
+                        has_fward_path = graph.has_path(true_out_array, a)
                     # If there is no path between the access nodes (disconnected
                     # components), then it is definitely possible to have data
                     # races. Abort.
@@ -756,11 +756,11 @@ class RedundantSecondArray(pm.SingleStateTransformation):
                         try:
                             has_bward_path = nx.has_path(G, a, true_in_array)
                         except NodeNotFound:
-                            has_bward_path = nx.has_path(graph.nx, a, true_in_array)
+                            has_bward_path = graph.has_path(a, true_in_array)
                         try:
                             has_fward_path = nx.has_path(G, true_in_array, a)
                         except NodeNotFound:
-                            has_fward_path = nx.has_path(graph.nx, true_in_array, a)
+                            has_fward_path = graph.has_path(true_in_array, a)
                         # If there is no path between the access nodes
                         # (disconnected components), then it is definitely
                         # possible to have data races. Abort.
@@ -3,7 +3,6 @@
 from collections import defaultdict
 import copy
 from typing import Dict, List, Tuple
-import networkx as nx
 import warnings
 import sympy
 
@@ -329,7 +328,7 @@ class StreamingMemory(xf.SingleStateTransformation):
             for i, component in enumerate(components):
                 edges_to_remove = set()
                 for cedge in component:
-                    if any(nx.has_path(state.nx, o[1].dst, cedge[1].dst) for o in component if o is not cedge):
+                    if any(state.has_path(o[1].dst, cedge[1].dst) for o in component if o is not cedge):
                         ccs_to_add.append([cedge])
                         edges_to_remove.add(cedge)
                 if edges_to_remove:
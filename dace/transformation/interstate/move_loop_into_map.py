@@ -94,7 +94,7 @@ class MoveLoopIntoMap(DetectLoop, transformation.MultiStateTransformation):
                 # if there is a RW dependency on the loop variable. However, in such complicated cases, it is far more
                 # likely that the simplification redundant array/copying transformations trigger first. If they don't,
                 # this is a good hint that there is a RW dependency.
-                if nx.has_path(body._nx, map_exit, e.dst):
+                if body.has_path(map_exit, e.dst):
                     return False
         for n in body.nodes():
             if n in subgraph.nodes():
@@ -1,7 +1,6 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 """ State elimination transformations """
 
-import networkx as nx
 from typing import Dict, List, Set
 
 from dace import data as dt, dtypes, registry, sdfg, symbolic
@@ -405,13 +404,13 @@ class HoistState(transformation.SingleStateTransformation):
         # 2. No other connected components can use descriptors.
         for dnode in graph.data_nodes():
             if dnode.data in outer_data_to_check:
-                if nx.has_path(graph._nx, nsdfg, dnode):
+                if graph.has_path(nsdfg, dnode):
                     # OK, has path from nsdfg to access node
                     continue
                 if dnode in graph.predecessors(nsdfg):
                     # OK, a direct edge to nsdfg
                     continue
-                if nx.has_path(graph._nx, dnode, nsdfg):
+                if graph.has_path(dnode, nsdfg):
                     # NOT OK, some path goes through access node to SDFG,
                     # so state cannot safely be hoisted
                     return False
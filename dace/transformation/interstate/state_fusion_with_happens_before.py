@@ -127,7 +127,7 @@ class StateFusionExtended(transformation.MultiStateTransformation):
                  match_nodes: Dict[nodes.AccessNode, nodes.AccessNode], node_a: nodes.Node, node_b: nodes.Node) -> bool:
         """ Check for paths between the two states if they are fused. """
         for match_a, match_b in match_nodes.items():
-            if nx.has_path(first_state._nx, node_a, match_a) and nx.has_path(second_state._nx, match_b, node_b):
+            if first_state.has_path(node_a, match_a) and second_state.has_path(match_b, node_b):
                 return True
         return False
 
@@ -153,12 +153,12 @@ class StateFusionExtended(transformation.MultiStateTransformation):
         path_found = False
         for match in match_nodes:
             for node in nodes_first:
-                path_to = nx.has_path(first_state._nx, node, match)
+                path_to = first_state.has_path(node, match)
                 if not path_to:
                     continue
                 path_found = True
                 node2 = next(n for n in second_input if n.data == match.data)
-                if not all(nx.has_path(second_state._nx, node2, n) for n in nodes_second):
+                if not all(second_state.has_path(node2, n) for n in nodes_second):
                     fail = True
                     break
             if fail or path_found:
@@ -363,7 +363,7 @@ class StateFusionExtended(transformation.MultiStateTransformation):
                                             for n1 in fused_cc.first_output_nodes:
                                                 if n1.data == src.data:
                                                     for n0 in nodes_first:
-                                                        if not nx.has_path(first_state._nx, n0, n1):
+                                                        if not first_state.has_path(n0, n1):
                                                             return False
                                 # Read-write hazard where an access node is connected
                                 # to more than one output at once: (a) -> (b)  |  (d) -> [code] -> (d)
@@ -442,10 +442,10 @@ class StateFusionExtended(transformation.MultiStateTransformation):
                                 # If found more than once, either there is a
                                 # path from one to another or it is ambiguous
                                 if found is not None:
-                                    if nx.has_path(first_state.nx, outnode, found):
+                                    if first_state.has_path(outnode, found):
                                         # Found is a descendant, continue
                                         continue
-                                    elif nx.has_path(first_state.nx, found, outnode):
+                                    elif first_state.has_path(found, outnode):
                                         # New node is a descendant, set as found
                                         found = outnode
                                     else:
@@ -557,7 +557,7 @@ class StateFusionExtended(transformation.MultiStateTransformation):
             if not source_node:
                 for cand in candidates:
                     if StateFusionExtended.memlets_intersect(first_state, [cand], False, second_state, [node], True):
-                        if nx.has_path(first_state._nx, cand, node):  # Do not create cycles
+                        if first_state.has_path(cand, node):  # Do not create cycles
                             continue
                         sdutil.change_edge_src(first_state, cand, node)
                         sdutil.change_edge_dest(first_state, cand, node)
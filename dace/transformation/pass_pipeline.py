@@ -2,11 +2,12 @@
 """
 API for SDFG analysis and manipulation Passes, as well as Pipelines that contain multiple dependent passes.
 """
-from dace import properties, serialize
+from dace import config, properties, serialize
 from dace.sdfg import SDFG, SDFGState, graph as gr, nodes, utils as sdutil
 
+from collections import defaultdict
 from enum import Flag, auto
-from typing import Any, Dict, Iterator, List, Optional, Set, Type, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Type, Union
 from dataclasses import dataclass
 
 
@@ -498,12 +499,22 @@ class Pipeline(Pass):
         state = pipeline_results
         retval = {}
         self._modified = Modifies.Nothing
+        analyses = get_analysis_manager(sdfg)
         for p in self.iterate_over_passes(sdfg):
-            r = self.apply_subpass(sdfg, p, state)
+            # Analysis results may be reused from previous pipelines and transformations
+            if analyses is not None and p.modifies() == Modifies.Nothing:
+                found, r = analyses.lookup(p)
+                if not found:
+                    r = self.apply_subpass(sdfg, p, state)
+                    analyses.store(p, r)
+            else:
+                r = self.apply_subpass(sdfg, p, state)
             if r is not None:
                 state[type(p).__name__] = r
                 retval[type(p).__name__] = r
                 self._modified = p.modifies()
+                if analyses is not None:
+                    analyses.invalidate(self._modified, acknowledge=True)
 
         if retval:
             return retval
@@ -556,3 +567,159 @@ class FixedPointPipeline(Pipeline):
                 return None
             state.update(newret)
             retval.update(newret)
+
+
+class AnalysisManager:
+    """
+    Caches the results of analysis passes (i.e., passes that do not modify the SDFG) on an SDFG, such that they can be
+    reused across pipelines and transformations. The manager of an SDFG is obtained with ``get_analysis_manager``, and
+    is used by every ``Pipeline`` applied on that SDFG.
+
+    Cached results are invalidated with the ``Modifies`` flags reported by applied passes and transformations: an
+    analysis result is dropped if the analysis ``should_reapply`` given the modified elements, or if it depends on
+    another dropped result. Nodes and edges that are added to or removed from the SDFG (or its states and nested
+    SDFGs) are always detected, even if they were not reported (e.g., when using the SDFG API): they invalidate results
+    as if the dataflow of the states (or, for the SDFG itself, everything) was modified. Other modifications made
+    outside of passes and transformations (e.g., changing memlets or inter-state edges in place) must be reported by
+    calling ``invalidate``.
+
+    The ``hits``, ``misses``, and ``invalidations`` counters are kept per analysis (by pass class name).
+    """
+
+    def __init__(self, sdfg: SDFG):
+        self.sdfg = sdfg
+        self._results: Dict[str, Any] = {}
+        self._passes: Dict[str, Pass] = {}
+        self._stamp = gr.last_modification_stamp()
+        self._sdfg_list = list(sdfg.sdfg_list)
+
+        self.hits: Dict[str, int] = defaultdict(int)
+        self.misses: Dict[str, int] = defaultdict(int)
+        self.invalidations: Dict[str, int] = defaultdict(int)
+
+    def _unreported_modifications(self) -> Modifies:
+        """
+        Returns which elements of the SDFG may have been modified, based on the nodes and edges of the SDFG (or its
+        states and nested SDFGs) that were added or removed since the last acknowledged modification.
+        """
+        if self.sdfg.sdfg_list != self._sdfg_list:
+            # Analysis results are keyed by SDFG IDs, which changed
+            return Modifies.Everything
+        if gr.last_modification_stamp() == self._stamp:
+            return Modifies.Nothing
+        result = Modifies.Nothing
+        for sd in self.sdfg.all_sdfgs_recursive():
+            if sd.modification_stamp > self._stamp:
+                # States, inter-state edges, or data descriptors (and their names) were modified
+                return Modifies.Everything
+            if any(state.modification_stamp > self._stamp for state in sd.nodes()):
+                result |= Modifies.Nodes | Modifies.Memlets
+        return result
+
+    def check_unreported(self):
+        """
+        Drops the cached results that are invalidated by nodes and edges of the SDFG (or its states and nested SDFGs)
+        that were added or removed since the last acknowledged modification.
+        """
+        self.invalidate(Modifies.Nothing, acknowledge=True)
+
+    def lookup(self, p: Pass) -> Tuple[bool, Optional[Any]]:
+        """
+        Looks up the cached result of an analysis pass.
+
+        :param p: The analysis pass.
+        :return: A 2-tuple of whether the result was found in the cache, and the result itself.
+        """
+        name = type(p).__name__
+        self.check_unreported()
+        if name in self._results:
+            self.hits[name] += 1
+            return True, self._results[name]
+        self.misses[name] += 1
+        return False, None
+
+    def store(self, p: Pass, result: Optional[Any]):
+        """
+        Caches the result of an analysis pass that was just applied on the SDFG.
+
+        :param p: The analysis pass.
+        :param result: The return value of the pass.
+        """
+        name = type(p).__name__
+        self._results[name] = result
+        self._passes[name] = p
+
+    def invalidate(self, modified: Modifies = Modifies.Everything, acknowledge: bool = False):
+        """
+        Drops the cached results that are invalidated by modifying the given elements of the SDFG.
+
+        :param modified: Flags specifying which elements of the SDFG were modified.
+        :param acknowledge: If True, also drops the results invalidated by nodes and edges that were added or
+                            removed since the last acknowledged modification, and acknowledges them.
+        """
+        if acknowledge:
+            # Reported flags may not cover all added or removed nodes and edges
+            modified |= self._unreported_modifications()
+            self._stamp = gr.last_modification_stamp()
+            self._sdfg_list = list(self.sdfg.sdfg_list)
+        if modified == Modifies.Nothing:
+            return
+
+        invalid = set(name for name, p in self._passes.items() if p.should_reapply(modified))
+
+        # Results of analyses that depend on invalidated results are invalid as well
+        added = bool(invalid)
+        while added:
+            added = False
+            for name, p in self._passes.items():
+                if name in invalid:
+                    continue
+                deps = (dep.__name__ if isinstance(dep, type) else type(dep).__name__ for dep in p.depends_on())
+                if any(dep in invalid for dep in deps):
+                    invalid.add(name)
+                    added = True
+
+        for name in invalid:
+            del self._results[name]
+            del self._passes[name]
+            self.invalidations[name] += 1
+
+    def report(self) -> str:
+        """
+        Returns a user-readable string with the cache hit rate of every analysis.
+        """
+        lines = []
+        for name in sorted(set(self.hits.keys()) | set(self.misses.keys())):
+            hits, misses = self.hits[name], self.misses[name]
+            lines.append(f'{name}: {hits} hits, {misses} misses, {self.invalidations[name]} invalidations '
+                         f'({100 * hits / (hits + misses):.0f}% hit rate)')
+        return '\n'.join(lines)
+
+
+def get_analysis_manager(sdfg: SDFG) -> Optional[AnalysisManager]:
+    """
+    Returns the analysis manager that caches analysis results on the given SDFG, creating it if necessary.
+
+    :param sdfg: The SDFG to get the analysis manager of.
+    :return: The analysis manager, or None if analysis caching is disabled (``optimizer.cache_analyses``).
+    """
+    if not config.Config.get_bool('optimizer', 'cache_analyses'):
+        return None
+    if getattr(sdfg, '_analysis_manager', None) is None:
+        sdfg._analysis_manager = AnalysisManager(sdfg)
+    return sdfg._analysis_manager
+
+
+def invalidate_analyses(sdfg: SDFG, modified: Modifies = Modifies.Everything):
+    """
+    Drops the cached analysis results that are invalidated by modifying the given elements of an SDFG, on the SDFG
+    and on all of its parent SDFGs. Used to report modifications made outside of pipelines (e.g., by
+    transformations).
+
+    :param sdfg: The modified SDFG.
+    :param modified: Flags specifying which elements of the SDFG were modified.
+    """
+    while sdfg is not None:
+        if getattr(sdfg, '_analysis_manager', None) is not None:
+            sdfg._analysis_manager.invalidate(modified)
+        sdfg = sdfg.parent_sdfg
@@ -91,8 +91,9 @@ class AccessSets(ppl.Pass):
         return ppl.Modifies.Nothing
 
     def should_reapply(self, modified: ppl.Modifies) -> bool:
-        # If anything was modified, reapply
-        return modified & ppl.Modifies.AccessNodes
+        # Access sets depend on the states, their access nodes (and whether they are read or written), and on
+        # inter-state edges
+        return modified & (ppl.Modifies.States | ppl.Modifies.AccessNodes | ppl.Modifies.Edges)
 
     def apply_pass(self, top_sdfg: SDFG, _) -> Dict[int, Dict[SDFGState, Tuple[Set[str], Set[str]]]]:
         """
@@ -135,8 +136,8 @@ class FindAccessStates(ppl.Pass):
         return ppl.Modifies.Nothing
 
     def should_reapply(self, modified: ppl.Modifies) -> bool:
-        # If anything was modified, reapply
-        return modified & ppl.Modifies.AccessNodes
+        # Depends on the states, their access nodes, and on inter-state edges
+        return modified & (ppl.Modifies.States | ppl.Modifies.AccessNodes | ppl.Modifies.InterstateEdges)
 
     def apply_pass(self, top_sdfg: SDFG, _) -> Dict[int, Dict[str, Set[SDFGState]]]:
         """
@@ -174,7 +175,8 @@ class FindAccessNodes(ppl.Pass):
         return ppl.Modifies.Nothing
 
     def should_reapply(self, modified: ppl.Modifies) -> bool:
-        return modified & ppl.Modifies.AccessNodes
+        # Depends on the states, their access nodes, and whether they are read or written
+        return modified & (ppl.Modifies.States | ppl.Modifies.AccessNodes | ppl.Modifies.Memlets)
 
     def apply_pass(self, top_sdfg: SDFG,
                    _) -> Dict[int, Dict[str, Dict[SDFGState, Tuple[Set[nd.AccessNode], Set[nd.AccessNode]]]]]:
@@ -239,7 +241,7 @@ class SymbolWriteScopes(ppl.Pass):
             else:
                 dom_edge = None
                 for cand in oedges:
-                    if nxsp.has_path(n_state.parent.nx, cand.dst, last_state):
+                    if n_state.parent.has_path(cand.dst, last_state):
                         if dom_edge is not None:
                             dom_edge = None
                             break
@@ -338,8 +340,8 @@ class ScalarWriteShadowScopes(ppl.Pass):
             closest_candidate = None
             write_nodes = access_nodes[desc][state][1]
             for cand in write_nodes:
-                if cand != read and nxsp.has_path(state._nx, cand, read):
-                    if closest_candidate is None or nxsp.has_path(state._nx, closest_candidate, cand):
+                if cand != read and state.has_path(cand, read):
+                    if closest_candidate is None or state.has_path(closest_candidate, cand):
                         closest_candidate = cand
             if closest_candidate is not None:
                 return (state, closest_candidate)
@@ -349,7 +351,7 @@ class ScalarWriteShadowScopes(ppl.Pass):
             closest_candidate = None
             write_nodes = access_nodes[desc][state][1]
             for cand in write_nodes:
-                if closest_candidate is None or nxsp.has_path(state._nx, closest_candidate, cand):
+                if closest_candidate is None or state.has_path(closest_candidate, cand):
                     closest_candidate = cand
             if closest_candidate is not None:
                 return (state, closest_candidate)
@@ -369,7 +371,7 @@ class ScalarWriteShadowScopes(ppl.Pass):
                 if write_state.out_degree(cand) == 0:
                     closest_candidate = cand
                     break
-                elif closest_candidate is None or nxsp.has_path(write_state._nx, closest_candidate, cand):
+                elif closest_candidate is None or write_state.has_path(closest_candidate, cand):
                     closest_candidate = cand
             if closest_candidate is not None:
                 return (write_state, closest_candidate)
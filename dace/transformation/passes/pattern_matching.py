@@ -110,9 +110,11 @@ class PatternMatchAndApply(ppl.Pass):
             match._pipeline_results = pipeline_results
 
             result = match.apply(graph, tsdfg)
+            # Transformations may modify the graph in-place (e.g., memlet subsets), which is not tracked otherwise
+            graph._mark_modified()
             applied_transformations[type(match).__name__].append(result)
             if self.validate_all:
-                sdfg.validate()
+                sdfg.validate(incremental=Config.get_bool('optimizer', 'incremental_validation'))
 
         if self.validate:
             sdfg.validate()
@@ -166,13 +168,15 @@ class PatternMatchAndApplyRepeated(PatternMatchAndApply):
             match_name = match.print_match(tsdfg)
 
         applied_transformations[type(match).__name__].append(match.apply(graph, tsdfg))
+        # See ``PatternMatchAndApply.apply_pass``
+        graph._mark_modified()
         if self.progress or (self.progress is None and (time.time() - start) > 5):
             print('Applied {}.\r'.format(', '.join(['%d %s' % (len(v), k)
                                                     for k, v in applied_transformations.items()])),
                   end='')
         if self.validate_all:
             try:
-                sdfg.validate()
+                sdfg.validate(incremental=Config.get_bool('optimizer', 'incremental_validation'))
             except InvalidSDFGError as err:
                 raise InvalidSDFGError(
                     f'Validation failed after applying {match_name}. '
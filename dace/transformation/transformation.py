@@ -23,7 +23,7 @@ import copy
 from dace import dtypes, serialize
 from dace.dtypes import ScheduleType
 from dace.sdfg import SDFG, SDFGState
-from dace.sdfg import nodes as nd, graph as gr, utils as sdutil, propagation, infer_types, state as st
+from dace.sdfg import nodes as nd, graph as gr, utils as sdutil, propagation, infer_types, state as st, lazy_copy
 from dace.properties import make_properties, Property, DictProperty, SetProperty
 from dace.transformation import pass_pipeline as ppl
 from typing import Any, Dict, Generic, List, Optional, Set, Type, TypeVar, Union
@@ -227,8 +227,11 @@ class PatternTransformation(TransformationBase):
         tsdfg: SDFG = self._sdfg.sdfg_list[self.sdfg_id]
         tgraph = tsdfg.node(self.state_id) if self.state_id >= 0 else tsdfg
         retval = self.apply(tgraph, tsdfg)
+        # Changes to existing elements of the graph (e.g., to a memlet subset) are not tracked by the graph itself
+        tgraph._mark_modified()
         if annotate and not self.annotates_memlets():
             propagation.propagate_memlets_sdfg(tsdfg)
+        ppl.invalidate_analyses(tsdfg, self.modifies())
         return retval
 
     def __lt__(self, other: 'PatternTransformation') -> bool:
@@ -329,7 +332,8 @@ class PatternTransformation(TransformationBase):
             graph = sdfg
             state_id = -1
         elif isinstance(sample_node, nd.Node):
-            graph = next(s for s in sdfg.nodes() if sample_node in s.nodes())
+            # States of lazy copies that were not accessed yet cannot contain the node
+            graph = next(s for s in sdfg.nodes() if not lazy_copy.is_lazy(s) and sample_node in s.nodes())
             state_id = sdfg.node_id(graph)
         else:
             raise TypeError('Invalid node type "%s"' % type(sample_node).__name__)
@@ -825,7 +829,8 @@ class SubgraphTransformation(TransformationBase):
                 graph = sdfg
                 state_id = -1
             elif isinstance(sample_node, nd.Node):
-                graph = next(s for s in sdfg.nodes() if sample_node in s.nodes())
+                # States of lazy copies that were not accessed yet cannot contain the node
+                graph = next(s for s in sdfg.nodes() if not lazy_copy.is_lazy(s) and sample_node in s.nodes())
                 state_id = sdfg.node_id(graph)
             else:
                 raise TypeError('Invalid node type "%s"' % type(sample_node).__name__)
@@ -0,0 +1,64 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks the time spent in SDFG simplification and automatic optimization, with and without caching analysis results
+(e.g., state reachability, access sets) across pipelines and transformations (``optimizer.cache_analyses``), and
+reports the analysis cache hit rates.
+"""
+import click
+import copy
+import dace
+import numpy as np
+import timeit
+from dace.transformation import pass_pipeline as ppl
+from dace.transformation.auto import auto_optimize as aopt
+
+N = dace.symbol('N')
+
+
+@dace.program
+def jacobi_steps(A: dace.float64[N, N], B: dace.float64[N, N], norms: dace.float64[10], tsteps: dace.int64):
+    for t in range(tsteps):
+        if t % 2 == 0:
+            B[1:-1, 1:-1] = 0.2 * (A[1:-1, 1:-1] + A[1:-1, :-2] + A[1:-1, 2:] + A[2:, 1:-1] + A[:-2, 1:-1])
+        else:
+            A[1:-1, 1:-1] = 0.2 * (B[1:-1, 1:-1] + B[1:-1, :-2] + B[1:-1, 2:] + B[2:, 1:-1] + B[:-2, 1:-1])
+        for i in range(10):
+            tmp = A[i, :] * B[:, i]
+            norms[i] = np.sum(tmp)
+            if norms[i] > 1:
+                A[i, :] /= norms[i]
+
+
+def optimize(sdfg: dace.SDFG, auto_optimize: bool) -> dace.SDFG:
+    """ Simplifies (and optionally automatically optimizes) a copy of the given SDFG. """
+    sdfg = copy.deepcopy(sdfg)
+    sdfg.simplify()
+    if auto_optimize:
+        aopt.auto_optimize(sdfg, dace.DeviceType.CPU)
+    return sdfg
+
+
+def benchmark(call, repetitions: int) -> float:
+    """ Returns the median runtime of a call in milliseconds. """
+    return np.median(timeit.repeat(call, number=1, repeat=repetitions)) * 1000
+
+
+@click.command()
+@click.option('--repetitions', type=int, default=5)
+def cli(repetitions):
+    sdfg = jacobi_steps.to_sdfg(simplify=False)
+
+    for auto_optimize in (False, True):
+        name = 'simplify + auto_optimize' if auto_optimize else 'simplify'
+        times = {}
+        for cache in (False, True):
+            with dace.config.set_temporary('optimizer', 'cache_analyses', value=cache):
+                times[cache] = benchmark(lambda: optimize(sdfg, auto_optimize), repetitions)
+        print(f'{name}: {times[False]:.2f} ms without analysis cache, {times[True]:.2f} ms with analysis cache')
+
+        optimized = optimize(sdfg, auto_optimize)
+        print(ppl.get_analysis_manager(optimized).report())
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,87 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks automatic vectorization of innermost CPU maps on NumPy-style element-wise kernels, comparing the runtime of
+``auto_optimize`` with and without the vectorization step.
+"""
+import click
+import copy
+import dace
+import numpy as np
+import timeit
+from dace.transformation.auto import auto_optimize as aopt
+
+N = dace.symbol('N')
+
+
+@dace.program
+def axpy(a: dace.float64, x: dace.float64[N], y: dace.float64[N]):
+    y[:] = a * x + y
+
+
+@dace.program
+def triad(a: dace.float32[N], b: dace.float32[N], c: dace.float32[N]):
+    a[:] = b + c * 3
+
+
+@dace.program
+def jacobi1d(A: dace.float64[N], B: dace.float64[N]):
+    B[1:-1] = 0.33333 * (A[:-2] + A[1:-1] + A[2:])
+
+
+@dace.program
+def scaled_diff(x: dace.float64[N], y: dace.float64[N], z: dace.float64[N]):
+    z[:] = (x - y) * (x + y) / 2.0
+
+
+KERNELS = {
+    'axpy': (axpy, lambda n: dict(a=np.float64(2), x=np.random.rand(n), y=np.random.rand(n))),
+    'triad': (triad, lambda n: dict(a=np.random.rand(n).astype(np.float32),
+                                    b=np.random.rand(n).astype(np.float32),
+                                    c=np.random.rand(n).astype(np.float32))),
+    'jacobi1d': (jacobi1d, lambda n: dict(A=np.random.rand(n), B=np.random.rand(n))),
+    'scaled_diff': (scaled_diff, lambda n: dict(x=np.random.rand(n), y=np.random.rand(n), z=np.random.rand(n))),
+}
+
+
+def benchmark(sdfg: dace.SDFG, args, n: int, repetitions: int) -> float:
+    """ Returns the median runtime of a compiled SDFG in milliseconds. """
+    csdfg = sdfg.compile()
+    csdfg(**args, N=n)  # Warm-up
+    times = timeit.repeat(lambda: csdfg(**args, N=n), number=1, repeat=repetitions)
+    return np.median(times) * 1000
+
+
+@click.command()
+@click.option('--size', type=int, default=1 << 24)
+@click.option('--repetitions', type=int, default=20)
+@click.option('--vector-bytes', type=int, default=None)
+@click.argument('kernels', nargs=-1)
+def cli(size, repetitions, vector_bytes, kernels):
+    if vector_bytes is not None:
+        dace.Config.set('optimizer', 'autovectorize_bytes', value=vector_bytes)
+
+    for name in (kernels or KERNELS.keys()):
+        program, make_args = KERNELS[name]
+        sdfg = program.to_sdfg(simplify=True)
+
+        scalar_sdfg = copy.deepcopy(sdfg)
+        scalar_sdfg.name = f'{name}_scalar'
+        aopt.auto_optimize(scalar_sdfg, dace.DeviceType.CPU, vectorize=False)
+
+        vector_sdfg = copy.deepcopy(sdfg)
+        vector_sdfg.name = f'{name}_vector'
+        aopt.auto_optimize(vector_sdfg, dace.DeviceType.CPU, vectorize=True)
+
+        args = make_args(size)
+        scalar_args = copy.deepcopy(args)
+        scalar_time = benchmark(scalar_sdfg, scalar_args, size, repetitions)
+        vector_time = benchmark(vector_sdfg, args, size, repetitions)
+        for k in args.keys():
+            assert np.allclose(args[k], scalar_args[k])
+
+        print(f'{name:12s}: scalar {scalar_time:8.3f} ms, vectorized {vector_time:8.3f} ms '
+              f'(speedup {scalar_time / vector_time:.2f}x)')
+
+
+if __name__ == '__main__':
+    cli()
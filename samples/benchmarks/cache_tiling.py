@@ -0,0 +1,80 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks cache-aware automatic tiling on matrix- and stencil-like kernels, comparing the runtime of ``auto_optimize``
+with and without the tiling step.
+"""
+import click
+import copy
+import dace
+import numpy as np
+import timeit
+from dace.transformation.auto import auto_optimize as aopt
+
+N = dace.symbol('N')
+
+
+@dace.program
+def matmul(A: dace.float64[N, N], B: dace.float64[N, N], C: dace.float64[N, N]):
+    for i, j in dace.map[0:N, 0:N]:
+        for k in range(N):
+            C[i, j] += A[i, k] * B[k, j]
+
+
+@dace.program
+def transpose_add(A: dace.float64[N, N], B: dace.float64[N, N]):
+    for i, j in dace.map[0:N, 0:N]:
+        B[i, j] = A[i, j] + A[j, i]
+
+
+@dace.program
+def jacobi2d(A: dace.float64[N, N], B: dace.float64[N, N]):
+    for i, j in dace.map[1:N - 1, 1:N - 1]:
+        B[i, j] = 0.2 * (A[i, j] + A[i - 1, j] + A[i + 1, j] + A[i, j - 1] + A[i, j + 1])
+
+
+KERNELS = {
+    'matmul': (matmul, lambda n: dict(A=np.random.rand(n, n), B=np.random.rand(n, n), C=np.zeros((n, n)))),
+    'transpose_add': (transpose_add, lambda n: dict(A=np.random.rand(n, n), B=np.zeros((n, n)))),
+    'jacobi2d': (jacobi2d, lambda n: dict(A=np.random.rand(n, n), B=np.zeros((n, n)))),
+}
+
+
+def benchmark(sdfg: dace.SDFG, make_args, n: int, repetitions: int) -> float:
+    """ Returns the median runtime of a compiled SDFG in milliseconds. """
+    csdfg = sdfg.compile()
+    times = []
+    for _ in range(repetitions):
+        args = make_args(n)
+        times.append(timeit.timeit(lambda: csdfg(**args), number=1))
+    return np.median(times) * 1000
+
+
+@click.command()
+@click.option('--size', type=int, default=2048)
+@click.option('--repetitions', type=int, default=10)
+@click.option('--local-storage/--no-local-storage', default=False)
+@click.argument('kernels', nargs=-1)
+def cli(size, repetitions, local_storage, kernels):
+    for name in (kernels or KERNELS.keys()):
+        program, make_args = KERNELS[name]
+        # Specialize the size so that tile footprints can be computed statically
+        sdfg = program.to_sdfg(simplify=True)
+        sdfg.specialize(dict(N=size))
+
+        untiled_sdfg = copy.deepcopy(sdfg)
+        untiled_sdfg.name = f'{name}_untiled'
+        aopt.auto_optimize(untiled_sdfg, dace.DeviceType.CPU, tile_for_cache=False)
+
+        tiled_sdfg = copy.deepcopy(sdfg)
+        tiled_sdfg.name = f'{name}_tiled'
+        aopt.auto_optimize(tiled_sdfg, dace.DeviceType.CPU, tile_for_cache=False)
+        decisions = aopt.cache_tile_maps(tiled_sdfg, local_storage=local_storage)
+
+        untiled_time = benchmark(untiled_sdfg, make_args, size, repetitions)
+        tiled_time = benchmark(tiled_sdfg, make_args, size, repetitions)
+        print(f'{name:14s}: untiled {untiled_time:9.3f} ms, tiled {tiled_time:9.3f} ms '
+              f'(speedup {untiled_time / tiled_time:.2f}x), tiles: {[d[1] for d in decisions]}')
+
+
+if __name__ == '__main__':
+    cli()
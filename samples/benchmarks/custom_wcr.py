@@ -0,0 +1,81 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks custom (unrecognized) write-conflict resolution in parallel CPU maps, comparing lock-free compare-and-swap
+updates against a single OpenMP critical section for all updates (``DACE_CPU_WCR_CRITICAL``). Each kernel scatters
+the values of a large array into a smaller one, such that the number of conflicting updates to the same element
+decreases with the size of the output.
+"""
+import click
+import copy
+import dace
+import numpy as np
+import timeit
+
+N = dace.symbol('N')
+M = dace.symbol('M')
+
+
+def make_scatter(dtype: dace.typeclass) -> dace.SDFG:
+    """ Creates a program that accumulates squares of the input into ``out[i % M]`` with a custom WCR. """
+    @dace.program
+    def scatter(x: dtype[N], out: dtype[M]):
+        for i in dace.map[0:N]:
+            with dace.tasklet:
+                a << x[i]
+                o >> out(1, lambda a, b: a + b * b)[i % M]
+                o = a
+
+    sdfg = scatter.to_sdfg(simplify=True)
+    sdfg.name = f'scatter_{dtype.to_string()}'
+    return sdfg
+
+
+KERNELS = {
+    'float32': (dace.float32, lambda n: np.random.rand(n).astype(np.float32)),
+    'float64': (dace.float64, lambda n: np.random.rand(n)),
+    'complex128': (dace.complex128, lambda n: np.random.rand(n) + 1j * np.random.rand(n)),
+}
+
+
+def benchmark(sdfg: dace.SDFG, x: np.ndarray, m: int, repetitions: int, critical: bool):
+    """ Returns the median runtime of a compiled SDFG in milliseconds, along with its output. """
+    args = dace.Config.get('compiler', 'cpu', 'args')
+    if critical:
+        args += ' -DDACE_CPU_WCR_CRITICAL'
+    with dace.config.set_temporary('compiler', 'cpu', 'args', value=args):
+        csdfg = sdfg.compile()
+
+    out = np.zeros([m], dtype=x.dtype)
+    csdfg(x=x, out=out, N=x.shape[0], M=m)  # Warm-up
+    times = timeit.repeat(lambda: csdfg(x=x, out=out, N=x.shape[0], M=m), number=1, repeat=repetitions)
+
+    out[:] = 0
+    csdfg(x=x, out=out, N=x.shape[0], M=m)
+    return np.median(times) * 1000, out
+
+
+@click.command()
+@click.option('--size', type=int, default=1 << 24)
+@click.option('--outputs', type=str, default='1,64,65536', help='Comma-separated output sizes.')
+@click.option('--repetitions', type=int, default=10)
+@click.argument('kernels', nargs=-1)
+def cli(size, outputs, repetitions, kernels):
+    for name in (kernels or KERNELS.keys()):
+        dtype, make_input = KERNELS[name]
+        sdfg = make_scatter(dtype)
+
+        critical_sdfg = copy.deepcopy(sdfg)
+        critical_sdfg.name = f'{sdfg.name}_critical'
+
+        x = make_input(size)
+        for m in (int(o) for o in outputs.split(',')):
+            critical_time, expected = benchmark(critical_sdfg, x, m, repetitions, critical=True)
+            cas_time, result = benchmark(sdfg, x, m, repetitions, critical=False)
+            assert np.allclose(result, expected)
+
+            print(f'{name:10s} M={m:<8d}: critical section {critical_time:8.3f} ms, '
+                  f'compare-and-swap {cas_time:8.3f} ms (speedup {critical_time / cas_time:.2f}x)')
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,87 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks discrete Fourier transforms (``numpy.fft``) with the ``FFT`` library node on the CPU, comparing the
+``FFTW`` expansion under different planner modes against NumPy. Plans are created in the first (warm-up) call and
+reused afterwards.
+"""
+import click
+import dace
+import numpy as np
+import timeit
+from dace.libraries.fft import FFT
+
+N = dace.symbol('N')
+M = dace.symbol('M')
+K = dace.symbol('K')
+
+
+@dace.program
+def fft_1d(A: dace.complex128[N], B: dace.complex128[N]):
+    B[:] = np.fft.fft(A)
+
+
+@dace.program
+def rfft_rows(A: dace.float64[M, N], B: dace.complex128[M, N // 2 + 1]):
+    B[:] = np.fft.rfft(A)
+
+
+@dace.program
+def fft_2d(A: dace.complex128[M, N], B: dace.complex128[M, N]):
+    B[:] = np.fft.fft2(A)
+
+
+@dace.program
+def irfft_3d(A: dace.complex128[K, M, N // 2 + 1], B: dace.float64[K, M, N]):
+    B[:] = np.fft.irfftn(A, s=(K, M, N))
+
+
+def _complex(*shape):
+    return np.random.rand(*shape) + 1j * np.random.rand(*shape)
+
+
+KERNELS = {
+    'fft': (fft_1d, lambda size: dict(A=_complex(size), B=np.zeros(size, np.complex128), N=size), np.fft.fft),
+    'rfft_rows': (rfft_rows, lambda size: dict(
+        A=np.random.rand(size // 1024, 1024), B=np.zeros(
+            (size // 1024, 513), np.complex128), M=size // 1024, N=1024), np.fft.rfft),
+    'fft2': (fft_2d, lambda size: dict(
+        A=_complex(size // 2048, 2048), B=np.zeros(
+            (size // 2048, 2048), np.complex128), M=size // 2048, N=2048), np.fft.fft2),
+    'irfft3': (irfft_3d, lambda size: dict(
+        A=_complex(size // 16384, 128, 65), B=np.zeros((size // 16384, 128, 128)), K=size // 16384, M=128, N=128),
+               lambda A: np.fft.irfftn(A, s=(A.shape[0], 128, 128))),
+}
+
+
+@click.command()
+@click.option('--size', type=int, default=1 << 22)
+@click.option('--repetitions', type=int, default=10)
+@click.option('--planners', default='estimate,measure')
+@click.argument('kernels', nargs=-1)
+def cli(size, repetitions, planners, kernels):
+    for name in (kernels or KERNELS.keys()):
+        program, make_args, reference = KERNELS[name]
+        args = make_args(size)
+        expected = reference(args['A'])
+        numpy_time = np.median(timeit.repeat(lambda: reference(args['A']), number=1, repeat=repetitions)) * 1000
+        print(f'{name:10s}: NumPy {numpy_time:8.3f} ms')
+
+        for planner in planners.split(','):
+            with dace.config.set_temporary('library', 'fft', 'fftw_planner', value=planner):
+                sdfg = program.to_sdfg(simplify=True)
+                for node, _ in sdfg.all_nodes_recursive():
+                    if isinstance(node, FFT):
+                        node.implementation = 'FFTW'
+                csdfg = sdfg.compile()
+
+            start = timeit.default_timer()
+            csdfg(**args)  # Warm-up, creates plans
+            plan_time = (timeit.default_timer() - start) * 1000
+            assert np.allclose(args['B'], expected)
+            dace_time = np.median(timeit.repeat(lambda: csdfg(**args), number=1, repeat=repetitions)) * 1000
+            print(f'{"":10s}  FFTW ({planner:9s}) {dace_time:8.3f} ms (speedup {numpy_time / dace_time:.2f}x, '
+                  f'first call {plan_time:8.3f} ms)')
+
+
+if __name__ == '__main__':
+    cli()
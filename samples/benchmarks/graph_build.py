@@ -0,0 +1,69 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks the time and memory needed to build (i.e., add nodes and edges to) SDFG states of increasing size, and the time to validate them. States
+do not keep a networkx version of themselves up to date on every modification, but only build it when requested (e.g.,
+``state.nx``), so the networkx build time is reported separately. Run against an older version of DaCe to compare.
+"""
+import click
+import dace
+from dace.sdfg import nodes
+import numpy as np
+import timeit
+import tracemalloc
+from typing import List, Tuple
+
+
+def make_elements(size: int) -> Tuple[dace.SDFG, List[Tuple[nodes.Node, nodes.Node, dace.Memlet]]]:
+    """
+    Creates an SDFG with one array and the nodes and memlets of a chain of ``size`` tasklets connected through
+    access nodes. Creating the elements (e.g., parsing the tasklet code) is not part of the measured build time.
+    """
+    sdfg = dace.SDFG(f'graph_build_{size}')
+    sdfg.add_array('A', [size + 1], dace.float64)
+    edges = []
+    previous = nodes.AccessNode('A')
+    for i in range(size):
+        tasklet = nodes.Tasklet(f't{i}', {'a'}, {'b'}, 'b = a + 1')
+        access = nodes.AccessNode('A')
+        edges.append((previous, tasklet, dace.Memlet(f'A[{i}]')))
+        edges.append((tasklet, access, dace.Memlet(f'A[{i + 1}]')))
+        previous = access
+    return sdfg, edges
+
+
+def build_state(sdfg: dace.SDFG, edges: List[Tuple[nodes.Node, nodes.Node, dace.Memlet]]) -> dace.SDFGState:
+    """ Adds a new state to the SDFG that contains the given chain of edges. """
+    state = sdfg.add_state()
+    for src, dst, memlet in edges:
+        state.add_edge(src, 'b' if isinstance(src, nodes.Tasklet) else None, dst,
+                       'a' if isinstance(dst, nodes.Tasklet) else None, memlet)
+    return state
+
+
+def benchmark(call, repetitions: int) -> float:
+    """ Returns the median runtime of a call in milliseconds. """
+    return np.median(timeit.repeat(call, number=1, repeat=repetitions)) * 1000
+
+
+@click.command()
+@click.option('--sizes', type=str, default='1000,10000,20000', help='Comma-separated numbers of tasklets')
+@click.option('--repetitions', type=int, default=5)
+def cli(sizes, repetitions):
+    for size in (int(s) for s in sizes.split(',')):
+        sdfg, edges = make_elements(size)
+
+        tracemalloc.start()
+        state = build_state(sdfg, edges)
+        memory = tracemalloc.get_traced_memory()[0] / 2**20
+        tracemalloc.stop()
+
+        build_time = benchmark(lambda: build_state(dace.SDFG('graph_build'), edges), repetitions)
+        validate_time = benchmark(sdfg.validate, repetitions)
+        nx_time = benchmark(lambda: state.nx, 1)
+
+        print(f'{state.number_of_nodes():7d} nodes: memory {memory:8.1f} MiB, build {build_time:9.2f} ms, '
+              f'validate {validate_time:9.2f} ms, networkx {nx_time:8.2f} ms')
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,52 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks node ID lookups (``state.node_id``) in states of increasing size, comparing the indexed lookup of ordered
+graphs against a linear scan over the nodes (``Graph.node_id``). Also reports the time to look up the IDs of all nodes
+in a state (as code generation does), which is quadratic in the number of nodes with linear scans.
+"""
+import click
+import dace
+import numpy as np
+import timeit
+from dace.sdfg.graph import Graph
+
+
+def make_sdfg(size: int) -> dace.SDFG:
+    """ Creates an SDFG with one state that contains ``size`` independent tasklets with an input and an output. """
+    sdfg = dace.SDFG(f'graph_ids_{size}')
+    sdfg.add_array('A', [size], dace.float64)
+    sdfg.add_array('B', [size], dace.float64)
+    state = sdfg.add_state()
+    for i in range(size):
+        tasklet = state.add_tasklet(f't{i}', {'a'}, {'b'}, 'b = a + 1')
+        state.add_edge(state.add_read('A'), None, tasklet, 'a', dace.Memlet(f'A[{i}]'))
+        state.add_edge(tasklet, 'b', state.add_write('B'), None, dace.Memlet(f'B[{i}]'))
+    return sdfg
+
+
+def benchmark(call, repetitions: int) -> float:
+    """ Returns the median runtime of a call in milliseconds. """
+    return np.median(timeit.repeat(call, number=1, repeat=repetitions)) * 1000
+
+
+@click.command()
+@click.option('--sizes', type=str, default='1000,4000,16000,64000', help='Comma-separated numbers of tasklets')
+@click.option('--lookups', type=int, default=1000, help='Number of node IDs to look up')
+@click.option('--repetitions', type=int, default=5)
+def cli(sizes, lookups, repetitions):
+    for size in (int(s) for s in sizes.split(',')):
+        sdfg = make_sdfg(size)
+        state = sdfg.node(0)
+        nodes = state.nodes()
+        sample = [nodes[i] for i in np.random.randint(0, len(nodes), size=lookups)]
+
+        linear_time = benchmark(lambda: [Graph.node_id(state, n) for n in sample], repetitions)
+        indexed_time = benchmark(lambda: [state.node_id(n) for n in sample], repetitions)
+        all_time = benchmark(lambda: [state.node_id(n) for n in nodes], repetitions)
+
+        print(f'{len(nodes):7d} nodes: {lookups} lookups linear {linear_time:9.3f} ms, indexed {indexed_time:7.3f} ms '
+              f'(speedup {linear_time / indexed_time:8.1f}x), all nodes indexed {all_time:7.3f} ms')
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,79 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks histograms (``numpy.histogram``), weighted bin counts and unbuffered additions (``numpy.add.at``) with the
+``ScatterAdd`` library node on the CPU, comparing the ``pure`` expansion (atomic additions) against the ``OpenMP``
+expansion (privatized bins for small histograms, bins partitioned among threads for large ones) and NumPy.
+"""
+import click
+import dace
+import numpy as np
+import timeit
+from dace.libraries.standard import ScatterAdd
+
+N = dace.symbol('N')
+
+
+@dace.program
+def histogram(A: dace.float64[N], H: dace.int64[256]):
+    hist, _ = np.histogram(A, bins=256, range=(0.0, 1.0))
+    H[:] = hist
+
+
+@dace.program
+def add_at_small(A: dace.float64[N], I: dace.int64[N], B: dace.float64[1024]):
+    np.add.at(B, I, A)
+
+
+@dace.program
+def add_at_large(A: dace.float64[N], I: dace.int64[N], B: dace.float64[1 << 22]):
+    np.add.at(B, I, A)
+
+
+def _add_at_reference(A, I, B):
+    np.add.at(B, I, A)
+    return B
+
+
+KERNELS = {
+    'histogram': (histogram, 'H', 256, lambda A, I, B: np.histogram(A, bins=256, range=(0.0, 1.0))[0]),
+    'add_at_small': (add_at_small, 'B', 1024, _add_at_reference),
+    'add_at_large': (add_at_large, 'B', 1 << 22, _add_at_reference),
+}
+
+
+@click.command()
+@click.option('--size', type=int, default=1 << 24)
+@click.option('--repetitions', type=int, default=10)
+@click.argument('kernels', nargs=-1)
+def cli(size, repetitions, kernels):
+    for name in (kernels or KERNELS.keys()):
+        program, output, nbins, reference = KERNELS[name]
+        A = np.random.rand(size)
+        I = np.random.randint(0, nbins, size=size)
+        args = dict(A=A, N=size)
+        if name != 'histogram':
+            args['I'] = I
+        args[output] = np.zeros([nbins], dtype=np.int64 if name == 'histogram' else np.float64)
+
+        times = {}
+        for impl in ('pure', 'OpenMP'):
+            sdfg = program.to_sdfg(simplify=True)
+            sdfg.name = f'{sdfg.name}_{impl.lower()}'
+            for node, _ in sdfg.all_nodes_recursive():
+                if isinstance(node, ScatterAdd):
+                    node.implementation = impl
+
+            csdfg = sdfg.compile()
+            args[output][:] = 0
+            csdfg(**args)  # Warm-up
+            assert np.allclose(args[output], reference(A, I, np.zeros([nbins])))
+            times[impl] = np.median(timeit.repeat(lambda: csdfg(**args), number=1, repeat=repetitions)) * 1000
+        numpy_time = np.median(timeit.repeat(lambda: reference(A, I, np.zeros([nbins])), number=1,
+                                             repeat=repetitions)) * 1000
+
+        print(f'{name:12s}: NumPy {numpy_time:8.3f} ms, pure {times["pure"]:8.3f} ms, '
+              f'OpenMP {times["OpenMP"]:8.3f} ms (speedup {numpy_time / times["OpenMP"]:.2f}x)')
+
+
+if __name__ == '__main__':
+    cli()
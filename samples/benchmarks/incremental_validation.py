@@ -0,0 +1,59 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks applying transformations to SDFGs with many states while validating the SDFG after every transformation
+(``validate_all``), validating the entire SDFG and only the modified states (``optimizer.incremental_validation``),
+and prints the time spent in each case.
+"""
+import click
+import dace
+import numpy as np
+import time
+from dace.transformation.dataflow import MapExpansion
+from dace.transformation.passes.pattern_matching import PatternMatchAndApplyRepeated
+
+N = dace.symbol('N')
+
+
+def make_program(states: int, maps: int) -> dace.SDFG:
+    """ Creates an SDFG with a chain of states, each containing a chain of two-dimensional element-wise maps. """
+    sdfg = dace.SDFG(f'incremental_validation_{states}')
+    sdfg.add_array('A', [N, N], dace.float64)
+    sdfg.add_array('B', [N, N], dace.float64)
+    state = sdfg.add_state()
+    for i in range(states):
+        for j in range(maps):
+            state.add_mapped_tasklet(f'step_{i}_{j}',
+                                     dict(k='0:N', l='0:N'),
+                                     dict(inp=dace.Memlet('A[k, l]')),
+                                     f'out = inp * {i} + {j}',
+                                     dict(out=dace.Memlet('B[k, l]')),
+                                     external_edges=True)
+        state = sdfg.add_state_after(state)
+    return sdfg
+
+
+def expand(sdfg: dace.SDFG, incremental: bool):
+    """ Expands all maps of the SDFG, validating it after every transformation. """
+    with dace.config.set_temporary('optimizer', 'incremental_validation', value=incremental):
+        PatternMatchAndApplyRepeated([MapExpansion], validate_all=True, progress=False).apply_pass(sdfg, {})
+
+
+@click.command()
+@click.option('--repetitions', type=int, default=3)
+@click.option('--maps', type=int, default=10)
+@click.argument('sizes', type=int, nargs=-1)
+def cli(repetitions, maps, sizes):
+    for states in (sizes or (10, 30)):
+        for incremental in (False, True):
+            times = []
+            for _ in range(repetitions):
+                sdfg = make_program(states, maps)
+                start = time.perf_counter()
+                expand(sdfg, incremental)
+                times.append(time.perf_counter() - start)
+            print(f'{states} states, {states * maps} transformations, '
+                  f'{"incremental" if incremental else "full"} validation: {np.median(times) * 1000:.2f} ms')
+
+
+if __name__ == '__main__':
+    cli()
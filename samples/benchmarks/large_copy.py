@@ -0,0 +1,78 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks large array-to-array copies on the CPU, comparing single-threaded copies against copies that are split across
+threads (``compiler.cpu.parallel_copy_bytes``) and use non-temporal stores (``compiler.cpu.nontemporal_copy_bytes``).
+"""
+import click
+import copy
+import dace
+import numpy as np
+import timeit
+
+
+def make_copy(name: str, src_shape, dst_shape, src_subset) -> dace.SDFG:
+    """ Creates an SDFG that copies a subset of one array into another. """
+    sdfg = dace.SDFG(name)
+    sdfg.add_array('A', src_shape, dace.float64)
+    sdfg.add_array('B', dst_shape, dace.float64)
+    state = sdfg.add_state()
+    dst_subset = ', '.join(f'0:{s}' for s in dst_shape)
+    state.add_nedge(state.add_read('A'), state.add_write('B'), dace.Memlet(f'A[{src_subset}] -> {dst_subset}'))
+    return sdfg
+
+
+SHAPES = {
+    'contiguous': ([1 << 25], [1 << 25], '0:33554432'),
+    'rows': ([4096, 8192], [4096, 4096], '0:4096, 1:4097'),
+    'columns': ([1 << 24, 2], [1 << 24], '0:16777216, 0'),
+    '3d_block': ([512, 512, 256], [256, 512, 128], '128:384, 0:512, 64:192'),
+}
+
+CONFIGS = {
+    'single-threaded': (0, 0),
+    'parallel': (None, 0),
+    'parallel+non-temporal': (None, None),
+}
+
+
+def benchmark(sdfg: dace.SDFG, args, repetitions: int, parallel_bytes, nontemporal_bytes) -> float:
+    """ Returns the median runtime of a compiled SDFG in milliseconds. """
+    if parallel_bytes is None:
+        parallel_bytes = dace.Config.get('compiler', 'cpu', 'parallel_copy_bytes')
+    if nontemporal_bytes is None:
+        nontemporal_bytes = dace.Config.get('compiler', 'cpu', 'nontemporal_copy_bytes')
+    with dace.config.set_temporary('compiler', 'cpu', 'parallel_copy_bytes', value=parallel_bytes):
+        with dace.config.set_temporary('compiler', 'cpu', 'nontemporal_copy_bytes', value=nontemporal_bytes):
+            csdfg = sdfg.compile()
+    csdfg(**args)  # Warm-up
+    times = timeit.repeat(lambda: csdfg(**args), number=1, repeat=repetitions)
+    return np.median(times) * 1000
+
+
+@click.command()
+@click.option('--repetitions', type=int, default=20)
+@click.argument('shapes', nargs=-1)
+def cli(repetitions, shapes):
+    for name in (shapes or SHAPES.keys()):
+        src_shape, dst_shape, src_subset = SHAPES[name]
+        sdfg = make_copy(f'copy_{name}', src_shape, dst_shape, src_subset)
+        A = np.random.rand(*src_shape)
+        nbytes = np.prod(dst_shape) * 8
+
+        results = []
+        expected = None
+        for config, (parallel_bytes, nontemporal_bytes) in CONFIGS.items():
+            config_sdfg = copy.deepcopy(sdfg)
+            config_sdfg.name = f'{sdfg.name}_{len(results)}'
+            B = np.zeros(dst_shape)
+            time = benchmark(config_sdfg, dict(A=A, B=B), repetitions, parallel_bytes, nontemporal_bytes)
+            if expected is None:
+                expected = B
+            assert np.array_equal(B, expected)
+            results.append(f'{config} {time:8.3f} ms ({nbytes / time / 1e6:6.2f} GB/s)')
+
+        print(f'{name:10s}: ' + ', '.join(results))
+
+
+if __name__ == '__main__':
+    cli()
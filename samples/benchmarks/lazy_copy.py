@@ -0,0 +1,67 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks exploring candidate transformations on copies of an SDFG with many states, copying the SDFG for each
+candidate with ``copy.deepcopy`` and with ``SDFG.lazy_copy``, and prints the time and the memory needed to keep all
+candidates alive.
+"""
+import click
+import copy
+import dace
+import numpy as np
+import timeit
+import tracemalloc
+from dace.transformation.dataflow import MapTiling
+
+N = dace.symbol('N')
+
+
+def make_program(states: int, maps: int) -> dace.SDFG:
+    """ Creates an SDFG with a chain of states, each containing a chain of element-wise maps. """
+    sdfg = dace.SDFG(f'lazy_copy_{states}')
+    sdfg.add_array('A', [N], dace.float64)
+    sdfg.add_array('B', [N], dace.float64)
+    state = sdfg.add_state()
+    for i in range(states):
+        for j in range(maps):
+            state.add_mapped_tasklet(f'step_{i}_{j}',
+                                     dict(k='0:N'),
+                                     dict(inp=dace.Memlet('A[k]')),
+                                     f'out = inp * {i} + {j}',
+                                     dict(out=dace.Memlet('B[k]')),
+                                     external_edges=True)
+        state = sdfg.add_state_after(state)
+    return sdfg
+
+
+def explore(sdfg: dace.SDFG, lazy: bool):
+    """ Tiles the first map of each state in a separate copy of the SDFG and returns the copies. """
+    candidates = []
+    for state_id in range(sdfg.number_of_nodes() - 1):
+        candidate = sdfg.lazy_copy() if lazy else copy.deepcopy(sdfg)
+        state = candidate.node(state_id)
+        map_entry = next(n for n in state.nodes() if isinstance(n, dace.nodes.MapEntry))
+        MapTiling.apply_to(candidate, map_entry=map_entry, save=False)
+        candidates.append(candidate)
+    return candidates
+
+
+@click.command()
+@click.option('--repetitions', type=int, default=3)
+@click.option('--maps', type=int, default=10)
+@click.argument('sizes', type=int, nargs=-1)
+def cli(repetitions, maps, sizes):
+    for states in (sizes or (20, 50)):
+        sdfg = make_program(states, maps)
+        for lazy in (False, True):
+            runtime = np.median(timeit.repeat(lambda: explore(sdfg, lazy), number=1, repeat=repetitions)) * 1000
+            tracemalloc.start()
+            candidates = explore(sdfg, lazy)
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del candidates
+            print(f'{states} candidates ({states * maps * 3} nodes), {"lazy copy" if lazy else "deepcopy"}: '
+                  f'{runtime:.2f} ms, {memory / 1024**2:.1f} MiB')
+
+
+if __name__ == '__main__':
+    cli()
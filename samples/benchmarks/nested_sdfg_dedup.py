@@ -0,0 +1,89 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks generating a single function for structurally equivalent nested SDFGs (``compiler.unique_functions``),
+reporting the size of the generated code, the code generation time, and optionally the build time, with and without
+deduplication.
+"""
+import click
+import copy
+import dace
+import numpy as np
+import timeit
+
+N = dace.symbol('N')
+
+
+def make_nested(index: int, states: int) -> dace.SDFG:
+    """
+    Creates a nested SDFG with a chain of element-wise maps through transients. Nested SDFGs created with different
+    indices only differ in their names.
+    """
+    sdfg = dace.SDFG(f'nested_{index}')
+    sdfg.add_array(f'inp_{index}', [N], dace.float64)
+    sdfg.add_array(f'out_{index}', [N], dace.float64)
+    state = sdfg.add_state()
+    src = f'inp_{index}'
+    for i in range(states):
+        dst = f'out_{index}' if i == states - 1 else f'tmp_{index}_{i}'
+        if dst != f'out_{index}':
+            sdfg.add_transient(dst, [N], dace.float64)
+        state.add_mapped_tasklet(f'step_{index}_{i}',
+                                 dict(j='0:N'),
+                                 dict(inp=dace.Memlet(f'{src}[j]')),
+                                 f'out = inp * 2 + {i}',
+                                 dict(out=dace.Memlet(f'{dst}[j]')),
+                                 external_edges=True)
+        src = dst
+        state = sdfg.add_state_after(state)
+    return sdfg
+
+
+def make_program(nested_sdfgs: int, states: int) -> dace.SDFG:
+    """ Creates an SDFG that calls a chain of structurally equivalent nested SDFGs. """
+    sdfg = dace.SDFG(f'nested_sdfg_dedup_{nested_sdfgs}')
+    sdfg.add_array('A', [N], dace.float64)
+    sdfg.add_array('B', [N], dace.float64)
+    state = sdfg.add_state()
+    for i in range(nested_sdfgs):
+        src, dst = ('A', 'B') if i % 2 == 0 else ('B', 'A')
+        nsdfg = state.add_nested_sdfg(make_nested(i, states), sdfg, {f'inp_{i}'}, {f'out_{i}'})
+        state.add_edge(state.add_read(src), None, nsdfg, f'inp_{i}', dace.Memlet(src))
+        state.add_edge(nsdfg, f'out_{i}', state.add_write(dst), None, dace.Memlet(dst))
+        state = sdfg.add_state_after(state)
+    return sdfg
+
+
+def generate(sdfg: dace.SDFG, unique_functions: str) -> int:
+    """ Generates code for a copy of the given SDFG and returns the size of the generated code. """
+    sdfg = copy.deepcopy(sdfg)
+    with dace.config.set_temporary('compiler', 'unique_functions', value=unique_functions):
+        return sum(len(obj.clean_code) for obj in sdfg.generate_code())
+
+
+def build(sdfg: dace.SDFG, unique_functions: str):
+    """ Generates and compiles code for a copy of the given SDFG. """
+    sdfg = copy.deepcopy(sdfg)
+    with dace.config.set_temporary('compiler', 'unique_functions', value=unique_functions):
+        sdfg.compile()
+
+
+@click.command()
+@click.option('--repetitions', type=int, default=3)
+@click.option('--states', type=int, default=10)
+@click.option('--build/--no-build', 'with_build', default=False, help='Also time compiling the generated code')
+@click.argument('sizes', type=int, nargs=-1)
+def cli(repetitions, states, with_build, sizes):
+    for nested_sdfgs in (sizes or (16, 64)):
+        sdfg = make_program(nested_sdfgs, states)
+        for unique_functions in ('none', 'hash'):
+            size = generate(sdfg, unique_functions)
+            times = [
+                np.median(timeit.repeat(lambda: func(sdfg, unique_functions), number=1, repeat=repetitions)) * 1000
+                for func in ((generate, build) if with_build else (generate, ))
+            ]
+            print(f'{nested_sdfgs} nested SDFGs, unique_functions={unique_functions}: {size / 1024:.1f} KiB of code, '
+                  f'{times[0]:.2f} ms to generate' + (f', {times[1]:.2f} ms to build' if with_build else ''))
+
+
+if __name__ == '__main__':
+    cli()
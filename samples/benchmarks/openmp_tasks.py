@@ -0,0 +1,100 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks task-based execution of CPU dataflow (``compiler.cpu.openmp_tasks``), in which independent maps within and
+across states run concurrently as OpenMP tasks, compared to generating every map as a separate parallel loop.
+"""
+import click
+import copy
+import dace
+import numpy as np
+import timeit
+from dace.transformation.auto.auto_optimize import auto_optimize
+
+N = dace.symbol('N')
+
+
+@dace.program
+def independent(A: dace.float64[N], B: dace.float64[2 * N], C: dace.float64[N, 3], D: dace.float64[3, N]):
+    """ Four independent element-wise kernels of different shapes. """
+    A[:] = np.exp(A) * 0.5
+    B[:] = np.sin(B) + 1
+    C[:] = np.sqrt(C) * 0.5
+    D[:] = np.cos(D) * 0.5
+
+
+@dace.program
+def pipeline(A: dace.float64[N], B: dace.float64[N], out: dace.float64[N]):
+    """ Two independent dependency chains that only meet at the end. """
+    for _ in range(10):
+        A[:] = np.sin(A) + 1
+        B[:] = np.cos(B) * 0.5
+        A[:] = A * 0.5
+        B[:] = B + A[0]
+    out[:] = A + B
+
+
+@dace.program
+def stencils(A: dace.float64[N, N], B: dace.float64[N, N], C: dace.float64[N, N], D: dace.float64[N, N]):
+    """ Two independent stencil sweeps. """
+    for _ in range(10):
+        B[1:-1, 1:-1] = 0.25 * (A[:-2, 1:-1] + A[2:, 1:-1] + A[1:-1, :-2] + A[1:-1, 2:])
+        D[1:-1, 1:-1] = 0.25 * (C[:-2, 1:-1] + C[2:, 1:-1] + C[1:-1, :-2] + C[1:-1, 2:])
+        A[1:-1, 1:-1] = B[1:-1, 1:-1]
+        C[1:-1, 1:-1] = D[1:-1, 1:-1]
+
+
+KERNELS = {
+    'independent':
+    (independent,
+     lambda n: dict(A=np.random.rand(n), B=np.random.rand(2 * n), C=np.random.rand(n, 3), D=np.random.rand(3, n), N=n),
+     [4096, 1 << 21]),
+    'pipeline':
+    (pipeline, lambda n: dict(A=np.random.rand(n), B=np.random.rand(n), out=np.zeros(n), N=n), [4096, 1 << 20]),
+    'stencils': (stencils, lambda n: dict(
+        A=np.random.rand(n, n), B=np.random.rand(n, n), C=np.random.rand(n, n), D=np.random.rand(n, n), N=n),
+                 [256, 2048]),
+}
+
+
+def benchmark(csdfg, args, repetitions: int) -> float:
+    """ Returns the median runtime of a compiled SDFG in milliseconds. """
+    csdfg(**args)  # Warm-up
+    times = timeit.repeat(lambda: csdfg(**args), number=1, repeat=repetitions)
+    return np.median(times) * 1000
+
+
+@click.command()
+@click.option('--repetitions', type=int, default=20)
+@click.argument('kernels', nargs=-1)
+def cli(repetitions, kernels):
+    for name in (kernels or KERNELS.keys()):
+        program, make_args, sizes = KERNELS[name]
+        sdfg = program.to_sdfg()
+        auto_optimize(sdfg, dace.DeviceType.CPU)
+        for size in sizes:
+            args = make_args(size)
+            results = []
+            outputs = []
+            for tasks in (False, True):
+                config_sdfg = copy.deepcopy(sdfg)
+                config_sdfg.name = f'{sdfg.name}_{size}_{int(tasks)}'
+                for sd in config_sdfg.all_sdfgs_recursive():
+                    sd.openmp_tasks = tasks
+                csdfg = config_sdfg.compile()
+
+                # Validate a single run before timing
+                run_args = copy.deepcopy(args)
+                csdfg(**run_args)
+                outputs.append(run_args)
+
+                time = benchmark(csdfg, copy.deepcopy(args), repetitions)
+                results.append(f'{"tasks" if tasks else "parallel loops"} {time:8.3f} ms')
+            for k, v in outputs[0].items():
+                if isinstance(v, np.ndarray):
+                    assert np.allclose(v, outputs[1][k]), k
+
+            print(f'{name:11s} N={size:<8d}: ' + ', '.join(results))
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,79 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks code generation for SDFGs with many nested SDFGs, generating the nested SDFGs sequentially and in parallel
+worker processes (``compiler.codegen_workers``), and prints the time spent in each phase of code generation.
+"""
+import click
+import copy
+import dace
+import numpy as np
+import os
+import timeit
+from dace.codegen import codegen
+from dace.codegen.common import CodegenTimer
+
+N = dace.symbol('N')
+
+
+def make_nested(index: int, states: int) -> dace.SDFG:
+    """ Creates a nested SDFG with a chain of states, each containing a different element-wise map. """
+    sdfg = dace.SDFG(f'nested_{index}')
+    sdfg.add_array('A', [N], dace.float64)
+    sdfg.add_array('B', [N], dace.float64)
+    state = sdfg.add_state()
+    for i in range(states):
+        src, dst = ('A', 'B') if i % 2 == 0 else ('B', 'A')
+        state.add_mapped_tasklet(f'step_{i}',
+                                 dict(j='0:N'),
+                                 dict(inp=dace.Memlet(f'{src}[j]')),
+                                 f'out = inp * {index + 1} + {i}',
+                                 dict(out=dace.Memlet(f'{dst}[j]')),
+                                 external_edges=True)
+        state = sdfg.add_state_after(state)
+    return sdfg
+
+
+def make_program(nested_sdfgs: int, states: int) -> dace.SDFG:
+    """ Creates an SDFG that calls a chain of different nested SDFGs. """
+    sdfg = dace.SDFG(f'parallel_codegen_{nested_sdfgs}')
+    sdfg.add_array('A', [N], dace.float64)
+    sdfg.add_array('B', [N], dace.float64)
+    state = sdfg.add_state()
+    for i in range(nested_sdfgs):
+        nsdfg = state.add_nested_sdfg(make_nested(i, states), sdfg, {'A', 'B'}, {'A', 'B'})
+        for conn in ('A', 'B'):
+            state.add_edge(state.add_read(conn), None, nsdfg, conn, dace.Memlet(conn))
+            state.add_edge(nsdfg, conn, state.add_write(conn), None, dace.Memlet(conn))
+        state = sdfg.add_state_after(state)
+    return sdfg
+
+
+def generate(sdfg: dace.SDFG, workers: int) -> CodegenTimer:
+    """ Generates code for a copy of the given SDFG and returns the time spent in each phase. """
+    sdfg = copy.deepcopy(sdfg)
+    sdfg.fill_scope_connectors()
+    timer = CodegenTimer()
+    with dace.config.set_temporary('compiler', 'codegen_workers', value=workers):
+        codegen.generate_code(sdfg, timer=timer)
+    return timer
+
+
+@click.command()
+@click.option('--repetitions', type=int, default=3)
+@click.option('--workers', type=int, default=os.cpu_count())
+@click.option('--states', type=int, default=10)
+@click.argument('sizes', type=int, nargs=-1)
+def cli(repetitions, workers, states, sizes):
+    for nested_sdfgs in (sizes or (16, 64)):
+        sdfg = make_program(nested_sdfgs, states)
+        times = {}
+        for nworkers in (0, workers):
+            times[nworkers] = np.median(timeit.repeat(lambda: generate(sdfg, nworkers), number=1,
+                                                      repeat=repetitions)) * 1000
+        print(f'{nested_sdfgs} nested SDFGs: {times[0]:.2f} ms sequential, '
+              f'{times[workers]:.2f} ms with {workers} workers')
+        print(generate(sdfg, workers).report(f'Code generation phases ({workers} workers):'))
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,77 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks cumulative sums (``numpy.cumsum``) with the ``Scan`` library node on the CPU, comparing the sequential
+``pure`` expansion against the two-pass parallel ``OpenMP`` expansion and NumPy.
+"""
+import click
+import copy
+import dace
+import numpy as np
+import timeit
+from dace.libraries.standard import Scan
+
+N = dace.symbol('N')
+M = dace.symbol('M')
+
+
+@dace.program
+def cumsum_1d(A: dace.float64[N], B: dace.float64[N]):
+    B[:] = np.cumsum(A)
+
+
+@dace.program
+def cumsum_rows(A: dace.float64[M, N], B: dace.float64[M, N]):
+    B[:] = np.cumsum(A, axis=1)
+
+
+@dace.program
+def cumsum_columns(A: dace.float64[M, N], B: dace.float64[M, N]):
+    B[:] = np.cumsum(A, axis=0)
+
+
+KERNELS = {
+    '1d': (cumsum_1d, lambda size: [size], lambda A: np.cumsum(A)),
+    'rows': (cumsum_rows, lambda size: [4, size // 4], lambda A: np.cumsum(A, axis=1)),
+    'columns': (cumsum_columns, lambda size: [size // 64, 64], lambda A: np.cumsum(A, axis=0)),
+}
+
+
+def benchmark(sdfg: dace.SDFG, args, repetitions: int, implementation: str):
+    """ Returns the median runtime of a compiled SDFG in milliseconds, using the given scan implementation. """
+    sdfg = copy.deepcopy(sdfg)
+    sdfg.name = f'{sdfg.name}_{implementation}'
+    for node, _ in sdfg.all_nodes_recursive():
+        if isinstance(node, Scan):
+            node.implementation = implementation
+    csdfg = sdfg.compile()
+    csdfg(**args)  # Warm-up
+    times = timeit.repeat(lambda: csdfg(**args), number=1, repeat=repetitions)
+    return np.median(times) * 1000
+
+
+@click.command()
+@click.option('--size', type=int, default=1 << 25)
+@click.option('--repetitions', type=int, default=10)
+@click.argument('kernels', nargs=-1)
+def cli(size, repetitions, kernels):
+    for name in (kernels or KERNELS.keys()):
+        program, shape, reference = KERNELS[name]
+        A = np.random.rand(*shape(size))
+        B = np.zeros_like(A)
+        args = dict(A=A, B=B, N=A.shape[-1])
+        if A.ndim > 1:
+            args['M'] = A.shape[0]
+        sdfg = program.to_sdfg(simplify=True)
+
+        numpy_time = np.median(timeit.repeat(lambda: reference(A), number=1, repeat=repetitions)) * 1000
+        pure_time = benchmark(sdfg, args, repetitions, 'pure')
+        assert np.allclose(B, reference(A))
+        omp_time = benchmark(sdfg, args, repetitions, 'OpenMP')
+        assert np.allclose(B, reference(A))
+
+        print(f'{name:8s}: NumPy {numpy_time:8.3f} ms, pure {pure_time:8.3f} ms, '
+              f'OpenMP {omp_time:8.3f} ms (speedup {pure_time / omp_time:.2f}x)')
+
+
+if __name__ == '__main__':
+    cli()
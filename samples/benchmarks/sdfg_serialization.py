@@ -0,0 +1,50 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks saving and loading large SDFGs in the JSON and binary serialization formats (``SDFG.save(binary=True)``),
+with and without compression, and prints the size of the resulting files.
+"""
+import click
+import dace
+import numpy as np
+import os
+import tempfile
+import timeit
+
+
+def make_program(nodes: int) -> dace.SDFG:
+    """ Creates an SDFG with a single state that contains the given number of nodes in independent mapped tasklets. """
+    sdfg = dace.SDFG(f'sdfg_serialization_{nodes}')
+    sdfg.add_array('A', [nodes], dace.float64)
+    sdfg.add_array('B', [nodes], dace.float64)
+    state = sdfg.add_state()
+    for i in range(nodes // 4):
+        state.add_mapped_tasklet(f'task_{i}',
+                                 dict(j=f'0:{i + 1}'),
+                                 dict(inp=dace.Memlet('A[j]')),
+                                 'out = inp * 2',
+                                 dict(out=dace.Memlet('B[j]')),
+                                 external_edges=True)
+    return sdfg
+
+
+@click.command()
+@click.option('--repetitions', type=int, default=3)
+@click.argument('sizes', type=int, nargs=-1)
+def cli(repetitions, sizes):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for nodes in (sizes or (1000, 10000)):
+            sdfg = make_program(nodes)
+            for binary in (False, True):
+                for compress in (False, True):
+                    filename = os.path.join(tmpdir, 'program.sdfg')
+                    save = lambda: sdfg.save(filename, hash=False, compress=compress, binary=binary)
+                    load = lambda: dace.SDFG.from_file(filename)
+                    save_time = np.median(timeit.repeat(save, number=1, repeat=repetitions)) * 1000
+                    load_time = np.median(timeit.repeat(load, number=1, repeat=repetitions)) * 1000
+                    fmt = ('binary' if binary else 'JSON') + (', compressed' if compress else '')
+                    print(f'{nodes} nodes, {fmt}: {os.path.getsize(filename) / 1024:.1f} KiB, '
+                          f'{save_time:.2f} ms to save, {load_time:.2f} ms to load')
+
+
+if __name__ == '__main__':
+    cli()
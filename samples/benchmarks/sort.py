@@ -0,0 +1,68 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks sorting (``numpy.sort``) and argsorting (``numpy.argsort``) with the ``Sort`` library node on the CPU,
+comparing the ``OpenMP`` expansion (a parallel merge sort for long lines, and one line per thread otherwise) against
+NumPy.
+"""
+import click
+import dace
+import numpy as np
+import timeit
+from dace.libraries.standard import Sort
+
+N = dace.symbol('N')
+M = dace.symbol('M')
+
+
+@dace.program
+def sort_1d(A: dace.float64[N], B: dace.float64[N]):
+    B[:] = np.sort(A)
+
+
+@dace.program
+def argsort_1d(A: dace.float64[N], I: dace.int64[N]):
+    I[:] = np.argsort(A, kind='stable')
+
+
+@dace.program
+def sort_rows(A: dace.float64[M, N], B: dace.float64[M, N]):
+    B[:] = np.sort(A, axis=1)
+
+
+KERNELS = {
+    'sort': (sort_1d, lambda size: [size], lambda A: np.sort(A), np.float64),
+    'argsort': (argsort_1d, lambda size: [size], lambda A: np.argsort(A, kind='stable'), np.int64),
+    'rows': (sort_rows, lambda size: [size // 256, 256], lambda A: np.sort(A, axis=1), np.float64),
+}
+
+
+@click.command()
+@click.option('--size', type=int, default=1 << 24)
+@click.option('--repetitions', type=int, default=10)
+@click.argument('kernels', nargs=-1)
+def cli(size, repetitions, kernels):
+    for name in (kernels or KERNELS.keys()):
+        program, shape, reference, out_type = KERNELS[name]
+        A = np.random.rand(*shape(size))
+        B = np.zeros(A.shape, dtype=out_type)
+        args = dict(A=A, N=A.shape[-1])
+        args['I' if name == 'argsort' else 'B'] = B
+        if A.ndim > 1:
+            args['M'] = A.shape[0]
+        sdfg = program.to_sdfg(simplify=True)
+        for node, _ in sdfg.all_nodes_recursive():
+            if isinstance(node, Sort):
+                node.implementation = 'OpenMP'
+
+        csdfg = sdfg.compile()
+        csdfg(**args)  # Warm-up
+        assert np.array_equal(B, reference(A))
+        dace_time = np.median(timeit.repeat(lambda: csdfg(**args), number=1, repeat=repetitions)) * 1000
+        numpy_time = np.median(timeit.repeat(lambda: reference(A), number=1, repeat=repetitions)) * 1000
+
+        print(f'{name:8s}: NumPy {numpy_time:8.3f} ms, OpenMP {dace_time:8.3f} ms '
+              f'(speedup {numpy_time / dace_time:.2f}x)')
+
+
+if __name__ == '__main__':
+    cli()
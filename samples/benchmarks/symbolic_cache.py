@@ -0,0 +1,61 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks symbolic subset comparisons (``covers``, ``intersects``) with memoized results and affine fast paths,
+compared to clearing the caches before every comparison, and prints the time spent in each case along with the cache
+statistics of the memoized symbolic functions (``dace.symbolic.cache_statistics``).
+"""
+import click
+import dace
+import numpy as np
+import time
+from dace import subsets, symbolic
+
+N, M, i, j = (dace.symbol(s) for s in 'NMij')
+
+
+def make_subsets(count: int):
+    """ Creates pairs of symbolic ranges with affine bounds, as found in stencil and loop-nest memlets. """
+    rng = np.random.default_rng(42)
+    pairs = []
+    for _ in range(count):
+        a, b, c, d = (int(x) for x in rng.integers(-3, 4, size=4))
+        pairs.append((subsets.Range([(i + a, i + a + 4, 1), (0, N - 1, 1), (j, M - 1 + b, 1)]),
+                      subsets.Range([(i + c, i + c + 2, 1), (1, N - 2, 1), (j + d, M - 2, 1)])))
+    return pairs
+
+
+def compare(pairs, memoized: bool):
+    for a, b in pairs:
+        if not memoized:
+            symbolic.clear_caches()
+        a.covers(b)
+        b.covers(a)
+        subsets.intersects(a, b)
+
+
+@click.command()
+@click.option('--repetitions', type=int, default=3)
+@click.option('--pairs', type=int, default=50)
+@click.argument('sizes', type=int, nargs=-1)
+def cli(repetitions, pairs, sizes):
+    for passes in (sizes or (1, 10)):
+        subset_pairs = make_subsets(pairs)
+        for memoized in (False, True):
+            times = []
+            for _ in range(repetitions):
+                symbolic.clear_caches()
+                start = time.perf_counter()
+                for _ in range(passes):
+                    compare(subset_pairs, memoized)
+                times.append(time.perf_counter() - start)
+            print(f'{passes} passes over {pairs} subset pairs, {"memoized" if memoized else "uncached"}: '
+                  f'{np.median(times) * 1000:.2f} ms')
+
+    for name, stats in symbolic.cache_statistics().items():
+        if stats.hits + stats.misses > 0:
+            print(f'{name}: {stats.hits} hits, {stats.misses} misses, {stats.time * 1000:.2f} ms computing, '
+                  f'~{stats.time_saved * 1000:.2f} ms saved')
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,71 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmarks the latency of warm calls to ``@dace.program`` functions (i.e., calls to an already compiled program),
+comparing guard-based dispatch against constructing the full program cache key on every call, and against calling the
+compiled SDFG directly.
+"""
+import click
+import dace
+import numpy as np
+import timeit
+
+N = dace.symbol('N')
+bias = np.random.rand(16)
+scale = 2.0
+
+
+@dace.program
+def annotated(a: dace.float64, x: dace.float64[N], y: dace.float64[N]):
+    y[:] = a * x + y
+
+
+@dace.program
+def unannotated(x, y):
+    y[:] = x + y
+
+
+@dace.program
+def closure(x: dace.float64[16], y: dace.float64[16]):
+    y[:] = scale * x + bias
+
+
+KERNELS = {
+    'annotated': (annotated, lambda: ((np.float64(2), np.random.rand(16), np.random.rand(16)), {})),
+    'unannotated': (unannotated, lambda: ((np.random.rand(16), np.random.rand(16)), {})),
+    'closure': (closure, lambda: ((np.random.rand(16), np.random.rand(16)), {})),
+}
+
+
+def benchmark(call, repetitions: int) -> float:
+    """ Returns the median latency of a call in microseconds. """
+    times = timeit.repeat(call, number=100, repeat=repetitions)
+    return np.median(times) / 100 * 1e6
+
+
+@click.command()
+@click.option('--repetitions', type=int, default=20)
+@click.argument('kernels', nargs=-1)
+def cli(repetitions, kernels):
+    for name in (kernels or KERNELS.keys()):
+        program, make_args = KERNELS[name]
+        args, kwargs = make_args()
+        program(*args, **kwargs)  # Compile
+
+        # Baseline: construct the full cache key on every call
+        program._guarded_calls = False
+        key_time = benchmark(lambda: program(*args, **kwargs), repetitions)
+
+        program._guarded_calls = True
+        program(*args, **kwargs)  # Register guard
+        guard_time = benchmark(lambda: program(*args, **kwargs), repetitions)
+
+        entry = next(iter(program._cache.guards.values())).entry
+        sdfg_args = program._create_sdfg_args(entry.sdfg, args, kwargs)
+        direct_time = benchmark(lambda: entry.compiled_sdfg(**sdfg_args), repetitions)
+
+        print(f'{name:12s}: cache key {key_time:8.2f} us, guards {guard_time:8.2f} us, '
+              f'compiled SDFG {direct_time:8.2f} us (speedup {key_time / guard_time:.2f}x)')
+
+
+if __name__ == '__main__':
+    cli()
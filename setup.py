@@ -87,5 +87,6 @@ setup(name='dace',
               'sdfv = dace.cli.sdfv:main',
               'sdfgcc = dace.cli.sdfgcc:main',
               'daceprof = dace.cli.daceprof:main',
+              'daceaot = dace.cli.daceaot:main',
           ],
       })
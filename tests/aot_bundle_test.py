@@ -0,0 +1,96 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests ahead-of-time compilation of programs into relocatable bundles. """
+import copy
+import importlib
+import os
+import sys
+import tempfile
+
+import dace
+import numpy as np
+from dace.cli import daceaot
+from dace.codegen import aot
+
+PACKAGE_SOURCE = '''
+import dace
+N = dace.symbol('N')
+
+
+@dace.program
+def annotated(A: dace.float64[N]):
+    A += 1
+
+
+@dace.program
+def unannotated(A):
+    A += 1
+
+
+imported = annotated
+'''
+
+
+def _create_package(path, name: str):
+    os.makedirs(os.path.join(path, name))
+    with open(os.path.join(path, name, '__init__.py'), 'w') as fp:
+        fp.write('')
+    with open(os.path.join(path, name, 'kernels.py'), 'w') as fp:
+        fp.write(PACKAGE_SOURCE)
+
+
+def test_program_hash_relocatable():
+    @dace.program
+    def prog(A: dace.float64[20]):
+        A += 1
+
+    sdfg = prog.to_sdfg()
+    moved = copy.deepcopy(sdfg)
+    for node, _ in moved.all_nodes_recursive():
+        if getattr(node, 'debuginfo', None) is not None:
+            node.debuginfo.filename = '/elsewhere/prog.py'
+    assert aot.program_hash(sdfg) == aot.program_hash(moved)
+
+
+def test_find_programs(tmp_path):
+    _create_package(tmp_path, 'aotpkg_find')
+    sys.path.insert(0, str(tmp_path))
+    try:
+        programs = daceaot.find_programs('aotpkg_find')
+        kernels = importlib.import_module('aotpkg_find.kernels')
+    finally:
+        sys.path.remove(str(tmp_path))
+
+    assert sorted(programs) == [('aotpkg_find.kernels', 'annotated'), ('aotpkg_find.kernels', 'unannotated')]
+    assert daceaot.has_declared_signature(kernels.annotated)
+    assert not daceaot.has_declared_signature(kernels.unannotated)
+
+
+def test_load_from_package_bundle(tmp_path):
+    _create_package(tmp_path, 'aotpkg_load')
+    sys.path.insert(0, str(tmp_path))
+    try:
+        kernels = importlib.import_module('aotpkg_load.kernels')
+    finally:
+        sys.path.remove(str(tmp_path))
+
+    bundle = daceaot.default_bundle('aotpkg_load')
+    assert bundle == os.path.join(str(tmp_path), 'aotpkg_load', aot.PACKAGE_BUNDLE)
+    kernels.annotated.aot_compile(bundle)
+
+    # A new program object (e.g., on import in another process) loads the build from the bundle
+    prog = dace.program(kernels.annotated.f)
+    assert len(prog._aot_builds) == 1
+    csdfg = prog.compile()
+    assert csdfg.filename.startswith(bundle)
+
+    A = np.random.rand(20)
+    expected = A + 1
+    prog(A)
+    assert np.allclose(A, expected)
+    del csdfg
+
+
+if __name__ == '__main__':
+    test_program_hash_relocatable()
+    test_find_programs(tempfile.mkdtemp())
+    test_load_from_package_bundle(tempfile.mkdtemp())
@@ -0,0 +1,103 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests safe automatic vectorization of innermost CPU maps """
+import dace
+from dace.transformation.auto import auto_optimize as aopt
+import numpy as np
+
+N = dace.symbol('N')
+
+
+def test_axpy():
+    @dace.program
+    def axpy(a: dace.float64, x: dace.float64[N], y: dace.float64[N]):
+        y[:] = a * x + y
+
+    sdfg = axpy.to_sdfg()
+    aopt.auto_optimize(sdfg, dace.DeviceType.CPU, vectorize=True)
+    assert 'vecu<double, 4>' in sdfg.generate_code()[0].code
+
+    # Test remainder handling with an odd size and unaligned arrays
+    x = np.random.rand(1031)[1:]
+    y = np.random.rand(1031)[1:]
+    expected = 2.0 * x + y
+    sdfg(a=2.0, x=x, y=y, N=1030)
+    assert np.allclose(y, expected)
+
+
+def test_float32_width():
+    @dace.program
+    def scale(x: dace.float32[N], y: dace.float32[N]):
+        y[:] = x * 3
+
+    sdfg = scale.to_sdfg()
+    assert aopt.auto_vectorize(sdfg, vector_bytes=64) == 1
+    assert 'vec<float, 16>' in sdfg.generate_code()[0].code
+
+    x = np.random.rand(37).astype(np.float32)
+    y = np.zeros_like(x)
+    sdfg(x=x, y=y, N=37)
+    assert np.allclose(y, x * 3)
+
+
+def test_shifted_access():
+    @dace.program
+    def diff(x: dace.float64[N], y: dace.float64[N]):
+        for i in dace.map[0:N - 1]:
+            y[i] = x[i + 1] - x[i]
+
+    sdfg = diff.to_sdfg()
+    assert aopt.auto_vectorize(sdfg) == 1
+
+    x = np.random.rand(67)
+    y = np.zeros_like(x)
+    sdfg(x=x, y=y, N=67)
+    assert np.allclose(y[:-1], x[1:] - x[:-1])
+
+
+def test_no_vectorization_loop_carried():
+    @dace.program
+    def carried(x: dace.float64[N]):
+        for i in dace.map[0:N - 1]:
+            x[i + 1] = x[i] * 2
+
+    sdfg = carried.to_sdfg()
+    assert aopt.auto_vectorize(sdfg) == 0
+
+
+def test_no_vectorization_strided():
+    @dace.program
+    def strided(x: dace.float64[N, N], y: dace.float64[N, N]):
+        for i, j in dace.map[0:N, 0:N]:
+            y[j, i] = x[j, i] + 1
+
+    sdfg = strided.to_sdfg()
+    assert aopt.auto_vectorize(sdfg) == 0
+
+
+def test_no_vectorization_calls():
+    @dace.program
+    def exps(x: dace.float64[N], y: dace.float64[N]):
+        y[:] = np.exp(x)
+
+    sdfg = exps.to_sdfg()
+    assert aopt.auto_vectorize(sdfg) == 0
+
+
+def test_no_vectorization_wcr():
+    @dace.program
+    def sum(A: dace.float64[N], output: dace.float64[1]):
+        for i in dace.map[0:N]:
+            output += A[i]
+
+    sdfg = sum.to_sdfg()
+    assert aopt.auto_vectorize(sdfg) == 0
+
+
+if __name__ == '__main__':
+    test_axpy()
+    test_float32_width()
+    test_shifted_access()
+    test_no_vectorization_loop_carried()
+    test_no_vectorization_strided()
+    test_no_vectorization_calls()
+    test_no_vectorization_wcr()
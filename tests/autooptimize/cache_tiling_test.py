@@ -0,0 +1,104 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests cache-aware automatic tiling of CPU maps """
+import dace
+from dace.transformation.auto import auto_optimize as aopt
+from dace.transformation.auto import cache_tiling
+from dace.transformation.dataflow import MapTiling
+import numpy as np
+
+N = dace.symbol('N')
+
+
+@dace.program
+def matmul(A: dace.float64[300, 300], B: dace.float64[300, 300], C: dace.float64[300, 300]):
+    for i, j in dace.map[0:300, 0:300]:
+        for k in range(300):
+            C[i, j] += A[i, k] * B[k, j]
+
+
+@dace.program
+def stencil(A: dace.float64[N, N], B: dace.float64[N, N]):
+    for i, j in dace.map[1:N - 1, 1:N - 1]:
+        B[i, j] = 0.2 * (A[i, j] + A[i - 1, j] + A[i + 1, j] + A[i, j - 1] + A[i, j + 1])
+
+
+def test_cache_sizes():
+    with dace.config.set_temporary('optimizer', 'autotile_cache_sizes', value='48K,2M'):
+        assert cache_tiling.get_cache_sizes() == [48 * 1024, 2 * 1024 * 1024]
+    assert len(cache_tiling.get_cache_sizes()) > 0
+
+
+def test_footprint():
+    sdfg = stencil.to_sdfg(simplify=True)
+    state = sdfg.start_state
+    map_entry = next(n for n in state.nodes() if isinstance(n, dace.nodes.MapEntry))
+    footprint = cache_tiling.map_data_footprint(sdfg, state, map_entry, [16, 16])
+    assert footprint['A'] == 18 * 18 * 8
+    assert footprint['B'] == 16 * 16 * 8
+
+
+def test_tile_matmul():
+    sdfg = matmul.to_sdfg(simplify=True)
+    with dace.config.set_temporary('optimizer', 'autotile_cache_sizes', value='32K,256K'):
+        decisions = cache_tiling.cache_tile_maps(sdfg)
+    assert len(decisions) == 1
+    _, tile_sizes, footprint = decisions[0]
+    assert all(ts < 300 for ts in tile_sizes)
+    assert footprint <= 128 * 1024
+    assert any(isinstance(xform, MapTiling) for xform in sdfg.transformation_hist)
+
+    A = np.random.rand(300, 300)
+    B = np.random.rand(300, 300)
+    C = np.zeros((300, 300))
+    sdfg(A=A, B=B, C=C)
+    assert np.allclose(C, A @ B)
+
+
+def test_tile_stencil_local_storage():
+    sdfg = stencil.to_sdfg(simplify=True)
+    with dace.config.set_temporary('optimizer', 'autotile_cache_sizes', value='32K,256K'):
+        decisions = cache_tiling.cache_tile_maps(sdfg, local_storage=True)
+    assert len(decisions) == 1
+
+    A = np.random.rand(200, 200)
+    B = np.zeros((200, 200))
+    sdfg(A=A, B=B, N=200)
+    expected = 0.2 * (A[1:-1, 1:-1] + A[:-2, 1:-1] + A[2:, 1:-1] + A[1:-1, :-2] + A[1:-1, 2:])
+    assert np.allclose(B[1:-1, 1:-1], expected)
+
+
+def test_no_tiling_without_reuse():
+    @dace.program
+    def elementwise(A: dace.float64[N, N], B: dace.float64[N, N]):
+        for i, j in dace.map[0:N, 0:N]:
+            B[i, j] = A[i, j] + 1
+
+    sdfg = elementwise.to_sdfg(simplify=True)
+    assert len(cache_tiling.cache_tile_maps(sdfg)) == 0
+
+
+def test_no_tiling_small():
+    @dace.program
+    def small(A: dace.float64[16, 16], B: dace.float64[16, 16]):
+        for i, j in dace.map[1:15, 1:15]:
+            B[i, j] = A[i - 1, j] + A[i + 1, j]
+
+    sdfg = small.to_sdfg(simplify=True)
+    assert len(cache_tiling.cache_tile_maps(sdfg)) == 0
+
+
+def test_auto_optimize():
+    sdfg = stencil.to_sdfg(simplify=True)
+    with dace.config.set_temporary('optimizer', 'autotile_cache_sizes', value='32K,256K'):
+        aopt.auto_optimize(sdfg, dace.DeviceType.CPU, tile_for_cache=True)
+    assert any(isinstance(xform, MapTiling) for xform in sdfg.transformation_hist)
+
+
+if __name__ == '__main__':
+    test_cache_sizes()
+    test_footprint()
+    test_tile_matmul()
+    test_tile_stencil_local_storage()
+    test_no_tiling_without_reuse()
+    test_no_tiling_small()
+    test_auto_optimize()
@@ -0,0 +1,61 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests symbol-specialized multi-versioned SDFGs with runtime dispatch """
+import dace
+from dace.transformation.auto import multiversion
+import numpy as np
+
+N = dace.symbol('N')
+
+
+@dace.program
+def axpy(a: dace.float64, x: dace.float64[N], y: dace.float64[N]):
+    y[:] = a * x + y
+
+
+def test_variant_conditions():
+    assert multiversion.variant_condition({'N': 4, 'M': 2}) == '(M == 2) and (N == 4)'
+    assert multiversion.variant_condition('N <= 64') == 'N <= 64'
+
+
+def test_specialize_variant():
+    sdfg = axpy.to_sdfg(simplify=True)
+    multiversion.specialize_variant(sdfg, {'N': 32})
+    assert 'N' not in sdfg.free_symbols
+    assert sdfg.arrays['x'].shape == (32, )
+
+
+def test_multiversion_sdfg():
+    sdfg = axpy.to_sdfg(simplify=True)
+    versions = []
+    mvsdfg = multiversion.multiversion(sdfg, [{'N': 32}, 'N <= 16'], lambda v, variant: versions.append(variant))
+    mvsdfg.validate()
+    assert versions == [{'N': 32}, 'N <= 16', None]
+    assert mvsdfg.free_symbols == {'N'}
+    assert len(list(mvsdfg.all_sdfgs_recursive())) == 4
+
+    for n in (8, 32, 45):
+        x = np.random.rand(n)
+        y = np.random.rand(n)
+        expected = 2.0 * x + y
+        mvsdfg(a=2.0, x=x, y=y, N=n)
+        assert np.allclose(y, expected)
+
+
+def test_multiversion_program():
+    @dace.program(auto_optimize=True, symbol_variants=[{'N': 20}, {'N': 1000}])
+    def scale(x: dace.float64[N]):
+        return x * 2
+
+    for n in (20, 1000, 33):
+        x = np.random.rand(n)
+        assert np.allclose(scale(x), x * 2)
+
+    # A single compiled program is reused for all sizes
+    assert len(scale._cache.cache) == 1
+
+
+if __name__ == '__main__':
+    test_variant_conditions()
+    test_specialize_variant()
+    test_multiversion_sdfg()
+    test_multiversion_program()
@@ -0,0 +1,94 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests profile-guided optimization of SDFGs and DaCe programs """
+import copy
+import os
+
+import dace
+from dace.codegen import compiler
+from dace.transformation.auto import profile_guided as pgo
+from dace.transformation.auto.auto_optimize import auto_optimize
+import numpy as np
+
+N = dace.symbol('N')
+
+
+@dace.program
+def twomaps(x: dace.float64[N], y: dace.float64[N], z: dace.float64[N, N]):
+    y[:] = x * 2 + y
+    for i, j in dace.map[0:N, 0:N]:
+        z[i, j] = x[i] + x[j]
+
+
+def _optimized_sdfg():
+    sdfg = twomaps.to_sdfg()
+    auto_optimize(sdfg, dace.DeviceType.CPU, vectorize=False, tile_for_cache=False)
+    sdfg.simplify()
+    return sdfg
+
+
+def test_instrument_maps():
+    sdfg = _optimized_sdfg()
+    uuids = pgo.instrument_maps(sdfg)
+    assert len(uuids) == 2
+    for sdfg_id, state_id, node_id in uuids:
+        node = sdfg.sdfg_list[sdfg_id].node(state_id).node(node_id)
+        assert isinstance(node, dace.nodes.MapEntry)
+        assert node.map.instrument == dace.InstrumentationType.Timer
+
+
+def test_optimize_from_profile():
+    sdfg = _optimized_sdfg()
+    uuids = pgo.instrument_maps(copy.deepcopy(sdfg))
+    hot, cold = uuids
+    hot_map = sdfg.sdfg_list[hot[0]].node(hot[1]).node(hot[2]).map
+    cold_map = sdfg.sdfg_list[cold[0]].node(cold[1]).node(cold[2]).map
+
+    decisions = pgo.optimize_from_profile(sdfg, {hot: 10.0, cold: 0.001})
+    sdfg.validate()
+    assert decisions['sequential'] == [cold_map.label]
+    assert cold_map.schedule == dace.ScheduleType.Sequential
+    assert hot_map.schedule == dace.ScheduleType.CPU_Multicore
+    assert decisions['vectorized'] == [hot_map.label]
+
+
+def test_pgo_flags(tmp_path):
+    with dace.config.temporary_config():
+        dace.Config.set('compiler', 'cpu', 'pgo', value='')
+        assert compiler.get_pgo_flags(str(tmp_path)) == ''
+
+        dace.Config.set('compiler', 'cpu', 'pgo', value='generate')
+        assert '-fprofile-generate=' in compiler.get_pgo_flags(str(tmp_path))
+        assert os.path.isdir(os.path.join(tmp_path, 'profile'))
+
+        dace.Config.set('compiler', 'cpu', 'pgo', value='use')
+        assert '-fprofile-use=' in compiler.get_pgo_flags(str(tmp_path))
+
+
+def test_profile_guided_program():
+
+    @dace.program(auto_optimize=True)
+    def pgo_axpy(a: dace.float64, x: dace.float64[N], y: dace.float64[N]):
+        y[:] = a * x + y
+
+    inputs = [(2.0, np.random.rand(n), np.random.rand(n)) for n in (1000, 20000)]
+    csdfg = pgo_axpy.profile_guided_compile(inputs, repetitions=2)
+    assert os.path.isfile(os.path.join(pgo_axpy.profile_guided_build_folder, 'pgo.json'))
+
+    x = np.random.rand(500)
+    y = np.random.rand(500)
+    expected = 3.0 * x + y
+    pgo_axpy(3.0, x, y)
+    assert np.allclose(y, expected)
+
+    # A new program object (e.g., in a new process) loads the tuned binary
+    reloaded = copy.deepcopy(pgo_axpy)
+    reloaded._cache.clear()
+    assert reloaded.compile(3.0, x, y).filename.startswith(os.path.abspath(pgo_axpy.profile_guided_build_folder))
+    del csdfg
+
+
+if __name__ == '__main__':
+    test_instrument_maps()
+    test_optimize_from_profile()
+    test_pgo_flags(dace.config.tempfile.mkdtemp())
+    test_profile_guided_program()
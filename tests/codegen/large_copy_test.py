@@ -0,0 +1,65 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests parallel and non-temporal copies of large arrays on the CPU. """
+import dace
+import numpy as np
+
+N = dace.symbol('N')
+
+
+def _copy_sdfg(name: str, src_shape, dst_shape, memlet: str) -> dace.SDFG:
+    sdfg = dace.SDFG(name)
+    sdfg.add_array('A', src_shape, dace.float64)
+    sdfg.add_array('B', dst_shape, dace.float64)
+    state = sdfg.add_state()
+    state.add_nedge(state.add_read('A'), state.add_write('B'), dace.Memlet(memlet))
+    return sdfg
+
+
+def test_large_copy_codegen():
+    contiguous = _copy_sdfg('large_copy_contiguous', [1024], [1024], 'A[0:1024]')
+    strided = _copy_sdfg('large_copy_strided', [64, 32], [64, 16], 'A[0:64, 8:24] -> 0:64, 0:16')
+    dynamic = _copy_sdfg('large_copy_dynamic', [N], [N], 'A[0:N]')
+
+    with dace.config.set_temporary('compiler', 'cpu', 'parallel_copy_bytes', value=1024):
+        assert 'dace::LargeCopy' in contiguous.generate_code()[0].clean_code
+        assert '__copy_i' in strided.generate_code()[0].clean_code
+        assert 'dace::LargeCopy' in dynamic.generate_code()[0].clean_code
+
+    # Copies below the thresholds remain unchanged
+    with dace.config.set_temporary('compiler', 'cpu', 'parallel_copy_bytes', value=1 << 20):
+        code = strided.generate_code()[0].clean_code
+        assert '__copy_i' not in code and 'CopyND' in code
+
+    # Disabled
+    with dace.config.set_temporary('compiler', 'cpu', 'parallel_copy_bytes', value=0):
+        with dace.config.set_temporary('compiler', 'cpu', 'nontemporal_copy_bytes', value=0):
+            assert 'dace::LargeCopy' not in dynamic.generate_code()[0].clean_code
+
+
+def test_large_copy():
+    contiguous = _copy_sdfg('large_copy_contiguous_run', [N], [N], 'A[0:N]')
+    strided = _copy_sdfg('large_copy_strided_run', [128, 64], [128, 31], 'A[0:128, 3:34] -> 0:128, 0:31')
+    column = _copy_sdfg('large_copy_column_run', [4096, 3], [4096], 'A[0:4096, 1] -> 0:4096')
+
+    with dace.config.set_temporary('compiler', 'cpu', 'parallel_copy_bytes', value=1024):
+        with dace.config.set_temporary('compiler', 'cpu', 'nontemporal_copy_bytes', value=4096):
+            for n in (100, 1001, 100003):
+                A = np.random.rand(n)
+                B = np.zeros([n])
+                contiguous(A=A, B=B, N=n)
+                assert np.array_equal(A, B)
+
+            A = np.random.rand(128, 64)
+            B = np.zeros([128, 31])
+            strided(A=A, B=B)
+            assert np.array_equal(A[:, 3:34], B)
+
+            A = np.random.rand(4096, 3)
+            B = np.zeros([4096])
+            column(A=A, B=B)
+            assert np.array_equal(A[:, 1], B)
+
+
+if __name__ == '__main__':
+    test_large_copy_codegen()
+    test_large_copy()
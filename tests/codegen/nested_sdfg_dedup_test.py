@@ -0,0 +1,92 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests generating a single function for structurally equivalent nested SDFGs. """
+import re
+
+import dace
+import numpy as np
+from dace.sdfg import utils as sdutils
+
+N = dace.symbol('N')
+
+
+@dace.program
+def absdouble(x: dace.float64[N], y: dace.float64[N]):
+    for i in range(N):
+        if x[i] > 0:
+            y[i] = x[i] * 2
+        else:
+            y[i] = -x[i]
+
+
+@dace.program
+def absdouble_f32(x: dace.float32[N], y: dace.float32[N]):
+    for i in range(N):
+        if x[i] > 0:
+            y[i] = x[i] * 2
+        else:
+            y[i] = -x[i]
+
+
+@dace.program
+def calls(A: dace.float64[N], B: dace.float64[N], C: dace.float64[N], D: dace.float64[N]):
+    absdouble(A, B)
+    absdouble(B, C)
+    absdouble(C, D)
+
+
+def _nested_functions(sdfg: dace.SDFG):
+    return re.findall(r'inline void (\w+)\(', sdfg.generate_code()[0].clean_code)
+
+
+def _nested_sdfgs(sdfg: dace.SDFG):
+    return [node.sdfg for node, _ in sdfg.all_nodes_recursive() if isinstance(node, dace.nodes.NestedSDFG)]
+
+
+def test_structural_hashes():
+    sdfg = calls.to_sdfg(simplify=False)
+    nested = _nested_sdfgs(sdfg)
+    assert len(nested) == 3
+    # Nested SDFGs differ in the names of their transients
+    assert len(set(nsdfg.hash_sdfg() for nsdfg in nested)) == 3
+
+    hashes = sdutils.structural_hashes(sdfg)
+    assert len(hashes) == len(list(sdfg.all_sdfgs_recursive()))
+    assert len(set(hashes[nsdfg.sdfg_id] for nsdfg in nested)) == 1
+
+    # Data types are part of the structure
+    float64_hash = sdutils.structural_hashes(absdouble.to_sdfg(simplify=False))[0]
+    float32_hash = sdutils.structural_hashes(absdouble_f32.to_sdfg(simplify=False))[0]
+    assert float64_hash != float32_hash
+
+
+def test_structural_dedup():
+    sdfg = calls.to_sdfg(simplify=False)
+    assert len(_nested_functions(sdfg)) == 1
+    with dace.config.set_temporary('compiler', 'unique_functions', value='none'):
+        assert len(_nested_functions(sdfg)) == 3
+
+    A = np.random.rand(20) - 0.5
+    B, C, D = (np.random.rand(20) for _ in range(3))
+    expected_B = np.where(A > 0, A * 2, -A)
+    expected_C = expected_B * 2
+    expected_D = expected_C * 2
+    sdfg(A=A, B=B, C=C, D=D, N=20)
+    assert np.allclose(B, expected_B)
+    assert np.allclose(C, expected_C)
+    assert np.allclose(D, expected_D)
+
+
+def test_dedup_persistent():
+    sdfg = calls.to_sdfg(simplify=False)
+    for nsdfg in _nested_sdfgs(sdfg):
+        for desc in nsdfg.arrays.values():
+            if desc.transient:
+                desc.lifetime = dace.AllocationLifetime.Persistent
+    # Persistent transients are allocated separately for each nested SDFG
+    assert len(_nested_functions(sdfg)) == 3
+
+
+if __name__ == '__main__':
+    test_structural_hashes()
+    test_structural_dedup()
+    test_dedup_persistent()
@@ -0,0 +1,107 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests generating the dataflow of states as OpenMP tasks with dependencies. """
+import dace
+import numpy as np
+
+N = dace.symbol('N')
+
+
+@dace.program
+def independent_maps(A: dace.float64[N], B: dace.float64[N], C: dace.float64[N], D: dace.float64[N],
+                     E: dace.float64[N]):
+    C[:] = A * 2
+    D[:] = B + 1
+    E[:] = C + D
+
+
+@dace.program
+def tasks_in_loop(A: dace.float64[N], B: dace.float64[N]):
+    for i in range(5):
+        tmp = A * 2
+        B[:] = tmp + B
+        A[:] = B - 1
+        if i % 2 == 0:
+            A[0] = 3.0
+
+
+def _chain_sdfg() -> dace.SDFG:
+    sdfg = dace.SDFG('openmp_task_chain')
+    for name in 'ABCD':
+        sdfg.add_array(name, [N], dace.float64)
+
+    first = sdfg.add_state()
+    first.add_mapped_tasklet('double',
+                             dict(i='0:N'),
+                             dict(a=dace.Memlet('A[i]')),
+                             'b = 2 * a',
+                             dict(b=dace.Memlet('B[i]')),
+                             schedule=dace.ScheduleType.CPU_Multicore,
+                             external_edges=True)
+    second = sdfg.add_state_after(first)
+    second.add_mapped_tasklet('increment',
+                              dict(i='0:N'),
+                              dict(a=dace.Memlet('A[i]')),
+                              'c = a + 1',
+                              dict(c=dace.Memlet('C[i]')),
+                              external_edges=True)
+    third = sdfg.add_state_after(second)
+    third.add_mapped_tasklet('add',
+                             dict(i='0:N'),
+                             dict(b=dace.Memlet('B[i]'), c=dace.Memlet('C[i]')),
+                             'd = b + c',
+                             dict(d=dace.Memlet('D[i]')),
+                             external_edges=True)
+    return sdfg
+
+
+def test_openmp_tasks_in_state():
+    sdfg = independent_maps.to_sdfg()
+    sdfg.openmp_tasks = True
+    code = sdfg.generate_code()[0].clean_code
+    assert code.count('#pragma omp task ') == 3
+    assert 'depend(in: C, D) depend(out: E)' in code
+    assert '#pragma omp taskloop' in code and '#pragma omp parallel for' not in code
+
+    A, B = np.random.rand(100), np.random.rand(100)
+    C, D, E = np.zeros([100]), np.zeros([100]), np.zeros([100])
+    sdfg(A=A, B=B, C=C, D=D, E=E, N=100)
+    assert np.allclose(E, 2 * A + B + 1)
+
+    # Disabled
+    sdfg.openmp_tasks = False
+    assert '#pragma omp task' not in sdfg.generate_code()[0].clean_code
+
+
+def test_openmp_tasks_across_states():
+    sdfg = _chain_sdfg()
+    sdfg.openmp_tasks = True
+    code = sdfg.generate_code()[0].clean_code
+    # All three states share one task region
+    assert code.count('#pragma omp single') == 1
+    assert code.count('#pragma omp task ') == 3
+
+    A = np.random.rand(200)
+    B, C, D = np.zeros([200]), np.zeros([200]), np.zeros([200])
+    sdfg(A=A, B=B, C=C, D=D, N=200)
+    assert np.allclose(D, 3 * A + 1)
+
+    # Assignments on the inter-state edge separate the task regions
+    sdfg.edges()[1].data.assignments['j'] = '1'
+    assert sdfg.generate_code()[0].clean_code.count('#pragma omp single') == 1
+
+
+def test_openmp_tasks_control_flow():
+    sdfg = tasks_in_loop.to_sdfg()
+    sdfg.openmp_tasks = True
+    A, B = np.random.rand(100), np.random.rand(100)
+    expected_A, expected_B = np.copy(A), np.copy(B)
+    tasks_in_loop.f(expected_A, expected_B)
+    sdfg(A=A, B=B, N=100)
+    assert np.allclose(A, expected_A)
+    assert np.allclose(B, expected_B)
+
+
+if __name__ == '__main__':
+    test_openmp_tasks_in_state()
+    test_openmp_tasks_across_states()
+    test_openmp_tasks_control_flow()
@@ -0,0 +1,102 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests generating the code of nested SDFGs in parallel worker processes. """
+import copy
+import multiprocessing
+
+import dace
+import numpy as np
+import pytest
+from dace.codegen import codegen
+from dace.codegen.common import CodegenTimer
+
+N = dace.symbol('N')
+
+pytestmark = pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(),
+                                reason='Parallel code generation requires forking processes')
+
+
+@dace.program
+def branches(A: dace.float64[N], B: dace.float64[N]):
+    for i in range(N):
+        if A[i] > 0.5:
+            B[i] = A[i] * 2
+        else:
+            B[i] = A[i] + 1
+
+
+@dace.program
+def scale(A: dace.float64[N], B: dace.float64[N]):
+    tmp = np.ndarray([N], dace.float64)
+    tmp[:] = A * 3
+    B[:] = tmp + B
+
+
+@dace.program
+def nested_calls(A: dace.float64[N], B: dace.float64[N], C: dace.float64[N], D: dace.float64[N]):
+    branches(A, B)
+    scale(B, C)
+    branches(C, D)
+    scale(A, D)
+
+
+@dace.program
+def independent_calls(A: dace.float64[N], B: dace.float64[N], C: dace.float64[N], D: dace.float64[N]):
+    branches(A, B)
+    branches(C, D)
+
+
+def _generate(sdfg: dace.SDFG, workers: int):
+    sdfg = copy.deepcopy(sdfg)
+    sdfg.fill_scope_connectors()
+    timer = CodegenTimer()
+    with dace.config.set_temporary('compiler', 'codegen_workers', value=workers):
+        code = [obj.clean_code for obj in codegen.generate_code(sdfg, timer=timer)]
+    return code, timer
+
+
+def test_parallel_codegen():
+    sdfg = nested_calls.to_sdfg(simplify=False)
+    sequential, _ = _generate(sdfg, 0)
+    parallel, timer = _generate(sdfg, 2)
+    assert parallel == sequential
+    # Both calls to each program share one function
+    assert timer.counters['nested SDFGs generated in parallel'] == 2
+
+    A, B, C, D = (np.random.rand(20) for _ in range(4))
+    expected_B = np.where(A > 0.5, A * 2, A + 1)
+    expected_C = expected_B * 3 + C
+    expected_D = np.where(expected_C > 0.5, expected_C * 2, expected_C + 1) + A * 3
+    with dace.config.set_temporary('compiler', 'codegen_workers', value=2):
+        sdfg(A=A, B=B, C=C, D=D, N=20)
+    assert np.allclose(B, expected_B)
+    assert np.allclose(C, expected_C)
+    assert np.allclose(D, expected_D)
+
+
+def test_parallel_codegen_fallback():
+    sdfg = independent_calls.to_sdfg(simplify=False)
+    # Nested SDFGs that are generated within OpenMP tasks cannot be generated ahead of time
+    sdfg.openmp_tasks = True
+    with dace.config.set_temporary('compiler', 'unique_functions', value='none'):
+        sequential, _ = _generate(sdfg, 0)
+        assert '#pragma omp task ' in sequential[0]
+        parallel, timer = _generate(sdfg, 2)
+    assert parallel == sequential
+    assert timer.counters['nested SDFGs generated in parallel'] == 0
+    assert timer.counters['nested SDFGs regenerated sequentially'] > 0
+
+
+def test_codegen_timing(capsys):
+    sdfg = nested_calls.to_sdfg(simplify=False)
+    with dace.config.set_temporary('compiler', 'codegen_timing', value=True):
+        sdfg.generate_code()
+    output = capsys.readouterr().out
+    assert 'Code generation timing' in output
+    for phase in ('preprocessing', 'allocation lifetime', 'dispatch'):
+        assert phase in output
+
+
+if __name__ == '__main__':
+    test_parallel_codegen()
+    test_parallel_codegen_fallback()
+    test_codegen_timing()
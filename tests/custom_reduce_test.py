@@ -17,5 +17,30 @@ def test_custom_reduce():
     assert diff <= 1e-5
 
 
+def test_custom_wcr_parallel():
+    """ Tests lock-free custom write-conflict resolution in parallel maps, with 8- and 16-byte types. """
+    N, M = 10000, 7
+
+    for dtype in (dace.float64, dace.complex128):
+
+        @dace.program
+        def scatter(x: dtype[N], out: dtype[M]):
+            for i in dace.map[0:N]:
+                with dace.tasklet:
+                    a << x[i]
+                    o >> out(1, lambda a, b: a + b * b)[i % M]
+                    o = a
+
+        x = np.random.rand(N).astype(dtype.type)
+        if dtype is dace.complex128:
+            x += 1j * np.random.rand(N)
+        out = np.zeros([M], dtype=dtype.type)
+        scatter(x, out)
+
+        expected = np.array([np.sum(x[j::M]**2) for j in range(M)])
+        assert np.allclose(out, expected)
+
+
 if __name__ == "__main__":
     test_custom_reduce()
+    test_custom_wcr_parallel()
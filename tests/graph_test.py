@@ -106,6 +106,71 @@ class TestOrderedGraphs(unittest.TestCase):
         self.assertEqual(next(bfs_edges), e6)
         self.assertEqual(next(bfs_edges), e7)
 
+    def test_node_and_edge_ids(self):
+        g = OrderedMultiDiGraph()
+        e0 = g.add_edge(0, 1, "abc")
+        e1 = g.add_edge(1, 2, "def")
+        e2 = g.add_edge(2, 3, "ghi")
+        e3 = g.add_edge(3, 4, "jkl")
+        self.assertEqual([g.node_id(n) for n in range(5)], list(range(5)))
+        self.assertEqual([g.edge_id(e) for e in (e0, e1, e2, e3)], list(range(4)))
+        self.assertEqual(g.node(3), 3)
+        # Removing the last node keeps the IDs
+        g.remove_node(4)
+        self.assertEqual(g.node_id(3), 3)
+        self.assertRaises(NodeNotFoundError, g.node_id, 4)
+        self.assertRaises(NodeNotFoundError, g.node, 4)
+        self.assertRaises(EdgeNotFoundError, g.edge_id, e3)
+        # Removing another node compacts the IDs
+        g.remove_node(1)
+        self.assertEqual([g.node_id(n) for n in (0, 2, 3)], [0, 1, 2])
+        self.assertEqual(g.node(1), 2)
+        self.assertEqual(g.edge_id(e2), 0)
+        g.add_node(5)
+        e4 = g.add_edge(5, 0, "mno")
+        self.assertEqual(g.node_id(5), 3)
+        self.assertEqual(g.edge_id(e4), 1)
+        for i, n in enumerate(g.nodes()):
+            self.assertEqual(g.node_id(n), i)
+            self.assertEqual(g.node(i), n)
+
+    def test_lazy_networkx(self):
+        g = OrderedMultiDiGraph()
+        e0 = g.add_edge(0, 1, "abc")
+        e1 = g.add_edge(0, 1, "def")
+        g.add_edge(1, 2, "ghi")
+        self.assertNotEqual(e0.key, e1.key)
+        self.assertEqual(g.nx.number_of_edges(), 3)
+        self.assertEqual(g.nx.edges[0, 1, e1.key]['data'], "def")
+        self.assertIs(g.nx, g.nx)
+        g.remove_edge(e0)
+        self.assertEqual(g.nx.number_of_edges(), 2)
+        g.add_node(3)
+        self.assertEqual(g.nx.number_of_nodes(), 4)
+        g.remove_node(2)
+        self.assertEqual(sorted(g.nx.nodes()), [0, 1, 3])
+        self.assertEqual(g.in_degree(1), 1)
+        self.assertEqual(g.out_degree(0), 1)
+
+    def test_reachability(self):
+        g = OrderedDiGraph()
+        g.add_edge(0, 1, None)
+        g.add_edge(1, 2, None)
+        g.add_edge(0, 3, None)
+        g.add_node(4)
+        self.assertTrue(g.has_path(0, 2))
+        self.assertTrue(g.has_path(2, 2))
+        self.assertFalse(g.has_path(2, 0))
+        self.assertFalse(g.has_path(3, 2))
+        self.assertFalse(g.has_path(0, 4))
+        self.assertRaises(NodeNotFoundError, g.has_path, 0, 5)
+        self.assertFalse(g.has_cycles())
+        g.add_edge(2, 3, None)
+        self.assertFalse(g.has_cycles())
+        g.add_edge(3, 1, None)
+        self.assertTrue(g.has_cycles())
+        self.assertTrue(g.has_path(3, 2))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,60 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests lazy loading of DaCe modules and benchmarks the time of ``import dace``. """
+import subprocess
+import sys
+
+#: Modules that are only loaded on first use, rather than on ``import dace``
+LAZY_MODULES = ('sympy', 'networkx', 'dace.sdfg', 'dace.frontend.python.parser', 'dace.transformation')
+
+#: Modules that are not necessary to load and call precompiled programs
+NON_RUNTIME_MODULES = ('dace.frontend.python.parser', 'dace.frontend.python.newast', 'dace.transformation',
+                       'dace.codegen.targets')
+
+
+def _run(code: str) -> str:
+    """ Runs Python code in a new interpreter and returns its output. """
+    return subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _loaded_modules(code: str, modules) -> str:
+    return _run(f'import sys; {code}; print(",".join(m for m in {modules!r} if m in sys.modules))')
+
+
+def _import_time(code: str, repetitions: int = 5) -> float:
+    """ Returns the minimum time of running the given code in a new interpreter, in seconds. """
+    times = [
+        float(_run(f'import time; start = time.perf_counter(); {code}; print(time.perf_counter() - start)'))
+        for _ in range(repetitions)
+    ]
+    return min(times)
+
+
+def test_lazy_modules():
+    assert _loaded_modules('import dace', LAZY_MODULES) == ''
+
+
+def test_lazy_attributes():
+    _run('import dace; from dace.sdfg import SDFG; from dace.frontend.python import interface; '
+         'assert dace.SDFG is SDFG; assert dace.program is interface.program; '
+         'assert dace.data.Array is not None; assert "SDFG" in dir(dace)')
+
+
+def test_runtime_import_path():
+    code = 'from dace.sdfg.utils import load_precompiled_sdfg'
+    assert _loaded_modules(code, NON_RUNTIME_MODULES) == ''
+
+
+def test_import_time_benchmark():
+    lazy = _import_time('import dace')
+    runtime = _import_time('import dace; from dace.sdfg.utils import load_precompiled_sdfg')
+    full = _import_time('import dace; dace.program; dace.SDFG')
+    print(f'import dace: {lazy * 1000:.1f} ms, runtime-only: {runtime * 1000:.1f} ms, '
+          f'with Python frontend: {full * 1000:.1f} ms')
+    assert lazy < full
+
+
+if __name__ == '__main__':
+    test_lazy_modules()
+    test_lazy_attributes()
+    test_runtime_import_path()
+    test_import_time_benchmark()
@@ -0,0 +1,125 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import dace
+import numpy as np
+import pytest
+from dace.libraries.fft import FFT
+
+N = dace.symbol('N')
+
+_params = ['pure', pytest.param('FFTW', marks=pytest.mark.fftw)]
+
+
+def _set_implementation(sdfg: dace.SDFG, impl: str):
+    for node, _ in sdfg.all_nodes_recursive():
+        if isinstance(node, FFT):
+            node.implementation = impl
+
+
+@pytest.mark.parametrize('impl', _params)
+@pytest.mark.parametrize('norm', [None, 'ortho', 'forward'])
+def test_fft(impl, norm):
+
+    @dace.program
+    def fft(a: dace.complex128[N, 6]):
+        return np.fft.fft(a, norm=norm), np.fft.ifft(a, axis=0, norm=norm)
+
+    sdfg = fft.to_sdfg()
+    _set_implementation(sdfg, impl)
+    a = np.random.rand(7, 6) + 1j * np.random.rand(7, 6)
+    forward, inverse = sdfg(a=a, N=7)
+    assert np.allclose(forward, np.fft.fft(a, norm=norm))
+    assert np.allclose(inverse, np.fft.ifft(a, axis=0, norm=norm))
+
+
+@pytest.mark.parametrize('impl', _params)
+def test_fftn_resize(impl):
+
+    @dace.program
+    def fftn_resize(a: dace.float32[5, 6, 4]):
+        return np.fft.fft2(a, s=(7, 3)), np.fft.ifftn(a, axes=(2, 0))
+
+    sdfg = fftn_resize.to_sdfg()
+    _set_implementation(sdfg, impl)
+    a = np.random.rand(5, 6, 4).astype(np.float32)
+    resized, permuted = sdfg(a=a)
+    assert resized.dtype == np.complex128
+    assert np.allclose(resized, np.fft.fft2(a, s=(7, 3)), atol=1e-5)
+    assert np.allclose(permuted, np.fft.ifftn(a, axes=(2, 0)), atol=1e-5)
+
+
+@pytest.mark.parametrize('impl', _params)
+@pytest.mark.parametrize('n', [8, 9])
+def test_rfft_roundtrip(impl, n):
+
+    @dace.program
+    def rfft_roundtrip(a: dace.float64[4, N]):
+        b = np.fft.rfft(a)
+        return b, np.fft.irfft(b, n=N)
+
+    sdfg = rfft_roundtrip.to_sdfg()
+    _set_implementation(sdfg, impl)
+    a = np.random.rand(4, n)
+    spectrum, signal = sdfg(a=a, N=n)
+    assert np.allclose(spectrum, np.fft.rfft(a))
+    assert np.allclose(signal, a)
+
+
+@pytest.mark.parametrize('impl', _params)
+def test_rfftn(impl):
+
+    @dace.program
+    def rfftn(a: dace.float64[6, 5, 4], b: dace.complex128[6, 5, 3]):
+        return np.fft.rfftn(a, axes=(0, 2), norm='ortho'), np.fft.irfftn(b[:, 1:4, :], s=(6, 5))
+
+    sdfg = rfftn.to_sdfg()
+    _set_implementation(sdfg, impl)
+    a = np.random.rand(6, 5, 4)
+    b = np.random.rand(6, 5, 3) + 1j * np.random.rand(6, 5, 3)
+    forward, inverse = sdfg(a=a, b=b)
+    assert np.allclose(forward, np.fft.rfftn(a, axes=(0, 2), norm='ortho'))
+    assert np.allclose(inverse, np.fft.irfftn(b[:, 1:4, :], s=(6, 5)))
+
+
+def test_fft_invalid():
+
+    @dace.program
+    def fft_duplicate_axes(a: dace.complex128[4, 4]):
+        return np.fft.fftn(a, axes=(0, 0))
+
+    with pytest.raises(Exception, match='unique'):
+        fft_duplicate_axes.to_sdfg()
+
+    @dace.program
+    def fft_invalid_norm(a: dace.complex128[4, 4]):
+        return np.fft.fft(a, norm='none')
+
+    with pytest.raises(Exception, match='norm'):
+        fft_invalid_norm.to_sdfg()
+
+
+@pytest.mark.gpu
+def test_fft_gpu():
+
+    @dace.program
+    def fft_gpu(a: dace.complex128[16, 32, 64], b: dace.float64[64, 128]):
+        return np.fft.fftn(a, axes=(0, 2)), np.fft.irfft2(np.fft.rfft2(b))
+
+    sdfg = fft_gpu.to_sdfg()
+    sdfg.apply_gpu_transformations()
+    _set_implementation(sdfg, 'cuFFT')
+    a = np.random.rand(16, 32, 64) + 1j * np.random.rand(16, 32, 64)
+    b = np.random.rand(64, 128)
+    spectrum, signal = sdfg(a=a, b=b)
+    assert np.allclose(spectrum, np.fft.fftn(a, axes=(0, 2)))
+    assert np.allclose(signal, b)
+
+
+if __name__ == '__main__':
+    for p in ('pure', 'FFTW'):
+        for norm in (None, 'ortho', 'forward'):
+            test_fft(p, norm)
+        test_fftn_resize(p)
+        test_rfft_roundtrip(p, 8)
+        test_rfft_roundtrip(p, 9)
+        test_rfftn(p)
+    test_fft_invalid()
@@ -0,0 +1,108 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import dace
+import numpy as np
+import pytest
+import dace.libraries.standard as std
+
+N = dace.symbol('N')
+
+_params = ['pure', 'OpenMP']
+
+
+def _set_implementation(sdfg: dace.SDFG, impl: str):
+    for node, _ in sdfg.all_nodes_recursive():
+        if isinstance(node, std.Scan):
+            node.implementation = impl
+
+
+@pytest.mark.parametrize('impl', _params)
+def test_cumsum(impl):
+    @dace.program
+    def cumsum(a: dace.float64[N]):
+        return np.cumsum(a)
+
+    sdfg = cumsum.to_sdfg()
+    _set_implementation(sdfg, impl)
+    for n in (0, 1, 100, 100003):
+        a = np.random.rand(n)
+        assert np.allclose(sdfg(a=a, N=n), np.cumsum(a))
+
+
+@pytest.mark.parametrize('impl', _params)
+@pytest.mark.parametrize('axis', [None, 0, 1, -1])
+def test_cumsum_axis(impl, axis):
+    @dace.program
+    def cumsum_axis(a: dace.float64[20, 30]):
+        return np.cumsum(a, axis=axis)
+
+    sdfg = cumsum_axis.to_sdfg()
+    _set_implementation(sdfg, impl)
+    a = np.random.rand(20, 30)
+    assert np.allclose(sdfg(a=a), np.cumsum(a, axis=axis))
+
+
+@pytest.mark.parametrize('impl', _params)
+def test_cumprod_integer(impl):
+    @dace.program
+    def cumprod(a: dace.int32[3, 10]):
+        return a.cumprod(axis=1)
+
+    sdfg = cumprod.to_sdfg()
+    _set_implementation(sdfg, impl)
+    a = np.random.randint(1, 4, size=(3, 10)).astype(np.int32)
+    result = sdfg(a=a)
+    assert result.dtype == np.cumprod(a, axis=1).dtype
+    assert np.array_equal(result, np.cumprod(a, axis=1))
+
+
+@pytest.mark.parametrize('impl', _params)
+def test_exclusive_scan(impl):
+    @dace.program
+    def exclusive_max(a: dace.float64[N]):
+        return dace.scan(lambda x, y: max(x, y), a, identity=-1.0, exclusive=True)
+
+    sdfg = exclusive_max.to_sdfg()
+    _set_implementation(sdfg, impl)
+    a = np.random.rand(10000)
+    expected = np.concatenate([[-1.0], np.maximum.accumulate(a)[:-1]])
+    assert np.allclose(sdfg(a=a, N=a.shape[0]), expected)
+
+
+def test_scan_without_identity():
+    @dace.program
+    def scan_noident(a: dace.float64[N], b: dace.float64[N]):
+        dace.scan(lambda x, y: x + y, a, b)
+
+    sdfg = scan_noident.to_sdfg()
+    _set_implementation(sdfg, 'OpenMP')
+    a = np.random.rand(100)
+    b = np.zeros_like(a)
+    with pytest.warns(UserWarning):
+        sdfg(a=a, b=b, N=a.shape[0])
+    assert np.allclose(b, np.cumsum(a))
+
+
+@pytest.mark.gpu
+@pytest.mark.parametrize('axis', [0, 1])
+def test_cumsum_gpu(axis):
+    @dace.program
+    def cumsum_gpu(a: dace.float64[64, 1000]):
+        return np.cumsum(a, axis=axis)
+
+    sdfg = cumsum_gpu.to_sdfg()
+    sdfg.apply_gpu_transformations()
+    _set_implementation(sdfg, 'CUDA (device)')
+    a = np.random.rand(64, 1000)
+    assert np.allclose(sdfg(a=a), np.cumsum(a, axis=axis))
+
+
+if __name__ == '__main__':
+    for p in _params:
+        test_cumsum(p)
+        for axis in (None, 0, 1, -1):
+            test_cumsum_axis(p, axis)
+        test_cumprod_integer(p)
+        test_exclusive_scan(p)
+    test_scan_without_identity()
+    test_cumsum_gpu(0)
+    test_cumsum_gpu(1)
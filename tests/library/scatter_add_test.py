@@ -0,0 +1,154 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import dace
+import numpy as np
+import pytest
+import dace.libraries.standard as std
+
+N = dace.symbol('N')
+
+_params = ['pure', 'OpenMP']
+
+
+def _set_implementation(sdfg: dace.SDFG, impl: str):
+    for node, _ in sdfg.all_nodes_recursive():
+        if isinstance(node, std.ScatterAdd):
+            node.implementation = impl
+
+
+@pytest.mark.parametrize('impl', _params)
+@pytest.mark.parametrize('nbins', [100, 200000])
+def test_add_at(impl, nbins):
+
+    @dace.program
+    def add_at(a: dace.float64[nbins], i: dace.int64[N], v: dace.float64[N]):
+        np.add.at(a, i, v)
+        np.add.at(a, i[1:], 2.0)
+
+    sdfg = add_at.to_sdfg()
+    _set_implementation(sdfg, impl)
+    # Exercise both the serial and the parallel OpenMP implementations
+    for n in (1, 1000, 100003):
+        a = np.random.rand(nbins)
+        i = np.random.randint(-nbins, nbins, size=n)
+        v = np.random.rand(n)
+        expected = np.copy(a)
+        np.add.at(expected, i, v)
+        np.add.at(expected, i[1:], 2.0)
+        sdfg(a=a, i=i, v=v, N=n)
+        assert np.allclose(a, expected)
+
+
+@pytest.mark.parametrize('impl', _params)
+def test_bincount(impl):
+
+    @dace.program
+    def bincount(x: dace.int32[N], w: dace.float64[N], counts: dace.int64[30], sums: dace.float64[40],
+                 sizes: dace.int64[2]):
+        c = np.bincount(x)
+        s = np.bincount(x, weights=w, minlength=40)
+        counts[:] = c[:30]
+        sums[:] = s[:40]
+        sizes[0] = len(c)
+        sizes[1] = len(s)
+
+    sdfg = bincount.to_sdfg()
+    _set_implementation(sdfg, impl)
+    x = np.random.randint(0, 30, size=20000).astype(np.int32)
+    x[0] = 29
+    w = np.random.rand(20000)
+    counts = np.zeros([30], dtype=np.int64)
+    sums = np.zeros([40])
+    sizes = np.zeros([2], dtype=np.int64)
+    sdfg(x=x, w=w, counts=counts, sums=sums, sizes=sizes, N=x.shape[0])
+    assert np.array_equal(counts, np.bincount(x))
+    assert np.allclose(sums, np.bincount(x, weights=w, minlength=40))
+    assert list(sizes) == [30, 40]
+
+
+@pytest.mark.parametrize('impl', _params)
+def test_histogram(impl):
+
+    @dace.program
+    def histogram(a: dace.float64[N, 5], w: dace.float32[N, 5]):
+        h, e = np.histogram(a)
+        hw, ew = np.histogram(a, bins=7, range=(0.2, 0.9), weights=w)
+        hd, ed = np.histogram(a, bins=13, density=True)
+        return h, e, hw, ew, hd, ed
+
+    sdfg = histogram.to_sdfg()
+    _set_implementation(sdfg, impl)
+    a = np.random.rand(200, 5)
+    a[3, 2] = 0.9  # On the last edge
+    w = np.random.rand(200, 5).astype(np.float32)
+    results = sdfg(a=a, w=w, N=200)
+    expected = (np.histogram(a) + np.histogram(a, bins=7, range=(0.2, 0.9), weights=w) +
+                np.histogram(a, bins=13, density=True))
+    assert results[0].dtype == np.int64
+    assert results[2].dtype == np.float32
+    for result, ref in zip(results, expected):
+        assert np.allclose(result, ref)
+
+
+def test_histogram_constant():
+
+    @dace.program
+    def histogram_constant(a: dace.int32[N]):
+        hist, edges = np.histogram(a, bins=4)
+        return hist, edges
+
+    a = np.full([10], 3, dtype=np.int32)
+    hist, edges = histogram_constant.to_sdfg()(a=a, N=10)
+    expected_hist, expected_edges = np.histogram(a, bins=4)
+    assert np.array_equal(hist, expected_hist)
+    assert np.allclose(edges, expected_edges)
+
+
+def test_scatter_add_invalid():
+
+    @dace.program
+    def histogram_edges(a: dace.float64[N], b: dace.float64[5]):
+        return np.histogram(a, bins=b)
+
+    with pytest.raises(NotImplementedError):
+        histogram_edges.to_sdfg()
+
+    @dace.program
+    def multiply_at(a: dace.float64[N], i: dace.int64[5]):
+        np.multiply.at(a, i, 2.0)
+
+    with pytest.raises(NotImplementedError):
+        multiply_at.to_sdfg()
+
+
+@pytest.mark.gpu
+def test_scatter_add_gpu():
+
+    @dace.program
+    def scatter_add_gpu(a: dace.float64[100000], b: dace.float32[1000], i: dace.int64[N], v: dace.float64[N]):
+        np.add.at(a, i, v)
+        np.add.at(b, i, 1.0)
+
+    sdfg = scatter_add_gpu.to_sdfg()
+    sdfg.apply_gpu_transformations()
+    _set_implementation(sdfg, 'CUDA (device)')
+    a = np.random.rand(100000)
+    b = np.random.rand(1000).astype(np.float32)
+    i = np.random.randint(0, 1000, size=1000000)
+    v = np.random.rand(1000000)
+    expected_a, expected_b = np.copy(a), np.copy(b)
+    np.add.at(expected_a, i, v)
+    np.add.at(expected_b, i, 1.0)
+    sdfg(a=a, b=b, i=i, v=v, N=i.shape[0])
+    assert np.allclose(a, expected_a)
+    assert np.allclose(b, expected_b, rtol=1e-4)
+
+
+if __name__ == '__main__':
+    for p in _params:
+        test_add_at(p, 100)
+        test_add_at(p, 200000)
+        test_bincount(p)
+        test_histogram(p)
+    test_histogram_constant()
+    test_scatter_add_invalid()
+    test_scatter_add_gpu()
@@ -0,0 +1,125 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import dace
+import numpy as np
+import pytest
+import dace.libraries.standard as std
+
+N = dace.symbol('N')
+
+_params = ['pure', 'OpenMP']
+
+
+def _set_implementation(sdfg: dace.SDFG, impl: str):
+    for node, _ in sdfg.all_nodes_recursive():
+        if isinstance(node, std.Sort):
+            node.implementation = impl
+
+
+@pytest.mark.parametrize('impl', _params)
+def test_sort(impl):
+
+    @dace.program
+    def sort(a: dace.float64[N]):
+        return np.sort(a)
+
+    sdfg = sort.to_sdfg()
+    _set_implementation(sdfg, impl)
+    # The pure expansion is quadratic, keep its inputs small
+    for n in ((0, 1, 2, 101) if impl == 'pure' else (0, 1, 2, 101, 100003)):
+        a = np.random.rand(n)
+        a[::13] = np.nan
+        assert np.array_equal(sdfg(a=a, N=n), np.sort(a), equal_nan=True)
+
+
+@pytest.mark.parametrize('impl', _params)
+@pytest.mark.parametrize('axis', [None, 0, 1, -1])
+def test_sort_axis(impl, axis):
+
+    @dace.program
+    def sort_axis(a: dace.float64[20, 30]):
+        return np.sort(a, axis=axis)
+
+    sdfg = sort_axis.to_sdfg()
+    _set_implementation(sdfg, impl)
+    a = np.random.rand(20, 30)
+    assert np.array_equal(sdfg(a=a), np.sort(a, axis=axis))
+
+
+@pytest.mark.parametrize('impl', _params)
+@pytest.mark.parametrize('axis', [0, 1])
+def test_argsort_stable(impl, axis):
+
+    @dace.program
+    def argsort(a: dace.int32[40, 50]):
+        return np.argsort(a, axis=axis, kind='stable')
+
+    sdfg = argsort.to_sdfg()
+    _set_implementation(sdfg, impl)
+    a = np.random.randint(0, 5, size=(40, 50)).astype(np.int32)
+    assert np.array_equal(sdfg(a=a), np.argsort(a, axis=axis, kind='stable'))
+
+
+@pytest.mark.parametrize('impl', _params)
+def test_sort_methods(impl):
+
+    @dace.program
+    def sort_methods(a: dace.float64[N, 6], b: dace.int64[N, 6]):
+        b[:] = a.argsort(axis=0)
+        a.sort()
+
+    sdfg = sort_methods.to_sdfg()
+    _set_implementation(sdfg, impl)
+    a = np.random.rand(30, 6)
+    b = np.zeros([30, 6], dtype=np.int64)
+    expected_a, expected_b = np.sort(a), np.argsort(a, axis=0, kind='stable')
+    sdfg(a=a, b=b, N=30)
+    assert np.array_equal(a, expected_a)
+    assert np.array_equal(b, expected_b)
+
+
+@pytest.mark.parametrize('impl', _params)
+def test_unique(impl):
+
+    @dace.program
+    def unique(a: dace.float64[N], total: dace.float64[1], count: dace.int64[1]):
+        u = np.unique(a)
+        total[0] = np.sum(u)
+        count[0] = len(u)
+
+    sdfg = unique.to_sdfg()
+    _set_implementation(sdfg, impl)
+    a = np.random.randint(0, 20, size=200).astype(np.float64)
+    total = np.zeros([1])
+    count = np.zeros([1], dtype=np.int64)
+    sdfg(a=a, total=total, count=count, N=a.shape[0])
+    assert np.allclose(total[0], np.sum(np.unique(a)))
+    assert count[0] == len(np.unique(a))
+
+
+@pytest.mark.gpu
+def test_sort_gpu():
+
+    @dace.program
+    def sort_gpu(a: dace.float64[64, 1000], b: dace.int64[64, 1000]):
+        b[:] = np.argsort(a)
+        return np.sort(a)
+
+    sdfg = sort_gpu.to_sdfg()
+    sdfg.apply_gpu_transformations()
+    _set_implementation(sdfg, 'CUDA (device)')
+    a = np.random.rand(64, 1000)
+    b = np.zeros([64, 1000], dtype=np.int64)
+    assert np.array_equal(sdfg(a=a, b=b), np.sort(a))
+    assert np.array_equal(b, np.argsort(a, kind='stable'))
+
+
+if __name__ == '__main__':
+    for p in _params:
+        test_sort(p)
+        for axis in (None, 0, 1, -1):
+            test_sort_axis(p, axis)
+        test_argsort_stable(p, 0)
+        test_argsort_stable(p, 1)
+        test_sort_methods(p)
+        test_unique(p)
+    test_sort_gpu()
@@ -1,5 +1,6 @@
 # Copyright 2019-2022 ETH Zurich and the DaCe authors. All rights reserved.
 
+import copy
 import dace
 from dace.transformation import pass_pipeline as ppl
 
@@ -96,7 +97,69 @@ def test_pipeline_modification_rerun():
     assert result == {'MyAnalysis': 1, 'PassA': 1, 'PassB': 1, 'PassC': 1}
 
 
+def test_analysis_cache():
+    class MyAnalysis(MyPass):
+        def should_reapply(self, modified: ppl.Modifies) -> bool:
+            return modified & ppl.Modifies.States
+
+        def modifies(self) -> ppl.Modifies:
+            return ppl.Modifies.Nothing
+
+    class DependentAnalysis(MyAnalysis):
+        def depends_on(self):
+            return {MyAnalysis}
+
+        def should_reapply(self, modified: ppl.Modifies) -> bool:
+            return False
+
+    class PassA(MyPass):
+        def depends_on(self):
+            return {DependentAnalysis}
+
+        def modifies(self) -> ppl.Modifies:
+            return ppl.Modifies.Symbols
+
+    an, dep = MyAnalysis(), DependentAnalysis()
+    sdfg = empty.to_sdfg()
+    sdfg.add_state()
+
+    # Results are reused across pipelines
+    ppl.Pipeline([an, dep]).apply_pass(sdfg, {})
+    ppl.Pipeline([an, dep]).apply_pass(sdfg, {})
+    result = ppl.Pipeline([an, dep, PassA()]).apply_pass(sdfg, {})
+    assert an.applied == 1
+    assert dep.applied == 1
+    assert result == {'MyAnalysis': 1, 'DependentAnalysis': 1, 'PassA': 1}
+    analyses = ppl.get_analysis_manager(sdfg)
+    assert analyses.hits['MyAnalysis'] == 2
+    assert analyses.misses['MyAnalysis'] == 1
+
+    # Reported modifications invalidate analyses and those that depend on them
+    analyses.invalidate(ppl.Modifies.States)
+    ppl.Pipeline([dep]).apply_pass(sdfg, {})
+    assert analyses.misses['MyAnalysis'] == 2
+    assert dep.applied == 2
+
+    # Modifications to the graph are detected even if not reported
+    sdfg.add_state()
+    ppl.Pipeline([an]).apply_pass(sdfg, {})
+    assert analyses.misses['MyAnalysis'] == 3
+    sdfg.node(0).add_tasklet('t', {}, {}, '')
+    ppl.Pipeline([an, dep]).apply_pass(sdfg, {})
+    assert analyses.misses['MyAnalysis'] == 3
+    assert dep.applied == 3
+
+    # Analysis results are not shared with copies of the SDFG
+    applied = an.applied
+    ppl.Pipeline([an]).apply_pass(copy.deepcopy(sdfg), {})
+    assert an.applied == applied + 1
+
+    with dace.config.set_temporary('optimizer', 'cache_analyses', value=False):
+        ppl.Pipeline([an]).apply_pass(sdfg, {})
+        assert an.applied == applied + 2
+
 if __name__ == '__main__':
     test_simple_pipeline()
     test_pipeline_with_dependencies()
     test_pipeline_modification_rerun()
+    test_analysis_cache()
@@ -65,8 +65,108 @@ def test_cache_argument_names():
     assert np.allclose(a, rega) and np.allclose(c, regc)
 
 
+def test_cache_guards():
+    """
+    Tests that warm calls are dispatched by argument guards, and that
+    guards distinguish argument shapes and strides.
+    """
+    N = dace.symbol('N')
+
+    @dace.program
+    def test(x: dace.float64[N], y: dace.float64[N]):
+        y[:] = x * 2
+
+    a = np.random.rand(20)
+    b = np.zeros(20)
+    test(a, b)
+    assert len(test._cache.guards) == 1
+    test(a, b)
+    assert len(test._cache.guards) == 1
+    assert np.allclose(b, a * 2)
+
+    # New shape (inferred symbol value) and new strides
+    a = np.random.rand(30)
+    b = np.zeros(30)
+    test(a, b)
+    assert len(test._cache.guards) == 2
+    assert np.allclose(b, a * 2)
+    test(a[::2], b[::2])
+    assert len(test._cache.guards) == 3
+    assert np.allclose(b[::2], a[::2] * 2)
+
+    # Guarded calls do not recompile
+    assert len(test._cache.cache) == 1
+
+
+def test_cache_guards_closure():
+    """ Tests that guarded calls detect changes in closure constants. """
+    value = 2
+
+    @dace.program
+    def test(x):
+        return x * value
+
+    a = np.random.rand(20)
+    assert np.allclose(test(a), a * 2)
+    assert np.allclose(test(a), a * 2)
+    value = 3
+    assert np.allclose(test(a), a * 3)
+    assert len(test._cache.cache) == 2
+
+
+def test_cache_guards_unsupported():
+    """ Tests that calls with unsupported argument types are not guarded. """
+    @dace.program
+    def test(x: dace.float64[20], y: dace.compiletime):
+        x[:] = y
+
+    a = np.random.rand(20)
+    test(a, 1)
+    test(a, 2)
+    assert len(test._cache.guards) == 0
+    assert np.allclose(a, 2)
+
+
+def test_cache_nested_programs():
+    """ Tests that nested program calls are parsed once per argument types and reused across call sites. """
+    @dace.program
+    def inner(x):
+        x += 1
+
+    @dace.program
+    def outer(a: dace.float64[20], b: dace.float64[20], c: dace.int32[10]):
+        for _ in range(3):
+            inner(a)
+        inner(b)
+        inner(c)
+
+    @dace.program
+    def outer2(a: dace.float64[20]):
+        inner(a)
+
+    sdfg = outer.to_sdfg(simplify=False)
+    sdfg.validate()
+    nsdfgs = [n for n, _ in sdfg.all_nodes_recursive() if isinstance(n, dace.nodes.NestedSDFG)]
+    assert len(nsdfgs) == 3
+    # Call sites do not share the nested SDFG object
+    assert len(set(id(n.sdfg) for n in nsdfgs)) == 3
+    assert len(inner._cache.parsed) == 2
+
+    # Reused by other programs
+    outer2.to_sdfg(simplify=False).validate()
+    assert len(inner._cache.parsed) == 2
+
+    # Simplified and unsimplified results are separate entries
+    outer2.to_sdfg(simplify=True).validate()
+    assert len(inner._cache.parsed) == 3
+
+
 if __name__ == '__main__':
     test_cache_same_args()
     test_cache_different_args()
     test_cache_return_values()
     test_cache_argument_names()
+    test_cache_guards()
+    test_cache_guards_closure()
+    test_cache_guards_unsupported()
+    test_cache_nested_programs()
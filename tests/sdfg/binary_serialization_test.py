@@ -0,0 +1,80 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests saving and loading SDFGs in the binary serialization format. """
+import io
+import json
+import os
+import pickle
+
+import dace
+import numpy as np
+import pytest
+
+N = dace.symbol('N')
+
+
+@dace.program
+def nested(A: dace.float64[N], B: dace.float64[N]):
+    for i in range(1, N):
+        if A[i] > 0:
+            B[i] = A[i - 1] + A[i]
+
+
+@dace.program
+def program(A: dace.float64[N], B: dace.float64[N], C: dace.float64[20]):
+    nested(A, B)
+    C[:] = np.sum(B) * A[:20]
+
+
+def _json(obj):
+    return json.loads(dace.serialize.dumps(obj))
+
+
+def test_binary_roundtrip(tmp_path):
+    sdfg = program.to_sdfg(simplify=False)
+    sdfg.save(os.path.join(tmp_path, 'program.sdfg'), hash=False)
+    sdfg.save(os.path.join(tmp_path, 'program.sdfgb'), hash=False, binary=True)
+    assert (os.path.getsize(os.path.join(tmp_path, 'program.sdfgb')) * 4 < os.path.getsize(
+        os.path.join(tmp_path, 'program.sdfg')))
+
+    # The binary format stores the same JSON representation
+    with open(os.path.join(tmp_path, 'program.sdfgb'), 'rb') as fp:
+        assert dace.serialize.load_binary_json(fp) == _json(sdfg.to_json())
+
+    loaded = dace.SDFG.from_file(os.path.join(tmp_path, 'program.sdfgb'))
+    assert _json(loaded.to_json()) == _json(sdfg.to_json())
+    from_json = dace.SDFG.from_file(os.path.join(tmp_path, 'program.sdfg'))
+    assert loaded.generate_code()[0].clean_code == from_json.generate_code()[0].clean_code
+
+
+def test_binary_compressed(tmp_path):
+    sdfg = program.to_sdfg()
+    filename = os.path.join(tmp_path, 'program.sdfgz')
+    sdfg.save(filename, hash=False, binary=True, compress=True)
+    loaded = dace.SDFG.from_file(filename)
+    assert _json(loaded.to_json()) == _json(sdfg.to_json())
+
+
+def test_binary_json_compatibility():
+    obj = {'a': [1, 2.5, None, True], 'b': (1, 'x'), 3: {'a': [], 'b': {}}, None: 'a', 'c': np.arange(3)}
+    stream = io.BytesIO()
+    dace.serialize.dump_binary(obj, stream)
+    stream.seek(0)
+    assert dace.serialize.load_binary_json(stream) == _json(obj)
+
+
+def test_binary_rejects_objects():
+    stream = io.BytesIO()
+    stream.write(dace.serialize.BINARY_HEADER + bytes([dace.serialize.BINARY_VERSION]))
+    pickle.dump(dace.float64, stream)
+    stream.seek(0)
+    with pytest.raises(pickle.UnpicklingError):
+        dace.serialize.load_binary_json(stream)
+
+
+if __name__ == '__main__':
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp_path:
+        test_binary_roundtrip(tmp_path)
+        test_binary_compressed(tmp_path)
+    test_binary_json_compatibility()
+    test_binary_rejects_objects()
@@ -0,0 +1,152 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests incrementally validating SDFGs. """
+import copy
+
+import dace
+import pytest
+from dace.sdfg import validation
+from dace.transformation.dataflow import MapExpansion
+from dace.transformation.passes.pattern_matching import PatternMatchAndApplyRepeated
+
+N = dace.symbol('N')
+
+
+@dace.program
+def nested(A: dace.float64[N], B: dace.float64[N]):
+    for i in range(N):
+        B[i] = A[i] * 2
+
+
+@dace.program
+def program(A: dace.float64[N], B: dace.float64[N], C: dace.float64[N], D: dace.float64[N, N]):
+    nested(A, B)
+    C[:] = B + 1
+    for i, j in dace.map[0:N, 0:N]:
+        D[i, j] = A[i] + C[j]
+
+
+@pytest.fixture
+def validated_states(monkeypatch):
+    """ Records the labels of the states that are validated. """
+    labels = []
+    validate_state = validation.validate_state
+
+    def recording_validate_state(state, *args, **kwargs):
+        labels.append(state.label)
+        return validate_state(state, *args, **kwargs)
+
+    monkeypatch.setattr(validation, 'validate_state', recording_validate_state)
+    return labels
+
+
+def _map_state(sdfg: dace.SDFG) -> dace.SDFGState:
+    return next(s for s in sdfg.nodes() if any(
+        isinstance(n, dace.nodes.MapEntry) and len(n.map.params) == 2 for n in s.nodes()))
+
+
+def _nested_sdfg(sdfg: dace.SDFG) -> dace.SDFG:
+    return next(s for s in sdfg.all_sdfgs_recursive() if s is not sdfg)
+
+
+def test_unmodified_states_skipped(validated_states):
+    sdfg = program.to_sdfg(simplify=False)
+    sdfg.validate(incremental=True)
+    num_states = len(validated_states)
+    assert num_states == sum(len(s.nodes()) for s in sdfg.all_sdfgs_recursive())
+
+    validated_states.clear()
+    sdfg.validate(incremental=True)
+    assert validated_states == []
+
+    # Property modifications only validate the modified state
+    state = _map_state(sdfg)
+    map_entry = next(n for n in state.nodes() if isinstance(n, dace.nodes.MapEntry))
+    map_entry.map.range = dace.subsets.Range.from_string('0:N, 0:N')
+    sdfg.validate(incremental=True)
+    assert validated_states == [state.label]
+
+    # Full validation is still performed on demand
+    validated_states.clear()
+    sdfg.validate()
+    assert len(validated_states) == num_states
+
+    # Copies are validated fully
+    validated_states.clear()
+    copy.deepcopy(sdfg).validate(incremental=True)
+    assert len(validated_states) == num_states
+
+
+def test_invalid_modifications():
+    sdfg = program.to_sdfg(simplify=False)
+    sdfg.validate(incremental=True)
+
+    # Memlet property
+    state = _map_state(sdfg)
+    edge = state.edges()[0]
+    data = edge.data.data
+    edge.data.data = 'D'
+    with pytest.raises(validation.InvalidSDFGEdgeError):
+        sdfg.validate(incremental=True)
+    edge.data.data = data
+    sdfg.validate(incremental=True)
+
+    # Structure
+    node = state.add_access('C')
+    with pytest.raises(validation.InvalidSDFGNodeError, match='Isolated node'):
+        sdfg.validate(incremental=True)
+    state.remove_node(node)
+    sdfg.validate(incremental=True)
+
+    # Data descriptors
+    sdfg.arrays['D'].shape = (N, )
+    with pytest.raises(validation.InvalidSDFGEdgeError, match='dimension'):
+        sdfg.validate(incremental=True)
+    sdfg.arrays['D'].shape = (N, N)
+    sdfg.validate(incremental=True)
+
+
+def test_invalid_nested_modifications():
+    sdfg = program.to_sdfg(simplify=False)
+    sdfg.validate(incremental=True)
+
+    nsdfg = _nested_sdfg(sdfg)
+    name = next(iter(nsdfg.parent_nsdfg_node.in_connectors))
+    nsdfg.arrays[name].transient = True
+    with pytest.raises(validation.InvalidSDFGNodeError, match='transient'):
+        sdfg.validate(incremental=True)
+    nsdfg.arrays[name].transient = False
+    sdfg.validate(incremental=True)
+
+    nsdfg.start_state.add_access(name)
+    with pytest.raises(validation.InvalidSDFGNodeError, match='Isolated node'):
+        sdfg.validate(incremental=True)
+
+
+def test_duplicate_references():
+    sdfg = program.to_sdfg(simplify=False)
+    sdfg.validate(incremental=True)
+
+    # The duplicated node is also part of an unmodified state, which is validated first
+    state = _map_state(sdfg)
+    other_state = next(s for s in sdfg.nodes() if s is not state and s.number_of_nodes() > 0)
+    state.add_node(other_state.nodes()[0])
+    with pytest.raises(validation.InvalidSDFGNodeError, match='Duplicate node'):
+        sdfg.validate(incremental=True)
+
+
+def test_validate_all(validated_states):
+    sdfg = program.to_sdfg(simplify=False)
+    sdfg.validate()
+    validated_states.clear()
+
+    # Only the transformed state is validated again
+    state = _map_state(sdfg)
+    result = PatternMatchAndApplyRepeated([MapExpansion], validate=False, validate_all=True).apply_pass(sdfg, {})
+    assert len(result['MapExpansion']) == 1
+    assert validated_states == [state.label]
+
+
+if __name__ == '__main__':
+    test_invalid_modifications()
+    test_invalid_nested_modifications()
+    test_duplicate_references()
@@ -0,0 +1,92 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests lazily copying SDFGs. """
+import copy
+import json
+import pickle
+
+import dace
+import numpy as np
+import pytest
+from dace.sdfg import lazy_copy
+from dace.transformation.dataflow import MapTiling
+
+N = dace.symbol('N')
+
+
+@dace.program
+def nested(A: dace.float64[N], B: dace.float64[N]):
+    for i in range(N):
+        if A[i] > 0:
+            B[i] = A[i] * 2
+        else:
+            B[i] = -A[i]
+
+
+@dace.program
+def program(A: dace.float64[N], B: dace.float64[N], C: dace.float64[N]):
+    nested(A, B)
+    C[:] = B + 1
+    nested(C, B)
+
+
+def _json(sdfg: dace.SDFG):
+    return json.loads(dace.serialize.dumps(sdfg.to_json()))
+
+
+def _map_state(sdfg: dace.SDFG) -> int:
+    return next(i for i, state in enumerate(sdfg.nodes()) if any(
+        isinstance(n, dace.nodes.MapEntry) for n in state.nodes()))
+
+
+def test_lazy_copy():
+    sdfg = program.to_sdfg(simplify=False)
+    reference = _json(sdfg)
+    state_id = _map_state(sdfg)
+    sdfg_copy = sdfg.lazy_copy()
+    assert all(lazy_copy.is_lazy(state) for state in sdfg_copy.nodes())
+
+    # Modify a single state of the copy
+    state = sdfg_copy.node(state_id)
+    map_entry = next(n for n in state.nodes() if isinstance(n, dace.nodes.MapEntry))
+    assert not lazy_copy.is_lazy(state)
+    MapTiling.apply_to(sdfg_copy, map_entry=map_entry, save=False)
+    assert sum(lazy_copy.is_lazy(s) for s in sdfg_copy.nodes()) == len(sdfg_copy.nodes()) - 1
+    assert _json(sdfg) == reference
+
+    # Accessing the rest of the copy copies it
+    original_nodes = set(id(n) for n, _ in sdfg.all_nodes_recursive())
+    assert all(id(n) not in original_nodes for n, _ in sdfg_copy.all_nodes_recursive())
+    assert [s.sdfg_id for s in sdfg_copy.all_sdfgs_recursive()] == list(range(len(sdfg.sdfg_list)))
+    assert all(s.parent_nsdfg_node.sdfg is s and s.parent_nsdfg_node in s.parent.nodes()
+               for s in sdfg_copy.sdfg_list[1:])
+    sdfg_copy.validate()
+
+    A = np.random.rand(20) - 0.5
+    B, C = np.random.rand(20), np.random.rand(20)
+    expected_C = np.where(A > 0, A * 2, -A) + 1
+    sdfg_copy(A=A, B=B, C=C, N=20)
+    assert np.allclose(C, expected_C)
+    assert np.allclose(B, np.where(expected_C > 0, expected_C * 2, -expected_C))
+
+
+def test_lazy_copy_equivalence():
+    sdfg = program.to_sdfg(simplify=False)
+    reference = _json(sdfg)
+    assert _json(sdfg.lazy_copy()) == reference
+    assert _json(copy.deepcopy(sdfg.lazy_copy())) == reference
+    assert _json(sdfg.lazy_copy().lazy_copy()) == reference
+    assert _json(pickle.loads(pickle.dumps(sdfg.lazy_copy()))) == reference
+
+
+def test_lazy_copy_modified_original():
+    sdfg = program.to_sdfg(simplify=False)
+    sdfg_copy = sdfg.lazy_copy()
+    sdfg.start_state.add_access('A')
+    with pytest.raises(RuntimeError):
+        sdfg_copy.start_state.nodes()
+
+
+if __name__ == '__main__':
+    test_lazy_copy()
+    test_lazy_copy_equivalence()
+    test_lazy_copy_modified_original()
@@ -0,0 +1,79 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests memoized symbolic computations and affine fast paths. """
+import dace
+import numpy as np
+import sympy
+from dace import subsets, symbolic
+
+
+def test_affine_difference():
+    N, M = dace.symbol('N'), dace.symbol('M')
+    assert symbolic.affine_difference(N + 2, N - 1) == 3
+    assert symbolic.affine_difference(2 * N + M, M + N + N) == 0
+    assert symbolic.affine_difference(np.int64(5), sympy.Integer(2)) == 3
+    assert symbolic.affine_difference(N, M) is None
+    assert symbolic.affine_difference(N * M, N * M + 1) is None  # Not affine
+    assert symbolic.affine_difference(N / 2, N / 2 - 1) is None  # Not integer
+
+    # Symbols with different assumptions
+    N_pos = dace.symbol('N', positive=True)
+    assert symbolic.affine_difference(N_pos, N) is None
+    assert symbolic.affine_difference(N_pos, N, by_name=True) == 0
+
+    # Complex symbols
+    z = sympy.Symbol('z')
+    assert symbolic.affine_difference(z + 1, z) is None
+
+
+def test_memoize():
+    calls = []
+
+    @symbolic.memoize(maxsize=2)
+    def negate(expr):
+        calls.append(expr)
+        return -expr
+
+    N = dace.symbol('N')
+    assert negate(N + 1) == -N - 1
+    assert negate(dace.symbol('N') + 1) == -N - 1
+    assert len(calls) == 1
+
+    # SymPy numbers are cached separately from Python numbers
+    assert negate(1) == -1 and negate(sympy.Integer(1)) == -1
+    assert len(calls) == 3
+
+    # Least recently used results are evicted
+    assert negate(N + 1) == -N - 1
+    assert len(calls) == 4
+
+    # Unhashable arguments are not cached
+    assert negate(np.array([1])) == -1
+    assert negate(np.array([1])) == -1
+    assert len(calls) == 6
+
+    statistics = symbolic.cache_statistics()[f'{__name__}.test_memoize.<locals>.negate']
+    assert (statistics.hits, statistics.misses, statistics.size, statistics.maxsize) == (1, 4, 2, 2)
+    assert statistics.time >= 0 and statistics.time_saved >= 0
+
+    symbolic.clear_caches()
+    assert negate.statistics().size == 0
+    assert negate(N + 1) == -N - 1
+    assert len(calls) == 7
+
+
+def test_affine_subsets():
+    N = dace.symbol('N')
+    i = dace.symbol('i')
+    rng = subsets.Range([(0, N - 1, 1), (i, i + 3, 1)])
+    assert rng.covers(subsets.Range([(1, N - 2, 1), (i + 1, i + 3, 1)])) is True
+    assert rng.covers(subsets.Range([(1, N, 1), (i, i + 3, 1)])) is False
+    assert subsets.intersects(rng, subsets.Range([(N, N, 1), (i, i, 1)])) is False
+    assert subsets.intersects(subsets.Range([(i, i + 3, 1)]), subsets.Range([(i + 3, i + 4, 1)])) is True
+    assert symbolic.inequal_symbols(N + 1, N) is True
+    assert symbolic.inequal_symbols(N + 1, 1 + dace.symbol('N', positive=True)) is False
+
+
+if __name__ == '__main__':
+    test_affine_difference()
+    test_memoize()
+    test_affine_subsets()
@@ -0,0 +1,71 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests the persistent tuning database of the cutout tuners. """
+import math
+import os
+
+import dace
+from dace.optimization import MapTilingTuner, TuningDatabase
+from dace.optimization import tuning_database as tdb
+
+N = dace.symbol('N')
+
+
+@dace.program
+def twomaps(A: dace.float64[N, N], B: dace.float64[N, N]):
+    B[:] = A + 1
+    A[:] = B * 2
+
+
+def test_store_and_load(tmp_path):
+    db = TuningDatabase(os.path.join(tmp_path, 'tuning.db'))
+    assert db.load('Task', 'cutout') is None
+
+    # Partial results are only visible on request
+    db.store('Task', 'cutout', {'a': 2.0, 'b': 1.0}, complete=False)
+    assert db.load('Task', 'cutout') is None
+    assert db.load('Task', 'cutout', complete=False) == {'a': 2.0, 'b': 1.0}
+
+    db.store('Task', 'cutout', {'c': math.inf})
+    assert db.load('Task', 'cutout') == {'a': 2.0, 'b': 1.0, 'c': math.inf}
+
+    # Results persist across database objects, but are specific to hardware
+    assert TuningDatabase(db.path).load('Task', 'cutout') is not None
+    assert TuningDatabase(db.path, hardware='other').load('Task', 'cutout') is None
+
+
+def test_top_k(tmp_path):
+    db = TuningDatabase(os.path.join(tmp_path, 'tuning.db'))
+    db.store('Task', 'c1', {'a': 3.0, 'b': 1.0, 'c': 2.0})
+    db.store('Task', 'c2', {'a': math.inf})
+    db.store('Other', 'c3', {'a': 1.0})
+    assert db.top_k('Task', 2) == [('c1', 'b', 1.0), ('c1', 'c', 2.0)]
+
+
+def test_patterns(tmp_path):
+    db = TuningDatabase(os.path.join(tmp_path, 'tuning.db'))
+    db.store_patterns('Task', [{'x': 2, 'y': 1}])
+    db.store_patterns('Task', [{'y': 1, 'x': 2}, {'z': 1}])
+    assert db.load_patterns('Task') == [{'x': 2, 'y': 1}, {'z': 1}]
+
+
+def test_structural_cutout_hash(tmp_path):
+    sdfg = twomaps.to_sdfg()
+    tuner = MapTilingTuner(sdfg, database=TuningDatabase(os.path.join(tmp_path, 'tuning.db')))
+    cutouts = list(tuner.cutouts())
+    assert len(cutouts) == 2
+
+    # Cutouts are keyed by structure, regardless of labels and instrumentation
+    (first, _), (second, _) = cutouts
+    assert tdb.cutout_hash(first) != tdb.cutout_hash(second)
+    tuner.database.store(tuner.task, tdb.cutout_hash(first), {'None': 1.0})
+    first.start_state.instrument = dace.InstrumentationType.Timer
+    assert tuner.try_load(first) == {'None': 1.0}
+    assert tuner.try_load(second) is None
+
+
+if __name__ == '__main__':
+    import tempfile
+    test_store_and_load(tempfile.mkdtemp())
+    test_top_k(tempfile.mkdtemp())
+    test_patterns(tempfile.mkdtemp())
+    test_structural_cutout_hash(tempfile.mkdtemp())